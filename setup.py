@@ -64,8 +64,7 @@ def read(*names, **kwargs):
         'numpy==1.24; python_version == "3.8"',  # Last version compatible with Python 3.8
         'numpy; python_version > "3.8"',
         'numpy-financial',
-        'pint',
-        'forex_python',
+        'pint>=0.20',  # cache_folder of UnitRegistry
         'jsons',
         'mpmath',
         'deepdiff',
@@ -87,6 +86,8 @@ def read(*names, **kwargs):
         'pylocker',
         'nrel-pysam',
         'tabulate',
+        # TOML input files are read with tomllib on Python >= 3.11
+        'tomli; python_version < "3.11"',
     ],
     extras_require={
         # eg:
@@ -7,6 +7,8 @@
 @author: softwareengineerprogrammer
 """
 
+from __future__ import annotations
+
 import argparse
 import concurrent.futures
 import json
@@ -17,6 +19,7 @@
 import tempfile
 import time
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -162,14 +165,47 @@ def check_and_replace_mean(input_value, args) -> list:
     return input_value
 
 
-def work_package(pass_list: list):
+@dataclass
+class IterationTimings:
+    """
+    Where the time of a single Monte Carlo iteration went, for tuning the number of workers and chunk size.
+    """
+
+    pid: int
+    """ID of the worker process that ran the iteration"""
+
+    start_time: float
+    """Time the iteration started, in seconds since the epoch (comparable across worker processes)"""
+
+    input_write_sec: float
+    """Drawing the random input values and writing the iteration's input file"""
+
+    simulation_sec: float
+    """Running the simulation"""
+
+    parse_sec: float
+    """Reading the requested outputs from the simulation's result file"""
+
+    lock_wait_sec: float
+    """Waiting for the lock on the shared MC output file and writing the iteration's result line to it"""
+
+    @property
+    def total_sec(self) -> float:
+        return self.input_write_sec + self.simulation_sec + self.parse_sec + self.lock_wait_sec
+
+
+def work_package(pass_list: list) -> IterationTimings:
     """
     Function that is called by the executor. It does the work of running the simulation.
     :param pass_list: the list of arguments passed in from the command line
+    :return: the timings of the iteration
     """
 
     log = _get_logger()
 
+    start_time = time.time()
+    phase_start = time.perf_counter()
+
     print('#', end='')  # TODO Use tdqm library to show progress bar on screen: https://github.com/tqdm/tqdm
 
     input_values: list[list] = pass_list[0]
@@ -212,6 +248,9 @@ def work_package(pass_list: list):
     with open(tmp_input_file, 'a') as f:
         f.write(input_file_entries)
 
+    input_write_sec = time.perf_counter() - phase_start
+    phase_start = time.perf_counter()
+
     if args.Code_File.endswith('GEOPHIRESv3.py'):
         geophires_client: GeophiresXClient = GeophiresXClient()
         result: GeophiresXResult = geophires_client.get_geophires_result(
@@ -245,6 +284,9 @@ def work_package(pass_list: list):
         )
         sprocess.wait()
 
+    simulation_sec = time.perf_counter() - phase_start
+    phase_start = time.perf_counter()
+
     # look group "_result.txt" file for the OUTPUT variables that the user asked for.
     # For each of them, write them as a column in results file
     s1 = ''
@@ -293,6 +335,9 @@ def get_output(output):
     result_s = result_s.strip(' ').strip(',')  # get rid of last space and comma
     result_s += '\n'
 
+    parse_sec = time.perf_counter() - phase_start
+    phase_start = time.perf_counter()
+
     # write the result to a file in a concurrent thread safe way
     lock_pass = str(uuid.uuid1())
     FL = Locker(filePath=output_file, lockPass=lock_pass, timeout=10, mode='a')
@@ -301,6 +346,121 @@ def get_output(output):
         if fd is not None:
             fd.write(result_s)
 
+    return IterationTimings(
+        pid=os.getpid(),
+        start_time=start_time,
+        input_write_sec=input_write_sec,
+        simulation_sec=simulation_sec,
+        parse_sec=parse_sec,
+        lock_wait_sec=time.perf_counter() - phase_start,
+    )
+
+
+def _work_package_or_none(pass_list: list) -> IterationTimings | None:
+    """
+    Runs work_package, returning None instead of raising if the iteration fails, so that a failed iteration does not
+    stop the other iterations (failed iterations are left out of the statistics).
+    """
+
+    try:
+        return work_package(pass_list)
+    except (Exception, SystemExit) as e:
+        _get_logger().warning(f'Monte Carlo iteration failed: {e!s}')
+        return None
+
+
+@dataclass
+class IterationsRun:
+    """
+    Timings of running the iterations of a Monte Carlo simulation in a process pool
+    """
+
+    max_workers: int | None
+    """The requested maximum number of worker processes (None for the ProcessPoolExecutor default)"""
+
+    chunksize: int
+    """The number of iterations sent to a worker process at a time"""
+
+    start_time: float
+    """Time the process pool was started, in seconds since the epoch"""
+
+    wall_time_sec: float
+    """Wall time from starting the process pool to all iterations being finished and the pool shut down"""
+
+    iteration_timings: list[IterationTimings]
+    """Timings of the iterations that succeeded"""
+
+    failed_iterations: int
+
+    @property
+    def workers_used(self) -> int:
+        return len({it.pid for it in self.iteration_timings})
+
+    @property
+    def throughput_per_sec(self) -> float:
+        """Successful iterations per second"""
+        return len(self.iteration_timings) / self.wall_time_sec if self.wall_time_sec > 0 else 0.0
+
+    @property
+    def spawn_sec(self) -> float:
+        """
+        Total time from starting the process pool to each worker process starting its first iteration, i.e. the cost
+        of spawning (and, for workers that start late, waiting for) the worker processes
+        """
+
+        first_start_time_by_pid: dict[int, float] = {}
+        for it in self.iteration_timings:
+            first_start_time_by_pid[it.pid] = min(it.start_time, first_start_time_by_pid.get(it.pid, it.start_time))
+
+        return sum(first_start_time - self.start_time for first_start_time in first_start_time_by_pid.values())
+
+    def __str__(self) -> str:
+        iterations = len(self.iteration_timings)
+        if iterations == 0:
+            return f'0 iterations succeeded ({self.failed_iterations} failed) in {self.wall_time_sec:.3f} sec'
+
+        def _mean_sec(phase: str) -> float:
+            return sum(getattr(it, phase) for it in self.iteration_timings) / iterations
+
+        return (
+            f'{iterations} iterations in {self.wall_time_sec:.3f} sec ({self.throughput_per_sec:.3f}/sec) '
+            f'on {self.workers_used} workers with chunksize {self.chunksize}'
+            f'{f" ({self.failed_iterations} failed)" if self.failed_iterations > 0 else ""}; '
+            f'mean per iteration: spawn {self.spawn_sec / iterations:.3f} sec, '
+            f'input write {_mean_sec("input_write_sec"):.3f} sec, simulation {_mean_sec("simulation_sec"):.3f} sec, '
+            f'parse {_mean_sec("parse_sec"):.3f} sec, lock wait {_mean_sec("lock_wait_sec"):.3f} sec'
+        )
+
+
+def run_iterations(
+    pass_list: list, iterations: int, max_workers: int | None = None, chunksize: int = 1
+) -> IterationsRun:
+    """
+    Runs the iterations of a Monte Carlo simulation in a process pool.
+    :param pass_list: the arguments of each iteration (see work_package)
+    :param iterations: the number of iterations
+    :param max_workers: the maximum number of worker processes; None for the ProcessPoolExecutor default (the number
+        of CPUs)
+    :param chunksize: the number of iterations sent to a worker process at a time. Larger chunks reduce inter-process
+        communication overhead, but can leave workers idle at the end of the run if iterations take uneven time.
+    :return: the timings of the run
+    """
+
+    start_time = time.time()
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_work_package_or_none, [pass_list] * iterations, chunksize=chunksize))
+
+    iteration_timings = [it for it in results if it is not None]
+    return IterationsRun(
+        max_workers=max_workers,
+        chunksize=chunksize,
+        start_time=start_time,
+        wall_time_sec=time.perf_counter() - start,
+        iteration_timings=iteration_timings,
+        failed_iterations=len(results) - len(iteration_timings),
+    )
+
 
 def main(command_line_args=None):
     r"""
@@ -327,6 +487,10 @@ def main(command_line_args=None):
                    MC_OUTPUT_FILE, "D:\Work\GEOPHIRES3-master\MC_Result.txt"
             d) the path to the python executable, it it is not already linked to "python", in the form:
                    PYTHON_PATH, /user/local/bin/python3
+            e) optionally, the maximum number of worker processes (default: the number of CPUs) and the number of
+            iterations sent to a worker at a time (default: 1), in the form:
+                   MAX_WORKERS, 4
+                   CHUNKSIZE, 2
     :param enable_geophires_monte_carlo_logging_config: if True, use the logging.conf file to configure logging
     :type enable_geophires_monte_carlo_logging_config: bool
     """
@@ -370,6 +534,8 @@ def main(command_line_args=None):
     code_file_name = Path(args.Code_File).name
     python_path = 'python'
     html_path = ''
+    max_workers = None
+    chunksize = 1
 
     for line in flist:
         clean = line.strip()
@@ -389,6 +555,10 @@ def main(command_line_args=None):
             python_path = pair[1]
         elif pair[0].startswith('HTML_PATH'):
             html_path = pair[1]
+        elif pair[0].startswith('MAX_WORKERS'):
+            max_workers = int(pair[1])
+        elif pair[0].startswith('CHUNKSIZE'):
+            chunksize = int(pair[1])
 
     # check to see if there is a "#" in an input, if so, use the results file to replace it with the value
     for input_value in inputs:
@@ -424,16 +594,11 @@ def main(command_line_args=None):
     # build the args list
     pass_list = [inputs, outputs, args, output_file, working_dir, python_path]  # this list never changes
 
-    args = []
-    for _ in range(iterations):
-        args.append(pass_list)  # we need to make Iterations number of copies of this list for the map
-    args = tuple(args)  # convert to a tuple
-
-    # Now run the executor with the map - that will run it Iterations number of times
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        executor.map(work_package, args)
+    # Now run the iterations in a process pool
+    iterations_run = run_iterations(pass_list, iterations, max_workers=max_workers, chunksize=chunksize)
 
     print('\n')  # See TODO re: tqdm
+    logger.info(f'Iterations: {iterations_run}')
     logger.info('Done with calculations! Summarizing...')
 
     # read the results into an array
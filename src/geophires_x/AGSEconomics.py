@@ -1,4 +1,3 @@
-import sys
 import os
 import numpy as np
 import geophires_x.Model as Model
@@ -22,7 +21,7 @@ def __init__(self, model: Model):
         :type model: Model
         :return: Nothing, and is used to initialize the class
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
 
         # Initialize the superclass first to gain access to those variables
         super().__init__(model)
@@ -78,7 +77,7 @@ def __init__(self, model: Model):
 
         # results are stored here and in the parent ProducedTemperature array
 
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: __init__', __class__)
 
     def __str__(self):
         return 'AGSEconomics'
@@ -92,7 +91,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)  # read the default parameters
         # if we call super, we don't need to deal with setting the parameters here,
         # just deal with the special cases for the variables in this class
@@ -103,7 +102,7 @@ def read_parameters(self, model: Model) -> None:
         self.Discount_rate = model.economics.discountrate.value  # same units as GEOPHIRES
         self.Electricity_rate = model.surfaceplant.electricity_cost_to_buy.value  # same units as GEOPHIRES
 
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: read_parameters', __class__)
 
     def verify(self, model: Model) -> int:
         """
@@ -113,7 +112,7 @@ def verify(self, model: Model) -> int:
         :type model: :class:`~geophires_x.Model.Model`
         :return: 0 if all OK, 1 if error.
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: verify', __class__)
 
         # Verify inputs are within allowable bounds
         self.error = 0
@@ -161,7 +160,7 @@ def verify(self, model: Model) -> int:
             model.logger.fatal(msg)
             self.error = 1
 
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: verify', __class__)
         return self.error
 
     def Calculate(self, model: Model) -> None:
@@ -171,7 +170,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         if self.econmodel.value is not EconomicModel.CLGS:  # do a classical econ calculation
             super().Calculate(model)
@@ -250,5 +249,5 @@ def Calculate(self, model: Model) -> None:
             self.Coam.CurrentUnits = CurrencyFrequencyUnit.KDOLLARSPERYEAR
 
         self._calculate_derived_outputs(model)
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
@@ -28,7 +28,7 @@ def PrintOutputs(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: PrintOutputs', __class__)
 
         self._convert_units(model)
 
@@ -212,4 +212,4 @@ def PrintOutputs(self, model: Model):
             traceback.print_exc()
             raise RuntimeError(msg)
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: PrintOutputs', __class__)
@@ -7,9 +7,9 @@
  Technical and Economic Modeling of Heat Production and Electricity Generation. No. NREL/CP-5700-84979.
  National Renewable Energy Lab.(NREL), Golden, CO (United States), 2023.
 """
-import sys
 import os
 import math
+from functools import lru_cache
 import numpy as np
 from pint.facets.plain import PlainQuantity
 
@@ -271,39 +271,14 @@ def inverselaplace(cls:WellBores, NL, MM, pressure:PlainQuantity):
     :rtype: float
     """
     V = np.zeros(50)
-    Gi = np.zeros(50)
-    H = np.zeros(25)
     DLN2 = 0.6931471805599453
-    FI = 0.0
-    SN = 0.0
     Az = 0.0
     Z = 0.0
 
     if NL != MM:
-        Gi[1] = 1.0
-        NH = NL // 2
-        SN = 2.0 * (NH % 2) - 1.0
-
-        for i in range(1, NL + 1):
-            Gi[i + 1] = Gi[i] * i
-
-        H[1] = 2.0 / Gi[NH]
-        for i in range(1, NH + 1):
-            FI = i
-            H[i] = math.pow(FI, NH) * Gi[2 * i + 1] / Gi[NH - i + 1] / Gi[i + 1] / Gi[i]
-
-        for i in range(1, NL + 1):
-            V[i] = 0.0
-            KBG = (i + 1) // 2
-            temp = NH if i >= NH else i
-            KND = temp
-            for k in range(KBG, KND + 1):
-                V[i] = V[i] + H[k] / Gi[i - k + 1] / Gi[2 * k - i + 1]
-            V[i] = SN * V[i]
-            SN = -SN
+        V = stehfest_coefficients(NL)
         MM = NL
 
-    FI = 0.0
     Az = DLN2 / cls.time_operation.value
     Toutlet = 0.0
     for k in range(1, NL + 1):
@@ -436,6 +411,164 @@ def Chebyshev(self, a, b, n, yy, zz, yt, zt, ye, ze, alpha, sp, func):
     return y * d - dd + 0.5 * cint[0]  # Last step is different
 
 
+@lru_cache(maxsize=None)
+def stehfest_coefficients(NL: int) -> np.ndarray:
+    """
+    Stehfest coefficients for the numerical Laplace transformation algorithm (see inverselaplace), calculated once per
+    process for each NL
+    :param NL: number of terms (even)
+    :type NL: int
+    :return: V, where V[k] is the coefficient of the k-th term (V[0] is unused)
+    :rtype: np.ndarray
+    """
+    V = np.zeros(50)
+    Gi = np.zeros(50)
+    H = np.zeros(25)
+
+    Gi[1] = 1.0
+    NH = NL // 2
+    SN = 2.0 * (NH % 2) - 1.0
+
+    for i in range(1, NL + 1):
+        Gi[i + 1] = Gi[i] * i
+
+    H[1] = 2.0 / Gi[NH]
+    for i in range(1, NH + 1):
+        FI = i
+        H[i] = math.pow(FI, NH) * Gi[2 * i + 1] / Gi[NH - i + 1] / Gi[i + 1] / Gi[i]
+
+    for i in range(1, NL + 1):
+        V[i] = 0.0
+        KBG = (i + 1) // 2
+        temp = NH if i >= NH else i
+        KND = temp
+        for k in range(KBG, KND + 1):
+            V[i] = V[i] + H[k] / Gi[i - k + 1] / Gi[2 * k - i + 1]
+        V[i] = SN * V[i]
+        SN = -SN
+
+    V.setflags(write=False)
+    return V
+
+
+@lru_cache(maxsize=None)
+def chebyshev_quadrature(n: int = 32) -> tuple:
+    """
+    Nodes and weights of the Chebyshev approximation of the integral from 1e-8 to 1e5 over decades (see
+    chebeve_pointsource), such that the integral of func is weights @ func(nodes), as calculated by Chebyshev
+    :param n: number of nodes per decade
+    :type n: int
+    :return: nodes, weights
+    :rtype: tuple
+    """
+    num_decades = int(math.log10(1.0e4 / 1.0e-8) + 1)
+    cos_k = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+    cos_jk = np.cos(np.pi * np.arange(n) * (np.arange(n)[:, np.newaxis] + 0.5) / n)
+    alternating_sign = (-1.0) ** np.arange(n - 2)
+
+    nodes = []
+    weights = []
+    a = 1.0e-8
+    for _ in range(num_decades):
+        b = a * 10.0
+        nodes.append(cos_k * (0.5 * (b - a)) + 0.5 * (b + a))
+
+        # Same steps as Chebyshev, applied to each node's unit vector (rows of the identity matrix)
+        c = (2.0 / n) * np.eye(n) @ cos_jk
+        con = 0.25 * (b - a)
+        cint = np.zeros((n, n))
+        j = np.arange(1, n - 1)
+        cint[:, 1:n - 1] = con * (c[:, 0:n - 2] - c[:, 2:n]) / j
+        cint[:, n - 1] = con * c[:, n - 2] / (n - 1)
+        # Chebyshev assigns cint[0] in its loop over j, so each iteration adds cint[n - 1] with alternating sign
+        cint[:, 0] = 2.0 * (cint[:, 1:n - 1] @ alternating_sign + cint[:, n - 1] * np.sum(-alternating_sign))
+        d = np.zeros(n)
+        dd = np.zeros(n)
+        y = (2.0 * b - a - b) * (1.0 / (b - a))
+        for j in range(n - 1, 0, -1):
+            d, dd = 2.0 * y * d - dd + cint[:, j], d
+        weights.append(y * d - dd + 0.5 * cint[:, 0])
+        a = b
+
+    return np.concatenate(nodes), np.concatenate(weights)
+
+
+def image_series(x: float, e: float, alpha: float, t: np.ndarray) -> np.ndarray:
+    """
+    Sum of the images of a point source/sink between boundaries (see thetaY and thetaZ), for all times at once. The
+    series is truncated by a term count precomputed over all times: images on either side are added while any of their
+    terms exceeds esp2, with at least the image j = 0 and its nearest image j = -1, which is where thetaY and thetaZ
+    truncate it.
+    :param x: coordinate of the point source/sink relative to the target (m)
+    :type x: float
+    :param e: distance between the boundaries (m)
+    :type e: float
+    :param alpha: thermal diffusivity (m2/s)
+    :type alpha: float
+    :param t: times (s)
+    :type t: np.ndarray
+    :return: image series at each time
+    :rtype: np.ndarray
+    """
+    coeff = 1.0 / np.sqrt(math.pi * alpha * t)
+
+    def term(j: int) -> np.ndarray:
+        return coeff * np.exp(-(x + 2 * j * e) * (x + 2 * j * e) / 4.0 / alpha / t)
+
+    images = [0, -1]
+    j = 1
+    while np.any(np.abs(term(j)) > esp2):
+        images.append(j)
+        j += 1
+    j = -2
+    while np.any(np.abs(term(j)) > esp2):
+        images.append(j)
+        j -= 1
+
+    return np.sum([term(j) for j in images], axis=0)
+
+
+def inverselaplace_times(cls: WellBores, NL: int, time_operation: np.ndarray, pressure: PlainQuantity) -> np.ndarray:
+    """
+    Numerical Laplace transformation algorithm (see inverselaplace) for all times of operation at once: the Chebyshev
+    quadrature of the point source/sink solution is evaluated as arrays over all Laplace variables of all times.
+    :param NL: number of Stehfest terms
+    :type NL: int
+    :param time_operation: times of operation
+    :type time_operation: np.ndarray
+    :param pressure: Lithostatic pressure, per https://github.com/NREL/GEOPHIRES-X/issues/113#issuecomment-1941951134
+    :return: Toutlet at each time of operation
+    :rtype: np.ndarray
+    """
+    V = stehfest_coefficients(NL)[1:NL + 1]
+    Az = 0.6931471805599453 / np.asarray(time_operation, dtype=float)
+    sp = Az[:, np.newaxis] * np.arange(1, NL + 1)  # Laplace variables, of shape (times, NL)
+
+    # pointsource is the product of a function of time and exp(-sp * t), so the former is evaluated once per node
+    yy, zz = cls.y_well, cls.z_well
+    yt, zt = cls.y_well, cls.z_well - 0.078
+    nodes, weights = chebyshev_quadrature()
+    source = (1.0 / (cls.rhorock * cls.cprock * 4.0)) * (
+        image_series(yt - yy, cls.y_boundary, cls.alpha_rock, nodes)
+        + image_series(yt + yy, cls.y_boundary, cls.alpha_rock, nodes)
+    ) * (
+        image_series(zt - zz, cls.z_boundary, cls.alpha_rock, nodes)
+        + image_series(zt + zz, cls.z_boundary, cls.alpha_rock, nodes)
+    )
+    chebeve = np.exp(-sp[..., np.newaxis] * nodes) @ (weights * source) + (
+        1 / sp * (np.exp(-sp * 1.0e5) - np.exp(-sp * 1.0e30))
+    ) / (cls.y_boundary * cls.z_boundary) / cls.rhorock / cls.cprock
+
+    # Duhamel convolution (see laplace_solution)
+    ss = 1.0 / sp / chebeve
+    Toutletl = (cls.Tini - cls.Tinj.value) / sp * np.exp(
+        -sp * ss / cls.q_circulation / 24.0 / density_water_kg_per_m3(
+            cls.Tini, pressure=pressure) / heat_capacity_water_J_per_kg_per_K(
+            cls.Tini, pressure=pressure) * cls.Nonvertical_length.value - sp / cls.velocity * cls.Nonvertical_length.value)
+
+    return cls.Tini - Az * (Toutletl @ V)
+
+
 class AGSWellBores(WellBores):
     """
     AGSWellBores Child class of WellBores; it is the same, but has advanced AGS closed-loop functionality
@@ -450,7 +583,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, and is used to initialize the class
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
 
         # Initialize the superclass first to gain access to those variables
         super().__init__(model)
@@ -549,7 +682,7 @@ def __init__(self, model: Model):
         # results are stored here and in the parent ProducedTemperature array
         self.Tini = 0.0
 
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: __init__', __class__)
 
     def __str__(self):
         return 'AGSWellBores'
@@ -563,7 +696,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)  # read the default parameters
         # if we call super, we don't need to deal with setting the parameters here, just deal with the special cases
         # for the variables in this class because the call to the super.read_parameters will set all the variables,
@@ -593,7 +726,7 @@ def read_parameters(self, model: Model) -> None:
         # inputs we already have - needs to be set at ReadParameter time so values set at the latest possible time
         self.krock = model.reserv.krock.value  # same units are GEOPHIRES
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: read_parameters', __class__)
 
 
     def calculatedrillinglengths(self, model) -> tuple:
@@ -622,7 +755,7 @@ def initialize(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: initialize', __class__)
 
         if self.Fluid.value == WorkingFluid.WATER:
             if self.Configuration.value == Configuration.ULOOP:
@@ -674,7 +807,7 @@ def initialize(self, model: Model) -> None:
             self.TPh = self.additional_mat['TPh']
             self.hPs = self.additional_mat['hPs']
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: initialize', __class__)
 
     def getTandP(self, model: Model) -> None:
         """
@@ -683,7 +816,7 @@ def getTandP(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: getTandP', __class__)
 
         # code from Koenraad
         self.point = (
@@ -699,7 +832,7 @@ def getTandP(self, model: Model) -> None:
         self.Tout[0] = self.Tout[1]
         self.Pout[0] = self.Pout[1]
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: getTandP', __class__)
 
     def verify(self, model: Model) -> int:
         """
@@ -710,7 +843,7 @@ def verify(self, model: Model) -> int:
         :return: 0 if all OK, 1 if error.
         :rtype: int
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: verify', __class__)
 
         self.error = 0
         errors = []
@@ -735,7 +868,7 @@ def on_invalid_parameter_value(err_msg):
             on_invalid_parameter_value(f'{model.reserv.gradient1.Name} must be between '
                                        f'30 and 70 {TemperatureGradientUnit.DEGREESCPERKM.value}')
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: verify', __class__)
 
         return self.error
 
@@ -810,7 +943,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         if model.reserv.Trock.value > model.reserv.Tmax.value:
             s = f'{model.reserv.Trock.Name} ({model.reserv.Trock.value}) exceeds ' \
@@ -851,11 +984,16 @@ def Calculate(self, model: Model) -> None:
             self.NonverticalPressureDrop.value = [0.0] * model.surfaceplant.plant_lifetime.value
 
             t = self.time_operation.value
+            times_operation = []
             while self.time_operation.value <= self.time_max:
+                times_operation.append(self.time_operation.value)
+                self.time_operation.value += self.al
+            Toutlet = inverselaplace_times(self, 16, np.array(times_operation), model.reserv.lithostatic_pressure())
+
+            for time_operation, Toutlet_year in zip(times_operation, Toutlet):
                 # MIR figure out how to calculate year and extract Tini from reserv Tresoutput array
-                year = math.trunc(self.time_operation.value / self.al)
-                self.NonverticalProducedTemperature.value[year] = inverselaplace(
-                    self, 16, 0, model.reserv.lithostatic_pressure())
+                year = math.trunc(time_operation / self.al)
+                self.NonverticalProducedTemperature.value[year] = float(Toutlet_year)
                 # update alpha_fluid value based on next temperature of reservoir
 
                 self.alpha_fluid = self.WaterThermalConductivity.value / density_water_kg_per_m3(
@@ -865,7 +1003,6 @@ def Calculate(self, model: Model) -> None:
                     self.NonverticalProducedTemperature.value[year],
                     pressure=model.reserv.hydrostatic_pressure()
                 ) * 24.0 * 3600.0
-                self.time_operation.value += self.al
 
             self.time_operation.value = t  # set it back for use in later loop
             # interpolate the result to a longer array
@@ -979,7 +1116,8 @@ def Calculate(self, model: Model) -> None:
 
                 raise RuntimeError(msg)
 
-            self.initialize(model)
+            with model.stage('AGS Database Load'):
+                self.initialize(model)
             self.getTandP(model)
 
             # Deep Copy the Arrays
@@ -1030,7 +1168,7 @@ def Calculate(self, model: Model) -> None:
 
         self._sync_output_params_from_input_params()
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
     def __str__(self):
         return 'AGSWellBores'
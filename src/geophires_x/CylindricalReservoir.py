@@ -1,6 +1,5 @@
 import math
 import os
-import sys
 from functools import lru_cache
 
 import numpy as np
@@ -38,7 +37,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)  # initialize the parent parameters and variables
 
         self.InputDepth = self.ParameterDict[self.InputDepth.Name] = floatParameter(
@@ -152,7 +151,7 @@ def __init__(self, model: Model):
             CurrentUnits=TemperatureUnit.CELSIUS,
         )
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return 'CylindricalReservoir'
@@ -168,7 +167,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
 
         super().read_parameters(model)
 
@@ -189,7 +188,7 @@ def read_parameters(self, model: Model) -> None:
         else:
             model.logger.info('No parameters read because no content provided')
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: read_parameters', __class__)
 
     @lru_cache(maxsize=1024)
     def Calculate(self, model: Model) -> None:
@@ -208,7 +207,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         # specify time-stepping vectors
         self.timevector.value = np.linspace(
@@ -251,7 +250,7 @@ def Calculate(self, model: Model) -> None:
             pressure=self.hydrostatic_pressure()
         )
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
     def lithostatic_pressure(self) -> PlainQuantity:
         """@override"""
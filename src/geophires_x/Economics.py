@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import math
-import sys
 # noinspection PyPackageRequirements
 import numpy as np
 import numpy_financial as npf
@@ -17,10 +16,11 @@
     overnight_capital_cost_output_parameter, CONSTRUCTION_CAPEX_SCHEDULE_PARAMETER_NAME, \
     _YEAR_INDEX_VALUE_EXPLANATION_SNIPPET
 from geophires_x.GeoPHIRESUtils import quantity
+from geophires_x.OutputProjection import SAM_CASH_FLOW, SAM_CASH_FLOW_PROFILE
 from geophires_x.OptionList import Configuration, WellDrillingCostCorrelation, EconomicModel, EndUseOptions, PlantType, \
     _WellDrillingCostCorrelationCitation
 from geophires_x.Parameter import intParameter, floatParameter, OutputParameter, ReadParameter, boolParameter, \
-    coerce_int_params_to_enum_values, listParameter, Parameter
+    coerce_int_params_to_enum_values, listParameter, Parameter, strParameter
 from geophires_x.SurfacePlantUtils import MAX_CONSTRUCTION_YEARS
 from geophires_x.Units import *
 from geophires_x.WellBores import calculate_total_drilling_lengths_m
@@ -597,7 +597,7 @@ def __init__(self, model: Model):
         :return: None
         """
 
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
 
         # These dictionaries contain a list of all the parameters set in this object, stored as "Parameter" and
         # "OutputParameter" Objects.  This will allow us later to access them in a user interface and get that list,
@@ -605,6 +605,20 @@ def __init__(self, model: Model):
         self.ParameterDict = {}
         self.OutputParameterDict = {}
 
+        # Read by the model before the parameters of any element, since currency parameters are converted with it (see
+        # Model.exchange_rates)
+        self.exchange_rates = self.ParameterDict[self.exchange_rates.Name] = strParameter(
+            'Exchange Rates',
+            DefaultValue='',
+            Required=False,
+            Provided=False,
+            ErrMessage='assume the exchange rates of the shipped exchange rate table',
+            ToolTipText='Exchange rates in units of currency per USD, as semicolon-separated currency: rate '
+                        'pairs (e.g. EUR: 0.92; GBP: 0.79), which are used instead of the rates of the exchange '
+                        'rate table shipped with GEOPHIRES to convert costs given in other currencies. '
+                        'Rates of currencies not in the table may be added.',
+        )
+
         # Note: setting Valid to False for any of the cost parameters forces GEOPHIRES to use it's builtin cost engine.
         # This is the default.
         self.econmodel = self.ParameterDict[self.econmodel.Name] = intParameter(
@@ -938,7 +952,7 @@ def __init__(self, model: Model):
         self.timestepsperyear = self.ParameterDict[self.timestepsperyear.Name] = intParameter(
             "Time steps per year",
             DefaultValue=4,
-            AllowableRange=list(range(1, 101, 1)),
+            AllowableRange=range(1, 101, 1),
             UnitType=Units.NONE,
             Required=True,
             ErrMessage="assume default number of time steps per year (4)",
@@ -1010,7 +1024,7 @@ def __init__(self, model: Model):
         self.royalty_escalation_rate_start_year = self.ParameterDict[self.royalty_escalation_rate_start_year.Name] = intParameter(
             'Royalty Rate Escalation Start Year',
             DefaultValue=1,
-            AllowableRange=list(range(1, model.surfaceplant.plant_lifetime.AllowableRange[-1], 1)),
+            AllowableRange=range(1, model.surfaceplant.plant_lifetime.AllowableRange[-1], 1),
             UnitType=Units.PERCENT,
             PreferredUnits=PercentUnit.TENTH,
             CurrentUnits=PercentUnit.TENTH,
@@ -1203,10 +1217,10 @@ def __init__(self, model: Model):
         self.bond_financing_start_year = self.ParameterDict[self.bond_financing_start_year.Name] = intParameter(
             bond_financing_start_year_name,
             DefaultValue=default_bond_financing_start_year,
-            AllowableRange=list(range(
+            AllowableRange=range(
                 min_bond_financing_start_year,
                 latest_allowed_bond_financing_start_year_index + 1,
-                1)),
+                1),
             UnitType=Units.TIME,
             PreferredUnits=TimeUnit.YEAR,
             CurrentUnits=TimeUnit.YEAR,
@@ -1523,7 +1537,7 @@ def __init__(self, model: Model):
         self.HeatEscalationStart = self.ParameterDict[self.HeatEscalationStart.Name] = intParameter(
             "Heat Escalation Start Year",
             DefaultValue=5,
-            AllowableRange=list(range(0, 101, 1)),
+            AllowableRange=range(0, 101, 1),
             UnitType=Units.TIME,
             PreferredUnits=TimeUnit.YEAR,
             CurrentUnits=TimeUnit.YEAR,
@@ -1568,7 +1582,7 @@ def __init__(self, model: Model):
         self.ElecEscalationStart = self.ParameterDict[self.ElecEscalationStart.Name] = intParameter(
             "Electricity Escalation Start Year",
             DefaultValue=5,
-            AllowableRange=list(range(0, 101, 1)),
+            AllowableRange=range(0, 101, 1),
             UnitType=Units.TIME,
             PreferredUnits=TimeUnit.YEAR,
             CurrentUnits=TimeUnit.YEAR,
@@ -1607,7 +1621,7 @@ def __init__(self, model: Model):
         self.CoolingEscalationStart = self.ParameterDict[self.CoolingEscalationStart.Name] = intParameter(
             "Cooling Escalation Start Year",
             DefaultValue=5,
-            AllowableRange=list(range(0, 101, 1)),
+            AllowableRange=range(0, 101, 1),
             UnitType=Units.TIME,
             PreferredUnits=TimeUnit.YEAR,
             CurrentUnits=TimeUnit.YEAR,
@@ -1646,7 +1660,7 @@ def __init__(self, model: Model):
         self.CarbonEscalationStart = self.ParameterDict[self.CarbonEscalationStart.Name] = intParameter(
             "Carbon Escalation Start Year",
             DefaultValue=0,
-            AllowableRange=list(range(0, 101, 1)),
+            AllowableRange=range(0, 101, 1),
             UnitType=Units.TIME,
             PreferredUnits=TimeUnit.YEAR,
             CurrentUnits=TimeUnit.YEAR,
@@ -1796,7 +1810,7 @@ def __init__(self, model: Model):
         self.PTCDuration = self.ParameterDict[self.PTCDuration.Name] = intParameter(
             "Production Tax Credit Duration",
             DefaultValue=10,
-            AllowableRange=list(range(0, 100, 1)),
+            AllowableRange=range(0, 100, 1),
             UnitType=Units.TIME,
             PreferredUnits=TimeUnit.YEAR,
             CurrentUnits=TimeUnit.YEAR,
@@ -2375,7 +2389,7 @@ def __init__(self, model: Model):
                         'project lifetime.'
         )
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def read_parameters(self, model: Model) -> None:
         """
@@ -2393,7 +2407,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
 
         def _warn(_msg: str) -> None:
             print(f'Warning: {_msg}')
@@ -2663,7 +2677,7 @@ def _warn(_msg: str) -> None:
             convertible_unit(self.accrued_financing_during_construction_percentage.CurrentUnits)
         ).magnitude
 
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: read_parameters', __class__)
 
     def sync_interest_rate(self, model):
         def discount_rate_display() -> str:
@@ -2717,7 +2731,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         # capital costs
         self.calculate_wellfield_costs(model)
@@ -2780,7 +2794,7 @@ def Calculate(self, model: Model) -> None:
                 'MW').magnitude * self.jobs_created_per_MW_electricity.value))
 
         self._calculate_derived_outputs(model)
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
     @property
     def _indirect_cost_factor(self) -> float:
@@ -3520,6 +3534,9 @@ def calculate_cashflow(self, model: Model) -> None:
 
     def _calculate_sam_economics(self, model: Model) -> None:
         non_calculated_output_placeholder_val = -1
+        # the cash flow table is only assembled if outputs that are read from it are requested (see OutputProjection)
+        cash_flow = model.requires_output_step(SAM_CASH_FLOW)
+        cash_flow_profile = model.requires_output_step(SAM_CASH_FLOW_PROFILE)
         self.sam_economics_calculations: SamEconomicsCalculations = calculate_sam_economics(model)
 
         # Setting capex_total distinguishes capex from CCap's display name of 'Total capital costs',
@@ -3538,6 +3555,13 @@ def _calculate_sam_economics(self, model: Model) -> None:
         ).to(self.interest_during_construction.CurrentUnits.value).magnitude
 
 
+        self.wacc.value = self.sam_economics_calculations.wacc.value
+        self.nominal_discount_rate.value = self.sam_economics_calculations.nominal_discount_rate.value
+        self.ProjectIRR.value = non_calculated_output_placeholder_val  # SAM calculates After-Tax IRR instead
+
+        if not cash_flow:
+            return
+
         if self.royalty_rate.Provided:
             # ignore pre-revenue year(s) (e.g. Year 0)
             pre_revenue_years_slice_index = model.surfaceplant.construction_years.value
@@ -3573,15 +3597,15 @@ def _calculate_sam_economics(self, model: Model) -> None:
             ).to(self.royalty_holder_total_revenue.CurrentUnits).magnitude
 
 
-        self.wacc.value = self.sam_economics_calculations.wacc.value
-        self.nominal_discount_rate.value = self.sam_economics_calculations.nominal_discount_rate.value
         self.ProjectNPV.value = self.sam_economics_calculations.project_npv.quantity().to(
             convertible_unit(self.ProjectNPV.CurrentUnits)).magnitude
 
-        self.ProjectIRR.value = non_calculated_output_placeholder_val  # SAM calculates After-Tax IRR instead
         self.after_tax_irr.value = self.sam_economics_calculations.after_tax_irr.quantity().to(
             convertible_unit(self.ProjectIRR.CurrentUnits)).magnitude
 
+        if not cash_flow_profile:
+            return
+
         self.ProjectMOIC.value = self.sam_economics_calculations.moic.value
         self.ProjectVIR.value = self.sam_economics_calculations.project_vir.value
 
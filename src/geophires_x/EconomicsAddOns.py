@@ -1,5 +1,4 @@
 import math
-import sys
 import os
 import numpy as np
 import numpy_financial as npf
@@ -40,7 +39,7 @@ def __init__(self, model: Model):
         :return: None
         """
 
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)  # initialize the parent parameters and variables
         sclass = str(__class__).replace("<class \'", "")
         self.MyClass = sclass.replace("\'>", "")
@@ -209,7 +208,7 @@ def multi_addon_tooltip_text(param_name: str) -> str:
             CurrentUnits=CurrencyFrequencyUnit.MDOLLARSPERYEAR
         )
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: __init__', __class__)
 
     def read_parameters(self, model: Model) -> None:
         """
@@ -221,7 +220,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)  # read the parameters for the parent.
 
         is_sam_econ_model = model.economics.econmodel.value == EconomicModel.SAM_SINGLE_OWNER_PPA
@@ -266,7 +265,7 @@ def read_parameters(self, model: Model) -> None:
             if key.startswith("AddOn Profit Gained"):
                 val = float(model.InputParameters[key].sValue)
                 self.AddOnProfitGainedPerYear.value.append(val)  # this assumes they put the values in the file in consecutive fashion
-        model.logger.info(f"complete {__class__!s}: {sys._getframe().f_code.co_name}")
+        model.logger.info('complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model) -> None:
         """
@@ -284,7 +283,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info(f"Init {str(__class__)}: {sys._getframe().f_code.co_name}")
+        model.logger.info('Init %s: Calculate', __class__)
 
         is_sam_em = model.economics.econmodel.value == EconomicModel.SAM_SINGLE_OWNER_PPA
 
@@ -412,7 +411,7 @@ def Calculate(self, model: Model) -> None:
             self.LCOE.value, self.LCOH.value, LCOC = Economics.CalculateLCOELCOHLCOC(self, model)
 
         self._calculate_derived_outputs(model)
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
     def __str__(self):
         return "EconomicsAddOns"
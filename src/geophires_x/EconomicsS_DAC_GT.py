@@ -1,4 +1,3 @@
-import sys
 import os
 import numpy as np
 from geophires_x.Parameter import floatParameter, OutputParameter, ReadParameter
@@ -41,7 +40,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, and is used to initialize the class
         """
-        model.logger.info(f"Init {str(__class__)}: {sys._getframe().f_code.co_name}")
+        model.logger.info('Init %s: __init__', __class__)
 
         # These dictionaries contains a list of all the parameters set in this object, stored as "Parameter" and
         # OutputParameter Objects.  This will allow us later to access them in a user interface and get that list,
@@ -336,7 +335,7 @@ def __init__(self, model: Model):
             CurrentUnits=CostPerMassUnit.DOLLARSPERTONNE
         )
 
-        model.logger.info(f"Complete {str(__class__)}: {sys._getframe().f_code.co_name}")
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "EconomicsS_DAC_GT"
@@ -350,7 +349,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f"Init {str(__class__)}: {sys._getframe().f_code.co_name}")
+        model.logger.info('Init %s: read_parameters', __class__)
 
         # Deal with all the parameter values that the user has provided.  They should really only provide values
         # that they want to change from the default values, but they can provide a value that is already set because it
@@ -375,7 +374,7 @@ def read_parameters(self, model: Model) -> None:
                     # none in this case so far
         else:
             model.logger.info("No parameters read becuase no content provided")
-        model.logger.info(f"read parameters complete {str(__class__)}: {sys._getframe().f_code.co_name}")
+        model.logger.info('read parameters complete %s: read_parameters', __class__)
 
     def calculate_CRF(self, wacc: float, num_years: float) -> float:
         """
@@ -566,7 +565,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: Calculate', __class__)
 
         # This is where all the calculations are made using all the values that have been set.
         # If you subclass this class, you can choose to run these calculations before (or after) your calculations,
@@ -681,4 +680,4 @@ def Calculate(self, model: Model) -> None:
         #       model.economics.CarbonCummCashFlow.value[i] = model.economics.CarbonCummCashFlow.value[i - 1] + model.economics.CarbonRevenue.value[i]
 
         self._calculate_derived_outputs(model)
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: Calculate', __class__)
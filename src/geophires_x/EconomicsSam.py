@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 from dataclasses import dataclass, field
-from functools import lru_cache
 from math import isnan
 from pathlib import Path
 from typing import Any
@@ -52,6 +52,7 @@
 )
 from geophires_x.GeoPHIRESUtils import is_float, is_int, sig_figs, quantity
 from geophires_x.OptionList import EconomicModel, EndUseOptions
+from geophires_x.OutputProjection import SAM_CASH_FLOW, SAM_CASH_FLOW_PROFILE
 from geophires_x.Parameter import Parameter, OutputParameter, floatParameter, listParameter
 from geophires_x.Units import convertible_unit, EnergyCostUnit, CurrencyUnit, Units
 
@@ -61,9 +62,9 @@
 
 @dataclass
 class SamEconomicsCalculations:
-    _sam_cash_flow_profile_operational_years: list[list[Any]]
+    _sam_cash_flow_profile_operational_years: list[list[Any]] | None
     """
-    Operational cash flow profile from SAM financial engine
+    Operational cash flow profile from SAM financial engine (None if the cash flow table was not assembled)
     """
 
     pre_revenue_costs_and_cash_flow: PreRevenueCostsAndCashflow
@@ -286,8 +287,26 @@ def _validate_construction_capex_schedule(
     return capex_schedule
 
 
-@lru_cache(maxsize=12)
 def calculate_sam_economics(model: Model) -> SamEconomicsCalculations:
+    """
+    The calculations are memoized on the model (in model.sam_economics_calculations_cache) until it is reset, so that
+    concurrently calculated models do not share or evict each other's calculations.
+
+    If the model has an output projection (see geophires_x.OutputProjection) that requests none of the results read
+    from the cash flow table (after-tax IRR, NPV, royalties, and the results of the cash flow profile), the table is not
+    assembled; likewise, MOIC, VIR and payback period are only calculated if requested.
+    """
+
+    if model.sam_economics_calculations_cache is None:
+        model.sam_economics_calculations_cache = _calculate_sam_economics(model)
+
+    return model.sam_economics_calculations_cache
+
+
+def _calculate_sam_economics(model: Model) -> SamEconomicsCalculations:
+    cash_flow = model.requires_output_step(SAM_CASH_FLOW)
+    cash_flow_profile = model.requires_output_step(SAM_CASH_FLOW_PROFILE)
+
     custom_gen = CustomGeneration.new()
     grid = Grid.from_existing(custom_gen)
     utility_rate = UtilityRate.from_existing(custom_gen)
@@ -320,14 +339,17 @@ def calculate_sam_economics(model: Model) -> SamEconomicsCalculations:
             mapping[2].value(k, v)
             mapping_result.append([module_name, k, v])
 
-    mapping_tabulated = tabulate(mapping_result, **{'floatfmt': ',.2f'})
-    mapping_msg = f'SAM Economics Parameter Mapping:\n{mapping_tabulated}'
-    model.logger.info(mapping_msg)
+    if model.logger.isEnabledFor(logging.INFO):  # (tabulating the mapping is relatively expensive)
+        mapping_tabulated = tabulate(mapping_result, **{'floatfmt': ',.2f'})
+        mapping_msg = f'SAM Economics Parameter Mapping:\n{mapping_tabulated}'
+        model.logger.info(mapping_msg)
 
     for module in modules:
         module.execute()
 
-    cash_flow_operational_years = _calculate_sam_economics_cash_flow_operational_years(model, single_owner)
+    cash_flow_operational_years = (
+        _calculate_sam_economics_cash_flow_operational_years(model, single_owner) if cash_flow else None
+    )
 
     def sf(_v: float, num_sig_figs: int = 5) -> float:
         return sig_figs(_v, num_sig_figs)
@@ -342,10 +364,17 @@ def sf(_v: float, num_sig_figs: int = 5) -> float:
     )
 
     sam_economics.lcoe_nominal.value = sf(single_owner.Outputs.lcoe_nom)
-    sam_economics.after_tax_irr.value = sf(_get_after_tax_irr_pct(single_owner, cash_flow_operational_years, model))
+    sam_economics.capex.value = single_owner.Outputs.adjusted_installed_cost * 1e-6
 
+    sam_economics.nominal_discount_rate.value, sam_economics.wacc.value = _calculate_nominal_discount_rate_and_wacc_pct(
+        model, single_owner
+    )
+
+    if not cash_flow:
+        return sam_economics
+
+    sam_economics.after_tax_irr.value = sf(_get_after_tax_irr_pct(single_owner, cash_flow_operational_years, model))
     sam_economics.project_npv.value = sf(_get_project_npv_musd(single_owner, cash_flow_operational_years, model))
-    sam_economics.capex.value = single_owner.Outputs.adjusted_installed_cost * 1e-6
 
     if model.economics.royalty_rate.Provided:
         # Assumes that royalties opex is the only possible O&M production-based expense - this logic will need to be
@@ -360,14 +389,12 @@ def sf(_v: float, num_sig_figs: int = 5) -> float:
 
         sam_economics._royalties_rate_schedule = model.economics.get_royalty_rate_schedule(model)
 
-    sam_economics.nominal_discount_rate.value, sam_economics.wacc.value = _calculate_nominal_discount_rate_and_wacc_pct(
-        model, single_owner
-    )
-    sam_economics.moic.value = _calculate_moic(sam_economics.sam_cash_flow_profile, model)
-    sam_economics.project_vir.value = _calculate_project_vir(sam_economics.sam_cash_flow_profile, model)
-    sam_economics.project_payback_period.value = _calculate_project_payback_period(
-        sam_economics.sam_cash_flow_profile, model
-    )
+    if cash_flow_profile:
+        # (the profile is assembled once for all the results that are read from it)
+        sam_cash_flow_profile = sam_economics.sam_cash_flow_profile
+        sam_economics.moic.value = _calculate_moic(sam_cash_flow_profile, model)
+        sam_economics.project_vir.value = _calculate_project_vir(sam_cash_flow_profile, model)
+        sam_economics.project_payback_period.value = _calculate_project_payback_period(sam_cash_flow_profile, model)
 
     return sam_economics
 
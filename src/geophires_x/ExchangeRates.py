@@ -0,0 +1,153 @@
+"""
+Offline currency exchange rates for converting cost inputs and outputs given in currencies other than USD (see
+geophires_x.Parameter.ConvertUnits and ConvertOutputUnits).
+
+Rates are looked up in a versioned rate table that is shipped with GEOPHIRES (exchange_rates.json), so that currency
+conversion is deterministic and does not depend on a network service. The table is loaded once per process. Users can
+override or add rates for the date of their study with the 'Exchange Rates' input parameter, and applications can plug
+in their own provider by setting Model.exchange_rate_provider.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from typing import Mapping
+from typing import Protocol
+
+EXCHANGE_RATE_TABLE_FILE_PATH = Path(__file__).parent / 'exchange_rates.json'
+
+# The currency that costs are calculated in, and that override rates are given per unit of
+EXCHANGE_RATE_OVERRIDE_CURRENCY = 'USD'
+
+
+class ExchangeRateProvider(Protocol):
+
+    def rate(self, from_currency: str, to_currency: str) -> float:
+        """
+        :return: The units of to_currency that one unit of from_currency is worth
+        :raises ValueError: If the rate of either currency is not known
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class ExchangeRateTable:
+    """
+    A table of the rates of currencies (as ISO 4217 codes), in units of the currency per unit of the base currency, as
+    of the given date.
+    """
+
+    version: int
+    date: str
+    source: str
+    base_currency: str
+    rates: Mapping[str, float]
+
+    def rate(self, from_currency: str, to_currency: str) -> float:
+        """
+        :return: The units of to_currency that one unit of from_currency is worth
+        :raises ValueError: If the rate of either currency is not in the table
+        """
+        for currency in (from_currency, to_currency):
+            if currency not in self.rates:
+                raise ValueError(
+                    f'No exchange rate for {currency} in exchange rate table version {self.version} ({self.date}). '
+                    "Provide its rate with the 'Exchange Rates' parameter."
+                )
+
+        return self.rates[to_currency] / self.rates[from_currency]
+
+    def with_overrides(self, overrides: Mapping[str, float]) -> ExchangeRateTable:
+        """
+        :param overrides: Rates in units of the currency per USD, which replace or are added to the rates of the table
+        :return: A copy of the table with USD as the base currency and the overrides applied
+        """
+        if EXCHANGE_RATE_OVERRIDE_CURRENCY in overrides:
+            raise ValueError(
+                f'Exchange rates are given per {EXCHANGE_RATE_OVERRIDE_CURRENCY}; '
+                f'{EXCHANGE_RATE_OVERRIDE_CURRENCY} cannot be overridden.'
+            )
+
+        usd_rate = self.rates[EXCHANGE_RATE_OVERRIDE_CURRENCY]
+        rates = {currency: rate / usd_rate for currency, rate in self.rates.items()}
+        rates.update(overrides)
+
+        return ExchangeRateTable(
+            version=self.version,
+            date=self.date,
+            source=f'{self.source}, with user-provided rates for {", ".join(overrides)}',
+            base_currency=EXCHANGE_RATE_OVERRIDE_CURRENCY,
+            rates=rates,
+        )
+
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> ExchangeRateTable:
+        return ExchangeRateTable(
+            version=int(d['version']),
+            date=str(d['date']),
+            source=str(d['source']),
+            base_currency=str(d['base_currency']),
+            rates={str(currency): float(rate) for currency, rate in d['rates'].items()},
+        )
+
+
+@lru_cache
+def load_exchange_rate_table(file_path: Path = EXCHANGE_RATE_TABLE_FILE_PATH) -> ExchangeRateTable:
+    """
+    Loads an exchange rate table file; each file is read only once per process.
+    """
+    with open(file_path, encoding='UTF-8') as f:
+        return ExchangeRateTable.from_dict(json.load(f))
+
+
+def parse_exchange_rate_overrides(overrides: str) -> dict[str, float]:
+    """
+    :param overrides: Rates in units of the currency per USD, as semicolon-separated currency: rate pairs, e.g.
+        'EUR: 0.92; GBP: 0.79'
+    :raises ValueError: If the overrides are malformed
+
+    >>> parse_exchange_rate_overrides('EUR: 0.92; gbp:0.79;')
+    {'EUR': 0.92, 'GBP': 0.79}
+    """
+    ret = {}
+    for entry in overrides.split(';'):
+        if entry.strip() == '':
+            continue
+
+        currency, _, rate = entry.partition(':')
+        currency = currency.strip().upper()
+        try:
+            ret[currency] = float(rate)
+        except ValueError as ve:
+            raise ValueError(
+                f'Invalid exchange rate "{entry.strip()}": expected "currency: rate", e.g. "EUR: 0.92"'
+            ) from ve
+
+        if currency == '' or not ret[currency] > 0:
+            raise ValueError(f'Invalid exchange rate "{entry.strip()}": expected a currency and a positive rate')
+
+    return ret
+
+
+@lru_cache(maxsize=64)
+def exchange_rate_table(overrides: str | None = None) -> ExchangeRateTable:
+    """
+    :param overrides: The value of the 'Exchange Rates' parameter, if provided (see parse_exchange_rate_overrides)
+    :return: The shipped exchange rate table, with the overrides applied; cached per process for each overrides value
+    """
+    table = load_exchange_rate_table()
+    if overrides is None:
+        return table
+
+    return table.with_overrides(parse_exchange_rate_overrides(overrides))
+
+
+def get_exchange_rates(model) -> ExchangeRateProvider:
+    """
+    :return: The exchange rate provider of the model, or the shipped table for models that have none (e.g. HIP-RA)
+    """
+    return getattr(model, 'exchange_rates', None) or exchange_rate_table()
@@ -1,98 +1,218 @@
 #! python
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+
+import cProfile
 import logging
-import logging.config
-import os
 import sys
 from pathlib import Path
+from typing import Iterable
 
 import geophires_x.Model as Model
 import geophires_x.OptionList as OptionList
+from geophires_x.OutputProjection import OutputProjection
+from geophires_x.OutputsJson import output_parameters_to_json_dict
+from geophires_x.OutputsStructured import write_structured_result
+from geophires_x.Parameter import OutputParameter
+from geophires_x.Parameter import ParameterEntry
+
+
+def get_output_parameter_dicts(model: Model.Model) -> list[dict[str, OutputParameter]]:
+    """
+    :return: The output parameter dicts of the model's calculated elements, in the order they are merged into the JSON
+        output (i.e. later dicts take precedence for duplicate parameter names)
+    """
+    output_parameter_dicts = [
+        model.reserv.OutputParameterDict,
+        model.wellbores.OutputParameterDict,
+        model.economics.OutputParameterDict,
+        model.surfaceplant.OutputParameterDict,
+    ]
+    if model.economics.DoAddOnCalculations.value:
+        output_parameter_dicts.append(model.addeconomics.OutputParameterDict)
+    if model.economics.DoSDACGTCalculations.value:
+        output_parameter_dicts.append(model.sdacgteconomics.OutputParameterDict)
+
+    return output_parameter_dicts
 
 
-def main(enable_geophires_logging_config=True):
+def get_output_parameters(model: Model.Model) -> dict[str, OutputParameter]:
+    """
+    :return: The calculated output parameters of the model by name, i.e. the values written to the JSON output
+    """
+    output_parameters = {}
+    for output_parameter_dict in get_output_parameter_dicts(model):
+        output_parameters.update(output_parameter_dict)
+
+    return output_parameters
+
+
+def main(
+    enable_geophires_logging_config=True,
+    headless=False,
+    input_file=None,
+    output_file=None,
+    outputs: Iterable[str] | None = None,
+    input_parameters: dict[str, ParameterEntry] | None = None,
+):
     """
     This is the main function for the GEOPHIRESv3 model.  It is called when the user runs the model from the command
     line.  It is also called by the GUI when the user clicks the "Run Model" button.
-    :param enable_geophires_logging_config: If True, the logging.conf file will be used to configure logging.  If False,
-    logging will be configured in the Model class.
-    :return: None
+    :param enable_geophires_logging_config: If True, the logging.conf file will be used to configure logging (once per
+    process).  If False, logging is left as configured by the caller.
+    :param headless: If True, no outputs are rendered (text, JSON, HTML, or console) and the calculated output
+    parameters are returned instead. This avoids report formatting overhead for callers that only need the values,
+    such as optimization or Monte Carlo loops.
+    :param input_file: The input file path. If neither input_file nor output_file is provided, they are read from the
+    command line arguments (input file, then output file).
+    :param output_file: The output file path; defaults to HDR.out in the current working directory. The JSON output is
+    written next to it.
+    :param outputs: The names of the output parameters to calculate (see get_output_parameters), if only some are
+    needed by a headless run. Optional post-processing that produces none of them is skipped, and only they are
+    converted to their output units and returned (see geophires_x.OutputProjection).
+    :param input_parameters: The input parameters, if they have already been read from input_file (e.g. by the command
+    line program while checking for case blocks), in which case input_file is not read again
+    :return: None, or the calculated output parameters by name if headless is True
+    :raises ValueError: If outputs are given for a run that is not headless, or any of them is not an output of the
+    model
+
+    Paths are passed explicitly, and main does not change the working directory or any other process-wide state, so
+    simulations may be run concurrently in threads of one process.
     """
     original_cwd: Path = Path.cwd().absolute()
 
-    # set the starting directory to be the directory that this file is in
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    if outputs is not None:
+        if not headless:
+            raise ValueError('Outputs can only be projected for headless runs')
+        outputs = list(outputs)
+
+    if input_file is None and output_file is None:
+        # called as a command line program
+        if len(sys.argv) > 1:
+            input_file = sys.argv[1]
+        if len(sys.argv) > 2:
+            output_file = sys.argv[2]
+
+    if output_file is None:
+        output_file = Path(original_cwd, 'HDR.out')
+    output_file = str(output_file)
 
     if enable_geophires_logging_config:
         # set up logging.
-        logging.config.fileConfig('logging.conf')
+        Model.configure_geophires_logging()
 
     logger = logging.getLogger('root')
-    logger.info(f'Init {str(__name__)}')
+    logger.info('Init %s', __name__)
 
     # initiate the entire model
-    model = Model.Model(enable_geophires_logging_config=enable_geophires_logging_config)
+    model = Model.Model(
+        enable_geophires_logging_config=enable_geophires_logging_config,
+        input_file=str(input_file) if input_file is not None else None,
+        output_file=output_file,
+        input_parameters=input_parameters,
+    )
 
     # read the parameters that apply to the model
     model.read_parameters(default_output_path=original_cwd)
 
+    if outputs is not None:
+        model.output_projection = OutputProjection(outputs)
+        model.output_projection.validate(get_output_parameters(model))
+
+    # profile the calculations and output writing, if requested
+    profiler = _start_profiler(model)
+
     # Calculate the entire model
     model.Calculate()
 
+    if headless:
+        # convert output units as they would be for the written outputs, without writing them
+        model.outputs._convert_units(model, output_names=outputs)
+        _stop_profiler(model, profiler)
+        _log_instrumentation(model)
+        logger.info('Complete %s: main (headless)', __name__)
+
+        output_parameters = get_output_parameters(model)
+        if outputs is not None:
+            return {name: output_parameters[name] for name in outputs}
+
+        return output_parameters
+
     # write the outputs, if requested
-    model.outputs.PrintOutputs(model)
+    with model.stage('Text Output'):
+        model.outputs.PrintOutputs(model)
 
     # write the outputs as JSON
-    import jsons, json
+    import json
+
+    with model.stage('JSON Output'):
+        json_merged = output_parameters_to_json_dict(get_output_parameter_dicts(model))
+        if model.outputs.include_timings_in_json_output.value:
+            # timings of the stages preceding the JSON output
+            json_merged['Timings'] = model.timings.to_dict()
+        if model.memory_usage is not None:
+            # memory usage of the stages preceding the JSON output
+            json_merged['Memory Usage'] = model.memory_usage.to_dict()
+
+        output_file_path = Path(output_file)
+        json_outputfile = output_file.replace(output_file_path.name, f'{output_file_path.stem}.json')
+        with open(json_outputfile, 'w', encoding='UTF-8') as f:
+            f.write(json.dumps(json_merged))
+
+    # write the structured result sidecar, which gives clients the output parameter values without parsing the report
+    with model.stage('Structured Result Output'):
+        write_structured_result(get_output_parameters(model), model.outputs.output_file)
 
-    jsons.suppress_warnings(True)
-    json_resrv = jsons.dumps(model.reserv.OutputParameterDict, indent=4, sort_keys=True, supress_warnings=True)
-    json_wells = jsons.dumps(model.wellbores.OutputParameterDict, indent=4, sort_keys=True, supress_warnings=True)
-    json_surfaceplant = jsons.dumps(
-        model.surfaceplant.OutputParameterDict, indent=4, sort_keys=True, supress_warnings=True
-    )
-    json_economics = jsons.dumps(model.economics.OutputParameterDict, indent=4, sort_keys=True, supress_warnings=True)
-    json_merged = {
-        **json.loads(json_resrv),
-        **json.loads(json_wells),
-        **json.loads(json_economics),
-        **json.loads(json_surfaceplant),
-    }
-    if model.economics.DoAddOnCalculations.value:
-        json_addons = jsons.dumps(
-            model.addeconomics.OutputParameterDict, indent=4, sort_keys=True, supress_warnings=True
-        )
-        json_merged = {**json_merged, **json.loads(json_addons)}
-    if model.economics.DoSDACGTCalculations.value:
-        json_sdacgt = jsons.dumps(
-            model.sdacgteconomics.OutputParameterDict, indent=4, sort_keys=True, supress_warnings=True
+    # if the user has asked for it, copy the output file to the screen
+    if model.outputs.printoutput.value:
+        with model.stage('Console Output'):
+            with open(output_file, 'r', encoding='UTF-8') as f:
+                sys.stdout.write('\n')
+                content = f.readlines()  # store all output in one long list
+
+                # Now write each line to the screen
+                for line in content:
+                    sys.stdout.write(line)
+
+    _stop_profiler(model, profiler)
+    _log_instrumentation(model)
+    logger.info('Complete %s: main', __name__)
+
+
+def _log_instrumentation(model: Model.Model) -> None:
+    model.stop_memory_usage_tracking()
+    model.logger.info('Timings: %s', model.timings)
+    if model.memory_usage is not None:
+        model.logger.info('Memory usage: %s', model.memory_usage)
+
+    if model.logger.isEnabledFor(logging.INFO):
+        model.logger.info(
+            'Property calls: %s',
+            ', '.join(
+                f'{name}: {it.calls} calls, {it.unique_keys} unique, {it.hits} hits, {it.misses} misses, '
+                f'{it.cumulative_time_sec:.3f} s'
+                for name, it in model.property_call_stats.items()
+            ),
         )
-        json_merged = {**json_merged, **json.loads(json_sdacgt)}
 
-    json_outputfile = Path(original_cwd, 'HDR.json')
-    if len(sys.argv) > 2:
-        output_arg = str(sys.argv[2])
-        output_arg_path = Path(output_arg)
-        json_outputfile = output_arg.replace(output_arg_path.name, f'{output_arg_path.stem}.json')
-    with open(json_outputfile, 'w', encoding='UTF-8') as f:
-        f.write(json.dumps(json_merged))
 
-    # if the user has asked for it, copy the output file to the screen
-    if model.outputs.printoutput.value:
-        outputfile = Path(original_cwd, 'HDR.out')
-        if len(sys.argv) > 2:
-            outputfile = sys.argv[2]
+def _start_profiler(model: Model.Model) -> cProfile.Profile | None:
+    if not model.outputs.profile_output_file.Provided:
+        return None
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
 
-        with open(outputfile, 'r', encoding='UTF-8') as f:
-            sys.stdout.write('\n')
-            content = f.readlines()  # store all output in one long list
 
-            # Now write each line to the screen
-            for line in content:
-                sys.stdout.write(line)
+def _stop_profiler(model: Model.Model, profiler: cProfile.Profile | None) -> None:
+    if profiler is None:
+        return
 
-    logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+    profiler.disable()
+    profiler.dump_stats(model.outputs.profile_output_file.value)
+    model.logger.info('Wrote profile statistics to %s', model.outputs.profile_output_file.value)
 
 
 if __name__ == '__main__':
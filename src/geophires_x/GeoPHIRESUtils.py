@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-import sys
+import os
 from enum import Enum
 from os.path import exists
 import dataclasses
@@ -17,7 +17,8 @@
 
 import CoolProp.CoolProp as CP
 
-from geophires_x.Parameter import ParameterEntry, Parameter
+from geophires_x.Parameter import ParameterEntry, Parameter, OutputParameter, _is_number
+from geophires_x.PropertyCallCounters import count_property_calls
 from geophires_x.Units import get_unit_registry, convertible_unit
 
 _logger = logging.getLogger('root')  # TODO use __name__ instead of root
@@ -93,6 +94,9 @@
 
 _ureg = get_unit_registry()
 
+# CoolProp property lookups, counted so that their number and aggregate time can be reported per run
+PropsSI = count_property_calls('CoolProp.PropsSI')(CP.PropsSI)
+
 
 def InsertImagesIntoHTML(html_path: str, short_names: set, full_names: set) -> None:
     # Write a reference to the image(s) into the HTML file by inserting before the "</body>" tag
@@ -227,6 +231,7 @@ def quantity(value: float, unit: str) -> PlainQuantity:
     return _ureg.Quantity(value, convertible_unit(unit))
 
 
+@count_property_calls('density_water_kg_per_m3')
 @lru_cache
 def density_water_kg_per_m3(Twater_degC: float, pressure: Optional[PlainQuantity] = None) -> float:
     """
@@ -245,10 +250,10 @@ def density_water_kg_per_m3(Twater_degC: float, pressure: Optional[PlainQuantity
 
     try:
         if pressure is not None:
-            return CP.PropsSI('D', 'T', celsius_to_kelvin(Twater_degC), 'P', pressure.to('Pa').magnitude, 'Water')
+            return PropsSI('D', 'T', celsius_to_kelvin(Twater_degC), 'P', pressure.to('Pa').magnitude, 'Water')
         else:
             _logger.warning(f'density_water: No pressure provided, using vapor quality=0 instead')
-            return CP.PropsSI('D', 'T', celsius_to_kelvin(Twater_degC), 'Q', 0, 'Water')
+            return PropsSI('D', 'T', celsius_to_kelvin(Twater_degC), 'Q', 0, 'Water')
 
     except (NotImplementedError, ValueError) as e:
         raise ValueError(f'Input temperature & pressure ({Twater_degC}, {pressure}) '
@@ -273,6 +278,7 @@ def celsius_to_kelvin(celsius: float) -> float:
     return celsius + CELSIUS_TO_KELVIN_CONSTANT
 
 
+@count_property_calls('viscosity_water_Pa_sec')
 @lru_cache
 def viscosity_water_Pa_sec(
     Twater_degC: float,
@@ -291,16 +297,17 @@ def viscosity_water_Pa_sec(
 
     try:
         if pressure is not None:
-            return CP.PropsSI('V', 'T', celsius_to_kelvin(Twater_degC), 'P', pressure.to('Pa').magnitude, 'Water')
+            return PropsSI('V', 'T', celsius_to_kelvin(Twater_degC), 'P', pressure.to('Pa').magnitude, 'Water')
         else:
             _logger.warning(f'viscosity_water: No pressure provided, using vapor quality=0 instead')
-            return CP.PropsSI('V', 'T', celsius_to_kelvin(Twater_degC), 'Q', 0, 'Water')
+            return PropsSI('V', 'T', celsius_to_kelvin(Twater_degC), 'Q', 0, 'Water')
 
     except (NotImplementedError, ValueError) as e:
         raise ValueError(f'Input temperature & pressure ({Twater_degC}, {pressure}) '
                          f'are out of range or otherwise could not be used to calculate water viscosity.') from e
 
 
+@count_property_calls('heat_capacity_water_J_per_kg_per_K')
 @lru_cache
 def heat_capacity_water_J_per_kg_per_K(
     Twater_degC: float,
@@ -327,16 +334,17 @@ def heat_capacity_water_J_per_kg_per_K(
 
     try:
         if pressure is not None:
-            return CP.PropsSI('C', 'T', celsius_to_kelvin(Twater_degC), 'P', pressure.to('Pa').magnitude, 'Water')
+            return PropsSI('C', 'T', celsius_to_kelvin(Twater_degC), 'P', pressure.to('Pa').magnitude, 'Water')
         else:
             _logger.warning(f'heat_capacity_water: No pressure provided, using vapor quality=0 instead')
-            return CP.PropsSI('C', 'T', celsius_to_kelvin(Twater_degC), 'Q', 0, 'Water')
+            return PropsSI('C', 'T', celsius_to_kelvin(Twater_degC), 'Q', 0, 'Water')
 
     except (NotImplementedError, ValueError) as e:
         raise ValueError(f'Input temperature & pressure ({Twater_degC}, {pressure}) '
                          f'are out of range or otherwise could not be used to calculate heat capacity of water.') from e
 
 
+@count_property_calls('RecoverableHeat')
 @lru_cache
 def RecoverableHeat(Twater_degC: float) -> float:
     """
@@ -368,6 +376,7 @@ def RecoverableHeat(Twater_degC: float) -> float:
     return recoverable_heat
 
 
+@count_property_calls('vapor_pressure_water_kPa')
 @lru_cache
 def vapor_pressure_water_kPa(temperature_degC: float) -> float:
     """
@@ -388,13 +397,14 @@ def vapor_pressure_water_kPa(temperature_degC: float) -> float:
         raise ValueError(f'Input temperature ({temperature_degC}C) must be greater than or equal to 0')
 
     try:
-        return (quantity(CP.PropsSI('P', 'T', celsius_to_kelvin(temperature_degC), 'Q', 0, 'Water'), 'Pa')
+        return (quantity(PropsSI('P', 'T', celsius_to_kelvin(temperature_degC), 'Q', 0, 'Water'), 'Pa')
                 .to('kPa').magnitude)
 
     except (NotImplementedError, ValueError) as e:
         raise ValueError(f'Input temperature ({temperature_degC}C) is out of range or otherwise not implemented') from e
 
 
+@count_property_calls('entropy_water_kJ_per_kg_per_K')
 @lru_cache
 def entropy_water_kJ_per_kg_per_K(temperature_degC: float, pressure: Optional[PlainQuantity] = None) -> float:
     """
@@ -417,14 +427,15 @@ def entropy_water_kJ_per_kg_per_K(temperature_degC: float, pressure: Optional[Pl
 
     try:
         if pressure is not None:
-            return CP.PropsSI('S', 'T', celsius_to_kelvin(temperature_degC),
+            return PropsSI('S', 'T', celsius_to_kelvin(temperature_degC),
                               'P', pressure.to('Pa').magnitude, 'Water') * 1e-3
         else:
-            return CP.PropsSI('S', 'T', celsius_to_kelvin(temperature_degC), 'Q', 0, 'Water') * 1e-3
+            return PropsSI('S', 'T', celsius_to_kelvin(temperature_degC), 'Q', 0, 'Water') * 1e-3
     except (NotImplementedError, ValueError) as e:
         raise ValueError(f'Input temperature {temperature_degC} is out of range or otherwise not implemented') from e
 
 
+@count_property_calls('enthalpy_water_kJ_per_kg')
 @lru_cache
 def enthalpy_water_kJ_per_kg(temperature_degC: float, pressure: Optional[PlainQuantity] = None) -> float:
     """
@@ -447,15 +458,16 @@ def enthalpy_water_kJ_per_kg(temperature_degC: float, pressure: Optional[PlainQu
 
     try:
         if pressure is not None:
-            return CP.PropsSI('H', 'T', celsius_to_kelvin(temperature_degC),
+            return PropsSI('H', 'T', celsius_to_kelvin(temperature_degC),
                               'P', pressure.to('Pa').magnitude, 'Water') * 1e-3
         else:
-            return CP.PropsSI('H', 'T', celsius_to_kelvin(temperature_degC), 'Q', 0, 'Water') * 1e-3
+            return PropsSI('H', 'T', celsius_to_kelvin(temperature_degC), 'Q', 0, 'Water') * 1e-3
 
     except (NotImplementedError, ValueError) as e:
         raise ValueError(f'Input temperature {temperature_degC} is out of range or otherwise not implemented') from e
 
 
+@count_property_calls('UtilEff_func')
 @lru_cache
 def UtilEff_func(temperature_degC: float) -> float:
     """
@@ -479,13 +491,181 @@ def UtilEff_func(temperature_degC: float) -> float:
     return util_eff
 
 
-def read_input_file(return_dict_1, logger=None, input_file_name=None):
+def input_data_file_path(file_name: str) -> str:
+    """
+    :param file_name: The name of a data file provided in an input parameter, such as a district heating demand CSV or a
+        reservoir output file
+    :return: The path to read the file from. Relative names are relative to the geophires_x package directory, where
+        GEOPHIRES has always resolved them (historically by changing the working directory to it); resolving them
+        explicitly leaves the process working directory alone.
+    """
+
+    if os.path.isabs(file_name):
+        return file_name
+
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), file_name)
+
+
+def parse_input_line(raw_line: str) -> ParameterEntry | None:
+    """
+    Parses a line of an input file into a parameter entry
+    :param raw_line: The line, formatted as "<name>, <value>[, <comment>]"
+    :return: The parameter entry, or None if the line is a comment or does not contain a parameter
+    """
+
+    line = raw_line.strip()
+    if any([line.startswith(x) for x in ['#', '--', '*']]):
+        # skip any line that starts with "#" - # will be the comment parameter
+        return None
+
+    # now deal with the comma delimited parameters
+    # split on a comma - that should give us major divisions,
+    # Could be:
+    # 1) Desc and Val (2 elements),
+    # 2) Desc and Val with Unit (2 elements, Unit split from Val by space),
+    # 3) Desc, Val, and comment (3 elements),
+    # 4) Desc, Val with Unit, Comment (3 elements, Unit split from Val by space)
+    # If there are more than 3 commas, we are going to assume it is parseable,
+    # and that the commas are in the comment
+    elements = line.split(',')
+
+    if len(elements) < 2:
+        # not enough commas, so must not be data to parse
+        return None
+
+    # we have good data, so make initial assumptions
+    description = elements[0].strip()
+    s_val = elements[1].strip()
+    comment = ""  # cases 1 & 2 - no comment
+    if len(elements) == 3:  # cases 3 & 4
+        comment = elements[2].strip()
+
+    if len(elements) > 3:
+        # too many commas, so assume they are in comments
+        for i in range(2, len(elements), 1):
+            comment = comment + elements[i]
+
+    # done with parsing, now create the object
+    return ParameterEntry(description, s_val, comment, line)
+
+
+# Suffixes of typed input files, whose values are numbers, lists of numbers, booleans and strings rather than text
+TYPED_INPUT_FILE_SUFFIXES = ('.json', '.toml')
+
+_TYPED_VALUE_FIELDS = {'value', 'units', 'comment'}
+
+
+def _typed_value_text(value: Any) -> str:
+    # Integral numbers are written as integers, as they would be in text input files (e.g. 1 for integer options)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+
+    return str(value)
+
+
+def typed_parameter_entry(name: str, typed_value: Any) -> ParameterEntry | None:
+    """
+    Makes a parameter entry from a parameter of a typed (JSON or TOML) input file
+    :param name: The parameter name
+    :param typed_value: The value (a number, list of numbers, boolean or string), or an object with the value, its units
+        and an optional comment, e.g. {"value": 3, "units": "kilometer"}. Values without units are in the units of the
+        parameter in the GEOPHIRES JSON schema (geophires-request.json).
+    :return: The entry, whose sValue is the text of the value (as special cases of reading parameters rely on it), or
+        None if the value is null
+    :raises ValueError: If the value or its fields are not of the types parameters can have
+    """
+
+    units = None
+    comment = ''
+    if isinstance(typed_value, dict):
+        if 'value' not in typed_value or not typed_value.keys() <= _TYPED_VALUE_FIELDS:
+            raise ValueError(f'{name} must have a value and may have units and a comment, not {sorted(typed_value)}')
+
+        units = typed_value.get('units')
+        comment = typed_value.get('comment', '')
+        if not isinstance(units, (str, type(None))) or not isinstance(comment, str):
+            raise ValueError(f'The units and comment of {name} must be strings')
+
+        typed_value = typed_value['value']
+
+    if typed_value is None:
+        return None
+
+    if isinstance(typed_value, list):
+        if not all(_is_number(it) for it in typed_value):
+            raise ValueError(f'{name} must be a list of numbers: {typed_value}')
+        s_value = ', '.join(_typed_value_text(it) for it in typed_value)
+    elif isinstance(typed_value, (bool, int, float, str)):
+        s_value = _typed_value_text(typed_value)
+    else:
+        raise ValueError(f'{name} must be a number, list of numbers, boolean, or string: {typed_value}')
+
+    return ParameterEntry(name, s_value, comment, f'{name}, {s_value}', value=typed_value, units=units)
+
+
+def read_typed_input_file(input_file_name) -> dict[str, ParameterEntry]:
+    """
+    Reads a typed input file: a JSON object or TOML table of parameter values by parameter name (see
+    typed_parameter_entry), e.g. {"Reservoir Depth": {"value": 3, "units": "kilometer"}, "Gradient 1": 50}. Keys
+    starting with $ (such as $schema) are ignored.
+    :param input_file_name: The path of the JSON (.json) or TOML (.toml) input file
+    :return: The parameter entries by name
+    :raises ValueError: If the file is not an object of parameter values
+    """
+
+    if str(input_file_name).lower().endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+
+        with open(input_file_name, 'rb') as f:
+            document = tomllib.load(f)
+    else:
+        with open(input_file_name, encoding='UTF-8') as f:
+            document = json.load(f)
+
+    if not isinstance(document, dict):
+        raise ValueError(f'{input_file_name} must contain an object of parameter values by parameter name')
+
+    entries = {}
+    for name, typed_value in document.items():
+        if name.startswith('$'):
+            continue
+
+        entry = typed_parameter_entry(name, typed_value)
+        if entry is not None:
+            entries[name] = entry
+
+    return entries
+
+
+def parse_case_header(raw_line: str) -> str | None:
+    """
+    Parses the header line of a case block of a multi-case input file
+    :param raw_line: The line, formatted as "[<case name>]"
+    :return: The case name, or None if the line is not a case header
+    """
+
+    line = raw_line.strip()
+    if len(line) > 2 and line.startswith('[') and line.endswith(']'):
+        return line[1:-1].strip()
+
+    return None
+
+
+def read_input_file(return_dict_1, logger=None, input_file_name=None, return_cases=None):
     """
     Read input file and return a dictionary of parameters
     :param return_dict_1: dictionary of parameters
     :param logger: logger object
-    :return: dictionary of parameters
+    :param return_cases: dictionary of the cases of a multi-case input file, by case name. A multi-case input file has
+        a base block of parameters (which are read into return_dict_1) followed by named case blocks, each starting
+        with a "[<case name>]" header line and containing only the parameters that the case overrides (which are read
+        into a dictionary of parameters for the case). See geophires_x.MultiCase.
+    :return: dictionary of parameters. Typed input files (.json or .toml) are read with read_typed_input_file.
     :rtype: dict
+    :raises ValueError: If the input file has case blocks but return_cases is not provided, or has duplicate case names
 
     FIXME modifies dict instead of returning it - it should do what the doc says it does and return a dict instead,
       relying on mutation of parameters is Bad
@@ -496,20 +676,24 @@ def read_input_file(return_dict_1, logger=None, input_file_name=None):
 
     logger.info(f'Init {__name__}')
 
-    # Specify path of input file - it will always be the first command line argument.
-    # If it doesn't exist, simply run the default model without any inputs
+    # If no input file is provided, simply run the default model without any inputs.
+    # (The input file is passed explicitly, rather than read from the command line arguments, so that models can be run
+    # concurrently in one process; see GEOPHIRESv3.main.)
 
     # read input data (except input from optional filenames)
     if input_file_name is None:
-        logger.warning('Input file name not provided, checking sys.argv')
-        if len(sys.argv) > 1:
-            input_file_name = sys.argv[1]
-            logger.warning(f'Using input file from sys.argv: {input_file_name}')
+        logger.info('Input file name not provided, running the default model')
 
     if input_file_name is not None:
         content = []
         if exists(input_file_name):
             logger.info(f'Found filename: {input_file_name}. Proceeding with run using input parameters from that file')
+            if str(input_file_name).lower().endswith(TYPED_INPUT_FILE_SUFFIXES):
+                # typed input files are read without parsing text lines
+                return_dict_1.update(read_typed_input_file(input_file_name))
+                logger.info('Complete %s: read_input_file', __name__)
+                return
+
             with open(input_file_name, encoding='UTF-8') as f:
                 # store all input in one long string that will be passed to all objects
                 # so they can parse out their specific parameters (and ignore the rest)
@@ -520,42 +704,25 @@ def read_input_file(return_dict_1, logger=None, input_file_name=None):
         # successful read of data into list.  Now make a dictionary with all the parameter entries.
         # Index will be the unique name of the parameter.
         # The value will be a "ParameterEntry" structure, with name, value (optionally with units), optional comment
+        entries = return_dict_1
         for raw_line in content:
-            line = raw_line.strip()
-            if any([line.startswith(x) for x in ['#', '--', '*']]):
-                # skip any line that starts with "#" - # will be the comment parameter
-                continue
-
-            # now deal with the comma delimited parameters
-            # split on a comma - that should give us major divisions,
-            # Could be:
-            # 1) Desc and Val (2 elements),
-            # 2) Desc and Val with Unit (2 elements, Unit split from Val by space),
-            # 3) Desc, Val, and comment (3 elements),
-            # 4) Desc, Val with Unit, Comment (3 elements, Unit split from Val by space)
-            # If there are more than 3 commas, we are going to assume it is parseable,
-            # and that the commas are in the comment
-            elements = line.split(',')
-
-            if len(elements) < 2:
-                # not enough commas, so must not be data to parse
+            case_name = parse_case_header(raw_line)
+            if case_name is not None:
+                if return_cases is None:
+                    raise ValueError(
+                        f'{input_file_name} is a multi-case input file (it has a case block: {raw_line.strip()}); '
+                        f'run its cases with geophires_x.MultiCase.run_cases'
+                    )
+                if case_name in return_cases:
+                    raise ValueError(f'Duplicate case name in {input_file_name}: {case_name}')
+
+                # the following entries (until the next case header) are the overrides of the case
+                entries = return_cases[case_name] = {}
                 continue
 
-                # we have good data, so make initial assumptions
-            description = elements[0].strip()
-            s_val = elements[1].strip()
-            comment = ""  # cases 1 & 2 - no comment
-            if len(elements) == 3:  # cases 3 & 4
-                comment = elements[2].strip()
-
-            if len(elements) > 3:
-                # too many commas, so assume they are in comments
-                for i in range(2, len(elements), 1):
-                    comment = comment + elements[i]
-
-            # done with parsing, now create the object and add to the dictionary
-            p_entry = ParameterEntry(description, s_val, comment, line)
-            return_dict_1[description] = p_entry  # make the dictionary element
+            p_entry = parse_input_line(raw_line)
+            if p_entry is not None:
+                entries[p_entry.Name] = p_entry  # make the dictionary element
 
     else:
         logger.warning(
@@ -563,7 +730,7 @@ def read_input_file(return_dict_1, logger=None, input_file_name=None):
             'Proceeding with default parameter run...'
         )
 
-    logger.info(f'Complete {__name__}: {sys._getframe().f_code.co_name}')
+    logger.info('Complete %s: read_input_file', __name__)
 
 
 class _EnhancedJSONEncoder(json.JSONEncoder):
@@ -575,9 +742,15 @@ class _EnhancedJSONEncoder(json.JSONEncoder):
     """
 
     def default(self, o):
+        if isinstance(o, (Parameter, OutputParameter)):
+            return o.to_dict()
+
         if dataclasses.is_dataclass(o):
             return dataclasses.asdict(o)
 
+        if isinstance(o, range):
+            return list(o)
+
         if issubclass(o, Enum):
             def get_entry(member) -> dict[str, Any]:
                 d = {
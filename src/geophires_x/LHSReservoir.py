@@ -1,8 +1,8 @@
-import sys
 # import os
 import math
 import numpy as np
 from mpmath import *
+from mpmath import MPContext
 import geophires_x.Model as Model
 from .Reservoir import Reservoir
 
@@ -32,11 +32,11 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)  # initialize the parent parameters and variables
         sclass = str(__class__).replace("<class \'", "")
         self.myClass = sclass.replace("\'>", "")
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return 'LHSReservoir'
@@ -52,7 +52,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
 
         # if we call super, we don't need to deal with setting the parameters here,
         # just deal with the special cases for the variables in this class
@@ -60,7 +60,7 @@ def read_parameters(self, model: Model) -> None:
         # including the ones that are specific to this class
         super().read_parameters(model)  # read the parameters for the parent.
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model):
         """
@@ -72,7 +72,7 @@ def Calculate(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
         super().Calculate(model)  # run calculate for the parent.
 
         # specify rock properties
@@ -104,15 +104,19 @@ def Calculate(self, model: Model):
         # number of heat transfer units
         ntu = tres / tau_efr
 
+        # The mpmath context (i.e. working precision) of this calculation, separate from mpmath's global context, which
+        # is shared by all threads
+        ctx = MPContext()
+
         # specify Laplace-space function
-        fp = lambda s: (1 / s) * (1 - exp(-(1 + ntu / (gamma * (s + ntu))) * s))
+        fp = lambda s: (1 / s) * (1 - ctx.exp(-(1 + ntu / (gamma * (s + ntu))) * s))
 
         # calculate non-dimensional temperature array
         Twnd = []
         try:
             for t in range(1, len(model.reserv.timevector.value)):
                 Twnd = Twnd + [float(
-                    invertlaplace(fp, model.reserv.timevector.value[t] * 365. * 24. * 3600. / tres, method='talbot'))]
+                    ctx.invertlaplace(fp, model.reserv.timevector.value[t] * 365. * 24. * 3600. / tres, method='talbot'))]
         except:
             raise RuntimeError('Error: GEOPHIRES could not execute numerical inverse laplace calculation for '
                                'reservoir model 2. '
@@ -126,4 +130,4 @@ def Calculate(self, model: Model):
         model.reserv.Tresoutput.value = np.append([model.reserv.Trock.value], model.reserv.Tresoutput.value)
         model.reserv.Tresoutput.value = np.asarray([model.reserv.Trock.value if x > model.reserv.Trock.value or x < model.wellbores.Tinj.value else x for x in model.reserv.Tresoutput.value])
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: Calculate', __class__)
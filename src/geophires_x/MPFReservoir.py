@@ -1,6 +1,5 @@
-import sys
 
-from mpmath import mp, exp, invertlaplace, sqrt, tanh, workdps
+from mpmath import MPContext
 import numpy as np
 
 import geophires_x.Model as Model
@@ -36,7 +35,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
 
         super().__init__(model)  # initialize the parent parameters and variables
         sclass = str(__class__).replace("<class \'", "")
@@ -46,7 +45,7 @@ def __init__(self, model: Model):
         self.gringarten_stehfest_precision = self.ParameterDict[self.gringarten_stehfest_precision.Name] = intParameter(
             'Gringarten-Stehfest Precision',
             DefaultValue=15,
-            AllowableRange=list(range(8, max_allowed_precision + 1)),
+            AllowableRange=range(8, max_allowed_precision + 1),
             UnitType=Units.NONE,
             Required=False,
             ToolTipText='Sets the numerical precision (decimal places) for the inverse Laplace transform '
@@ -57,7 +56,7 @@ def __init__(self, model: Model):
         )
 
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "MPFReservoir"
@@ -74,14 +73,14 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
         # if we call super, we don't need to deal with setting the parameters here,
         # just deal with the special cases for the variables in this class
         # because the call to the super.readparameters will set all the variables,
         # including the ones that are specific to this class
         super().read_parameters(model)  # read the parameters for the parent.
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: read_parameters', __class__)
 
     # noinspection SpellCheckingInspection,PyUnresolvedReferences,PyProtectedMember
     def Calculate(self, model: Model):
@@ -91,17 +90,21 @@ def Calculate(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
         super().Calculate(model)  # run calculate for the parent.
 
         # convert flowrate to volumetric rate
         q = model.wellbores.nprod.value * model.wellbores.prodwellflowrate.value / model.reserv.rhowater.value  # m^3/s
 
+        # The mpmath context (i.e. working precision) of this calculation. mpmath's global context is shared by all
+        # threads, so concurrent calculations in it would change each other's precision.
+        ctx = MPContext()
+
         # specify Laplace-space function
-        fp = lambda s: (1. / s) * exp(-sqrt(s) * tanh((model.reserv.rhowater.value * model.reserv.cpwater.value * (
+        fp = lambda s: (1. / s) * ctx.exp(-ctx.sqrt(s) * ctx.tanh((model.reserv.rhowater.value * model.reserv.cpwater.value * (
                 q / model.reserv.fracnumbcalc.value / model.reserv.fracwidthcalc.value) * (
                                                                model.reserv.fracsepcalc.value / 2.) / (
-                                                               2. * model.reserv.krock.value * model.reserv.fracheightcalc.value)) * sqrt(s)))
+                                                               2. * model.reserv.krock.value * model.reserv.fracheightcalc.value)) * ctx.sqrt(s)))
 
         # calculate non-dimensional time
         td = ((model.reserv.rhowater.value * model.reserv.cpwater.value) ** 2 / (4 * model.reserv.krock.value * model.reserv.rhorock.value * model.reserv.cprock.value) *
@@ -115,18 +118,16 @@ def Calculate(self, model: Model):
             precision = (
                 self.gringarten_stehfest_precision.value
                 if self.gringarten_stehfest_precision.Provided
-                else mp.dps
+                else ctx.dps
             )
 
-            # Use the workdps context manager for a robust, thread-safe solution.
-            # It temporarily sets mp.dps for this block and restores it automatically.
-            with workdps(precision):
-                twnd_list = [
-                    float(invertlaplace(fp, td[t], method='stehfest'))
-                    for t in range(1, len(model.reserv.timevector.value))
-                ]
+            ctx.dps = precision
+            twnd_list = [
+                float(ctx.invertlaplace(fp, td[t], method='stehfest'))
+                for t in range(1, len(model.reserv.timevector.value))
+            ]
 
-                Twnd = np.asarray(twnd_list)
+            Twnd = np.asarray(twnd_list)
 
         except Exception as e_:
             msg = (
@@ -143,5 +144,5 @@ def Calculate(self, model: Model):
         model.reserv.Tresoutput.value = model.reserv.Trock.value - (Twnd * (model.reserv.Trock.value - model.wellbores.Tinj.value))
         model.reserv.Tresoutput.value = np.append([model.reserv.Trock.value], model.reserv.Tresoutput.value)
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: Calculate', __class__)
 
@@ -1,12 +1,27 @@
-import sys
+from __future__ import annotations
+
+import copy
+import dataclasses
+import pickle
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Iterator
 import logging
 import time
+import uuid
 import logging.config
 
 from geophires_x.EconomicsS_DAC_GT import EconomicsS_DAC_GT
-from geophires_x.GeoPHIRESUtils import read_input_file
+from geophires_x.EconomicsSam import SamEconomicsCalculations
+from geophires_x.ExchangeRates import ExchangeRateProvider, exchange_rate_table
+from geophires_x.GeoPHIRESUtils import parse_input_line, read_input_file
+from geophires_x.ModelMemoryUsage import ModelMemoryUsage
+from geophires_x.ModelTimings import ModelTimings
+from geophires_x.OutputProjection import OutputProjection
+from geophires_x.PropertyCallCounters import PropertyCallStats, collect_property_call_stats
 from geophires_x.OutputsAddOns import OutputsAddOns
+from geophires_x.Parameter import OutputParameter, Parameter, ParameterEntry, ReadParameter, parse_bool
 from geophires_x.OutputsS_DAC_GT import OutputsS_DAC_GT
 from geophires_x.TDPReservoir import TDPReservoir
 from geophires_x.WellBores import WellBores
@@ -42,51 +57,227 @@
 from geophires_x.AGSOutputs import AGSOutputs
 from geophires_x.EconomicsAddOns import EconomicsAddOns
 
+# Input parameters that are read when the model is constructed, to decide which elements it is made of (and whether to
+# track memory usage), rather than by read_parameters; they cannot be overridden by Model.reset.
+_CONSTRUCTION_INPUT_PARAMETER_NAMES = (
+    'Track Memory Usage',
+    'Trace Memory Allocations',
+    'Reservoir Model',
+    'Is AGS',
+    'Economic Model',
+    'Power Plant Type',
+    'AddOn Nickname 1',
+    'Do S-DAC-GT Calculations',
+)
+
+# Attribute names of the elements of the model
+_ELEMENT_NAMES = ('reserv', 'wellbores', 'surfaceplant', 'economics', 'outputs', 'addeconomics', 'addoutputs',
+                  'sdacgteconomics', 'sdacgtoutputs')
+
+# Attributes of the model that belong to a single run in a single process rather than to the model, which are not saved
+# in snapshots (see Model.save_snapshot) but recreated when a snapshot is loaded
+_PER_RUN_ATTRIBUTE_NAMES = (
+    'logger', 'tic', 'timings', 'property_call_stats', 'memory_usage', 'sam_economics_calculations_cache'
+)
+
+_logging_configured = False
+_logging_configuration_lock = threading.Lock()
+
+
+def configure_geophires_logging() -> None:
+    """
+    Configures logging from logging.conf, once per process. (Reconfiguring replaces the handlers of the root logger,
+    which is not safe while other models are running and logging in other threads.)
+    """
+
+    global _logging_configured
+    with _logging_configuration_lock:
+        if not _logging_configured:
+            logging.config.fileConfig(
+                Path(Path(__file__).parent, 'logging.conf'),
+                defaults={'log_file_path': Path(Path(__file__).parent, 'all_messages_conf.log').as_posix()},
+            )
+            root_logger = logging.getLogger('root')
+            root_logger.setLevel(logging.INFO)
+            for handler in root_logger.handlers:
+                handler.addFilter(_RunIdFilter())
+            _logging_configured = True
+
+
+def _parameter_state(parameter: Parameter | OutputParameter) -> tuple[Parameter | OutputParameter, Any, Any]:
+    # list values may be modified in place, e.g. when they are read or converted to other units
+    return parameter, parameter.__getstate__(), copy.copy(parameter.value)
+
+
+def _restore_parameter_state(parameter: Parameter | OutputParameter, state: Any, value: Any) -> None:
+    parameter.__setstate__(state)
+    parameter.value = copy.copy(value)
+
+
+def new_run_id() -> str:
+    """
+    :return: A new ID for correlating the log records of a run (see ModelLogger), unique across processes
+    """
+
+    return uuid.uuid4().hex[:12]
+
+
+def _discard_log_record(*args, **kwargs) -> None:
+    pass
+
+
+class _RunIdFilter(logging.Filter):
+    """Gives records that were not logged through a ModelLogger an empty run ID, for formats that include it"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'run_id'):
+            record.run_id = '-'
+
+        return True
+
+
+class ModelLogger(logging.LoggerAdapter):
+    """
+    The logger of a single Model, which tags its records with the model's ID (as the model_id record attribute) and
+    the ID of its current run (as the run_id record attribute) so that the logs of models running concurrently, in
+    threads or processes, can be told apart.
+
+    Messages should be passed with %-style arguments (e.g. logger.info('Init %s: %s', __class__, name)) rather than
+    formatted eagerly, so that nothing is formatted for records below the logging level. Debug and info records are
+    also gated at zero cost: while their level is disabled, debug and info are no-ops, without the level checks of
+    logging. The gate is refreshed by refresh_level_gate, which the model calls when it starts reading its parameters
+    and calculating, so changes to the level take effect from the next stage on.
+    """
+
+    _GATED_LEVELS = (('debug', logging.DEBUG), ('info', logging.INFO))
+
+    def __init__(self, model_id: str, run_id: str | None = None):
+        super().__init__(logging.getLogger('root'), {'model_id': model_id, 'run_id': run_id or new_run_id()})
+        self.refresh_level_gate()
+
+    @property
+    def run_id(self) -> str:
+        return self.extra['run_id']
+
+    def start_run(self, run_id: str | None = None) -> None:
+        """
+        Tags subsequent records with a new run ID (e.g. for each case of a parameter sweep of a reset model)
+        """
+
+        self.extra = {**self.extra, 'run_id': run_id or new_run_id()}
+        self.refresh_level_gate()
+
+    def refresh_level_gate(self) -> None:
+        for method_name, level in self._GATED_LEVELS:
+            if self.logger.isEnabledFor(level):
+                self.__dict__.pop(method_name, None)
+            else:
+                setattr(self, method_name, _discard_log_record)
+
+    def process(self, msg, kwargs):
+        kwargs['extra'] = {**self.extra, **kwargs.get('extra', {})}
+        return msg, kwargs
+
+    def fatal(self, msg, *args, **kwargs) -> None:
+        self.critical(msg, *args, **kwargs)
+
 
 class Model(object):
     """
     Model is the container class of the application, giving access to everything else, including the logger
     """
 
-    def __init__(self, enable_geophires_logging_config=True, input_file=None):
+    def __init__(self, enable_geophires_logging_config=True, input_file=None, output_file='HDR.out',
+                 input_parameters: dict[str, ParameterEntry] | None = None, run_id: str | None = None):
         """
         The __init__ function is called automatically every time the class is being used to create a new object.
+        The model does not read the command line arguments or change any other process-wide state (such as the working
+        directory), so models may be constructed and calculated concurrently in threads of one process.
+        :param enable_geophires_logging_config: If True, logging is configured from logging.conf (once per process)
+        :param input_file: The input file path; if None, the default model is run without any inputs
+        :param output_file: The output file path
+        :param input_parameters: The input parameters, if they have already been read (e.g. from the base block and a
+            case block of a multi-case input file), in which case input_file is not read
+        :param run_id: The ID that the model's log records are tagged with (see ModelLogger); by default, a new ID
         :return: Nothing
         """
 
         # get logging started
-        self.logger = logging.getLogger('root') # TODO should be getting __name__ logger instead of root
-
         if enable_geophires_logging_config:
-            logging.config.fileConfig(Path(Path(__file__).parent, 'logging.conf'))
-            self.logger.setLevel(logging.INFO)
+            configure_geophires_logging()
 
-        self.logger.info(f'Init {__class__}: {__name__}')
+        self.logger = ModelLogger(f'{id(self):x}', run_id=run_id)
+
+        self.logger.info('Init %s: %s', __class__, __name__)
 
         # keep track of execution time
         self.tic = time.time()
 
+        # wall and CPU time of each stage of the run (input reading, calculations, and output writers)
+        self.timings = ModelTimings()
+
+        # thermophysical property lookup stats of the run's calculations, by function name; set by Calculate.
+        self.property_call_stats: dict[str, PropertyCallStats] = {}
+
+        # the outputs requested of the run, if only some are; optional steps that produce none of them are skipped by
+        # Calculate (see requires_output_step)
+        self.output_projection: OutputProjection | None = None
+
+        # converts costs given in currencies other than USD; if None, the shipped exchange rate table (with the rates
+        # of the 'Exchange Rates' parameter of the economics, if provided) is used (see exchange_rates)
+        self.exchange_rate_provider: ExchangeRateProvider | None = None
+
         # dictionary to hold all the input parameter the user wants to change
         # This should give us a dictionary with all the parameters the user wants to set.
         # Should be only those value that they want to change from the default.
         # we do this as soon as possible because what we instantiate may depend on settings in this file
         self.InputParameters = {}
 
-        if input_file is None and len(sys.argv) > 1:
-            input_file = sys.argv[1]
-
         # Key step - read the entire provided input file
-        read_input_file(self.InputParameters, logger=self.logger, input_file_name=input_file)
+        with self.timings.stage('Read Input File'):
+            if input_parameters is not None:
+                # (entries are copied because reading may modify them, e.g. to make output file paths absolute)
+                self.InputParameters = {name: dataclasses.replace(entry) for name, entry in input_parameters.items()}
+            else:
+                read_input_file(self.InputParameters, logger=self.logger, input_file_name=input_file)
+
+        # memory usage of each stage of the run, if the user has asked for it. This is read directly from the input
+        # parameters (instead of from self.outputs after read_parameters) so that element initiation can be tracked.
+        self.memory_usage: ModelMemoryUsage | None = None
+        self._start_memory_usage_tracking()
+
+        # the SAM economics calculations of the run, memoized by calculate_sam_economics
+        self.sam_economics_calculations_cache: SamEconomicsCalculations | None = None
 
         # initiate the outputs object
-        output_file = 'HDR.out'
-        if len(sys.argv) > 2:
-            output_file = sys.argv[2]
         self.outputs = Outputs(self, output_file=output_file)
 
         # Initiate the elements of the Model object
         # this is where you can change what class get initiated - the superclass, or one of the subclasses
         self.logger.info("Initiate the elements of the Model")
+        with self.stage('Initiate Elements'):
+            self._initiate_elements(output_file)
+
+        # the state of the model before its parameters are read, which reset restores
+        self._initial_elements: dict[str, Any] = {name: getattr(self, name) for name in _ELEMENT_NAMES}
+        self._initial_input_parameters: dict[str, ParameterEntry] = {
+            name: dataclasses.replace(entry) for name, entry in self.InputParameters.items()
+        }
+        self._initial_parameter_dicts: list[tuple[dict, dict]] = [(d, dict(d)) for d in self._parameter_dicts()]
+        self._initial_parameter_states: list[tuple[Parameter | OutputParameter, Any, Any]] = [
+            _parameter_state(parameter) for d in self._parameter_dicts() for parameter in d.values()
+        ]
+        self._default_output_path: Path | None = None
+
+        self.logger.info('Complete %s: %s', __class__, __name__)
+
+    def _initiate_elements(self, output_file: str) -> None:
+        """
+        Instantiates the elements of the Model (reservoir, wellbores, surface plant, economics, outputs and add-ons)
+        based on the user settings in the input parameters.
+        :param output_file: The output file path passed to the Outputs elements
+        :return: None
+        """
 
         # Assume that SDAC and add-ons are not used
         self.sdacgtoutputs = None
@@ -190,19 +381,204 @@ def __init__(self, enable_geophires_logging_config=True, input_file=None):
                 self.sdacgteconomics: EconomicsS_DAC_GT = EconomicsS_DAC_GT(self)
                 self.sdacgtoutputs: OutputsS_DAC_GT = OutputsS_DAC_GT(self, output_file=output_file)
 
-        self.logger.info(f'Complete {__class__}: {__name__}')
 
+    def _parameter_dicts(self) -> Iterator[dict[str, Parameter | OutputParameter]]:
+        """The input and output parameter dictionaries of the elements of the model"""
+        for name in _ELEMENT_NAMES:
+            element = getattr(self, name)
+            if element is not None:
+                yield element.ParameterDict
+                yield element.OutputParameterDict
 
     def __str__(self):
         return "Model"
 
+    @contextmanager
+    def stage(self, stage_name: str) -> Iterator[None]:
+        """
+        Records the wall and CPU time of the enclosed block as the named stage of the run in self.timings, and its
+        memory usage in self.memory_usage if memory usage tracking is enabled.
+        :param stage_name: The name of the stage
+        """
+        with self.timings.stage(stage_name):
+            if self.memory_usage is None:
+                yield
+            else:
+                with self.memory_usage.stage(stage_name):
+                    yield
+
+    def requires_output_step(self, step: str) -> bool:
+        """
+        :param step: An optional step of the calculations (see geophires_x.OutputProjection)
+        :return: True if the step must run, i.e. all outputs are requested or the step produces a requested output
+        """
+        return self.output_projection is None or self.output_projection.requires(step)
+
+    @property
+    def exchange_rates(self) -> ExchangeRateProvider:
+        """
+        :return: The exchange rate provider of the model if one is set, else the shipped exchange rate table with the
+            rates of the 'Exchange Rates' parameter of the economics applied, once it has been read, which is before the
+            parameters of the elements are (see geophires_x.ExchangeRates)
+        """
+        if self.exchange_rate_provider is not None:
+            return self.exchange_rate_provider
+
+        economics = getattr(self, 'economics', None)
+        overrides = economics.exchange_rates.value if economics is not None else ''
+        return exchange_rate_table(overrides or None)
+
+    def _start_memory_usage_tracking(self) -> None:
+        def _is_true(input_parameter_name: str) -> bool:
+            # parsed like boolean parameters are by ReadParameter
+            entry = self.InputParameters.get(input_parameter_name)
+            if entry is None:
+                return False
+            return bool(entry.value) if entry.value is not None else parse_bool(entry.sValue)
+
+        self.memory_usage = None
+        if _is_true('Track Memory Usage') or _is_true('Trace Memory Allocations'):
+            self.memory_usage = ModelMemoryUsage(trace_allocations=_is_true('Trace Memory Allocations'))
+            self.memory_usage.start()
+
+    def stop_memory_usage_tracking(self) -> None:
+        """
+        Stops tracing memory allocations, if memory usage tracking is enabled. The memory usage of the stages that ran
+        before stopping remains available in self.memory_usage.
+        :return: None
+        """
+        if self.memory_usage is not None:
+            self.memory_usage.stop()
+
     def read_parameters(self, default_output_path: Path = None) -> None:
         """
         The read_parameters function reads the parameters from the input file and stores them in a dictionary.
         :param default_output_path: Relative path for non-absolute output path parameters
         :return: None
         """
-        self.logger.info(f'Init {__class__}: {__name__}')
+        self._default_output_path = default_output_path
+        self.logger.refresh_level_gate()
+        with self.stage('Read Parameters'):
+            self._read_parameters(default_output_path=default_output_path)
+
+    def reset(self, overrides: dict[str, Any] | None = None) -> None:
+        """
+        Resets the model to the state it had when it was constructed, then reads its parameters from the input file
+        with the overrides applied, so that a model may be used as a template for calculating many cases (e.g. in a
+        parameter sweep) without constructing a new one for each. The overrides are read like any other input
+        parameter (with validation and unit conversion), as if they were appended to the input file; the results of
+        Calculate are the same as those of a new model constructed from that input file.
+        :param overrides: Input parameter values by name, e.g. {'Gradient 1': 40, 'Reservoir Depth': '3 kilometer'}.
+            Overrides are not cumulative: each reset starts from the model's input file. Each reset also starts a
+            new run, whose log records are tagged with a new run ID (see ModelLogger).
+        :raises ValueError: If an override changes a parameter that decides which elements the model is made of (such
+            as the reservoir model or power plant type); construct a new model for such cases instead.
+        :return: None
+        """
+        # (entries are copied because reading may modify them, e.g. to make output file paths absolute)
+        input_parameters = {name: dataclasses.replace(entry) for name, entry in self._initial_input_parameters.items()}
+        for name, value in (overrides or {}).items():
+            entry = parse_input_line(f'{name}, {value}')
+            input_parameters[entry.Name] = entry
+
+        for name in _CONSTRUCTION_INPUT_PARAMETER_NAMES:
+            initial_entry = self._initial_input_parameters.get(name)
+            entry = input_parameters.get(name)
+            if (entry.sValue if entry else None) != (initial_entry.sValue if initial_entry else None):
+                raise ValueError(f'{name} cannot be overridden when resetting a model because it decides which '
+                                 f'elements the model is made of. Construct a new model instead.')
+
+        self.InputParameters = input_parameters
+
+        # (reading the parameters replaces the surface plant)
+        for name, element in self._initial_elements.items():
+            setattr(self, name, element)
+        for d, initial_d in self._initial_parameter_dicts:
+            d.clear()
+            d.update(initial_d)
+        for parameter, state, value in self._initial_parameter_states:
+            _restore_parameter_state(parameter, state, value)
+
+        # Reservoir calculations are memoized by reservoir and model (the district heating second pass relies on this),
+        # so the reservoir is replaced with a copy for it to be recalculated. SAM economics are memoized on the model.
+        self.reserv = copy.copy(self.reserv)
+        self.sam_economics_calculations_cache = None
+
+        self.tic = time.time()
+        self.timings = ModelTimings()
+        self.property_call_stats = {}
+        self.stop_memory_usage_tracking()
+        self._start_memory_usage_tracking()
+        self.logger.start_run()
+
+        self.read_parameters(default_output_path=self._default_output_path)
+
+    def save_snapshot(self, path: str | Path) -> None:
+        """
+        Saves the model to a snapshot file, from which copies of it may be loaded with load_snapshot; typically after
+        read_parameters and before Calculate, so that many cases (e.g. the workers of a process pool, or repeated runs
+        of the same input file) can start from the snapshot instead of constructing the model and reading its
+        parameters again. A snapshot loaded from a model that has read its parameters may also be reset (see reset).
+        The snapshot holds only the state of the model, not per-run or per-process state such as its logger, timings
+        and memory usage tracking, which are recreated when it is loaded.
+        :param path: The snapshot file path
+        :return: None
+        """
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load_snapshot(path: str | Path, enable_geophires_logging_config: bool = True) -> Model:
+        """
+        Loads a model from a snapshot file saved with save_snapshot. Snapshots are pickles, so only load snapshots from
+        trusted sources.
+        :param path: The snapshot file path
+        :param enable_geophires_logging_config: If True, logging is configured from logging.conf (once per process)
+        :return: The model, which calculates the same results as the model that the snapshot was saved from
+        """
+        if enable_geophires_logging_config:
+            configure_geophires_logging()
+
+        with open(path, 'rb') as f:
+            model = pickle.load(f)  # noqa: S301
+
+        if not isinstance(model, Model):
+            raise ValueError(f'{path} is not a GEOPHIRES model snapshot')
+
+        model.logger.info('Loaded %s snapshot from %s', __class__, path)
+        return model
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = {name: value for name, value in self.__dict__.items() if name not in _PER_RUN_ATTRIBUTE_NAMES}
+
+        # whether memory usage is tracked is a setting of the model, but what was tracked belongs to the run
+        state['_trace_memory_allocations'] = None if self.memory_usage is None else self.memory_usage.trace_allocations
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        trace_memory_allocations = state.pop('_trace_memory_allocations')
+        self.__dict__.update(state)
+
+        self.logger = ModelLogger(f'{id(self):x}')
+        self.tic = time.time()
+        self.timings = ModelTimings()
+        self.property_call_stats = {}
+        self.sam_economics_calculations_cache = None
+        self.memory_usage = None
+        if trace_memory_allocations is not None:
+            self.memory_usage = ModelMemoryUsage(trace_allocations=trace_memory_allocations)
+            self.memory_usage.start()
+
+    def _read_parameters(self, default_output_path: Path = None) -> None:
+        self.logger.info('Init %s: %s', __class__, __name__)
+
+        # The exchange rates are read before the parameters of any element, since the currency parameters of every
+        # element are converted with them (see exchange_rates)
+        exchange_rates = self.economics.exchange_rates
+        if exchange_rates.Name in self.InputParameters:
+            ReadParameter(self.InputParameters[exchange_rates.Name], exchange_rates, self)
+        # raises ValueError if the rates are malformed
+        exchange_rate_table(exchange_rates.value or None)
 
         # Deal with all the parameter values that the user has provided.  This is handled on a class-by-class basis.
         self.logger.info("Read parameters for the elements of the Model and instantiate new attributes as needed")
@@ -259,7 +635,7 @@ def read_parameters(self, default_output_path: Path = None) -> None:
         if self.surfaceplant.plant_type.value == PlantType.DISTRICT_HEATING:
             self.surfaceplant.CalculateDHDemand(self)  # calculate district heating demand
 
-        self.logger.info(f'complete {str(__class__)}: {__name__}')
+        self.logger.info('complete %s: %s', __class__, __name__)
 
     def Calculate(self):
         """
@@ -268,25 +644,34 @@ def Calculate(self):
          and self.surfaceplant for later use by other functions.
         :return: None
         """
-        self.logger.info(f'Init {__class__}: {__name__}')
+        self.logger.refresh_level_gate()
+        self.logger.info('Init %s: %s', __class__, __name__)
         # calculate the results
         self.logger.info("Run calculations for the elements of the Model")
 
         # This is where all the calculations are made using all the values that have been set.
         # This is handled on a class-by-class basis
 
-        self.reserv.Calculate(self)  # model the reservoir
-        self.wellbores.Calculate(self)  # model the wellbores
-        self.surfaceplant.Calculate(self)  # model the surfaceplant
-
-        # in case of district heating, the surface plant module may have updated the utilization factor,
-        # and therefore we need to recalculate the modules reservoir, wellbore and surface plant.
-        # 1 iteration should be sufficient.
-        if self.surfaceplant.plant_type.value == PlantType.DISTRICT_HEATING:
-            self.reserv.Calculate(self)  # model the reservoir
-            self.wellbores.Calculate(self)  # model the wellbores
-            self.surfaceplant.Calculate(self)  # model the surfaceplant
-
-        self.economics.Calculate(self)  # model the economics
-
-        self.logger.info(f'complete {__class__}: {__name__}')
+        with collect_property_call_stats() as property_call_stats_collector:
+            with self.stage('Reservoir Calculate'):
+                self.reserv.Calculate(self)  # model the reservoir
+            with self.stage('Wellbores Calculate'):
+                self.wellbores.Calculate(self)  # model the wellbores
+            with self.stage('Surface Plant Calculate'):
+                self.surfaceplant.Calculate(self)  # model the surfaceplant
+
+            # in case of district heating, the surface plant module may have updated the utilization factor,
+            # and therefore we need to recalculate the modules reservoir, wellbore and surface plant.
+            # 1 iteration should be sufficient.
+            if self.surfaceplant.plant_type.value == PlantType.DISTRICT_HEATING:
+                with self.stage('District Heating Second Pass'):
+                    self.reserv.Calculate(self)  # model the reservoir
+                    self.wellbores.Calculate(self)  # model the wellbores
+                    self.surfaceplant.Calculate(self)  # model the surfaceplant
+
+            with self.stage('Economics Calculate'):
+                self.economics.Calculate(self)  # model the economics
+
+        self.property_call_stats = property_call_stats_collector.get_stats()
+
+        self.logger.info('complete %s: %s', __class__, __name__)
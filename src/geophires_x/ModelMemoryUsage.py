@@ -0,0 +1,185 @@
+"""
+Per-stage memory usage instrumentation of GEOPHIRES runs, using tracemalloc for Python allocations and the process
+resident set size (RSS) for total memory (which includes allocations by native extensions like h5py and CoolProp).
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class StageMemoryUsage:
+    rss_bytes: int | None
+    """Process resident set size at the end of the stage, if available on the platform"""
+
+    net_rss_bytes: int | None
+    """Process resident set size at the end of the stage minus at the start of the stage"""
+
+    peak_rss_bytes: int | None
+    """Process resident set size high-water mark at the end of the stage, if available on the platform"""
+
+    peak_allocated_bytes: int | None = None
+    """
+    Peak traced Python memory during the stage, relative to the traced memory at the start of the stage, if
+    allocations are traced
+    """
+
+    net_allocated_bytes: int | None = None
+    """
+    Traced Python memory at the end of the stage minus at the start of the stage (negative if memory was freed), if
+    allocations are traced
+    """
+
+
+def _get_rss_bytes() -> int | None:
+    try:
+        with open('/proc/self/statm', encoding='UTF-8') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError, IndexError):
+        return None
+
+
+def _get_peak_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS and in kilobytes on other platforms
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class _ActiveStage:
+    def __init__(self, start_rss_bytes: int | None, start_traced_bytes: int | None):
+        self.start_rss_bytes = start_rss_bytes
+        self.start_traced_bytes = start_traced_bytes
+        self.peak_traced_bytes = start_traced_bytes
+
+
+class ModelMemoryUsage:
+    """
+    Memory usage of each stage of a model run, in the order the stages completed. Stages may be nested (e.g. the AGS
+    database load within the wellbores calculation), in which case the usage of the enclosing stage includes the
+    usage of the nested stage.
+
+    Sampling the process resident set size is cheap. Tracing Python allocations with tracemalloc gives the peak and net
+    allocation of each stage, but slows down runs considerably (by more than an order of magnitude for SBT models), so
+    it is only done if trace_allocations is True.
+    """
+
+    def __init__(self, trace_allocations: bool = False):
+        self.trace_allocations = trace_allocations
+        self.stages: dict[str, StageMemoryUsage] = {}
+        self._active_stages: list[_ActiveStage] = []
+        self._started_tracing = False
+        self._peak_rss_bytes = 0
+
+    def start(self) -> None:
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _update_active_stage_peaks(self) -> int | None:
+        """
+        Folds the traced peak since the last reset into all active stages and resets the traced peak, so that each
+        stage's peak can be measured independently of the stages before it.
+
+        :return: the currently traced memory in bytes, or None if allocations are not being traced
+        """
+
+        if not self._started_tracing or not tracemalloc.is_tracing():
+            return None
+
+        traced_bytes, peak_traced_bytes = tracemalloc.get_traced_memory()
+        for active_stage in self._active_stages:
+            active_stage.peak_traced_bytes = max(active_stage.peak_traced_bytes, peak_traced_bytes)
+
+        # tracemalloc.reset_peak is not available in Python 3.8, where stage peaks are therefore upper bounds that may
+        # include the peaks of preceding stages
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+        return traced_bytes
+
+    @contextmanager
+    def stage(self, stage_name: str) -> Iterator[None]:
+        """
+        Tracks the memory usage of the enclosed block as the named stage. The usage is recorded even if the block
+        raises, so that memory usage up to a failure can still be inspected.
+        """
+
+        active_stage = _ActiveStage(_get_rss_bytes(), self._update_active_stage_peaks())
+        self._active_stages.append(active_stage)
+        try:
+            yield
+        finally:
+            end_traced_bytes = self._update_active_stage_peaks()
+            self._active_stages.remove(active_stage)
+
+            end_rss_bytes = _get_rss_bytes()
+            peak_rss_bytes = _get_peak_rss_bytes()
+            if peak_rss_bytes is not None:
+                # The kernel's RSS counters are synchronized lazily, so its high-water mark may lag slightly behind
+                # the current RSS (or an RSS sampled at the end of a previous stage).
+                peak_rss_bytes = max(peak_rss_bytes, end_rss_bytes or 0, self._peak_rss_bytes)
+                self._peak_rss_bytes = peak_rss_bytes
+
+            stage_memory_usage = StageMemoryUsage(
+                rss_bytes=end_rss_bytes,
+                net_rss_bytes=(
+                    end_rss_bytes - active_stage.start_rss_bytes
+                    if end_rss_bytes is not None and active_stage.start_rss_bytes is not None
+                    else None
+                ),
+                peak_rss_bytes=peak_rss_bytes,
+            )
+            if end_traced_bytes is not None and active_stage.start_traced_bytes is not None:
+                stage_memory_usage.peak_allocated_bytes = (
+                    active_stage.peak_traced_bytes - active_stage.start_traced_bytes
+                )
+                stage_memory_usage.net_allocated_bytes = end_traced_bytes - active_stage.start_traced_bytes
+
+            self.stages[stage_name] = stage_memory_usage
+
+    def to_dict(self) -> dict[str, dict[str, int | None]]:
+        """
+        :return: JSON-serializable memory usage by stage name, in the order the stages completed
+        """
+
+        return {
+            stage_name: {
+                'rss_bytes': it.rss_bytes,
+                'net_rss_bytes': it.net_rss_bytes,
+                'peak_rss_bytes': it.peak_rss_bytes,
+                'peak_allocated_bytes': it.peak_allocated_bytes,
+                'net_allocated_bytes': it.net_allocated_bytes,
+            }
+            for stage_name, it in self.stages.items()
+        }
+
+    def __str__(self) -> str:
+        def _mb(b: int | None) -> str:
+            return f'{b / 1024**2:.1f} MB' if b is not None else 'n/a'
+
+        def _stage_str(stage_name: str, it: StageMemoryUsage) -> str:
+            stage_str = f'{stage_name}: {_mb(it.net_rss_bytes)} net RSS, {_mb(it.peak_rss_bytes)} peak RSS'
+            if it.peak_allocated_bytes is not None:
+                stage_str += (
+                    f', {_mb(it.peak_allocated_bytes)} peak allocated, {_mb(it.net_allocated_bytes)} net allocated'
+                )
+            return stage_str
+
+        return ', '.join(_stage_str(stage_name, it) for stage_name, it in self.stages.items())
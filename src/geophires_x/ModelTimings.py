@@ -0,0 +1,82 @@
+"""
+Per-stage timing instrumentation of GEOPHIRES runs (input reading, module calculations, and output writers).
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class StageTiming:
+    wall_time_sec: float
+    cpu_time_sec: float
+
+    parent_stage: str | None = None
+    """The stage this stage ran within (whose time includes this stage's time), or None for a top-level stage"""
+
+
+class ModelTimings:
+    """
+    Wall time and CPU time of each stage of a model run, in the order the stages completed. Timing is always on; its
+    cost is two clock reads per stage.
+
+    Stages may be nested (e.g. the AGS database load within the wellbores calculation). The totals only include
+    top-level stages, so that the time of nested stages is not counted twice.
+    """
+
+    def __init__(self):
+        self.stages: dict[str, StageTiming] = {}
+        self._active_stage_names: list[str] = []
+
+    @contextmanager
+    def stage(self, stage_name: str) -> Iterator[None]:
+        """
+        Times the enclosed block as the named stage. The timing is recorded even if the block raises, so that the
+        stages that ran before a failure can still be inspected.
+        """
+
+        parent_stage = self._active_stage_names[-1] if self._active_stage_names else None
+        self._active_stage_names.append(stage_name)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.stages[stage_name] = StageTiming(
+                wall_time_sec=time.perf_counter() - start_wall,
+                cpu_time_sec=time.process_time() - start_cpu,
+                parent_stage=parent_stage,
+            )
+            self._active_stage_names.pop()
+
+    @property
+    def total_wall_time_sec(self) -> float:
+        return sum(it.wall_time_sec for it in self.stages.values() if it.parent_stage is None)
+
+    @property
+    def total_cpu_time_sec(self) -> float:
+        return sum(it.cpu_time_sec for it in self.stages.values() if it.parent_stage is None)
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        """
+        :return: JSON-serializable timings by stage name, in the order the stages completed
+        """
+
+        return {
+            stage_name: {
+                'wall_time_sec': it.wall_time_sec,
+                'cpu_time_sec': it.cpu_time_sec,
+                'parent_stage': it.parent_stage,
+            }
+            for stage_name, it in self.stages.items()
+        }
+
+    def __str__(self) -> str:
+        return ', '.join(
+            f'{stage_name}: {it.wall_time_sec:.3f} s wall, {it.cpu_time_sec:.3f} s CPU'
+            for stage_name, it in self.stages.items()
+        )
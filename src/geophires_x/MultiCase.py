@@ -0,0 +1,248 @@
+"""
+Multi-case input files, which run the cases of a parameter sweep or design of experiments as one batch.
+
+Instead of an input file per case, a multi-case input file has a base block of parameters followed by named case blocks
+that contain only the parameters that the case overrides::
+
+    Reservoir Depth, 3 kilometer
+    Gradient 1, 50
+    ...
+
+    [low gradient]
+    Gradient 1, 40
+
+    [deep]
+    Reservoir Depth, 5 kilometer
+
+The overrides of the cases may also be given in a CSV file, with a column for each overridden parameter and a row for
+each case. If the first column is named Case, it holds the case names (otherwise cases are named by row number), and
+empty cells leave the base value::
+
+    Case,Gradient 1,Reservoir Depth
+    low gradient,40,
+    deep,,5 kilometer
+
+The input file (and CSV file) is parsed once, then the cases are run in a pool of worker processes, which construct the
+model of each case from the parsed parameters without reading or writing any files. The results are written to one CSV
+table with a row for each case and a column for each scalar output parameter (with its units), plus an Error column if
+any case failed.
+
+Usage:
+    python -m geophires_x <multi-case input file> [<results file>] [--cases CSV] [--workers N]
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from geophires_x.Model import configure_geophires_logging
+from geophires_x.CylindricalReservoir import CylindricalReservoir
+from geophires_x.GEOPHIRESv3 import get_output_parameters
+from geophires_x.GeoPHIRESUtils import parse_input_line
+from geophires_x.GeoPHIRESUtils import read_input_file
+from geophires_x.Parameter import OutputParameter
+from geophires_x.Parameter import ParameterEntry
+from geophires_x.Reservoir import Reservoir
+from geophires_x.SBTReservoir import SBTReservoir
+
+_logger = logging.getLogger(__name__)
+
+CASE_COLUMN = 'Case'
+ERROR_COLUMN = 'Error'
+
+# the base input parameters and settings of the cases run by a worker process, set by _initialize_worker
+_worker_base_input_parameters: dict[str, ParameterEntry] = {}
+_worker_default_output_path: Path | None = None
+
+
+def read_cases(
+    input_file: str | Path, cases_file: str | Path | None = None
+) -> tuple[dict[str, ParameterEntry], dict[str, dict[str, ParameterEntry]]]:
+    """
+    :param input_file: The input file path, with a base block optionally followed by case blocks
+    :param cases_file: The path of an optional CSV file of case overrides
+    :return: The base input parameters, and the input parameters that each case overrides, by case name (empty if
+        the input file is not a multi-case input file and no cases file is given)
+    :raises ValueError: If case names are duplicated
+    """
+
+    base_input_parameters: dict[str, ParameterEntry] = {}
+    cases: dict[str, dict[str, ParameterEntry]] = {}
+    read_input_file(base_input_parameters, logger=_logger, input_file_name=str(input_file), return_cases=cases)
+
+    if cases_file is not None:
+        for name, overrides in read_cases_csv(cases_file).items():
+            if name in cases:
+                raise ValueError(f'Duplicate case name in {cases_file}: {name} (also a case block of {input_file})')
+            cases[name] = overrides
+
+    return base_input_parameters, cases
+
+
+def read_cases_csv(cases_file: str | Path) -> dict[str, dict[str, ParameterEntry]]:
+    """
+    :param cases_file: The path of a CSV file of case overrides (see the module docstring)
+    :return: The input parameters that each case overrides, by case name
+    :raises ValueError: If case names are duplicated or a row has more cells than the header
+    """
+
+    with open(cases_file, encoding='UTF-8', newline='') as f:
+        rows = list(csv.reader(f))
+
+    if len(rows) == 0:
+        return {}
+
+    header = [it.strip() for it in rows[0]]
+    has_case_column = header[0] == CASE_COLUMN
+    parameter_names = header[1:] if has_case_column else header
+
+    cases: dict[str, dict[str, ParameterEntry]] = {}
+    for row_number, row in enumerate(rows[1:], start=1):
+        if not any(it.strip() for it in row):
+            continue
+
+        if len(row) > len(header):
+            raise ValueError(f'Row {row_number} of {cases_file} has more cells than its header')
+
+        name = row[0].strip() if has_case_column else str(row_number)
+        if name in cases:
+            raise ValueError(f'Duplicate case name in {cases_file}: {name}')
+
+        overrides = {}
+        for parameter_name, value in zip(parameter_names, row[1:] if has_case_column else row):
+            value = value.strip()
+            if value != '':
+                # (parsed as an input file line, so that list values such as "0.5, 0.5" are read the same way)
+                entry = parse_input_line(f'{parameter_name}, {value}')
+                overrides[entry.Name] = entry
+
+        cases[name] = overrides
+
+    return cases
+
+
+def run_cases(
+    base_input_parameters: dict[str, ParameterEntry],
+    cases: dict[str, dict[str, ParameterEntry]],
+    results_file: str | Path,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    default_output_path: Path | None = None,
+    enable_geophires_logging_config: bool = True,
+) -> list[dict[str, Any]]:
+    """
+    Runs the cases in a process pool and writes their results to a CSV table. A case that fails does not stop the other
+    cases; its error is written to the Error column of its row.
+    :param base_input_parameters: The input parameters of all cases (see read_cases)
+    :param cases: The input parameters that each case overrides, by case name
+    :param results_file: The path of the CSV results table
+    :param max_workers: The maximum number of worker processes; None for the ProcessPoolExecutor default (the number of
+        CPUs)
+    :param chunksize: The number of cases sent to a worker process at a time
+    :param default_output_path: Relative path for non-absolute output path parameters; defaults to the current working
+        directory
+    :param enable_geophires_logging_config: If True, logging of the worker processes is configured from logging.conf
+    :return: The rows of the results table, in the order of the cases
+    :raises ValueError: If there are no cases
+    """
+
+    if len(cases) == 0:
+        raise ValueError('There are no cases to run')
+
+    if default_output_path is None:
+        default_output_path = Path.cwd().absolute()
+
+    _logger.info(f'Running {len(cases)} cases')
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(base_input_parameters, default_output_path, enable_geophires_logging_config),
+    ) as executor:
+        rows = list(executor.map(_run_case, cases.items(), chunksize=chunksize))
+
+    write_results_table(rows, results_file)
+    _logger.info(f'Wrote the results of {len(rows)} cases to {results_file}')
+    return rows
+
+
+def write_results_table(rows: list[dict[str, Any]], results_file: str | Path) -> None:
+    """
+    Writes the rows of results to a CSV table, with the union of the rows' columns (in the order they first appear, and
+    the Error column last). Cells of columns that a row does not have are left empty.
+    """
+
+    columns = list(dict.fromkeys(column for row in rows for column in row if column != ERROR_COLUMN))
+    if any(ERROR_COLUMN in row for row in rows):
+        columns.append(ERROR_COLUMN)
+
+    with open(results_file, 'w', encoding='UTF-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval='')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _initialize_worker(
+    base_input_parameters: dict[str, ParameterEntry], default_output_path: Path, enable_geophires_logging_config: bool
+) -> None:
+    global _worker_base_input_parameters, _worker_default_output_path
+
+    if enable_geophires_logging_config:
+        configure_geophires_logging()
+
+    _worker_base_input_parameters = base_input_parameters
+    _worker_default_output_path = default_output_path
+
+
+def _run_case(case: tuple[str, dict[str, ParameterEntry]]) -> dict[str, Any]:
+    name, overrides = case
+    try:
+        model = Model(
+            enable_geophires_logging_config=False,
+            output_file=os.devnull,
+            input_parameters={**_worker_base_input_parameters, **overrides},
+        )
+        model.read_parameters(default_output_path=_worker_default_output_path)
+        model.Calculate()
+
+        # convert output units as they would be for the written outputs
+        model.outputs._convert_units(model)
+
+        return {CASE_COLUMN: name, **_result_columns(get_output_parameters(model))}
+    except Exception as e:
+        _logger.warning(f'Case {name} failed: {e!s}')
+        return {CASE_COLUMN: name, ERROR_COLUMN: str(e) or e.__class__.__name__}
+    finally:
+        # Reservoir calculations are memoized by reservoir and model, which would retain every case's model
+        Reservoir.Calculate.cache_clear()
+        CylindricalReservoir.Calculate.cache_clear()
+        SBTReservoir.Calculate_Coaxial.cache_clear()
+        SBTReservoir.Calculate_Uloop.cache_clear()
+
+
+def _result_columns(output_parameters: dict[str, OutputParameter]) -> dict[str, Any]:
+    """
+    :return: The values of the scalar output parameters (profiles do not fit in a table), by column name
+    """
+
+    columns = {}
+    for name, output_parameter in output_parameters.items():
+        value = output_parameter.value
+        if isinstance(value, np.generic):
+            value = value.item()
+        if not isinstance(value, (str, bool, int, float)):
+            continue
+
+        units = getattr(output_parameter.CurrentUnits, 'value', None)
+        columns[f'{name} ({units})' if isinstance(units, str) and units != '' else name] = value
+
+    return columns
@@ -0,0 +1,79 @@
+"""
+Output projection, which computes and serializes only the requested outputs of a headless run.
+
+Callers that need only a few outputs (e.g. LCOE and net electricity production in an optimization loop) still pay for
+post-processing that produces outputs they do not use, such as assembling the SAM cash flow table. A projection names
+the output parameters to compute; optional steps that produce none of them are skipped, and only the requested outputs
+are converted to their output units and returned (see ``geophires_x.GEOPHIRESv3.main``).
+
+Only steps that no other calculation depends on are optional. The stage computations of the reservoir, wellbores,
+surface plant and economics (including add-ons and S-DAC-GT, which adjust costs and production that other outputs are
+calculated from) always run, so projected values are the same as those of a full run.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+SAM_CASH_FLOW = 'SAM Cash Flow'
+"""The operational years of the SAM cash flow table, which SAM economic model results beyond LCOE are read from"""
+
+SAM_CASH_FLOW_PROFILE = 'SAM Cash Flow Profile'
+"""The full SAM cash flow profile (with pre-revenue years and cumulative NPV and IRR), which returns are read from"""
+
+# The output parameters that each optional step produces (the dependency map of the steps). A step runs if any of its
+# outputs is requested.
+OPTIONAL_STEP_OUTPUTS: dict[str, frozenset[str]] = {
+    SAM_CASH_FLOW: frozenset(
+        [
+            'After-tax IRR',
+            'Project Net Present Value',
+            'Project MOIC',
+            'Project Value Investment Ratio',
+            'Project Payback Period',
+            # royalties are read from the cash flow table, and are added to O&M costs
+            'Average Annual Royalty Cost',
+            'Royalty Holder NPV',
+            'Royalty Holder Average Annual Revenue',
+            'Royalty Holder Total Revenue',
+            'Total O&M Cost',
+        ]
+    ),
+    SAM_CASH_FLOW_PROFILE: frozenset(
+        [
+            'Project MOIC',
+            'Project Value Investment Ratio',
+            'Project Payback Period',
+        ]
+    ),
+}
+
+
+class OutputProjection:
+    """The output parameters requested of a run, by name (the names of GEOPHIRESv3.get_output_parameters)"""
+
+    def __init__(self, output_names: Iterable[str]):
+        self.output_names: frozenset[str] = frozenset(output_names)
+        if len(self.output_names) == 0:
+            raise ValueError('At least one output must be requested')
+
+    def requires(self, step: str) -> bool:
+        """
+        :param step: An optional step, e.g. SAM_CASH_FLOW
+        :return: True if the step produces any of the requested outputs
+        """
+
+        return not self.output_names.isdisjoint(OPTIONAL_STEP_OUTPUTS[step])
+
+    def validate(self, available_output_names: Iterable[str]) -> None:
+        """
+        :param available_output_names: The names of the outputs that the model calculates
+        :raises ValueError: If any requested output is not calculated by the model
+        """
+
+        unknown_output_names = self.output_names.difference(available_output_names)
+        if len(unknown_output_names) > 0:
+            raise ValueError(f'Unknown output(s) requested: {", ".join(sorted(unknown_output_names))}')
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({sorted(self.output_names)})'
@@ -6,6 +6,7 @@
 import sys
 from io import TextIOWrapper
 from pathlib import Path
+from typing import Collection
 
 # noinspection PyPackageRequirements
 import numpy as np
@@ -73,11 +74,64 @@ def filepath_parameter(p: Parameter) -> Parameter:
                 ToolTipText='Provide a 0 if you do not want to print output to the console',
             )
 
+        self._init_instrumentation_parameters()
+
         model.logger.info(f'Complete {__class__!s}: {__name__}')
 
     def __str__(self):
         return 'Outputs'
 
+    def _init_instrumentation_parameters(self) -> None:
+        """
+        Parameters for timing and profiling the run, which apply to all Outputs subclasses.
+        """
+
+        self.include_timings_in_json_output = self.ParameterDict[self.include_timings_in_json_output.Name] = \
+            boolParameter(
+                'Include Timings in JSON Output',
+                DefaultValue=False,
+                Required=False,
+                Provided=False,
+                ErrMessage='assume no timings in JSON output',
+                ToolTipText='Provide a 1 to include the wall and CPU time of each stage of the run (input reading, '
+                            'calculations, and output writers preceding the JSON output) in the JSON output '
+                            'under "Timings"',
+            )
+
+        self.track_memory_usage = self.ParameterDict[self.track_memory_usage.Name] = boolParameter(
+                'Track Memory Usage',
+                DefaultValue=False,
+                Required=False,
+                Provided=False,
+                ErrMessage='assume no memory usage tracking',
+                ToolTipText='Provide a 1 to track the process resident set size (RSS) and RSS high-water mark at '
+                            'the end of each stage of the run and include them in the log and JSON output under '
+                            '"Memory Usage"',
+            )
+
+        self.trace_memory_allocations = self.ParameterDict[self.trace_memory_allocations.Name] = boolParameter(
+                'Trace Memory Allocations',
+                DefaultValue=False,
+                Required=False,
+                Provided=False,
+                ErrMessage='assume no memory allocation tracing',
+                ToolTipText='Provide a 1 to additionally trace the peak and net Python memory allocation of each '
+                            'stage of the run with tracemalloc (implies Track Memory Usage). Note that tracing slows '
+                            'down the run considerably.',
+            )
+
+        self.profile_output_file = self.ParameterDict[self.profile_output_file.Name] = strParameter(
+                'Profile Output File',
+                DefaultValue='GEOPHIRES.prof',
+                Required=False,
+                Provided=False,
+                ErrMessage='assume no profiling',
+                ToolTipText='Provide a file name to profile the calculations and output writing of the run with '
+                            'cProfile and write the profile statistics to the file (no profiling if not provided). '
+                            'The file can be read with pstats or tools like snakeviz.',
+            )
+        self.filepath_parameter_names.append(self.profile_output_file.Name)
+
     def read_parameters(self, model: Model, default_output_path: Path = None) -> None:
         """
         The read_parameters function reads in the parameters from a dictionary and stores them in the parameters.
@@ -128,17 +182,22 @@ def read_parameters(self, model: Model, default_output_path: Path = None) -> Non
 
         model.logger.info(f'Complete {__class__!s}: {__name__}')
 
-    def _convert_units(self, model: Model):
+    def _convert_units(self, model: Model, output_names: Collection[str] | None = None):
+        """
+        :param output_names: The names of the output parameters to convert, if only some are output (in which case
+            input parameters, which are only displayed in the text output, are not converted back)
+        """
         # Deal with converting Units back to PreferredUnits, if required.
         # before we write the outputs, we go thru all the parameters for all of the objects and set the values back
         # to the units that the user entered the data in
         # We do this because the value may be displayed in the output, and we want the user to recginze their value,
         # not some converted value
-        for obj in [model.reserv, model.wellbores, model.surfaceplant, model.economics]:
-            for key in obj.ParameterDict:
-                param = obj.ParameterDict[key]
-                if not param.UnitsMatch:
-                    ConvertUnitsBack(param, model)
+        if output_names is None:
+            for obj in [model.reserv, model.wellbores, model.surfaceplant, model.economics]:
+                for key in obj.ParameterDict:
+                    param = obj.ParameterDict[key]
+                    if not param.UnitsMatch:
+                        ConvertUnitsBack(param, model)
 
         # now we need to loop through all the output parameters to update their units to
         # whatever units the user has specified.
@@ -148,6 +207,9 @@ def _convert_units(self, model: Model):
 
         for obj in [model.reserv, model.wellbores, model.surfaceplant, model.economics]:
             for key in obj.OutputParameterDict:
+                if output_names is not None and key not in output_names:
+                    continue
+
                 output_param:OutputParameter = obj.OutputParameterDict[key]
                 if key in self.ParameterDict:
                     if self.ParameterDict[key] != output_param.CurrentUnits:
@@ -162,7 +224,7 @@ def PrintOutputs(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: PrintOutputs', __class__)
 
         self._convert_units(model)
 
@@ -843,7 +905,7 @@ def PrintOutputs(self, model: Model):
             addon_df
         )
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: PrintOutputs', __class__)
 
     # noinspection PyMethodMayBeStatic
     def write_revenue_and_cashflow_profile_output(self, model, f):
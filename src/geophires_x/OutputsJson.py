@@ -0,0 +1,109 @@
+"""
+JSON serialization of output parameters, as written to the JSON output file (e.g. ``HDR.json``).
+
+The serialized form of each parameter is identical to what ``jsons.dumps`` produces for ``OutputParameter`` and
+``Parameter`` instances (all attributes and properties in name order, enums by name), but attributes are resolved
+once per class rather than reflected over for every parameter, and values are converted in a single pass without
+re-parsing the intermediate JSON.
+"""
+
+from __future__ import annotations
+
+import inspect
+from enum import Enum
+from typing import Any
+
+import numpy as np
+
+from geophires_x.Parameter import OutputParameter
+from geophires_x.Parameter import Parameter
+
+# Attributes that jsons excludes when serializing objects
+_EXCLUDED_ATTRIBUTES = {
+    '_abc_registry',
+    '_abc_cache',
+    '_abc_negative_cache',
+    '_abc_negative_cache_version',
+    '_abc_impl',
+    'json',
+}
+
+_serialized_attribute_names_by_class: dict[type, list[str]] = {}
+
+
+def _get_serialized_attribute_names(cls: type) -> list[str]:
+    if cls not in _serialized_attribute_names_by_class:
+        attribute_names = []
+        for attribute_name in dir(cls):
+            # Private attributes (such as the shared spec of parameters) are not fields; parameters hide them from
+            # dir(), so jsons does not serialize them either.
+            if attribute_name.startswith('_') or attribute_name in _EXCLUDED_ATTRIBUTES:
+                continue
+
+            attribute = inspect.getattr_static(cls, attribute_name)
+            if isinstance(attribute, property) or not (
+                callable(attribute) or isinstance(attribute, (staticmethod, classmethod))
+            ):
+                attribute_names.append(attribute_name)
+
+        _serialized_attribute_names_by_class[cls] = attribute_names
+
+    return _serialized_attribute_names_by_class[cls]
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, Enum):  # checked first since some enums are also str subclasses
+        return value.name
+
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+
+    if isinstance(value, float):
+        return float(value)
+
+    if isinstance(value, np.ndarray):
+        return _to_json_value(value.tolist())
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(it) for it in value]
+
+    if isinstance(value, dict):
+        return {str(k): _to_json_value(v) for k, v in value.items()}
+
+    if isinstance(value, (OutputParameter, Parameter)):
+        return parameter_to_json_dict(value)
+
+    raise ValueError(f'Unable to serialize value of type {type(value).__name__} to JSON: {value}')
+
+
+def parameter_to_json_dict(param: OutputParameter | Parameter) -> dict[str, Any]:
+    """
+    :return: The JSON-serializable representation of an output or input parameter, with attributes in name order
+    """
+
+    attribute_names = _get_serialized_attribute_names(param.__class__)
+    instance_attribute_names = [
+        k for k in getattr(param, '__dict__', {}) if not k.startswith('__') and k not in attribute_names
+    ]
+    if len(instance_attribute_names) > 0:
+        attribute_names = sorted(attribute_names + instance_attribute_names)
+
+    return {attribute_name: _to_json_value(getattr(param, attribute_name)) for attribute_name in attribute_names}
+
+
+def output_parameters_to_json_dict(output_parameter_dicts: list[dict[str, OutputParameter | Parameter]]) -> dict:
+    """
+    :param output_parameter_dicts: Output parameter dicts to merge, in order of precedence (later dicts take precedence
+        for duplicate parameter names)
+    :return: The merged, JSON-serializable representation of the output parameters
+    """
+
+    json_dict = {}
+    for output_parameter_dict in output_parameter_dicts:
+        for key, output_parameter in output_parameter_dict.items():
+            json_dict[key] = parameter_to_json_dict(output_parameter)
+
+    return json_dict
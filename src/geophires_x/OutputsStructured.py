@@ -0,0 +1,139 @@
+"""
+Structured result sidecar for GEOPHIRES text reports.
+
+The text report (``.out``) is the canonical GEOPHIRES result format, but its values are rounded for display and
+recovering them requires parsing the report text. The sidecar (``<report>.result.jsonl``), written next to the report,
+holds:
+
+- the calculated output parameters themselves: full-precision values in their output units, with profiles (array
+  valued output parameters) as arrays
+- the result of the report as ``geophires_x_client.GeophiresXResult`` reads it, parsed once when the report is written
+
+so that readers such as ``GeophiresXResult`` can use them directly instead of parsing the report each time it is read.
+
+The sidecar is in JSON Lines format. The first line holds everything but the profiles, which are on the second line,
+since they can be much larger than the rest (e.g. hourly profiles) and readers that only need the result can skip them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+import geophires_x
+from geophires_x.Parameter import OutputParameter
+from geophires_x.Parameter import Parameter
+
+STRUCTURED_RESULT_SCHEMA_VERSION = 3
+STRUCTURED_RESULT_FILE_SUFFIX = '.result.jsonl'
+
+
+def get_structured_result_file_path(output_file_path: str | Path) -> Path:
+    return Path(output_file_path).with_suffix(STRUCTURED_RESULT_FILE_SUFFIX)
+
+
+def get_report_sha256(report_text: str) -> str:
+    return hashlib.sha256(report_text.encode('utf-8')).hexdigest()
+
+
+def _get_unit(output_parameter: OutputParameter | Parameter) -> str | None:
+    """
+    :return: The unit of the parameter's current value, or None if the parameter has no unit (i.e. its units are only
+        a system of measure, such as Units.NONE)
+    """
+
+    current_units = output_parameter.CurrentUnits
+    if isinstance(current_units, Enum) and isinstance(current_units.value, str):
+        return current_units.value
+
+    return None
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return _to_json_value(value.tolist())
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(it) for it in value]
+
+    if isinstance(value, Enum):
+        return value.value
+
+    return value
+
+
+def build_structured_result(output_parameters: dict[str, OutputParameter | Parameter]) -> dict[str, Any]:
+    """
+    :param output_parameters: The calculated output parameters by name (see GEOPHIRESv3.get_output_parameters)
+    :return: A JSON-serializable dict with:
+        ``output_parameters``: name -> ``{'value': value, 'unit': unit}`` for each scalar output parameter
+        ``profiles``: name -> ``{'value': [values], 'unit': unit}`` for each array valued output parameter
+    """
+
+    scalars = {}
+    profiles = {}
+    for name, output_parameter in output_parameters.items():
+        value = output_parameter.value
+        is_profile = isinstance(value, (list, tuple, np.ndarray))
+        (profiles if is_profile else scalars)[name] = {
+            'value': _to_json_value(value),
+            'unit': _get_unit(output_parameter),
+        }
+
+    return {'output_parameters': scalars, 'profiles': profiles}
+
+
+def _get_report_result(output_file_path: str | Path) -> dict[str, Any]:
+    """
+    :return: The report's result as parsed by GeophiresXResult (the fields of the report's categories and its profiles,
+        with the values as displayed in the report), and whether the report is AGS/CLGS-style, without the path of the
+        report
+    """
+
+    # Imported here since the client depends on this package, not the other way around; the import only runs once
+    # GEOPHIRES has been loaded.
+    from geophires_x_client.geophires_x_result import GeophiresXResult
+
+    report_result = GeophiresXResult(str(output_file_path), use_structured_result=False)
+    result = {**report_result.result}
+    result['metadata'] = {k: v for k, v in result['metadata'].items() if k != 'output_file_path'}
+
+    return {'result': result, 'is_ags_clgs_style_output': report_result.is_ags_clgs_style_output}
+
+
+def write_structured_result(
+    output_parameters: dict[str, OutputParameter | Parameter], output_file_path: str | Path
+) -> Path:
+    """
+    Writes the structured result sidecar for a report that has already been written to ``output_file_path``.
+
+    :param output_parameters: The calculated output parameters of the report, converted to their output units
+    :return: Path of the written sidecar
+    """
+
+    with open(output_file_path, encoding='UTF-8') as f:
+        report_text = f.read()
+
+    structured_result = {
+        'schema_version': STRUCTURED_RESULT_SCHEMA_VERSION,
+        'geophires_version': geophires_x.__version__,
+        'report_sha256': get_report_sha256(report_text),
+        **build_structured_result(output_parameters),
+        **_get_report_result(output_file_path),
+    }
+    profiles = structured_result.pop('profiles')
+
+    structured_result_path = get_structured_result_file_path(output_file_path)
+    with open(structured_result_path, 'w', encoding='UTF-8') as f:
+        f.write(json.dumps(structured_result) + '\n')
+        f.write(json.dumps({'profiles': profiles}) + '\n')
+
+    return structured_result_path
@@ -4,23 +4,22 @@
 import copy
 import dataclasses
 
-import sys
 from array import array
 from collections.abc import Iterable
 from typing import List, Optional, Any
 from dataclasses import dataclass, field
 from enum import IntEnum
-from forex_python.converter import CurrencyRates, CurrencyCodes
+from operator import attrgetter
 
 from abc import ABC
 
 from pint.facets.plain import PlainQuantity
 
+from geophires_x.ExchangeRates import get_exchange_rates
 from geophires_x.OptionList import GeophiresInputEnum
 from geophires_x.Units import *
 
 _ureg = get_unit_registry()
-_DISABLE_FOREX_API = True  # See https://github.com/NREL/GEOPHIRES-X/issues/236#issuecomment-2414681434
 
 _JSON_PARAMETER_TYPE_STRING = 'string'
 _JSON_PARAMETER_TYPE_INTEGER = 'integer'
@@ -30,6 +29,7 @@
 _JSON_PARAMETER_TYPE_OBJECT = 'object'
 
 class HasQuantity(ABC):
+    __slots__ = ()
 
     def quantity(self) -> PlainQuantity:
         """
@@ -47,17 +47,256 @@ class ParameterEntry:
         Name (str): The official name of the parameter that the user wants to set
         sValue (str): The value that the user wants it to be set to, as a string.
         Comment (str): The optional comment that the user provided with that parameter in the text file
+        value (Any): The typed value (number, list of numbers, boolean or string) of entries read from a typed (JSON or
+            TOML) input file, which is read without parsing sValue; None for entries read from text input files
+        units (str): The units of the typed value, if given explicitly
     """
 
     Name: str
     sValue: str
     Comment: Optional[str] = None
     raw_entry: Optional[str] = None
+    value: Any = None
+    units: Optional[str] = None
 
 
-@dataclass
-class OutputParameter(HasQuantity):
-    """A dataclass that is the holder values that are provided to the user as output
+@dataclass(frozen=True)
+class ParameterSpec:
+    """
+    The fields of a Parameter that describe it rather than hold its state (i.e. all fields but value, Provided, Valid
+    and CurrentUnits). Specs are immutable and shared between all parameters with the same fields, e.g. the same
+    parameter of every Model. See Parameter for the fields.
+    """
+
+    Name: str = ""
+    Required: bool = False
+    ErrMessage: str = "assume default value (see manual)"
+    InputComment: str = ""
+    ToolTipText: str = ""
+    UnitType: IntEnum = Units.NONE
+    PreferredUnits: Enum = None
+    parameter_category: str = None
+    ValuesEnum: GeophiresInputEnum = None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # Unpickled specs (e.g. of a loaded Model snapshot) are shared like constructed ones
+        return _shared_spec, (self.__class__, {f.name: getattr(self, f.name) for f in dataclasses.fields(self)})
+
+
+@dataclass(frozen=True)
+class boolParameterSpec(ParameterSpec):
+    DefaultValue: bool = None
+    json_parameter_type: str = _JSON_PARAMETER_TYPE_BOOLEAN
+
+
+@dataclass(frozen=True)
+class intParameterSpec(ParameterSpec):
+    DefaultValue: int = None
+    AllowableRange: List[int] = field(default_factory=list)
+    json_parameter_type: str = _JSON_PARAMETER_TYPE_INTEGER
+
+
+@dataclass(frozen=True)
+class floatParameterSpec(ParameterSpec):
+    DefaultValue: float = 0.0
+    Min: float = -1.8e30
+    Max: float = 1.8e30
+    json_parameter_type: str = _JSON_PARAMETER_TYPE_NUMBER
+
+
+@dataclass(frozen=True)
+class strParameterSpec(ParameterSpec):
+    DefaultValue: str = None
+    json_parameter_type: str = _JSON_PARAMETER_TYPE_STRING
+
+
+@dataclass(frozen=True)
+class listParameterSpec(ParameterSpec):
+    DefaultValue: List[float] = field(default_factory=list)
+    Min: float = -1.8e308
+    Max: float = 1.8e308
+    json_parameter_type: str = _JSON_PARAMETER_TYPE_ARRAY
+
+
+@dataclass(frozen=True)
+class OutputParameterSpec:
+    """
+    The fields of an OutputParameter that describe it rather than hold its state (i.e. all fields but value and
+    CurrentUnits), shared between all output parameters with the same fields. See OutputParameter for the fields.
+    """
+
+    Name: str = ""
+    display_name: str = None
+    ToolTipText: str = ""
+    UnitType: IntEnum = Units.NONE
+    PreferredUnits: Enum = Units.NONE
+    json_parameter_type: str = None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # Unpickled specs (e.g. of a loaded Model snapshot) are shared like constructed ones
+        return _shared_spec, (self.__class__, {f.name: getattr(self, f.name) for f in dataclasses.fields(self)})
+
+
+# Specs are defined by the code that constructs parameters, so there are few distinct ones; the limit only guards
+# against unbounded growth if parameters are constructed with many distinct field values.
+_shared_specs: dict = {}
+_MAX_SHARED_SPECS = 10_000
+
+
+def _spec_key_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return list, tuple(_spec_key_value(it) for it in value)
+
+    return value.__class__, value
+
+
+def _shared_spec(spec_class: type, spec_fields: dict):
+    """
+    :return: A spec with the given fields, shared with the other parameters that have the same fields
+    """
+
+    # Values are keyed along with their types so that, e.g., default values of 1, 1.0, and True do not share a spec.
+    values = tuple(spec_fields.values())
+    key = (spec_class, tuple(spec_fields), values, tuple(map(type, values)))
+    try:
+        spec = _shared_specs.get(key)
+    except TypeError:
+        try:
+            # Lists are keyed by their items
+            key = (spec_class, tuple((name, _spec_key_value(value)) for name, value in spec_fields.items()))
+            spec = _shared_specs.get(key)
+        except TypeError:
+            # Fields with other unhashable values (e.g. numpy arrays) are rare; their specs are not shared.
+            return spec_class(**spec_fields)
+
+    if spec is None:
+        spec = spec_class(**spec_fields)
+        if len(_shared_specs) < _MAX_SHARED_SPECS:
+            _shared_specs[key] = spec
+
+    return spec
+
+
+def _spec_field_property(name: str) -> property:
+    def set_spec_field(self, value: Any) -> None:
+        # The spec is shared with other parameters, so it is replaced rather than modified. Specs with fields set after
+        # construction are not shared, since their values may be specific to a model.
+        self._spec = dataclasses.replace(self._spec, **{name: value})
+
+    return property(attrgetter(f'_spec.{name}'), set_spec_field)
+
+
+class _ParameterBase(HasQuantity):
+    """
+    Base of the parameter classes, which hold the state of a parameter (such as its value) in slots and its other fields
+    in a shared spec, so that the many parameters of each Model take little memory. Parameters are constructed, read,
+    and set as if all fields were their own; setting a spec field replaces the parameter's spec.
+    """
+
+    __slots__ = ('_spec',)
+
+    _spec_class: type = None
+
+    # All fields, in the order of positional constructor arguments
+    _field_names: tuple = ()
+
+    # The fields held by each parameter, with their default values
+    _state_defaults: dict = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls._field_name_set = frozenset(cls._field_names)
+        cls._state_names = ('_spec',) + tuple(cls._state_defaults)
+        cls._get_state = attrgetter(*cls._state_names)
+        for spec_field in dataclasses.fields(cls._spec_class):
+            setattr(cls, spec_field.name, _spec_field_property(spec_field.name))
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > 0:
+            self._add_positional_args(args, kwargs)
+
+        if not self._field_name_set.issuperset(kwargs):
+            raise TypeError(
+                f"{self.__class__.__name__}() got an unexpected keyword argument "
+                f"'{sorted(kwargs.keys() - self._field_name_set)[0]}'"
+            )
+
+        for name, default in self._state_defaults.items():
+            setattr(self, name, kwargs.pop(name, default))
+
+        self._init_spec_fields(kwargs)
+        self._spec = _shared_spec(self._spec_class, kwargs)
+        self._init_state()
+
+    def _add_positional_args(self, args: tuple, kwargs: dict) -> None:
+        if len(args) > len(self._field_names):
+            raise TypeError(
+                f'{self.__class__.__name__}() takes {len(self._field_names)} positional arguments '
+                f'but {len(args)} were given'
+            )
+
+        for name, arg in zip(self._field_names, args):
+            if name in kwargs:
+                raise TypeError(f"{self.__class__.__name__}() got multiple values for argument '{name}'")
+            kwargs[name] = arg
+
+    def _init_spec_fields(self, spec_fields: dict) -> None:
+        """Sets the defaults of spec fields that depend on the state, before the spec is created"""
+        pass
+
+    def _init_state(self) -> None:
+        """Sets the defaults of state fields that depend on spec fields"""
+        pass
+
+    def to_dict(self) -> dict:
+        """
+        :return: All fields of the parameter, in constructor argument order
+        """
+        return {name: getattr(self, name) for name in self._field_names}
+
+    def __getstate__(self) -> tuple:
+        """
+        :return: The spec and the state fields, in a compact form, e.g. for models to keep the initial state of their
+            parameters
+        """
+        return self._get_state(self)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self._state_names, state):
+            setattr(self, name, value)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return tuple(self.to_dict().values()) == tuple(other.to_dict().values())
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields_repr = ', '.join(f'{name}={value!r}' for name, value in self.to_dict().items())
+        return f'{self.__class__.__qualname__}({fields_repr})'
+
+    def __dir__(self):
+        # Private attributes (such as the spec) are not fields, so they are hidden from reflective serializers.
+        return [it for it in super().__dir__() if not it.startswith('_') or it.startswith('__')]
+
+
+class OutputParameter(_ParameterBase):
+    """A holder of values that are provided to the user as output
      but are calculated internally by GEOPHIRES
 
     Attributes:
@@ -70,53 +309,59 @@ class OutputParameter(HasQuantity):
         UnitsMatch (boolean): Internal flag set when units are different
     """
 
-    Name: str = ""
-    display_name: str = None
-    value: Any = 0
-    ToolTipText: str = ""
-    UnitType: IntEnum = Units.NONE
-    PreferredUnits: Enum = Units.NONE
-    # set to PreferredUnits by default assuming that the current units are the preferred units -
-    # they will only change if the read function reads a different unit associated with a parameter
-    CurrentUnits: Enum = PreferredUnits
-    json_parameter_type: str = None
+    __slots__ = ('value', 'CurrentUnits')
+
+    _spec_class = OutputParameterSpec
+    _field_names = (
+        'Name',
+        'display_name',
+        'value',
+        'ToolTipText',
+        'UnitType',
+        'PreferredUnits',
+        'CurrentUnits',
+        'json_parameter_type',
+    )
+    _state_defaults = {'value': 0, 'CurrentUnits': Units.NONE}
 
     @property
     def UnitsMatch(self) -> str:
         return self.CurrentUnits == self.PreferredUnits
 
     def with_preferred_units(self) -> Any:  # Any is a proxy for Self
-        ret: OutputParameter = dataclasses.replace(self)
+        ret: OutputParameter = copy.copy(self)
         ret.value = ret.quantity().to(convertible_unit(ret.PreferredUnits)).magnitude
         ret.CurrentUnits = ret.PreferredUnits
         return ret
 
-    def __post_init__(self):
-        if self.display_name is None:
-            self.display_name: str = self.Name
+    def _init_spec_fields(self, spec_fields: dict) -> None:
+        if spec_fields.get('display_name') is None:
+            spec_fields['display_name'] = spec_fields.get('Name', OutputParameterSpec.Name)
+
+        if spec_fields.get('json_parameter_type') is None:
+            value = self.value
 
-        if self.json_parameter_type is None:
             # Note that this is sensitive to order of comparison; unit test ensures correct behavior:
             # test_parameter.ParameterTestCase.test_output_parameter_json_types
-            if isinstance(self.value, str):
-                self.json_parameter_type = _JSON_PARAMETER_TYPE_STRING
-            elif isinstance(self.value, bool):
-                self.json_parameter_type = _JSON_PARAMETER_TYPE_BOOLEAN
-            elif isinstance(self.value, float) or isinstance(self.value, int):
+            if isinstance(value, str):
+                spec_fields['json_parameter_type'] = _JSON_PARAMETER_TYPE_STRING
+            elif isinstance(value, bool):
+                spec_fields['json_parameter_type'] = _JSON_PARAMETER_TYPE_BOOLEAN
+            elif isinstance(value, float) or isinstance(value, int):
                 # Default number values may not be representative of whether calculated values are integer-only,
                 # so we specify number type even if value is int.
-                self.json_parameter_type = _JSON_PARAMETER_TYPE_NUMBER
-            elif isinstance(self.value, dict):
-                self.json_parameter_type = _JSON_PARAMETER_TYPE_OBJECT
-            elif isinstance(self.value, Iterable):
-                self.json_parameter_type = _JSON_PARAMETER_TYPE_ARRAY
+                spec_fields['json_parameter_type'] = _JSON_PARAMETER_TYPE_NUMBER
+            elif isinstance(value, dict):
+                spec_fields['json_parameter_type'] = _JSON_PARAMETER_TYPE_OBJECT
+            elif isinstance(value, Iterable):
+                spec_fields['json_parameter_type'] = _JSON_PARAMETER_TYPE_ARRAY
             else:
-                self.json_parameter_type = _JSON_PARAMETER_TYPE_OBJECT
+                spec_fields['json_parameter_type'] = _JSON_PARAMETER_TYPE_OBJECT
 
-@dataclass
-class Parameter(HasQuantity):
+
+class Parameter(_ParameterBase):
     """
-     A dataclass that is the holder values that are provided (optionally) by the user.  These are all the inout values
+     A holder of values that are provided (optionally) by the user.  These are all the inout values
      to the model.  They all must have a default value that is reasonable and will
      provide a reasonable result if not changed.
 
@@ -135,36 +380,40 @@ class Parameter(HasQuantity):
         UnitsMatch (boolean): Internal flag set when units are different
     """
 
-    Name: str = ""
-    Required: bool = False
-    Provided: bool = False
-    Valid: bool = True
-    ErrMessage: str = "assume default value (see manual)"
-    InputComment: str = ""
-    ToolTipText: str = Name
-    UnitType: IntEnum = Units.NONE
-    PreferredUnits: Enum = None
-
-    # set to PreferredUnits assuming that the current units are the preferred units
+    __slots__ = ('Provided', 'Valid', 'CurrentUnits')
+
+    _spec_class = ParameterSpec
+    _field_names = (
+        'Name',
+        'Required',
+        'Provided',
+        'Valid',
+        'ErrMessage',
+        'InputComment',
+        'ToolTipText',
+        'UnitType',
+        'PreferredUnits',
+        'CurrentUnits',
+        'parameter_category',
+        'ValuesEnum',
+    )
+
+    # CurrentUnits is set to PreferredUnits assuming that the current units are the preferred units
     # - they will only change if the read function reads a different unit associated with a parameter
-    CurrentUnits: Enum = PreferredUnits
+    _state_defaults = {'Provided': False, 'Valid': True, 'CurrentUnits': None}
 
     @property
     def UnitsMatch(self) -> bool:
         return self.PreferredUnits == self.CurrentUnits
 
-    parameter_category: str = None
-
-    ValuesEnum:GeophiresInputEnum = None
+    def _init_spec_fields(self, spec_fields: dict) -> None:
+        if spec_fields.get('PreferredUnits') is None:
+            spec_fields['PreferredUnits'] = self.CurrentUnits
 
-    def __post_init__(self):
-        if self.PreferredUnits is None:
-            self.PreferredUnits = self.CurrentUnits
 
-@dataclass
 class boolParameter(Parameter):
     """
-    boolParameter: a dataclass that stores the values for a Boolean value.  Includes the default value and the
+    boolParameter: a holder of the values for a Boolean value.  Includes the default value and the
     validation values (if appropriate).  Child of Parameter, so it gets all the Attributes of that class.
 
     Attributes:
@@ -172,46 +421,53 @@ class boolParameter(Parameter):
         DefaultValue (bool, True):  The default value of that parameter
     """
 
-    def __post_init__(self):
+    __slots__ = ('value',)
+
+    _spec_class = boolParameterSpec
+    _field_names = Parameter._field_names + ('value', 'DefaultValue', 'json_parameter_type')
+    _state_defaults = {**Parameter._state_defaults, 'value': None}
+
+    def _init_spec_fields(self, spec_fields: dict) -> None:
+        pass
+
+    def _init_state(self) -> None:
         if self.value is None:
             self.value: bool = self.DefaultValue
 
-    value: bool = None
-    DefaultValue: bool = value
-    json_parameter_type: str = _JSON_PARAMETER_TYPE_BOOLEAN
-
 
-@dataclass
 class intParameter(Parameter):
     """
-    intParameter: a dataclass that stores the values for an Integer value.  Includes the default value and the
+    intParameter: a holder of the values for an Integer value.  Includes the default value and the
     validation values (if appropriate).  Child of Parameter, so it gets all the Attributes of that class.
 
     Attributes:
         value (int): The value of that parameter
         DefaultValue (int, 0):  The default value of that parameter
-        AllowableRange (list): A list of the valid values
+        AllowableRange (list): A list (or range) of the valid values
     """
 
-    def __post_init__(self):
+    __slots__ = ('value',)
+
+    _spec_class = intParameterSpec
+    _field_names = Parameter._field_names + ('value', 'DefaultValue', 'AllowableRange', 'json_parameter_type')
+    _state_defaults = {**Parameter._state_defaults, 'value': None}
+
+    def _init_spec_fields(self, spec_fields: dict) -> None:
+        pass
+
+    def _init_state(self) -> None:
         if self.value is None:
             self.value:int = self.DefaultValue
 
-    value: int = None
-    DefaultValue: int = value
-    AllowableRange: List[int] = field(default_factory=list)
-    json_parameter_type: str = _JSON_PARAMETER_TYPE_INTEGER
-
     def coerce_value_to_enum(self):
         if self.ValuesEnum is not None:
             if not isinstance(self.value, self.ValuesEnum):
                 self.value = self.ValuesEnum.from_int(self.value)
 
 
-@dataclass
 class floatParameter(Parameter):
     """
-    floatParameter: a dataclass that stores the values for a Float value.  Includes the default value and the
+    floatParameter: a holder of the values for a Float value.  Includes the default value and the
     validation values (if appropriate).  Child of Parameter, so it gets all the Attributes of that class.
 
     Attributes:
@@ -223,42 +479,44 @@ class floatParameter(Parameter):
                 which means that any value is valid by default
     """
 
-    def __post_init__(self):
-        if self.value is None:
-            self.value = self.DefaultValue
-        super().__post_init__()
+    __slots__ = ('value',)
 
-    value: float = None
+    _spec_class = floatParameterSpec
+    _field_names = Parameter._field_names + ('value', 'DefaultValue', 'Min', 'Max', 'json_parameter_type')
+    _state_defaults = {**Parameter._state_defaults, 'value': None}
 
-    DefaultValue: float = 0.0
-    Min: float = -1.8e30
-    Max: float = 1.8e30
-    json_parameter_type: str = _JSON_PARAMETER_TYPE_NUMBER
+    def _init_state(self) -> None:
+        if self.value is None:
+            self.value = self.DefaultValue
 
 
-@dataclass
 class strParameter(Parameter):
     """
-    strParameter: a dataclass that stores the values for a String value.  Includes the default value and the
+    strParameter: a holder of the values for a String value.  Includes the default value and the
     validation values (if appropriate).  Child of Parameter, so it gets all the Attributes of that class.
 
     Attributes:
         value (str): The value of that parameter
         DefaultValue (str, ""):  The default value of that parameter
     """
-    def __post_init__(self):
+
+    __slots__ = ('value',)
+
+    _spec_class = strParameterSpec
+    _field_names = Parameter._field_names + ('value', 'DefaultValue', 'json_parameter_type')
+    _state_defaults = {**Parameter._state_defaults, 'value': None}
+
+    def _init_spec_fields(self, spec_fields: dict) -> None:
+        pass
+
+    def _init_state(self) -> None:
         if self.value is None:
             self.value: str = self.DefaultValue
 
-    value: str = None
-    DefaultValue: str = value
-    json_parameter_type: str = _JSON_PARAMETER_TYPE_STRING
-
 
-@dataclass
 class listParameter(Parameter):
     """
-    listParameter: a dataclass that stores the values for a List of values.  Includes the default value and the
+    listParameter: a holder of the values for a List of values.  Includes the default value and the
     validation values (if appropriate).  Child of Parameter, so it gets all the Attributes of that class.
 
     Attributes:
@@ -270,15 +528,33 @@ class listParameter(Parameter):
             which means that any value is valid by default
     """
 
-    def __post_init__(self):
+    __slots__ = ('value',)
+
+    _spec_class = listParameterSpec
+    _field_names = Parameter._field_names + ('value', 'DefaultValue', 'Min', 'Max', 'json_parameter_type')
+    _state_defaults = {**Parameter._state_defaults, 'value': None}
+
+    def _init_spec_fields(self, spec_fields: dict) -> None:
+        pass
+
+    def _init_state(self) -> None:
         if self.value is None:
-            self.value: str = self.DefaultValue
+            # The default value is shared through the spec, so the value is a copy that may be modified in place.
+            self.value: str = copy.copy(self.DefaultValue)
 
-    value: List[float] = None
-    DefaultValue: List[float] = field(default_factory=list)
-    Min: float = -1.8e308
-    Max: float = 1.8e308
-    json_parameter_type: str = _JSON_PARAMETER_TYPE_ARRAY
+
+def parse_bool(sValue: str) -> bool:
+    """
+    Parses the value of a boolean parameter read from a text input file
+    :param sValue: The value, e.g. "True", "false", "1", "no"
+    :return: The boolean value
+    """
+    if sValue in ['0', 'false', 'False', 'f', 'F', 'no', 'No', 'n', 'N']:
+        return False
+    elif sValue in ['1', 'true', 'True', 't', 'T', 'yes', 'Yes', 'y', 'Y']:
+        return True
+    else:
+        return bool(sValue)
 
 
 def ReadParameter(ParameterReadIn: ParameterEntry, ParamToModify, model) -> None:
@@ -296,26 +572,27 @@ def ReadParameter(ParameterReadIn: ParameterEntry, ParamToModify, model) -> None
     :type model: :class:`~geophires_x.Model.Model`
     :return: None
     """
-    model.logger.info(f'Init {str(__name__)}: {sys._getframe().f_code.co_name} for {ParamToModify.Name}')
+    model.logger.info('Init %s: ReadParameter for %s', __name__, ParamToModify.Name)
+
+    # Typed (JSON or TOML) input values are validated rather than parsed from sValue
+    is_typed = ParameterReadIn.value is not None
+    typed_value = _typed_value(ParameterReadIn, ParamToModify, model) if is_typed else None
 
     # these Parameter Types don't have units so don't do anything fancy, and ignore it if the user has supplied units
     if isinstance(ParamToModify, boolParameter) or isinstance(ParamToModify, strParameter):
-        if isinstance(ParamToModify, boolParameter):
-            if ParameterReadIn.sValue in ['0', 'false', 'False', 'f', 'F', 'no', 'No', 'n', 'N']:
-                ParamToModify.value = False
-            elif ParameterReadIn.sValue in ['1', 'true', 'True', 't', 'T', 'yes', 'Yes', 'y', 'Y']:
-                ParamToModify.value = True
-            else:
-                ParamToModify.value = bool(ParameterReadIn.sValue)
+        if is_typed:
+            ParamToModify.value = typed_value
+        elif isinstance(ParamToModify, boolParameter):
+            ParamToModify.value = parse_bool(ParameterReadIn.sValue)
         else:
             ParamToModify.value = ParameterReadIn.sValue
         ParamToModify.Provided = True  # set provided to true because we are using a user provide value now
         ParamToModify.Valid = True  # set Valid to true because it passed the validation tests
-        model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: ReadParameter', __name__)
         return
 
     # deal with the case where the value has a unit involved - that will be indicated by a space in it
-    if ' ' in ParameterReadIn.sValue:
+    if not is_typed and ' ' in ParameterReadIn.sValue:
         new_str = ConvertUnits(ParamToModify, ParameterReadIn.sValue, model)
         if len(new_str) > 0:
             ParameterReadIn.sValue = new_str
@@ -334,14 +611,14 @@ def default_parameter_value_message(new_val: Any, param_to_modify_name: str, def
         )
 
     if isinstance(ParamToModify, intParameter):
-        New_val = int(float(ParameterReadIn.sValue))
+        New_val = int(typed_value) if is_typed else int(float(ParameterReadIn.sValue))
 
         if New_val == ParamToModify.DefaultValue:
             if len(ParamToModify.ErrMessage) > 0:
                 msg = default_parameter_value_message(New_val, ParamToModify.Name, ParamToModify.DefaultValue)
                 model.logger.info(msg)
 
-            model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+            model.logger.info('Complete %s: ReadParameter', __name__)
             return
 
         if New_val == ParamToModify.value:
@@ -354,7 +631,7 @@ def default_parameter_value_message(new_val: Any, param_to_modify_name: str, def
             err_msg = f"Error: Parameter given ({New_val}) for {ParamToModify.Name} outside of valid range."
             print(err_msg)
             model.logger.fatal(err_msg)
-            model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+            model.logger.info('Complete %s: ReadParameter', __name__)
             raise ValueError(err_msg)
         else:
             # All is good
@@ -362,7 +639,7 @@ def default_parameter_value_message(new_val: Any, param_to_modify_name: str, def
             ParamToModify.Provided = True  # set provided to true because we are using a user provide value now
             ParamToModify.Valid = True  # set Valid to true because it passed the validation tests
     elif isinstance(ParamToModify, floatParameter):
-        New_val = float(ParameterReadIn.sValue)
+        New_val = float(typed_value) if is_typed else float(ParameterReadIn.sValue)
 
         if New_val == ParamToModify.DefaultValue:
             # Warning - the value read in is the same as the default value, making it superfluous
@@ -373,11 +650,11 @@ def default_parameter_value_message(new_val: Any, param_to_modify_name: str, def
                 msg = default_parameter_value_message(New_val, ParamToModify.Name, ParamToModify.DefaultValue)
                 model.logger.info(msg)
 
-            model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+            model.logger.info('Complete %s: ReadParameter', __name__)
         if New_val == ParamToModify.value:
             # We have nothing to change - user provided value that was the same as the
             # existing value (likely, the default value)
-            model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+            model.logger.info('Complete %s: ReadParameter', __name__)
             return
 
         if (New_val < float(ParamToModify.Min)) or (New_val > float(ParamToModify.Max)):
@@ -385,7 +662,7 @@ def default_parameter_value_message(new_val: Any, param_to_modify_name: str, def
             err_msg = f'Error: Parameter given ({New_val}) for {ParamToModify.Name} outside of valid range.'
             print(err_msg)
             model.logger.fatal(err_msg)
-            model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+            model.logger.info('Complete %s: ReadParameter', __name__)
             raise ValueError(err_msg)
         else:
             # All is good
@@ -393,7 +670,7 @@ def default_parameter_value_message(new_val: Any, param_to_modify_name: str, def
             ParamToModify.Provided = True  # set provided to true because we are using a user provide value now
             ParamToModify.Valid = True  # set Valid to true because it passed the validation tests
     elif isinstance(ParamToModify, listParameter):
-        _read_list_parameter(ParameterReadIn, ParamToModify, model)
+        _read_list_parameter(ParameterReadIn, ParamToModify, model, typed_value)
 
     elif isinstance(ParamToModify, boolParameter):
         if ParameterReadIn.sValue == "0":
@@ -403,7 +680,7 @@ def default_parameter_value_message(new_val: Any, param_to_modify_name: str, def
         else:
             New_val = True
         if New_val == ParamToModify.value:
-            model.logger.info(f'Complete {str(__name__)}": {sys._getframe().f_code.co_name}')
+            model.logger.info('Complete %s": ReadParameter', __name__)
             # We have nothing to change - user provide value that was the same as the existing value (likely, the default value)
             return
 
@@ -419,27 +696,76 @@ def default_parameter_value_message(new_val: Any, param_to_modify_name: str, def
         ParamToModify.Provided = True  # set provided to true because we are using a user provide value now
         ParamToModify.Valid = True  # set Valid to true because it passed the validation tests
 
-    model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+    model.logger.info('Complete %s: ReadParameter', __name__)
 
 
-def _read_list_parameter(ParameterReadIn: ParameterEntry, ParamToModify, model) -> None:
+def _is_number(o: Any) -> bool:
+    return isinstance(o, (int, float)) and not isinstance(o, bool)
+
+
+def _is_int(o: Any) -> bool:
+    try:
+        float_n = float(o)
+        int_n = int(float_n)
+    except ValueError:
+        return False
+    else:
+        return float_n == int_n
+
+
+def _is_positional_parameter(ParameterReadIn: ParameterEntry, ParamToModify) -> bool:
+    return ' ' in ParameterReadIn.Name and _is_int(ParamToModify.Name.split(' ')[-1])
+
+
+def _typed_value(ParameterReadIn: ParameterEntry, ParamToModify, model) -> Any:
     """
+    :return: The value of a typed (JSON or TOML) input parameter entry, validated against the type of the parameter (its
+        type in the JSON schema). Values are only converted if their units are given and differ from the parameter's
+        units (its units in the JSON schema), in which case they are converted as text values with units are.
+    :raises ValueError: If the value is not of the parameter's type
     :type ParamToModify: :class:`~geophires_x.Parameter.Parameter`
     :type model: :class:`~geophires_x.Model.Model`
     """
 
-    def _is_int(o: Any) -> bool:
-        try:
-            float_n = float(o)
-            int_n = int(float_n)
-        except ValueError:
-            return False
-        else:
-            return float_n == int_n
+    value = ParameterReadIn.value
+    if isinstance(ParamToModify, boolParameter):
+        is_valid = isinstance(value, bool)
+    elif isinstance(ParamToModify, strParameter):
+        is_valid = isinstance(value, str)
+    elif isinstance(ParamToModify, intParameter):
+        is_valid = _is_number(value) and float(value).is_integer()
+    elif isinstance(ParamToModify, listParameter) and not _is_positional_parameter(ParameterReadIn, ParamToModify):
+        is_valid = isinstance(value, list)  # (the items are numbers; see typed_parameter_entry)
+    else:
+        is_valid = _is_number(value)
+
+    if not is_valid:
+        err_msg = (f'Error: Parameter given ({value}) for {ParamToModify.Name} is not of its type '
+                   f'({ParamToModify.json_parameter_type}).')
+        model.logger.fatal(err_msg)
+        raise ValueError(err_msg)
+
+    units = ParameterReadIn.units
+    if units is None or units == getattr(ParamToModify.CurrentUnits, 'value', None):
+        return value
+
+    if isinstance(value, list):
+        return [float(ConvertUnits(ParamToModify, f'{it} {units}', model)) for it in value]
+
+    ParameterReadIn.sValue = ConvertUnits(ParamToModify, f'{value} {units}', model)
+    return float(ParameterReadIn.sValue)
+
 
-    is_positional_parameter = ' ' in ParameterReadIn.Name and _is_int(ParamToModify.Name.split(' ')[-1])
+def _read_list_parameter(ParameterReadIn: ParameterEntry, ParamToModify, model, typed_value: Any = None) -> None:
+    """
+    :param typed_value: The validated value of a typed input parameter entry (see _typed_value), if it is one
+    :type ParamToModify: :class:`~geophires_x.Parameter.Parameter`
+    :type model: :class:`~geophires_x.Model.Model`
+    """
+
+    is_positional_parameter = _is_positional_parameter(ParameterReadIn, ParamToModify)
     if is_positional_parameter:
-        New_val = float(ParameterReadIn.sValue)
+        New_val = float(typed_value) if typed_value is not None else float(ParameterReadIn.sValue)
         # Some list parameters are read in with enumerated parameter names;  in these cases we use the last
         # character of the description to get the position i.e., "Gradient 1" is position 0.
         parts = ParameterReadIn.Name.split(' ')
@@ -449,6 +775,8 @@ def _is_int(o: Any) -> bool:
         else:  # we are replacing a value, so pop the value we want to replace, then insert a new one
             ParamToModify.value.pop(position)
             ParamToModify.value.insert(position, New_val)
+    elif typed_value is not None:
+        ParamToModify.value = [float(x) for x in typed_value]
     else:
         # In an ideal world this would be handled in ParameterEntry such that its sValue and Comment are
         # correct; however that would only be practical if ParameterEntry had typing information to know
@@ -473,6 +801,14 @@ def _is_int(o: Any) -> bool:
     ParamToModify.Valid = valid
 
 
+def _has_currency_prefix(currency_unit: str) -> bool:
+    """
+    :return: True if the currency unit is an ISO 4217 currency code with an M (million) or K (thousand) prefix, like
+        MUSD or KEUR (but not a currency code that starts with M or K, like MXN)
+    """
+    return len(currency_unit) == 4 and currency_unit[0] in ['M', 'm', 'K', 'k'] and currency_unit[1:].isupper()
+
+
 def ConvertUnits(ParamToModify, strUnit: str, model) -> str:
     """
     ConvertUnits gets called if a unit version is needed: either currency or standard units like F to C or m to ft
@@ -487,7 +823,7 @@ def ConvertUnits(ParamToModify, strUnit: str, model) -> str:
     :return: The new value as a string (without the units, because they are already held in PreferredUnits of ParamToModify)
     :rtype: str
     """
-    model.logger.info(f'Init {str(__name__)}: {sys._getframe().f_code.co_name} for {ParamToModify.Name}')
+    model.logger.info('Init %s: ConvertUnits for %s', __name__, ParamToModify.Name)
 
     # deal with the currency case
     if ParamToModify.UnitType in [Units.CURRENCY, Units.CURRENCYFREQUENCY, Units.COSTPERMASS, Units.ENERGYCOST]:
@@ -520,27 +856,20 @@ def ConvertUnits(ParamToModify, strUnit: str, model) -> str:
         # Let's try to deal with first the simple conversion where the required units have a prefix like M (m) or K (k)
         # that means a "million" or a "thousand", like MUSD (or KUSD), and the user provided USD (or KUSD) or KEUR, MEUR
         # we have to deal with the case that the M, m, K, or k are NOT prefixes, but rather are a part of the currency name.
-        cc = CurrencyCodes()
         currFactor = prefFactor = 1.0
-        currPrefix = prefPrefix = False
         Factor = 1.0
         prefShort = prefType
         currShort = currType
-        # if either of these returns a symbol, then we must have prefixes we need to deal with
-        symbol = cc.get_symbol(prefType[1:])
-        symbol2 = cc.get_symbol(currType[1:])
-        if symbol is not None:
-            prefPrefix = True
-        if symbol2 is not None:
-            currPrefix = True
+        prefPrefix = _has_currency_prefix(prefType)
+        currPrefix = _has_currency_prefix(currType)
         if prefPrefix and prefType[0] in ['M', 'm']:
-            prefFactor = prefFactor * 1_000_000.0
+            prefFactor = prefFactor / 1_000_000.0
         elif prefPrefix and prefType[0] in ['K', 'k']:
-            prefFactor = prefFactor * 1000.0
+            prefFactor = prefFactor / 1000.0
         if currPrefix and currType[0] in ['M', 'm']:
-            currFactor = currFactor / 1_000_000.0
+            currFactor = currFactor * 1_000_000.0
         elif currPrefix and currType[0] in ['K', 'k']:
-            currFactor = currFactor / 1000.0
+            currFactor = currFactor * 1000.0
         Factor = currFactor * prefFactor
         if prefPrefix:
             prefShort = prefType[1:]
@@ -553,22 +882,17 @@ def ConvertUnits(ParamToModify, strUnit: str, model) -> str:
 
             val = float(val) * Factor
             strUnit = str(val)
-            ParamToModify.CurrentUnits = currType
+            ParamToModify.CurrentUnits = ParamToModify.PreferredUnits
             return strUnit
 
         try:
             # if we come here, we have a currency conversion to do (USD->EUR, etc.).
-
-            if _DISABLE_FOREX_API:
-                raise RuntimeError('Forex API disabled')
-
-            cr = CurrencyRates()
-            conv_rate = cr.get_rate(currShort, prefShort)
+            conv_rate = get_exchange_rates(model).rate(currShort, prefShort)
         except BaseException as ex:
             print(str(ex))
             msg = (
                 f'Error: GEOPHIRES failed to convert your currency for {ParamToModify.Name} to something it understands. '
-                f'You gave {strUnit} - conversion may be affected by https://github.com/NREL/GEOPHIRES-X/issues/236. '
+                f'You gave {strUnit}: {ex} '
                 f'Please change your units to {ParamToModify.PreferredUnits.value} '
                 f'to continue. Cannot continue unless you do. Exiting.'
             )
@@ -580,7 +904,8 @@ def ConvertUnits(ParamToModify, strUnit: str, model) -> str:
 
         New_val = (conv_rate * float(val)) * Factor
         strUnit = str(New_val)
-        ParamToModify.CurrentUnits = parts[1]
+        # (the value is now in the preferred units, like the values of parameters converted by pint below)
+        ParamToModify.CurrentUnits = ParamToModify.PreferredUnits
 
         if len(prefSuff) > 0:
             prefType = prefType + prefSuff  # set it back the way it was
@@ -653,7 +978,7 @@ def ConvertUnits(ParamToModify, strUnit: str, model) -> str:
             parts = strUnit.split(' ')
             strUnit = parts[0]
 
-    model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+    model.logger.info('Complete %s: ConvertUnits', __name__)
     return strUnit
 
 
@@ -668,14 +993,13 @@ def ConvertUnitsBack(ParamToModify: Parameter, model):
     :type model: :class:`~geophires_x.Model.Model`
     :return: None
     """
-    model.logger.info(f'Init {str(__name__)}: {sys._getframe().f_code.co_name} for {ParamToModify.Name}')
+    model.logger.info('Init %s: ConvertUnitsBack for %s', __name__, ParamToModify.Name)
 
     try:
         ParamToModify.value = _ureg.Quantity(ParamToModify.value, convertible_unit(ParamToModify.CurrentUnits)).to(convertible_unit(ParamToModify.PreferredUnits)).magnitude
         ParamToModify.CurrentUnits = ParamToModify.PreferredUnits
     except AttributeError as ae:
-        # TODO refactor to check for/convert currency instead of relying on try/except once currency conversion is
-        #  re-enabled - https://github.com/NREL/GEOPHIRES-X/issues/236?title=Currency+conversions+disabled
+        # TODO refactor to check for/convert currency instead of relying on try/except
         model.logger.warning(f'Failed to convert units with pint, attempting currency conversion ({ae})')
 
         try:
@@ -698,7 +1022,7 @@ def ConvertUnitsBack(ParamToModify: Parameter, model):
             raise RuntimeError(msg)
 
 
-    model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+    model.logger.info('Complete %s: ConvertUnitsBack', __name__)
 
 
 def _parameter_with_currency_units_converted_back_to_preferred_units(param: Parameter, model) -> Parameter:
@@ -733,28 +1057,20 @@ def _parameter_with_currency_units_converted_back_to_preferred_units(param: Para
         # that means a "million" or a "thousand", like MUSD (or KUSD), and the user provided USD (or KUSD) or KEUR, MEUR
         # we have to deal with the case that the M, m, K, or k are NOT prefixes,
         # but rather are a part of the currency name.
-        cc = CurrencyCodes()
         currFactor = prefFactor = 1.0
-        currPrefix = prefPrefix = False
         Factor = 1.0
         prefShort = prefType
         currShort = currType
-        symbol = cc.get_symbol(
-            prefType[1:]
-        )  # if either of these returns a symbol, then we must have prefixes we need to deal with
-        symbol2 = cc.get_symbol(currType[1:])
-        if symbol is not None:
-            prefPrefix = True
-        if symbol2 is not None:
-            currPrefix = True
+        prefPrefix = _has_currency_prefix(prefType)
+        currPrefix = _has_currency_prefix(currType)
         if prefPrefix and prefType[0] in ['M', 'm']:
-            prefFactor = prefFactor * 1_000_000.0
+            prefFactor = prefFactor / 1_000_000.0
         elif prefPrefix and prefType[0] in ['K', 'k']:
-            prefFactor = prefFactor * 1000.0
+            prefFactor = prefFactor / 1000.0
         if currPrefix and currType[0] in ['M', 'm']:
-            currFactor = currFactor / 1_000_000.0
+            currFactor = currFactor * 1_000_000.0
         elif currPrefix and currType[0] in ['K', 'k']:
-            currFactor = currFactor / 1000.0
+            currFactor = currFactor * 1000.0
         Factor = currFactor * prefFactor
         if prefPrefix:
             prefShort = prefType[1:]
@@ -764,26 +1080,20 @@ def _parameter_with_currency_units_converted_back_to_preferred_units(param: Para
             # this is true, then we just have a conversion between KUSD and USD, MUSD to KUSD, MUER to EUR, etc.,
             # so just do the simple factor conversion
             param_with_units_converted_back.value = param.value * Factor
-            param_with_units_converted_back.CurrentUnits = currType
+            param_with_units_converted_back.CurrentUnits = param.PreferredUnits
             return param_with_units_converted_back
 
         # Now lets deal with the case where the units still don't match, so we have a real currency conversion,
         # like USD to EUR
-        # start the currency conversion process
-        cc = CurrencyCodes()
         try:
-            if _DISABLE_FOREX_API:
-                raise RuntimeError('Forex API disabled')
-
-            cr = CurrencyRates()
-            conv_rate = cr.get_rate(currType, prefType)
+            conv_rate = get_exchange_rates(model).rate(currShort, prefShort)
         except BaseException as ex:
             print(str(ex))
             msg = (
-                f'Error: GEOPHIRES failed to convert your currency for {param.Name} to something it understands.'
-                f'You gave {currType} - conversion may be affected by https://github.com/NREL/GEOPHIRES-X/issues/236.  '
+                f'Error: GEOPHIRES failed to convert your currency for {param.Name} to something it understands. '
+                f'You gave {currType}: {ex} '
                 f'Please change your units to {param.PreferredUnits.value} '
-                f'to continue. Cannot continue unless you do.  Exiting.'
+                f'to continue. Cannot continue unless you do. Exiting.'
             )
             print(msg)
             model.logger.critical(str(ex))
@@ -791,7 +1101,8 @@ def _parameter_with_currency_units_converted_back_to_preferred_units(param: Para
 
             raise RuntimeError(msg, ex)
 
-        param_with_units_converted_back.value = (conv_rate * float(param.value)) / prefFactor
+        param_with_units_converted_back.value = conv_rate * float(param.value) * Factor
+        param_with_units_converted_back.CurrentUnits = param.PreferredUnits
         return param_with_units_converted_back
 
     else:
@@ -921,8 +1232,7 @@ def ConvertOutputUnits(oparam: OutputParameter, newUnit: Units, model):
         oparam.CurrentUnits = newUnit
         return
     except AttributeError as ae:
-        # TODO refactor to check for/convert currency instead of relying on try/except once currency conversion is
-        #  re-enabled - https://github.com/NREL/GEOPHIRES-X/issues/236?title=Currency+conversions+disabled
+        # TODO refactor to check for/convert currency instead of relying on try/except
         model.logger.warning(f'Failed to convert units with pint, falling back to legacy conversion code ({ae})')
 
     if isinstance(oparam.value, str):
@@ -969,20 +1279,12 @@ def ConvertOutputUnits(oparam: OutputParameter, newUnit: Units, model):
         # that means a "million" or a "thousand", like MUSD (or KUSD), and the user provided USD (or KUSD) or KEUR, MEUR
         # we have to deal with the case that the M, m, K, or k are NOT prefixes, but rather
         # are a part of the currency name.
-        cc = CurrencyCodes()
         currFactor = prefFactor = 1.0
-        currPrefix = prefPrefix = False
         Factor = 1.0
         prefShort = prefType
         currShort = currType
-        symbol = cc.get_symbol(
-            prefType[1:]
-        )  # if either of these returns a symbol, then we must have prefixes we need to deal with
-        symbol2 = cc.get_symbol(currType[1:])
-        if symbol is not None:
-            prefPrefix = True
-        if symbol2 is not None:
-            currPrefix = True
+        prefPrefix = _has_currency_prefix(prefType)
+        currPrefix = _has_currency_prefix(currType)
         if prefPrefix and prefType[0] in ['M', 'm']:
             prefFactor = prefFactor * 1_000_000.0
         elif prefPrefix and prefType[0] in ['K', 'k']:
@@ -1004,48 +1306,14 @@ def ConvertOutputUnits(oparam: OutputParameter, newUnit: Units, model):
             return
 
         # start the currency conversion process
-        # if we have a symbol for a currency type, then the type is known to the library.
-        # If we don't try some tricks to make it into something it does do recognize
-        symbol = cc.get_symbol(currShort)
-        if symbol is None:
-            msg = (
-                f'Error: GEOPHIRES failed to convert your currency for {oparam.Name} to something it understands.'
-                f'You gave {currType} - conversion may be affected by https://github.com/NREL/GEOPHIRES-X/issues/236.  '
-                f'Please change your units to {oparam.PreferredUnits.value} '
-                f'to continue. Cannot continue unless you do.  Exiting.'
-            )
-            print(msg)
-            model.logger.critical(msg)
-
-            raise RuntimeError(msg)
-
-        symbol = cc.get_symbol(prefShort)
-        # if we have a symbol for a currency type, then the type is known to the library.  If we don't
-        # try some tricks to make it into something it does do recognize
-        if symbol is None:
-            msg = (
-                f'Error: GEOPHIRES failed to convert your currency for {oparam.Name} to something it understands.'
-                f'You gave {currType} - conversion may be affected by https://github.com/NREL/GEOPHIRES-X/issues/236.  '
-                f'Please change your units to {oparam.PreferredUnits.value} '
-                f'to continue. Cannot continue unless you do.  Exiting.'
-            )
-
-            print(msg)
-            model.logger.critical(msg)
-
-            raise RuntimeError(msg)
         try:
-            if _DISABLE_FOREX_API:
-                raise RuntimeError('Forex API disabled')
-
-            cr = CurrencyRates()
-            conv_rate = cr.get_rate(prefShort, currShort)
+            conv_rate = get_exchange_rates(model).rate(prefShort, currShort)
         except BaseException as ex:
             print(str(ex))
 
             msg = (
                 f'Error: GEOPHIRES failed to convert your currency for {oparam.Name} to something it understands. '
-                f'You gave {currType} - conversion may be affected by https://github.com/NREL/GEOPHIRES-X/issues/236. '
+                f'You gave {currType}: {ex} '
                 f'Please change your units to {oparam.PreferredUnits.value} '
                 f'to continue. Cannot continue unless you do. Exiting.'
             )
@@ -1059,7 +1327,7 @@ def ConvertOutputUnits(oparam: OutputParameter, newUnit: Units, model):
 
         oparam.value = Factor * conv_rate * float(oparam.value)
         oparam.CurrentUnits = DefUnit
-        model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: ConvertOutputUnits', __name__)
 
 
 
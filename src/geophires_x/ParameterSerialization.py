@@ -0,0 +1,98 @@
+"""
+JSON (de)serialization of calculated output parameters, shared by the GEOPHIRES-X server (geophires_x.server), which
+serializes the output parameters of headless simulations, and the client (geophires_x_client), which deserializes them.
+"""
+
+from __future__ import annotations
+
+import importlib
+from enum import Enum
+from typing import Any
+
+import numpy as np
+
+from geophires_x.Parameter import OutputParameter
+from geophires_x.Parameter import Parameter
+
+
+def _resolve_class(module_name: str, qualified_name: str) -> type:
+    if module_name.split('.')[0] != 'geophires_x':
+        raise ValueError(f'Unable to deserialize {module_name}.{qualified_name}: not a GEOPHIRES class')
+
+    resolved = importlib.import_module(module_name)
+    for name in qualified_name.split('.'):
+        resolved = getattr(resolved, name)
+
+    return resolved
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return {'enum': [value.__class__.__module__, value.__class__.__qualname__, value.name]}
+
+    if isinstance(value, type) and issubclass(value, Enum):
+        return {'enum_class': [value.__module__, value.__qualname__]}
+
+    if isinstance(value, (OutputParameter, Parameter)):
+        return {'parameter': output_parameter_to_json_dict(value)}
+
+    if isinstance(value, np.ndarray):
+        return {'ndarray': value.tolist(), 'dtype': str(value.dtype)}
+
+    if isinstance(value, np.generic):
+        return {'numpy': value.item(), 'dtype': str(value.dtype)}
+
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(it) for it in value]
+
+    if isinstance(value, dict):
+        return {'dict': [[_to_json_value(k), _to_json_value(v)] for k, v in value.items()]}
+
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+
+    raise ValueError(f'Unable to serialize value of type {type(value).__name__}: {value}')
+
+
+def _from_json_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_from_json_value(it) for it in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if 'enum' in value:
+        module_name, qualified_name, member_name = value['enum']
+        return _resolve_class(module_name, qualified_name)[member_name]
+
+    if 'enum_class' in value:
+        return _resolve_class(*value['enum_class'])
+
+    if 'parameter' in value:
+        return output_parameter_from_json_dict(value['parameter'])
+
+    if 'ndarray' in value:
+        return np.array(value['ndarray'], dtype=value['dtype'])
+
+    if 'numpy' in value:
+        return np.dtype(value['dtype']).type(value['numpy'])
+
+    return {_from_json_value(k): _from_json_value(v) for k, v in value['dict']}
+
+
+def output_parameter_to_json_dict(output_parameter: OutputParameter | Parameter) -> dict[str, Any]:
+    """
+    :return: The JSON-serializable representation of a calculated output parameter (or of an input parameter included
+        in the outputs), from which output_parameter_from_json_dict recreates it. Unlike the JSON output, this preserves
+        the types of the parameter, its value, and its units.
+    """
+
+    return {
+        'class': [output_parameter.__class__.__module__, output_parameter.__class__.__qualname__],
+        'fields': {name: _to_json_value(value) for name, value in output_parameter.to_dict().items()},
+    }
+
+
+def output_parameter_from_json_dict(json_dict: dict[str, Any]) -> OutputParameter | Parameter:
+    parameter_class = _resolve_class(*json_dict['class'])
+    return parameter_class(**{name: _from_json_value(value) for name, value in json_dict['fields'].items()})
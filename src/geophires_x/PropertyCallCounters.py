@@ -0,0 +1,182 @@
+"""
+Call counters for thermophysical property lookups (CoolProp and property table entry points), for judging and tuning
+property caching.
+
+Calls are only counted while a collector is active in the calling context (see collect_property_call_stats), which
+Model.Calculate does for each run. Outside of a collector the counted functions are called directly, and there is no
+process-wide state that grows with the number of runs.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+MAX_UNIQUE_KEYS_PER_RUN = 10_000
+"""Maximum number of distinct argument keys tracked per function and run (see PropertyCallStats.unique_keys)"""
+
+
+@dataclass
+class PropertyCallStats:
+    calls: int = 0
+    """Number of calls"""
+
+    unique_keys: int = 0
+    """
+    Number of distinct argument combinations the function was called with. Calls with unhashable arguments (e.g. arrays)
+    are not counted, and counting stops at MAX_UNIQUE_KEYS_PER_RUN.
+    """
+
+    hits: int = 0
+    """
+    Number of calls served from the function's lru_cache (always 0 for uncached functions). Taken from the change of the
+    cache's statistics over the run, so when runs are concurrent, it includes the hits of the other runs' calls.
+    """
+
+    misses: int = 0
+    """Number of calls that computed the value; see hits"""
+
+    cumulative_time_sec: float = 0.0
+    """Total wall time spent in the function, including cache hits"""
+
+
+class _PropertyCallCounter:
+    def __init__(self):
+        self.calls = 0
+        self.cumulative_time_sec = 0.0
+        self.keys: set = set()
+
+    def record(self, elapsed_sec: float, args: tuple, kwargs: dict) -> None:
+        self.calls += 1
+        self.cumulative_time_sec += elapsed_sec
+
+        if len(self.keys) < MAX_UNIQUE_KEYS_PER_RUN:
+            try:
+                self.keys.add((args, tuple(kwargs.items())) if kwargs else args)
+            except (TypeError, ValueError):
+                pass  # unhashable arguments
+
+
+# The cache_info functions of the counted functions that are cached, by name
+_cache_info_by_name: dict[str, Callable[[], Any]] = {}
+
+_collector: contextvars.ContextVar[PropertyCallStatsCollector | None] = contextvars.ContextVar(
+    'property_call_stats_collector', default=None
+)
+
+
+class PropertyCallStatsCollector:
+    """
+    Stats of the property lookups made in one context (i.e. thread or asyncio task) while the collector is active; see
+    collect_property_call_stats.
+    """
+
+    def __init__(self):
+        self._counters_by_name: dict[str, _PropertyCallCounter] = {}
+        self._cache_info_start = {name: cache_info() for name, cache_info in _cache_info_by_name.items()}
+        self._cache_info_end: dict[str, Any] | None = None
+
+    def _record(self, name: str, elapsed_sec: float, args: tuple, kwargs: dict) -> None:
+        counter = self._counters_by_name.get(name)
+        if counter is None:
+            counter = self._counters_by_name[name] = _PropertyCallCounter()
+        counter.record(elapsed_sec, args, kwargs)
+
+    def _stop(self) -> None:
+        self._cache_info_end = {name: cache_info() for name, cache_info in _cache_info_by_name.items()}
+
+    def get_stats(self) -> dict[str, PropertyCallStats]:
+        """
+        :return: The collected stats of each property lookup function that was called, by name
+        """
+
+        cache_info_end = self._cache_info_end
+        if cache_info_end is None:
+            cache_info_end = {name: cache_info() for name, cache_info in _cache_info_by_name.items()}
+
+        stats_by_name = {}
+        for name, counter in self._counters_by_name.items():
+            stats = PropertyCallStats(
+                calls=counter.calls,
+                unique_keys=len(counter.keys),
+                misses=counter.calls,
+                cumulative_time_sec=counter.cumulative_time_sec,
+            )
+
+            start, end = self._cache_info_start.get(name), cache_info_end.get(name)
+            if start is not None and end is not None:
+                stats.hits = end.hits - start.hits
+                stats.misses = end.misses - start.misses
+
+            stats_by_name[name] = stats
+
+        return stats_by_name
+
+
+@contextmanager
+def collect_property_call_stats() -> Iterator[PropertyCallStatsCollector]:
+    """
+    Collects the stats of the property lookups made in the current context within the block. Lookups made concurrently
+    by other threads are not counted, so this gives the stats of a single run (e.g. a Model's calculations) even when
+    runs are concurrent.
+
+    Note that the property lookup caches are shared between threads, so when runs are concurrent, the hits and misses
+    of a run include those of the other runs' lookups made during the block.
+    """
+
+    collector = PropertyCallStatsCollector()
+    token = _collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _collector.reset(token)
+        collector._stop()
+
+
+def count_property_calls(name: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator that counts calls, unique keys, cache hits and misses, and cumulative time of a property lookup function
+    while a collector is active (see collect_property_call_stats). Apply it on top of ``functools.lru_cache`` (if the
+    function is cached) so that the hits and misses of its cache are reported.
+
+    :param name: The name that the function's stats are reported under
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        cache_info = getattr(fn, 'cache_info', None)
+        if cache_info is not None:
+            _cache_info_by_name[name] = cache_info
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            collector = _collector.get()
+            if collector is None:
+                return fn(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                collector._record(name, time.perf_counter() - start, args, kwargs)
+
+        if cache_info is not None:
+            wrapper.cache_info = cache_info
+            wrapper.cache_clear = fn.cache_clear
+
+        return wrapper
+
+    return decorator
+
+
+def property_call_stats_to_dict(stats_by_name: dict[str, PropertyCallStats]) -> dict[str, dict[str, Any]]:
+    """
+    :return: JSON-serializable property call stats by function name
+    """
+
+    return {name: vars(stats).copy() for name, stats in stats_by_name.items()}
@@ -1,4 +1,3 @@
-import sys
 import os
 import math
 from functools import lru_cache
@@ -31,7 +30,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
 
         # Set up all the Parameters that will be predefined by this class using the different types of parameter classes
         # Setting up includes giving it a name, a default value, The Unit Type (length, volume, temperature, etc) and
@@ -287,7 +286,7 @@ def __init__(self, model: Model):
             ToolTipText="Width of each fracture"
         )
 
-        fracnumb_allowable_range = list(range(1, _MAX_ALLOWED_FRACTURES + 1, 1))
+        fracnumb_allowable_range = range(1, _MAX_ALLOWED_FRACTURES + 1, 1)
         self.fracnumb = self.ParameterDict[self.fracnumb.Name] = intParameter(
             "Number of Fractures",
             DefaultValue=10,
@@ -541,7 +540,7 @@ def __init__(self, model: Model):
             CurrentUnits=TemperatureUnit.CELSIUS
         )
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "Reservoir"
@@ -557,7 +556,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
 
         # Deal with all the parameter values that the user has provided.  They should really only provide values
         # that they want to change from the default values, but they can provide a value that is already set
@@ -680,7 +679,7 @@ def read_parameters(self, model: Model) -> None:
                              f'Please provide only one of these parameters.')
 
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: read_parameters', __class__)
 
     @lru_cache(maxsize=1024)
     def Calculate(self, model: Model) -> None:
@@ -691,7 +690,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         # This is where all the calculations are made using all the values that have been set.
         # If you subclass this class, you can choose to run these calculations before (or after) your calculations,
@@ -797,7 +796,7 @@ def Calculate(self, model: Model) -> None:
         self.InitialReservoirHeatContent.value = self.resvolcalc.value * self.rhorock.value * self.cprock.value * (
             self.Trock.value - model.wellbores.Tinj.value) / 1E15  # 10^15 J
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
     def lithostatic_pressure(self) -> PlainQuantity:
         return quantity(static_pressure_MPa(self.rhorock.quantity().to('kg/m**3').magnitude,
@@ -0,0 +1,257 @@
+"""
+Array-batched kernels of the analytical reservoir models, which calculate the dimensionless production temperature
+(Tres - Tinj) / (Trock - Tinj) of many parameter sets (cases) in one vectorized call, without constructing a Model for
+each case, e.g. for Monte Carlo simulations and optimization.
+
+Each kernel takes its parameters as a dict of arrays with one value per case (scalars are broadcast), named and in the
+units of the corresponding parameter values of the reservoir and wellbores of a Model, and the time vector (in years,
+like Reservoir.timevector). It returns an array of shape (n_cases, n_steps). The parameters of a calculated Model are
+given by model_kernel. For example, for the percentage thermal drawdown model:
+
+>>> tdp({'drawdp': [0.005, 0.01]}, [0, 10, 20])
+array([[1.  , 0.95, 0.9 ],
+       [1.  , 0.9 , 0.8 ]])
+
+The Laplace-space models (multiple parallel fractures and linear heat sweep) are inverted with the fixed Talbot method
+in double precision, which agrees with the mpmath inversion of the models to about 1e-10.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+from typing import Callable
+from typing import Mapping
+
+import numpy as np
+from scipy.special import erf
+
+_SECONDS_PER_YEAR = 365.0 * 24.0 * 3600.0
+
+# Parameters of the kernels (see their docstrings), which are the names of the parameter values of Model elements
+_TDP_PARAMETER_NAMES = ('drawdp',)
+_SF_PARAMETER_NAMES = ('drawdp', 'cpwater', 'krock', 'rhorock', 'cprock')
+_MPF_PARAMETER_NAMES = (
+    'nprod',
+    'prodwellflowrate',
+    'rhowater',
+    'cpwater',
+    'krock',
+    'rhorock',
+    'cprock',
+    'fracnumbcalc',
+    'fracwidthcalc',
+    'fracheightcalc',
+    'fracsepcalc',
+)
+_LHS_PARAMETER_NAMES = (
+    'porrock',
+    'krock',
+    'rhorock',
+    'cprock',
+    'rhowater',
+    'cpwater',
+    'fracsepcalc',
+    'fracheightcalc',
+    'fracwidthcalc',
+    'fracnumbcalc',
+    'nprod',
+    'prodwellflowrate',
+)
+
+# Parameters that are values of the wellbores, rather than of the reservoir, of a Model
+_WELLBORES_PARAMETER_NAMES = ('nprod', 'prodwellflowrate')
+
+# Degree of the fixed Talbot inversion; the degree that mpmath's invertlaplace uses at its default precision
+_TALBOT_DEGREE = 34
+
+# Maximum number of complex Laplace-space values evaluated at once, which bounds the memory used by large batches
+_MAX_LAPLACE_VALUES_PER_CHUNK = 2**20
+
+
+def _case_params(params: Mapping[str, Any], names: tuple[str, ...]) -> tuple[list[np.ndarray], int]:
+    """
+    :return: The parameters as column vectors (of shape (n_cases, 1)), and the number of cases
+    """
+    missing = [name for name in names if name not in params]
+    if len(missing) > 0:
+        raise ValueError(f'Missing reservoir kernel parameters: {", ".join(missing)}')
+
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(params[name], dtype=float)) for name in names])
+    if any(a.ndim != 1 for a in arrays):
+        raise ValueError('Reservoir kernel parameters must be scalars or 1-D arrays (one value per case)')
+
+    return [a[:, np.newaxis] for a in arrays], len(arrays[0])
+
+
+def _fixed_talbot(fp: Callable[..., np.ndarray], t: np.ndarray, args: list[np.ndarray]) -> np.ndarray:
+    """
+    Inverts a Laplace-space function with the fixed Talbot method (Abate & Valko, 2004), like mpmath's invertlaplace
+    with method='talbot', in double precision.
+    :param fp: The Laplace-space function of the Laplace variable (of shape (n_cases, n_steps, degree)) and args
+    :param t: The times, of shape (n_cases, n_steps); must be positive
+    :param args: The parameters of fp, each of shape (n_cases, 1)
+    :return: The time-domain values, of shape (n_cases, n_steps); not finite where the inversion overflows
+    """
+    m = _TALBOT_DEGREE
+    r = 0.4 * m
+    theta = np.pi * np.arange(1, m) / m
+    cot_theta = 1.0 / np.tan(theta)
+    delta = np.concatenate(([r], r * theta * (cot_theta + 1j)))
+    weights = np.concatenate(([0.5], 1 + 1j * theta * (1 + cot_theta**2) - 1j * cot_theta))
+
+    ret = np.empty(t.shape)
+    cases_per_chunk = max(1, _MAX_LAPLACE_VALUES_PER_CHUNK // (t.shape[1] * m))
+    with np.errstate(all='ignore'):
+        for start in range(0, t.shape[0], cases_per_chunk):
+            chunk = slice(start, start + cases_per_chunk)
+            t_chunk = t[chunk, :, np.newaxis]
+            fp_values = fp(delta / t_chunk, *[arg[chunk, :, np.newaxis] for arg in args])
+            ret[chunk] = (0.4 * np.sum(np.exp(delta) * fp_values * weights, axis=-1) / t[chunk]).real
+
+    return ret
+
+
+def tdp(params: Mapping[str, Any], timevector: Any) -> np.ndarray:
+    """
+    Percentage thermal drawdown model (see TDPReservoir).
+    :param params: drawdp (the annual drawdown, as a fraction)
+    """
+    (drawdp,), _ = _case_params(params, _TDP_PARAMETER_NAMES)
+    return 1 - drawdp * np.asarray(timevector, dtype=float)
+
+
+def sf(params: Mapping[str, Any], timevector: Any) -> np.ndarray:
+    """
+    Single fracture m/A thermal drawdown model (see SFReservoir).
+    :param params: drawdp (the flow rate per fracture area), cpwater, krock, rhorock, cprock
+    """
+    (drawdp, cpwater, krock, rhorock, cprock), n_cases = _case_params(params, _SF_PARAMETER_NAMES)
+    t = np.asarray(timevector, dtype=float)
+
+    ret = np.ones((n_cases, len(t)))
+    ret[:, 1:] = erf(1.0 / drawdp / cpwater * np.sqrt(krock * rhorock * cprock / t[1:] / _SECONDS_PER_YEAR))
+    return ret
+
+
+def _mpf_fp(s: np.ndarray, a: np.ndarray) -> np.ndarray:
+    return (1.0 / s) * np.exp(-np.sqrt(s) * np.tanh(a * np.sqrt(s)))
+
+
+def mpf(params: Mapping[str, Any], timevector: Any) -> np.ndarray:
+    """
+    Multiple parallel fractures model (Gringarten; see MPFReservoir).
+    :param params: nprod, prodwellflowrate, rhowater, cpwater, krock, rhorock, cprock, fracnumbcalc, fracwidthcalc,
+        fracheightcalc, fracsepcalc
+    """
+    (
+        (nprod, prodwellflowrate, rhowater, cpwater, krock, rhorock, cprock, fracnumb, fracwidth, fracheight, fracsep),
+        n_cases,
+    ) = _case_params(params, _MPF_PARAMETER_NAMES)
+    t = np.asarray(timevector, dtype=float)
+
+    q = nprod * prodwellflowrate / rhowater  # m^3/s
+    a = rhowater * cpwater * (q / fracnumb / fracwidth) * (fracsep / 2.0) / (2.0 * krock * fracheight)
+    td = (
+        (rhowater * cpwater) ** 2
+        / (4 * krock * rhorock * cprock)
+        * (q / fracnumb / fracwidth / fracheight) ** 2
+        * t[1:]
+        * _SECONDS_PER_YEAR
+    )
+
+    ret = np.ones((n_cases, len(t)))
+    ret[:, 1:] = 1 - _fixed_talbot(_mpf_fp, td, [a])
+    return ret
+
+
+def _lhs_fp(s: np.ndarray, ntu: np.ndarray, gamma: np.ndarray) -> np.ndarray:
+    return (1 / s) * (1 - np.exp(-(1 + ntu / (gamma * (s + ntu))) * s))
+
+
+def lhs(params: Mapping[str, Any], timevector: Any) -> np.ndarray:
+    """
+    1-D linear heat sweep model (see LHSReservoir). Like the model, temperatures that are not between the injection
+    and initial rock temperatures (where the inversion fails, before thermal breakthrough) are the rock temperature.
+    :param params: porrock, krock, rhorock, cprock, rhowater, cpwater, fracsepcalc, fracheightcalc, fracwidthcalc,
+        fracnumbcalc, nprod, prodwellflowrate
+    """
+    (
+        (phi, krock, rhorock, cprock, rhowater, cpwater, fracsep, fracheight, fracwidth, fracnumb, nprod, flowrate),
+        n_cases,
+    ) = _case_params(params, _LHS_PARAMETER_NAMES)
+    t = np.asarray(timevector, dtype=float)
+
+    h = 500.0  # heat transfer coefficient [W/m^2 K]
+    shape = 0.2  # ratio of conduction path length
+    alpha = krock / (rhorock * cprock)
+    gamma = (rhowater * cpwater * phi) / (rhorock * cprock * (1 - phi))  # storage ratio
+    r_efr = 0.83 * (0.75 * (fracsep * fracheight * fracwidth) / math.pi) ** (1.0 / 3.0)  # effective rock radius
+    bi = h * r_efr / krock  # Biot number
+    tau_efr = r_efr**2.0 * (shape + 1.0 / bi) / (3.0 * alpha)  # effective rock time constant
+    u0 = nprod * flowrate / (rhowater * (fracnumb - 1) * fracsep * fracwidth)
+    tres = (fracheight * phi) / u0
+    ntu = tres / tau_efr  # number of heat transfer units
+
+    ret = np.ones((n_cases, len(t)))
+    twnd = _fixed_talbot(_lhs_fp, t[1:] * _SECONDS_PER_YEAR / tres, [ntu, gamma])
+    with np.errstate(invalid='ignore'):
+        ret[:, 1:] = np.where((twnd >= 0) & (twnd <= 1), twnd, 1.0)
+    return ret
+
+
+def cylindrical(params: Mapping[str, Any], timevector: Any) -> np.ndarray:
+    """
+    Cylindrical reservoir model (see CylindricalReservoir), whose production temperature is the initial rock
+    temperature; the temperature decline of closed-loop (AGS) models is calculated by their wellbores.
+    :param params: Any parameters; used only for the number of cases (1 if there are none)
+    """
+    arrays = [np.atleast_1d(np.asarray(value)) for value in params.values()]
+    n_cases = np.broadcast(*arrays).shape[0] if len(arrays) > 0 else 1
+    return np.ones((n_cases, len(np.asarray(timevector))))
+
+
+# Kernels and their parameters by the name of the reservoir model class
+_KERNELS: dict[str, tuple[Callable[[Mapping[str, Any], Any], np.ndarray], tuple[str, ...]]] = {
+    'TDPReservoir': (tdp, _TDP_PARAMETER_NAMES),
+    'SFReservoir': (sf, _SF_PARAMETER_NAMES),
+    'MPFReservoir': (mpf, _MPF_PARAMETER_NAMES),
+    'LHSReservoir': (lhs, _LHS_PARAMETER_NAMES),
+    'CylindricalReservoir': (cylindrical, ()),
+}
+
+
+def model_kernel(model) -> tuple[Callable[[Mapping[str, Any], Any], np.ndarray], dict[str, float]]:
+    """
+    :param model: A calculated model with an analytical reservoir model
+    :type model: :class:`~geophires_x.Model.Model`
+    :return: The kernel of the model's reservoir model and the model's values of its parameters
+    :raises ValueError: If the reservoir model has no kernel (e.g. it is numerical or reads its temperatures)
+    """
+    for cls in type(model.reserv).__mro__:
+        if cls.__name__ in _KERNELS:
+            kernel, names = _KERNELS[cls.__name__]
+            params = {
+                name: float(
+                    getattr(model.wellbores if name in _WELLBORES_PARAMETER_NAMES else model.reserv, name).value
+                )
+                for name in names
+            }
+            return kernel, params
+
+    raise ValueError(f'Reservoir model {type(model.reserv).__name__} has no batch kernel')
+
+
+def production_temperature(dimensionless_temperature: np.ndarray, Trock: Any, Tinj: Any) -> np.ndarray:
+    """
+    :param dimensionless_temperature: The result of a kernel, of shape (n_cases, n_steps)
+    :param Trock: The initial rock temperature of each case
+    :param Tinj: The injection temperature of each case
+    :return: The production temperature of each case, in the units of Trock and Tinj
+
+    >>> production_temperature(tdp({'drawdp': 0.005}, [0, 10]), Trock=200, Tinj=50)
+    array([[200. , 192.5]])
+    """
+    Trock = np.asarray(Trock, dtype=float).reshape(-1, 1)
+    Tinj = np.asarray(Tinj, dtype=float).reshape(-1, 1)
+    return Tinj + dimensionless_temperature * (Trock - Tinj)
@@ -1,4 +1,4 @@
-import sys, math
+import math
 import numpy as np
 import geophires_x.Model as Model
 from .Economics import Economics, calculate_cost_of_one_vertical_well, BuildPTCModel, CalculateRevenue, CalculateFinancialPerformance, CalculateLCOELCOHLCOC
@@ -94,7 +94,7 @@ def __init__(self, model: Model):
         :type model: Model
         :return: Nothing, and is used to initialize the class
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
 
         # Initialize the superclass first to gain access to those variables
         super().__init__(model)
@@ -102,7 +102,7 @@ def __init__(self, model: Model):
         self.MyClass = sclass.replace("\'>", "")
         self.MyPath = os.path.abspath(__file__)
 
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: __init__', __class__)
 
     def __str__(self):
         return 'SBTEconomics'
@@ -116,14 +116,14 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)  # read the default parameters
         # if we call super, we don't need to deal with setting the parameters here,
         # just deal with the special cases for the variables in this class
         # because the call to the super.readparameters will set all the variables,
         # including the ones that are specific to this class
 
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model) -> None:
         """
@@ -141,7 +141,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         #if hasattr(model.wellbores, 'numnonverticalsections') and model.wellbores.numnonverticalsections.Provided:
             #self.cost_lateral_section.value = 0.0
@@ -532,5 +532,5 @@ def Calculate(self, model: Model) -> None:
         self.LCOE.value, self.LCOH.value, self.LCOC.value = CalculateLCOELCOHLCOC(self, model)
 
         self._calculate_derived_outputs(model)
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
@@ -1,4 +1,3 @@
-import sys
 from functools import lru_cache
 
 import numpy as np
@@ -9,10 +8,9 @@
 import scipy.io as sio
 import matplotlib.pyplot as plt
 
-import CoolProp.CoolProp as CP
-
 import geophires_x.Model as Model
 from .CylindricalReservoir import CylindricalReservoir
+from .GeoPHIRESUtils import PropsSI
 from .MatplotlibUtils import plt_show
 from .NumpyUtils import np_trapz
 from .OptionList import FlowrateModel, InjectionTemperatureModel, Configuration
@@ -171,7 +169,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)
 
         # Set up all the Parameters that will be predefined by this class using the different types of parameter classes
@@ -293,7 +291,7 @@ def __init__(self, model: Model):
             UnitType=Units.NONE
         )
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "SBTReservoir"
@@ -309,7 +307,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)
 
         # Deal with all the parameter values that the user has provided.  They should really only provide values
@@ -350,14 +348,14 @@ def read_parameters(self, model: Model) -> None:
         else:
             model.logger.info("No parameters read because no content provided")
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: read_parameters', __class__)
 
     def Calculate(self, model):
         """
         The Calculate function is the main function that is called to run the calculations for this object.
         In this case, it just calls the appropriate function based on the configuration of the wellbores.
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         # calculate the reservoir depth because there is no one single depth as there are for other reservoirs.
         # Make the depth at which this pressure is calculates to be the average of the junction box depth and
@@ -371,7 +369,7 @@ def Calculate(self, model):
             self.Calculate_Coaxial(model)
         else:
             return
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
 
     @lru_cache(maxsize=1024)
@@ -380,7 +378,7 @@ def Calculate_Coaxial(self, model):
         """
         Calculate the coaxial version of the SBT model
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate_Coaxial', __class__)
 
         raise NotImplementedError('SBT with coaxial configuration is not implemented at this time.')
 
@@ -732,7 +730,7 @@ def Calculate_Coaxial(self, model):
         while kk < maxnumberofiterations and maxrelativechange > reltolerance:
             Pfluidupmidpointsold = Pfluidupmidpoints.copy()
             Pfluiddownmidpointsold = Pfluiddownmidpoints.copy()
-            densityfluidupmidpoints = CP.PropsSI('D', 'P', Pfluidupmidpoints, 'T', Tin + 273.15, 'Water')
+            densityfluidupmidpoints = PropsSI('D', 'P', Pfluidupmidpoints, 'T', Tin + 273.15, 'Water')
             densityfluiddownmidpoints = densityfluidupmidpoints
             Pfluiddownnodes = Pin * 1e5 - np.cumsum([0] + g * verticalchange * densityfluiddownmidpoints)
             Pfluidupnodes = Pfluiddownnodes
@@ -744,12 +742,12 @@ def Calculate_Coaxial(self, model):
             print(
                 f'Calculating initial pressure field ... | Iteration = {kk} | Max. Rel. change = {maxrelativechange:.5f}')
 
-        densityfluiddownnodes = CP.PropsSI('D', 'P', Pfluiddownnodes, 'T', Tfluiddownnodes + 273.15, 'Water')
+        densityfluiddownnodes = PropsSI('D', 'P', Pfluiddownnodes, 'T', Tfluiddownnodes + 273.15, 'Water')
         densityfluidupnodes = densityfluiddownnodes
 
         # HT Contribution
-        Phasefluiddownnodes = CP.PropsSI('Phase', 'P', Pfluiddownnodes, 'T', Tfluiddownnodes + 273.15, 'Water')
-        Phasefluidupnodes = CP.PropsSI('Phase', 'P', Pfluidupnodes, 'T', Tfluidupnodes + 273.15, 'Water')
+        Phasefluiddownnodes = PropsSI('Phase', 'P', Pfluiddownnodes, 'T', Tfluiddownnodes + 273.15, 'Water')
+        Phasefluidupnodes = PropsSI('Phase', 'P', Pfluidupnodes, 'T', Tfluidupnodes + 273.15, 'Water')
         Qfluiddownnodes = np.where(Phasefluiddownnodes == 0, 0, 1)
         Qfluidupnodes = np.where(Phasefluidupnodes == 0, 0, 1)
 
@@ -771,19 +769,19 @@ def Calculate_Coaxial(self, model):
             velocityfluidupnodes = m / A_flow_annulus / densityfluidupnodes
 
         # Obtain initial viscosity distribution of fluid [Pa·s]
-        viscosityfluiddownmidpoints = CP.PropsSI('V', 'P', Pfluiddownmidpoints, 'T', Tfluiddownmidpoints + 273.15,
+        viscosityfluiddownmidpoints = PropsSI('V', 'P', Pfluiddownmidpoints, 'T', Tfluiddownmidpoints + 273.15,
                                                  'Water')
-        viscosityfluidupmidpoints = CP.PropsSI('V', 'P', Pfluidupmidpoints, 'T', Tfluidupmidpoints + 273.15, 'Water')
+        viscosityfluidupmidpoints = PropsSI('V', 'P', Pfluidupmidpoints, 'T', Tfluidupmidpoints + 273.15, 'Water')
 
         # Obtain initial specific heat capacity distribution of fluid [J/kg·K]
-        heatcapacityfluiddownmidpoints = CP.PropsSI('C', 'P', Pfluiddownmidpoints, 'T', Tfluiddownmidpoints + 273.15,
+        heatcapacityfluiddownmidpoints = PropsSI('C', 'P', Pfluiddownmidpoints, 'T', Tfluiddownmidpoints + 273.15,
                                                     'Water')
-        heatcapacityfluidupmidpoints = CP.PropsSI('C', 'P', Pfluidupmidpoints, 'T', Tfluidupmidpoints + 273.15, 'Water')
+        heatcapacityfluidupmidpoints = PropsSI('C', 'P', Pfluidupmidpoints, 'T', Tfluidupmidpoints + 273.15, 'Water')
 
         # Obtain initial thermal conductivity distribution of fluid [W/m·K]
-        thermalconductivityfluiddownmidpoints = CP.PropsSI('L', 'P', Pfluiddownmidpoints, 'T',
+        thermalconductivityfluiddownmidpoints = PropsSI('L', 'P', Pfluiddownmidpoints, 'T',
                                                            Tfluiddownmidpoints + 273.15, 'Water')
-        thermalconductivityfluidupmidpoints = CP.PropsSI('L', 'P', Pfluidupmidpoints, 'T', Tfluidupmidpoints + 273.15,
+        thermalconductivityfluidupmidpoints = PropsSI('L', 'P', Pfluidupmidpoints, 'T', Tfluidupmidpoints + 273.15,
                                                          'Water')
 
         # Obtain initial thermal diffusivity distribution of fluid [m²/s]
@@ -791,9 +789,9 @@ def Calculate_Coaxial(self, model):
         alphafluidupmidpoints = thermalconductivityfluidupmidpoints / densityfluidupmidpoints / heatcapacityfluidupmidpoints
 
         # Obtain initial thermal expansion coefficient distribution of fluid [1/K]
-        thermalexpansionfluiddownmidpoints = CP.PropsSI('ISOBARIC_EXPANSION_COEFFICIENT', 'P', Pfluiddownmidpoints, 'T',
+        thermalexpansionfluiddownmidpoints = PropsSI('ISOBARIC_EXPANSION_COEFFICIENT', 'P', Pfluiddownmidpoints, 'T',
                                                         Tfluiddownmidpoints + 273.15, 'Water')
-        thermalexpansionfluidupmidpoints = CP.PropsSI('ISOBARIC_EXPANSION_COEFFICIENT', 'P', Pfluidupmidpoints, 'T',
+        thermalexpansionfluidupmidpoints = PropsSI('ISOBARIC_EXPANSION_COEFFICIENT', 'P', Pfluidupmidpoints, 'T',
                                                       Tfluidupmidpoints + 273.15, 'Water')
 
         # Obtain initial Prandtl number distribution of fluid [-]
@@ -1129,7 +1127,7 @@ def Calculate_Coaxial(self, model):
         # plt.grid()
         # plt.show()
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate_Coaxial', __class__)
 
     @lru_cache(maxsize=1024)
     #@profile
@@ -1137,7 +1135,7 @@ def Calculate_Uloop(self, model):
         """
         Calculate the U-loop version of the SBT model
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate_Uloop', __class__)
         self.averagegradient.value = np.average(self.gradient.value[0:self.numseg.value])
         self.Trock.value = self.Tsurf.value + (self.averagegradient.value * model.wellbores.lateral_endpoint_depth.value)
 
@@ -1231,21 +1229,21 @@ def Calculate_Uloop(self, model):
                 msg = f'Error: Coordinate mismatch between bottom of injection well and start of lateral #{dd}'
                 print(f'{msg}')
                 model.logger.fatal(msg)
-                model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+                model.logger.info('Complete %s: Calculate_Uloop', __name__)
                 raise ValueError(msg)
 
             if abs(xprod[0] - xlat[-1][dd - 1]) > 1e-12 or abs(yprod[0] - ylat[-1][dd - 1]) > 1e-12 or abs(zprod[0] - zlat[-1][dd - 1]) > 1e-12:
                 msg = f'Error: Coordinate mismatch between bottom of production well and end of lateral #{dd}'
                 print(f'{msg}')
                 model.logger.fatal(msg)
-                model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+                model.logger.info('Complete %s: Calculate_Uloop', __name__)
                 raise ValueError(msg)
 
         if len(lateralflowallocation) != model.wellbores.numnonverticalsections.value:
             msg = 'Error: Length of array "lateralflowallocation" does not match the number of laterals'
             print(f'{msg}')
             model.logger.fatal(msg)
-            model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+            model.logger.info('Complete %s: Calculate_Uloop', __name__)
             raise ValueError(msg)
 
         # Read injection temperature profile if provided
@@ -1260,21 +1258,21 @@ def Calculate_Uloop(self, model):
                 msg = 'Error: Provided injection temperature profile should have at least 2 values'
                 print(f'{msg}')
                 model.logger.fatal(msg)
-                model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+                model.logger.info('Complete %s: Calculate_Uloop', __name__)
                 raise ValueError(msg)
 
             if Tintimearray[0] != 0:
                 msg = 'Error: First time value in the user-provided injection temperature profile does not equal 0 s'
                 print(f'{msg}')
                 model.logger.fatal(msg)
-                model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+                model.logger.info('Complete %s: Calculate_Uloop', __name__)
                 raise ValueError(msg)
 
             if abs(Tintimearray[-1] - times[-1]) > 10e-6:
                 msg = 'Error: Last time value in the user-provided injection temperature profile does not equal the final value in the "times" array'
                 print(f'{msg}')
                 model.logger.fatal(msg)
-                model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+                model.logger.info('Complete %s: Calculate_Uloop', __name__)
                 raise ValueError(msg)
 
             else:
@@ -1298,21 +1296,21 @@ def Calculate_Uloop(self, model):
                 msg = 'Error: Provided flow rate profile should have at least 2 values'
                 print(f'{msg}')
                 model.logger.fatal(msg)
-                model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+                model.logger.info('Complete %s: Calculate_Uloop', __name__)
                 raise ValueError(msg)
 
             if mtimearray[0] != 0:
                 msg = 'Error: First time value in user-provided flow rate profile does not equal to 0 s'
                 print(f'{msg}')
                 model.logger.fatal(msg)
-                model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+                model.logger.info('Complete %s: Calculate_Uloop', __name__)
                 raise ValueError(msg)
 
             if abs(mtimearray[-1] - times[-1]) > 10e-6:
                 msg = 'Error: Last time value in user-provided flow rate profile does not equal to final value in "times" array'
                 print(f'{msg}')
                 model.logger.fatal(msg)
-                model.logger.info(f'Complete {str(__name__)}: {sys._getframe().f_code.co_name}')
+                model.logger.info('Complete %s: Calculate_Uloop', __name__)
                 raise ValueError(msg)
 
             else:
@@ -1810,4 +1808,4 @@ def Calculate_Uloop(self, model):
         # Calculate the Initial Reservoir Heat Content
         self.InitialReservoirHeatContent.value = mstore[0] * model.surfaceplant.cp_fluid.value * (self.Tresoutput.value[0] - Tinstore[0]) / 1e6  # Calculates the heat production [MW]
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate_Uloop', __class__)
@@ -1,5 +1,4 @@
 import math
-import sys
 import numpy as np
 from pint.facets.plain import PlainQuantity
 
@@ -30,7 +29,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, and is used to initialize the class
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
 
         # Initialize the superclass first to gain access to those variables
         super().__init__(model)
@@ -135,7 +134,7 @@ def __init__(self, model: Model):
             ToolTipText='vertical depth where the lateral section ends (tip of the multilateral section, deepest depth of model)'
         )
 
-        model.logger.info(f'complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: __init__', __class__)
 
     def __str__(self):
         return 'SBTWellbores'
@@ -149,7 +148,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)  # read the default parameters
         # if we call super, we don't need to deal with setting the parameters here, just deal with the special cases
         # for the variables in this class because the call to the super.readparameters will set all the variables,
@@ -167,7 +166,7 @@ def read_parameters(self, model: Model) -> None:
         else:
             model.logger.info("No parameters read because no content provided")
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model) -> None:
         """
@@ -176,7 +175,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
         self.Tini = np.max(model.reserv.Tresoutput.value)  # initial temperature of the reservoir
         self.ProducedTemperature.value = np.array(model.reserv.Tresoutput.value)
 
@@ -288,7 +287,7 @@ def Calculate(self, model: Model) -> None:
 
         self._sync_output_params_from_input_params()
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
     def CalculateNonverticalPressureDrop(self, model, value, time_max, al):
         pass
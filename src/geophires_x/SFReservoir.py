@@ -1,4 +1,3 @@
-import sys
 import math
 from .Parameter import floatParameter
 from .Units import *
@@ -19,7 +18,7 @@ def __init__(self, model:Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)   # initialize the parent parameters and variables
         sclass = str(__class__).replace("<class \'", "")
         self.MyClass = sclass.replace("\'>", "")
@@ -46,7 +45,7 @@ def __init__(self, model:Model):
             ToolTipText="specify the thermal drawdown for reservoir model 3 and 4"
         )
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return 'SFReservoir'
@@ -62,13 +61,13 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)    # read the parameters for the parent.
         # if we call super, we don't need to deal with setting the parameters here,
         # just deal with the special cases for the variables in this class
         # because the call to the super.readparameters will set all the variables,
         # including the ones that are specific to this class
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: read_parameters', __class__)
 
     def Calculate(self, model:Model):
         """
@@ -80,7 +79,7 @@ def Calculate(self, model:Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: Calculate', __class__)
         super().Calculate(model)    # run calculation for the parent.
 
         model.reserv.Tresoutput.value[0] = model.reserv.Trock.value
@@ -92,4 +91,4 @@ def Calculate(self, model:Model):
                                                         (model.reserv.Trock.value - model.wellbores.Tinj.value) +\
                                                         model.wellbores.Tinj.value
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: Calculate', __class__)
@@ -1,4 +1,3 @@
-import sys
 import os
 import numpy as np
 import geophires_x.Model as Model
@@ -14,7 +13,7 @@ class SUTRAEconomics(Economics.Economics):
     """
 
     def __init__(self, model: Model):
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)
 
         self.LCOH = self.OutputParameterDict[self.LCOH.Name] = OutputParameter(
@@ -56,7 +55,7 @@ def __init__(self, model: Model):
             CurrentUnits=CurrencyFrequencyUnit.KDOLLARSPERYEAR,
         )
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def read_parameters(self, model: Model) -> None:
         """
@@ -68,7 +67,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
 
         # Deal with all the parameter values that the user has provided.  They should really only provide values
         # that they want to change from the default values, but they can provide a value that is already set
@@ -101,7 +100,7 @@ def read_parameters(self, model: Model) -> None:
 
         self.sync_interest_rate(model)
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model) -> None:
         """
@@ -111,7 +110,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         # This is where all the calculations are made using all the values that have been set.
         # If you subclass this class, you can choose to run these calculations before (or after) your calculations,
@@ -192,7 +191,7 @@ def Calculate(self, model: Model) -> None:
         )  # cents/kWh
 
         self._calculate_derived_outputs(model)
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
 
     def __str__(self):
         return "Economics"
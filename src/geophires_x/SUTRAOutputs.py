@@ -27,7 +27,7 @@ def __init__(self, model: Model, output_file: str = 'HDR.out'):
         :return: None
         """
 
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
 
         self.output_file = output_file
 
@@ -45,7 +45,9 @@ def __init__(self, model: Model, output_file: str = 'HDR.out'):
                 ToolTipText='Provide a 0 if you do not want to print output to the console',
             )
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        self._init_instrumentation_parameters()
+
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return 'SUTRAOutputs'
@@ -58,7 +60,7 @@ def PrintOutputs(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: PrintOutputs', __class__)
 
         self._convert_units(model)
 
@@ -181,4 +183,4 @@ def PrintOutputs(self, model: Model):
             model.logger.critical(msg)
             raise RuntimeError(msg)
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: PrintOutputs', __class__)
@@ -1,5 +1,6 @@
 import sys
 
+from .GeoPHIRESUtils import input_data_file_path
 from .MatplotlibUtils import plt_show, plt_figure
 from .Parameter import strParameter, OutputParameter
 from .Units import *
@@ -37,7 +38,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)   # initialize the parent parameters and variables
         sclass = str(__class__).replace("<class \'", "")
         self.MyClass = sclass.replace("\'>","")
@@ -147,7 +148,7 @@ def __init__(self, model: Model):
             CurrentUnits=TemperatureUnit.CELSIUS
         )
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "UPPReservoir"
@@ -163,14 +164,14 @@ def read_parameters(self, model:Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: read_parameters', __class__)
         # if we call super, we don't need to deal with setting the parameters here, just deal with the special cases
         # for the variables in this class
         # because the call to the super.readparameters will set all the variables, including the ones that are specific
         # to this class
         super().read_parameters(model)    # read the parameters for the parent.
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model):
         """
@@ -180,22 +181,22 @@ def Calculate(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: Calculate', __class__)
         super().Calculate(model)    # run calculations for the parent.
 
         # Read in SUTRA simulation output
         try:
-            data = pd.read_csv(self.sutraannualheatfilename.value)
+            data = pd.read_csv(input_data_file_path(self.sutraannualheatfilename.value))
             self.AnnualHeatStored.value = data[['Heat Stored (J)']].to_numpy()[:,0]/3.6e12
             self.AnnualHeatSupplied.value = data[['Heat Supplied (J)']].to_numpy()[:,0]/3.6e12
             self.AnnualRTESEfficiency.value = data[['Efficiency (%)']].to_numpy()[:,0]
 
-            data = pd.read_csv(self.sutraheatbudgetfilename.value)
+            data = pd.read_csv(input_data_file_path(self.sutraheatbudgetfilename.value))
             self.TimeProfile.value = data[['Time (hrs)']].to_numpy()[:,0]
             self.TargetHeat.value = data[['Target Heat (J)']].to_numpy()[:,0]/3.6e6
             self.SimulatedHeat.value = data[['Simulated Heat (J)']].to_numpy()[:,0]/3.6e6
 
-            data = pd.read_csv(self.sutrabalanceandstoragewelloutputfilename.value)
+            data = pd.read_csv(input_data_file_path(self.sutrabalanceandstoragewelloutputfilename.value))
             self.StorageWellFlowRate.value = data[['Storage Well Q(kg/s)']].to_numpy()[:,0]
             self.BalanceWellFlowRate.value = data[['Balance Well Q(kg/s)']].to_numpy()[:,0]
             self.StorageWellTemperature.value = data[['Storage Well T(C)']].to_numpy()[:,0]
@@ -252,4 +253,4 @@ def Calculate(self, model: Model):
         plt.title('SUTRA Well Temperatures')
         plt_show(block=False)
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: Calculate', __class__)
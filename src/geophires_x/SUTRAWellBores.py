@@ -1,4 +1,3 @@
-import sys
 import os
 import math
 import numpy as np
@@ -28,7 +27,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, and is used to initialize the class
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)
 
         self.rhowaterprod = self.rhowaterinj = 0.0
@@ -43,7 +42,7 @@ def __init__(self, model: Model):
             "Number of Production Wells",
             value=1,
             DefaultValue=1,
-            AllowableRange=list(range(1, 201, 1)),
+            AllowableRange=range(1, 201, 1),
             UnitType=Units.NONE,
             Required=True,
             ErrMessage="assume default number of production wells (1)",
@@ -53,7 +52,7 @@ def __init__(self, model: Model):
             "Number of Injection Wells",
             value=1,
             DefaultValue=1,
-            AllowableRange=list(range(0, 201, 1)),
+            AllowableRange=range(0, 201, 1),
             UnitType=Units.NONE,
             Required=True,
             ErrMessage="assume default number of injection wells (1)",
@@ -184,7 +183,7 @@ def __init__(self, model: Model):
             CurrentUnits=FlowRateUnit.KGPERSEC,
         )
 
-        model.logger.info(f'Complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "WellBores"
@@ -206,7 +205,7 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: read_parameters', __class__)
 
         if len(model.InputParameters) > 0:
             # loop through all the parameters that the user wishes to set, looking for parameters that match this object
@@ -226,7 +225,7 @@ def read_parameters(self, model: Model) -> None:
 
         else:
             model.logger.info("No parameters read because no content provided")
-        model.logger.info("read parameters complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('read parameters complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model) -> None:
         """
@@ -243,7 +242,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: Calculate', __class__)
 
         # special case: production and injection well diameters are input as inches and call calculations
         # assume meters! Check and change if needed, assuming anything > 2 must be talking about inches
@@ -344,4 +343,4 @@ def Calculate(self, model: Model) -> None:
 
         self._sync_output_params_from_input_params()
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: Calculate', __class__)
@@ -359,7 +359,7 @@ def __init__(self, model: Model):
         self.plant_lifetime = self.ParameterDict[self.plant_lifetime.Name] = intParameter(
             "Plant Lifetime",
             DefaultValue=30,
-            AllowableRange=list(range(1, 101, 1)),
+            AllowableRange=range(1, 101, 1),
             UnitType=Units.TIME,
             PreferredUnits=TimeUnit.YEAR,
             CurrentUnits=TimeUnit.YEAR,
@@ -416,7 +416,7 @@ def __init__(self, model: Model):
         self.construction_years = self.ParameterDict[self.construction_years.Name] = intParameter(
             "Construction Years",
             DefaultValue=default_construction_years,
-            AllowableRange=list(range(1, MAX_CONSTRUCTION_YEARS + 1, 1)),
+            AllowableRange=range(1, MAX_CONSTRUCTION_YEARS + 1, 1),
             UnitType=Units.NONE,
             ErrMessage=f'assume default number of years in construction ({default_construction_years})',
             ToolTipText=f'Number of years spent in construction (assumes whole years, no fractions). '
@@ -1,5 +1,4 @@
 import os
-import sys
 from geophires_x.WellBores import *
 from geophires_x.Parameter import floatParameter, OutputParameter
 from geophires_x.Units import *
@@ -327,7 +326,7 @@ def verify(self, model: Model) -> int:
         :return: 0 if all OK, 1 if error.
         :rtype: int
         """
-        model.logger.info(f'Init {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: verify', __class__)
         self.error = 0
         errors = []
 
@@ -374,7 +373,7 @@ def on_invalid_parameter_value(err_msg):
             print(msg)
             raise RuntimeError(msg)
 
-        model.logger.info(f'complete {str(__class__)}: {sys._getframe().f_code.co_name}')
+        model.logger.info('complete %s: verify', __class__)
         return self.error
 
     def calculatepumpingpower(self, model):
@@ -629,7 +628,7 @@ def initialize(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: initialize', __class__)
 
         self.Time_array = np.linspace(0, self.Lifetime * 365 * 24 * 3600,
                                       1 + self.Lifetime * self.Number_of_points_per_year)  # [s]
@@ -699,7 +698,7 @@ def initialize(self, model: Model) -> None:
         # Initialize error code
         self.error_codes = np.zeros(0)  # if error occurs, code will be assigned to this tag
 
-        model.logger.info("complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('complete %s: initialize', __class__)
 
     def Calculate(self, model: Model) -> None:
         """
@@ -708,7 +707,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
 
         err = self.verify(model)
         if err > 0:
@@ -781,4 +780,4 @@ def _integrate_slice(series: np.ndarray, _i: int) -> np.float64:
             raise RuntimeError(base_msg)
 
         self._calculate_derived_outputs(model)
-        model.logger.info(f"complete {str(__class__)}: {sys._getframe().f_code.co_name}")
+        model.logger.info('complete %s: Calculate', __class__)
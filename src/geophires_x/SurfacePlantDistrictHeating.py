@@ -1,6 +1,7 @@
 import os
 import numpy as np
 import pandas as pd
+from geophires_x.GeoPHIRESUtils import input_data_file_path
 from geophires_x.OptionList import PlantType
 from geophires_x.Parameter import floatParameter, intParameter, strParameter, OutputParameter
 from geophires_x.SurfacePlant import SurfacePlant
@@ -66,7 +67,7 @@ def __init__(self, model: Model):
         self.dh_demand_data_column_number = self.ParameterDict[self.dh_demand_data_column_number.Name] = intParameter(
             "District Heating Demand Data Column Number",
             value=2,
-            AllowableRange=list(range(1, 101, 1)),
+            AllowableRange=range(1, 101, 1),
             UnitType=Units.NONE,
             ErrMessage="assume default district heating demand data column number (2)",
             ToolTipText="Select the column number of the hourly or daily data in the district heating demand csv file (if district heating demand option is set to 1)"
@@ -82,7 +83,7 @@ def __init__(self, model: Model):
             self.dh_temperature_data_column_number.Name] = intParameter(
             "Temperature Data Column Number",
             value=2,
-            AllowableRange=list(range(1, 101, 1)),
+            AllowableRange=range(1, 101, 1),
             UnitType=Units.NONE,
             ErrMessage="assume default temperature data column number (2)",
             ToolTipText="Select the column number of the hourly temperature data in the temperature csv file (if district heating demand option is set to 2)"
@@ -90,7 +91,7 @@ def __init__(self, model: Model):
         self.dh_number_of_housing_units = self.ParameterDict[self.dh_number_of_housing_units.Name] = intParameter(
             "Number of Housing Units",
             value=100,
-            AllowableRange=list(range(0, 1000000, 1)),
+            AllowableRange=range(0, 1000000, 1),
             UnitType=Units.NONE,
             ErrMessage="assume default number of housing units (100)",
             ToolTipText="Specify the number of housing units to calculate district heating demand (if district heating demand option is set to 2)"
@@ -312,7 +313,7 @@ def read_daily_demand(self, demand_file_name, demand_data_column, time_interval)
 
     def read_csv(self, file_name, data_column) -> np.array:  # data_column starts from 1
         # Extract data from CSV file
-        Data = pd.read_csv(file_name)  # Read csv data using pandas to dataframe
+        Data = pd.read_csv(input_data_file_path(file_name))  # Read csv data using pandas to dataframe
         data_column -= 1  # change index to start at 0 instead of 1
         data_array = Data.iloc[:, data_column].to_numpy()  # Extract data and convert to numpy array [s]
         return data_array
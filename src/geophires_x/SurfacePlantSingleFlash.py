@@ -1,4 +1,3 @@
-import sys
 from pathlib import Path
 import numpy as np
 from geophires_x.OptionList import EndUseOptions
@@ -17,7 +16,7 @@ def __init__(self, model: Model):
         :return: None
         """
 
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)  # Initialize all the parameters in the superclass
 
         # Set up all the Parameters that will be predefined by this class using the different types of parameter classes.
@@ -36,7 +35,7 @@ def __init__(self, model: Model):
         sclass = self.__class__.__name__
         self.MyClass = sclass
         self.MyPath = Path(__file__).resolve()
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "SurfacePlantSingleFlash"
@@ -49,9 +48,9 @@ def read_parameters(self, model:Model) -> None:
         :param model: The container class of the application, giving access to everything else, including the logger
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)  # Initialize all the parameters in the superclass
-        model.logger.info("complete "+ str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model) -> None:
         """
@@ -61,7 +60,7 @@ def Calculate(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: Nothing, but it does make calculations and set values in the model
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: Calculate', __class__)
 
         # This is where all the calculations are made using all the values that have been set.
         # If you subclass this class, you can choose to run these calculations before (or after) your calculations,
@@ -134,4 +133,4 @@ def Calculate(self, model: Model) -> None:
             self, model.reserv.InitialReservoirHeatContent.value, self.HeatkWhExtracted.value)
 
         self._calculate_derived_outputs(model)
-        model.logger.info(f"complete {str(__class__)}: {sys._getframe().f_code.co_name}")
+        model.logger.info('complete %s: Calculate', __class__)
@@ -1,4 +1,3 @@
-import sys
 
 from geophires_x.Parameter import floatParameter
 import geophires_x.Model as Model
@@ -20,7 +19,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)  # initialize the parent parameters and variables
         sclass = str(__class__).replace("<class \'", "")
         self.MyClass = sclass.replace("\'>", "")
@@ -47,7 +46,7 @@ def __init__(self, model: Model):
             ToolTipText="specify the thermal drawdown for reservoir model 3 and 4"
         )
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "TDPReservoir"
@@ -63,14 +62,14 @@ def read_parameters(self, model: Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)  # read the parameters for the parent.
         # if we call super, we don't need to deal with setting the parameters here, just deal with the special cases
         # for the variables in this class
         # because the call to the super.readparameters will set all the variables,
         # including the ones that are specific to this class
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model):
         """
@@ -79,11 +78,11 @@ def Calculate(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Init %s: Calculate', __class__)
         super().Calculate(model)  # run calculation for the parent.
 
         model.reserv.Tresoutput.value = (1 - model.reserv.drawdp.value * model.reserv.timevector.value) * \
                                         (model.reserv.Trock.value - model.wellbores.Tinj.value) + \
                                         model.wellbores.Tinj.value  # this is no longer as in thesis (equation 4.16)
 
-        model.logger.info(f'Complete {__class__!s}: {sys._getframe().f_code.co_name}')
+        model.logger.info('Complete %s: Calculate', __class__)
@@ -1,3 +1,5 @@
+import os
+import subprocess
 import sys
 import numpy as np
 from .Parameter import floatParameter, strParameter
@@ -19,7 +21,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)   # initialize the parent parameters and variables
         sclass = str(__class__).replace("<class \'", "")
         self.MyClass = sclass.replace("\'>", "")
@@ -66,7 +68,7 @@ def __init__(self, model: Model):
             ToolTipText="Reservoir width for built-in TOUGH2 doublet reservoir model"
         )
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "TOUGH2Reservoir"
@@ -82,7 +84,7 @@ def read_parameters(self, model:Model) -> None:
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)    # read the parameters for the parent.
         # if we call super, we don't need to deal with setting the parameters here, just deal with the special cases
         # for the variables in this class
@@ -113,7 +115,7 @@ def read_parameters(self, model:Model) -> None:
                         else:
                             self.usebuiltintough2model = False
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: read_parameters', __class__)
 
     def Calculate(self, model:Model):
         """
@@ -125,13 +127,15 @@ def Calculate(self, model:Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: Calculate', __class__)
         super().Calculate(model)    # run calculate for the parent.
 
-        # GEOPHIRES assumes TOUGH2 executable and input file are in same directory as GEOPHIRESv3.py
+        # GEOPHIRES assumes TOUGH2 executable and input file are in same directory as GEOPHIRESv3.py, so TOUGH2 is run
+        # in that directory (without changing the working directory of the process).
         # create tough2 input file
+        tough2_dir = os.path.dirname(os.path.abspath(__file__))
         path_to_exe = str(self.tough2_executable_path.value)
-        if not os.path.exists(os.path.join(os.getcwd(), path_to_exe)):
+        if not os.path.exists(os.path.join(tough2_dir, path_to_exe)):
             model.logger.critical('TOUGH2 executable file does not exist in current working directory. \
             GEOPHIRES will abort simulation.')
             print('TOUGH2 executable file does not exist in current working directory. \
@@ -159,7 +163,7 @@ def Calculate(self, model:Model):
             arrayhinj = np.array([1.0E4, 5.0E4, 1.0E5, 1.5E5, 2.0E5, 2.5E5, 3.0E5, 3.5E5, 4.0E5, 4.5E5, 5.0E5])
             injenthalpy = np.interp(model.wellbores.Tinj.value,arraytinj,arrayhinj)
             # write doublet input file
-            f = open(infile,'w', encoding='UTF-8')
+            f = open(os.path.join(tough2_dir, infile),'w', encoding='UTF-8')
             f.write('Doublet\n')
             f.write('MESHMAKER1----*----2----*----3----*----4----*----5----*----6----*----7----*----8\n')
             f.write('XYZ\n')
@@ -213,14 +217,14 @@ def Calculate(self, model:Model):
 
         # run TOUGH2 executable
         try:
-            os.system('%s < %s > %s' % (path_to_exe, infile, outfile))
+            subprocess.run('%s < %s > %s' % (path_to_exe, infile, outfile), shell=True, cwd=tough2_dir)
         except:
             print("Error: GEOPHIRES could not run TOUGH2 and will abort simulation.")
             sys.exit()
 
         # read output temperature and pressure
         try:
-            fname = 'FOFT'
+            fname = os.path.join(tough2_dir, 'FOFT')
             with open(fname, encoding='UTF-8') as f:
                 content = f.readlines()
 
@@ -238,4 +242,4 @@ def Calculate(self, model:Model):
             print("Error: GEOPHIRES could not import production temperature and pressure from TOUGH2 output file (" +
                   infile + ") and will abort simulation.")
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: Calculate', __class__)
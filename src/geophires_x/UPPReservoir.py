@@ -1,4 +1,5 @@
 import sys
+from .GeoPHIRESUtils import input_data_file_path
 from .Parameter import strParameter
 from .Units import *
 import geophires_x.Model as Model
@@ -18,7 +19,7 @@ def __init__(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: __init__', __class__)
         super().__init__(model)   # initialize the parent parameters and variables
         sclass = str(__class__).replace("<class \'", "")
         self.MyClass = sclass.replace("\'>","")
@@ -43,7 +44,7 @@ def __init__(self, model: Model):
             ToolTipText="File name of reservoir output in case reservoir model 5 is selected"
         )
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: __init__', __class__)
 
     def __str__(self):
         return "UPPReservoir"
@@ -58,14 +59,14 @@ def read_parameters(self, model:Model) -> None:
         :param model: The container class of the application, giving access to everything else, including the logger
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: read_parameters', __class__)
         super().read_parameters(model)    # read the parameters for the parent.
         # if we call super, we don't need to deal with setting the parameters here, just deal with the special cases
         # for the variables in this class
         # because the call to the super.readparameters will set all the variables, including the ones that are specific
         # to this class
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: read_parameters', __class__)
 
     def Calculate(self, model: Model):
         """
@@ -75,12 +76,12 @@ def Calculate(self, model: Model):
         :type model: :class:`~geophires_x.Model.Model`
         :return: None
         """
-        model.logger.info("Init " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Init %s: Calculate', __class__)
         super().Calculate(model)    # run calculations for the parent.
 
         model.reserv.Tresoutput.value[0] = model.reserv.Trock.value
         try:
-            with open(model.reserv.filenamereservoiroutput.value, encoding='UTF-8') as f:
+            with open(input_data_file_path(model.reserv.filenamereservoiroutput.value), encoding='UTF-8') as f:
                 contentprodtemp = f.readlines()
         except:
             model.logger.critical('Error: GEOPHIRES could not read reservoir output file ('
@@ -103,4 +104,4 @@ def Calculate(self, model: Model):
         for i in range(0, numlines-1):
             model.reserv.Tresoutput.value[i] = float(contentprodtemp[i].split(',')[1].strip('\n'))
 
-        model.logger.info("Complete " + str(__class__) + ": " + sys._getframe().f_code.co_name)
+        model.logger.info('Complete %s: Calculate', __class__)
@@ -1,18 +1,79 @@
 # copyright, 2023, Malcolm I Ross
+"""
+Units of measure of GEOPHIRES parameters, and the shared pint unit registry.
+
+The unit registry is loaded through pint's disk cache of parsed unit definitions, which is written on first use to
+pint's folder in the user cache directory (e.g. ~/.cache/pint on Linux, ~/Library/Caches/pint on macOS, and
+%LOCALAPPDATA%\\pint\\Cache on Windows). Set the GEOPHIRES_UNIT_REGISTRY_CACHE_FOLDER environment variable to use a
+different folder, or to an empty string to disable the cache.
+"""
+
 from enum import IntEnum, Enum, auto
-from typing import Any
+from typing import Any, Optional
 
 import pint
+from pint.registry import LazyRegistry
 import os
+import threading
 
 _UREG = None
+_UREG_LOCK = threading.Lock()
+
+_NEW_UNITS_DEFINITIONS_FILE_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'GEOPHIRES3_newunits.txt')
+
+UNIT_REGISTRY_CACHE_FOLDER_ENV_VAR = 'GEOPHIRES_UNIT_REGISTRY_CACHE_FOLDER'
+"""
+Environment variable that sets the folder of the unit registry cache (by default, pint's folder in the user cache
+directory). Set it to an empty string to disable the cache.
+"""
+
+
+def _unit_registry_cache_folder() -> Optional[str]:
+    cache_folder = os.getenv(UNIT_REGISTRY_CACHE_FOLDER_ENV_VAR, ':auto:')
+    return cache_folder if cache_folder != '' else None
+
+
+def _new_cached_unit_registry() -> Optional[pint.UnitRegistry]:
+    """
+    Parsing the default and GEOPHIRES unit definitions is a large share of the cold start of a process (e.g. a server or
+    client worker). pint caches the parsed definitions and the derived registry data in its cache folder, keyed by the
+    contents of the definitions files and the pint version, so only the first process after either changes parses them.
+
+    :return: A registry with the GEOPHIRES unit definitions loaded through the cache, or None if the cache is disabled
+        or its folder is not writable, or the installed pint does not support caching
+    """
+
+    cache_folder = _unit_registry_cache_folder()
+    if cache_folder is None:
+        return None
+
+    try:
+        ureg = pint.UnitRegistry(cache_folder=cache_folder)
+        ureg.load_definitions(_NEW_UNITS_DEFINITIONS_FILE_PATH)
+        return ureg
+    except (OSError, TypeError):
+        # TypeError: pint versions before 0.20 do not take a cache folder
+        return None
 
 
 def get_unit_registry():
     global _UREG
     if _UREG is None:
-        _UREG = pint.get_application_registry()
-        _UREG.load_definitions(os.path.join(os.path.abspath(os.path.dirname(__file__)), 'GEOPHIRES3_newunits.txt'))
+        # locked so that models constructed concurrently in threads load the definitions only once
+        with _UREG_LOCK:
+            if _UREG is None:
+                # The cached registry replaces the application registry only if it has not been used yet, since
+                # quantities of different registries can't be combined.
+                if isinstance(pint.application_registry.get(), LazyRegistry):
+                    cached_ureg = _new_cached_unit_registry()
+                    if cached_ureg is not None:
+                        pint.set_application_registry(cached_ureg)
+                        _UREG = pint.get_application_registry()
+                        return _UREG
+
+                ureg = pint.get_application_registry()
+                ureg.load_definitions(_NEW_UNITS_DEFINITIONS_FILE_PATH)
+                _UREG = ureg
 
     return _UREG
 
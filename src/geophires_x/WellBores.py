@@ -716,7 +716,7 @@ def __init__(self, model: Model):
         self.nprod = self.ParameterDict[self.nprod.Name] = intParameter(
             "Number of Production Wells",
             DefaultValue=2,
-            AllowableRange=list(range(1, max_doublets+1, 1)),
+            AllowableRange=range(1, max_doublets+1, 1),
             UnitType=Units.NONE,
             Required=False,
             ErrMessage="assume default number of production wells (2)",
@@ -726,7 +726,7 @@ def __init__(self, model: Model):
         self.ninj = self.ParameterDict[self.ninj.Name] = intParameter(
             "Number of Injection Wells",
             DefaultValue=2,
-            AllowableRange=list(range(0, max_doublets+1, 1)),
+            AllowableRange=range(0, max_doublets+1, 1),
             UnitType=Units.NONE,
             Required=False,
             ErrMessage="assume default number of injection wells (2)",
@@ -735,7 +735,7 @@ def __init__(self, model: Model):
         self.doublets_count = self.ParameterDict[self.doublets_count.Name] = intParameter(
             "Number of Doublets",
             DefaultValue=2,
-            AllowableRange=list(range(0, max_doublets+1, 1)),
+            AllowableRange=range(0, max_doublets+1, 1),
             UnitType=Units.NONE,
             ToolTipText="Pass this parameter to set the Number of Production Wells and Number of Injection Wells to "
                         "same value."
@@ -1072,7 +1072,7 @@ def __init__(self, model: Model):
         self.numnonverticalsections = self.ParameterDict[self.numnonverticalsections.Name] = intParameter(
             "Number of Multilateral Sections",
             DefaultValue=0,
-            AllowableRange=list(range(0, max_allowed_total_wells * max_allowed_laterals_per_well_when_max_wells, 1)),
+            AllowableRange=range(0, max_allowed_total_wells * max_allowed_laterals_per_well_when_max_wells, 1),
             UnitType=Units.NONE,
             ErrMessage="assume default for Number of Nonvertical Wellbore Sections (0)",
             ToolTipText='Number of Nonvertical Wellbore Sections, aka laterals or horizontals. '
@@ -1,36 +1,43 @@
 import argparse
+import sys
+from pathlib import Path
 
 from geophires_x import GEOPHIRESv3 as geophires
-from pathlib import Path
-import sys
-import os
+from geophires_x import MultiCase
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='GEOPHIRES-X CLI')
+    parser.add_argument('input-file', nargs=1, help='Input file path')
+    parser.add_argument('output-file', nargs='?', help='Output file path (the CSV results table, for multi-case runs)')
+    parser.add_argument('--cases', help='CSV file of case overrides, to run the input file as a multi-case input file')
+    parser.add_argument('--workers', type=int, help='Maximum number of worker processes of multi-case runs')
+    parsed_args = {k: v for k, v in vars(parser.parse_args()).items() if v is not None}
+
+    input_file = Path(parsed_args['input-file'][0]).absolute()
 
-parser = argparse.ArgumentParser(description='GEOPHIRES-X CLI')
-parser.add_argument('input-file', nargs=1, help='Input file path')
-parser.add_argument('output-file', nargs='?', help='Output file path')
-parsed_args = {k: v for k, v in vars(parser.parse_args()).items() if v is not None}
+    # (multi-case input files have case blocks; see geophires_x.MultiCase). The input file is only read here; if it
+    # has no cases, its parameters are passed to the single run.
+    base_input_parameters, cases = MultiCase.read_cases(input_file, parsed_args.get('cases'))
 
-stash_cwd = Path.cwd()
-stash_sys_argv = sys.argv
+    if len(cases) > 0:
+        if 'output-file' in parsed_args:
+            results_file = Path(parsed_args['output-file']).absolute()
+        else:
+            results_file = Path(Path.cwd(), 'HDR_cases.csv').absolute()
 
-if 'input-file' in parsed_args:
-    sys.argv[1] = Path(parsed_args['input-file'][0]).absolute()
+        MultiCase.run_cases(base_input_parameters, cases, results_file, max_workers=parsed_args.get('workers'))
+        return
 
-if 'output-file' in parsed_args:
-    sys.argv[2] = Path(parsed_args['output-file']).absolute()
-else:
-    if len(sys.argv) < 3:
-        sys.argv.append('')
+    if 'output-file' in parsed_args:
+        output_file = Path(parsed_args['output-file']).absolute()
+    else:
+        output_file = Path(Path.cwd(), 'HDR.out').absolute()
 
-    sys.argv[2] = Path(stash_cwd, 'HDR.out').absolute()
+    geophires.main(input_file=input_file, output_file=output_file, input_parameters=base_input_parameters)
 
-rc = 1
-try:
-    geophires.main()
-    rc = 0
-finally:
-    # Undo internal global settings changes
-    sys.argv = stash_sys_argv
-    os.chdir(stash_cwd)
 
-sys.exit(rc)
+# (the guard keeps worker processes of multi-case runs, which may import this module, from running the CLI)
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
@@ -0,0 +1,434 @@
+"""
+Local GEOPHIRES-X simulation server.
+
+Every process that runs GEOPHIRES pays for importing its dependencies and initializing their state (the pint unit
+registry, CoolProp, PySAM, etc.) before its first simulation. The server pays that cost once: it keeps a pool of worker
+processes that are warmed up with a small simulation at startup, and runs simulation requests sent by clients (see
+``geophires_x_client.GeophiresXClient(server_address=...)``) on them.
+
+The server accepts JSON requests over HTTP, on localhost or on a Unix domain socket:
+
+``GET /health``
+    ``{"status": "ok", "version": <GEOPHIRES version>, "workers": <number of workers>}``
+
+``POST /simulate``, with body ``{"input": <input file text>, "headless": <bool, optional>, "outputs": <list, optional>}``
+    ``{"output": <text report>, "json": <JSON output>, "structured_result": <structured result sidecar>}``, or if
+    headless is true, ``{"output_parameters": {<name>: <output parameter>}}`` (see
+    ``geophires_x.ParameterSerialization.output_parameter_to_json_dict``).
+    If outputs (output parameter names) are given, only they are calculated and returned (see
+    ``geophires_x.OutputProjection``).
+
+Errors are returned with status 400 (invalid request), 413 (request body too large), 500 (simulation failed), or 504
+(simulation timed out) and body ``{"error": <message>}``.
+
+Output files that the input asks for (e.g. ``Profile Output File``) are written in a temporary directory of the request
+and discarded, so clients can't write files elsewhere on the server; their values must be plain file names. Input files
+that the input refers to (e.g. ``District Heating Demand File Name``) are read from the geophires_x package directory
+(which has the data files of the examples), so clients can't read files elsewhere on the server; their values must be
+relative paths within it.
+
+
+Usage:
+    python -m geophires_x.server [--host HOST] [--port PORT | --unix-socket PATH] [--workers N] [--timeout SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import re
+import socketserver
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import geophires_x
+
+# noinspection PyPep8Naming
+from geophires_x import GEOPHIRESv3 as geophires
+from geophires_x.GeoPHIRESUtils import input_data_file_path
+from geophires_x.GeoPHIRESUtils import parse_input_line
+from geophires_x.OutputsStructured import get_structured_result_file_path
+from geophires_x.ParameterSerialization import output_parameter_to_json_dict
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_MAX_REQUEST_BYTES = 8 * 1024 * 1024
+DEFAULT_TIMEOUT_SEC = 600.0
+
+_OUTPUT_PATH_PARAMETER_NAMES = ('Improved Text Output File', 'HTML Output File', 'Profile Output File')
+"""Input parameters that set the paths of files written by a simulation"""
+
+_INPUT_PATH_PARAMETER_NAMES = (
+    'District Heating Demand File Name',
+    'Temperature File Name',
+    'SUTRA Annual Heat File Name',
+    'SUTRA Heat Budget File Name',
+    'SUTRA Balance and Storage Well Output File Name',
+    'Reservoir Output File Name',
+    'Flowrate File',
+    'Injection Temperature File',
+)
+"""Input parameters that set the paths of files read by a simulation"""
+
+_TOUGH2_PATH_PARAMETER_NAMES = ('TOUGH2 Executable Path', 'TOUGH2 Model/File Name')
+"""Input parameters that set the paths of the TOUGH2 executable and model file, which TOUGH2Reservoir resolves in the
+package directory itself (and which also accept built-in model names, such as Doublet)"""
+
+_SAFE_PATH_PATTERN = re.compile(r'[A-Za-z0-9_.\-]+(/[A-Za-z0-9_.\-]+)*')
+
+_WARM_UP_INPUT = 'Gradient 1, 69\nReservoir Depth, 5\nEnd-Use Option, 1\nPower Plant Type, 4\n'
+"""A small simulation that exercises the models, unit conversions, and fluid property lookups most inputs use"""
+
+
+def _confine_file_paths(input_text: str, output_dir: Path) -> str:
+    """
+    :return: The input text with the output file parameters set to paths in output_dir and the input file parameters
+        set to paths in the package directory
+    :raises ValueError: If an output file parameter is not a plain file name (e.g. it is an absolute path or has parent
+        directories), or an input file parameter is not a relative path within the package directory
+    """
+
+    lines = []
+    for line in input_text.splitlines(keepends=True):
+        entry = parse_input_line(line)
+        if entry is not None and entry.Name in _OUTPUT_PATH_PARAMETER_NAMES:
+            file_name = entry.sValue
+            if file_name in ('', '.', '..') or any(separator in file_name for separator in ('/', '\\', ':')):
+                raise ValueError(f'{entry.Name} must be a file name, not a path: {file_name}')
+
+            line = f'{entry.Name}, {Path(output_dir, file_name)}\n'
+
+        elif entry is not None and entry.Name in (*_INPUT_PATH_PARAMETER_NAMES, *_TOUGH2_PATH_PARAMETER_NAMES):
+            file_path = entry.sValue
+            if _SAFE_PATH_PATTERN.fullmatch(file_path) is None or '..' in file_path.split('/'):
+                raise ValueError(
+                    f'{entry.Name} must be a relative path within the GEOPHIRES package directory, '
+                    f'of letters, digits, and _.- separated by /: {file_path}'
+                )
+
+            if entry.Name in _INPUT_PATH_PARAMETER_NAMES:
+                line = f'{entry.Name}, {input_data_file_path(file_path)}\n'
+
+        lines.append(line)
+
+    return ''.join(lines)
+
+
+def simulate(input_text: str, headless: bool = False, outputs: list[str] | None = None) -> dict[str, Any]:
+    """
+    Runs a simulation in the current process. This is what server workers run for each request.
+
+    :return: The JSON-serializable response to a simulation request, as documented in the module docstring
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file_path = Path(tmp_dir, 'input.txt')
+        input_file_path.write_text(_confine_file_paths(input_text, Path(tmp_dir)), encoding='UTF-8')
+        output_file_path = Path(tmp_dir, 'result.out')
+
+        try:
+            with open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+                output_parameters = geophires.main(
+                    enable_geophires_logging_config=False,
+                    headless=headless,
+                    input_file=input_file_path,
+                    output_file=output_file_path,
+                    outputs=outputs,
+                )
+        except Exception as e:
+            raise RuntimeError(f'GEOPHIRES encountered an exception: {e!s}') from e
+        except SystemExit:
+            raise RuntimeError('GEOPHIRES exited without giving a reason') from None
+
+        if headless:
+            return {
+                'output_parameters': {
+                    name: output_parameter_to_json_dict(output_parameter)
+                    for name, output_parameter in output_parameters.items()
+                }
+            }
+
+        def _read_if_exists(file_path: Path) -> str | None:
+            return file_path.read_text(encoding='UTF-8') if file_path.exists() else None
+
+        return {
+            'output': output_file_path.read_text(encoding='UTF-8'),
+            'json': _read_if_exists(output_file_path.with_suffix('.json')),
+            'structured_result': _read_if_exists(get_structured_result_file_path(output_file_path)),
+        }
+
+
+def _initialize_worker() -> None:
+    try:
+        simulate(_WARM_UP_INPUT, headless=True)
+    except Exception as e:
+        _logger.warning(f'Warm-up simulation failed (worker will still accept requests): {e!s}')
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: ThreadingHTTPServer | _ThreadingUnixHTTPServer
+
+    def do_GET(self) -> None:
+        if self.path != '/health':
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': f'Not found: {self.path}'})
+            return
+
+        geophires_server: GeophiresXServer = self.server.geophires_server
+        self._send_json(
+            HTTPStatus.OK, {'status': 'ok', 'version': geophires_x.__version__, 'workers': geophires_server.max_workers}
+        )
+
+    def do_POST(self) -> None:
+        if self.path != '/simulate':
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': f'Not found: {self.path}'})
+            return
+
+        geophires_server: GeophiresXServer = self.server.geophires_server
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+            if content_length < 0:
+                raise ValueError(f'Invalid Content-Length: {content_length}')
+            if content_length > geophires_server.max_request_bytes:
+                self.close_connection = True  # the body is not read
+                self._send_json(
+                    HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                    {'error': f'Request body exceeds {geophires_server.max_request_bytes} bytes'},
+                )
+                return
+
+            request = json.loads(self.rfile.read(content_length))
+            input_text = request['input']
+            headless = bool(request.get('headless', False))
+            outputs = request.get('outputs')
+            if not isinstance(input_text, str):
+                raise TypeError('input must be a string')
+            if outputs is not None and not (
+                headless and isinstance(outputs, list) and all(isinstance(it, str) for it in outputs)
+            ):
+                raise TypeError('outputs must be a list of output parameter names, and is only valid if headless')
+            _confine_file_paths(input_text, Path(tempfile.gettempdir()))
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': f'Invalid simulation request: {e!s}'})
+            return
+
+        try:
+            response = geophires_server.run(input_text, headless, outputs=outputs)
+        except TimeoutError as e:
+            self._send_json(HTTPStatus.GATEWAY_TIMEOUT, {'error': str(e)})
+            return
+        except RuntimeError as e:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)})
+            return
+
+        self._send_json(HTTPStatus.OK, response)
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        content = json.dumps(body).encode('UTF-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def address_string(self) -> str:
+        # Unix domain socket clients have no address
+        return str(self.client_address[0]) if self.client_address else 'unix'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        _logger.debug(f'{self.address_string()} - {format % args}')
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class GeophiresXServer:
+    """
+    Runs simulation requests on a pool of warm worker processes. Use as a context manager to serve in a background
+    thread, e.g. in tests, or call start() then serve_forever() to serve in the current thread.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        unix_socket_path: str | Path | None = None,
+        max_workers: int | None = None,
+        timeout_sec: float | None = DEFAULT_TIMEOUT_SEC,
+        max_request_bytes: int = DEFAULT_MAX_REQUEST_BYTES,
+    ):
+        """
+        :param port: Port to listen on (0 for any free port). Ignored if unix_socket_path is given.
+        :param unix_socket_path: If given, listen on this Unix domain socket instead of on host and port
+        :param max_workers: Number of worker processes; defaults to the number of CPUs
+        :param timeout_sec: Time to wait for the result of a simulation, or None to wait indefinitely. A simulation that
+            times out keeps its worker busy until it completes, since GEOPHIRES cannot be interrupted.
+        :param max_request_bytes: Maximum size of a request body
+        """
+
+        self._host = host
+        self._port = port
+        self._unix_socket_path = Path(unix_socket_path) if unix_socket_path is not None else None
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self.timeout_sec = timeout_sec
+        self.max_request_bytes = max_request_bytes
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._http_server: ThreadingHTTPServer | _ThreadingUnixHTTPServer | None = None
+        self._serve_thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> str:
+        """
+        :return: The address clients connect to: ``http://<host>:<port>`` or ``unix:<socket path>``
+        """
+
+        if self._unix_socket_path is not None:
+            return f'unix:{self._unix_socket_path}'
+
+        port = self._http_server.server_address[1] if self._http_server is not None else self._port
+        return f'http://{self._host}:{port}'
+
+    def start(self) -> None:
+        """
+        Starts and warms up the worker processes, then binds the server's socket. Returns once the server is ready to
+        accept requests.
+        """
+
+        self._executor = self._create_executor()
+
+        # Submitting one task per worker starts all of them (and waits for their warm-up) before accepting requests
+        worker_pids = {it.result() for it in [self._executor.submit(_ready) for _ in range(self.max_workers)]}
+        _logger.info(f'Started {len(worker_pids)} warm worker(s)')
+
+        if self._unix_socket_path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                self._unix_socket_path.unlink()
+            self._http_server = _ThreadingUnixHTTPServer(str(self._unix_socket_path), _RequestHandler)
+        else:
+            self._http_server = ThreadingHTTPServer((self._host, self._port), _RequestHandler)
+            self._http_server.daemon_threads = True
+
+        self._http_server.geophires_server = self
+
+    def run(self, input_text: str, headless: bool = False, outputs: list[str] | None = None) -> dict[str, Any]:
+        """
+        Runs a simulation on a worker.
+
+        :return: The JSON-serializable response to the simulation request, as documented in the module docstring
+        :raises TimeoutError: If the simulation did not complete within the server's timeout
+        :raises RuntimeError: If the simulation fails
+        """
+
+        executor = self._executor
+        future = executor.submit(simulate, input_text, headless, outputs)
+        try:
+            return future.result(timeout=self.timeout_sec)
+        except FutureTimeoutError:
+            future.cancel()  # only takes effect if it has not started yet
+            raise TimeoutError(f'GEOPHIRES simulation timed out after {self.timeout_sec} seconds') from None
+        except BrokenProcessPool as e:
+            # A worker died (e.g. it ran out of memory); replace the pool so that later requests can succeed.
+            with self._executor_lock:
+                if self._executor is executor:
+                    _logger.warning('Worker process pool is broken, replacing it')
+                    executor.shutdown(wait=False)
+                    self._executor = self._create_executor()
+
+            raise RuntimeError(f'GEOPHIRES-X server worker failed: {e!s}') from e
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=_initialize_worker)
+
+    def serve_forever(self) -> None:
+        self._http_server.serve_forever()
+
+    def shutdown(self) -> None:
+        if self._http_server is not None:
+            if self._serve_thread is not None:
+                self._http_server.shutdown()
+                self._serve_thread.join()
+                self._serve_thread = None
+
+            self._http_server.server_close()
+            self._http_server = None
+
+            if self._unix_socket_path is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    self._unix_socket_path.unlink()
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> GeophiresXServer:
+        self.start()
+        self._serve_thread = threading.Thread(target=self.serve_forever, name='GeophiresXServer', daemon=True)
+        self._serve_thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port to listen on (0 for any free port)')
+    parser.add_argument('--unix-socket', help='Listen on this Unix domain socket path instead of on host and port')
+    parser.add_argument('--workers', type=int, help='Number of worker processes (default: number of CPUs)')
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=DEFAULT_TIMEOUT_SEC,
+        help=f'Time to wait for the result of a simulation, in seconds (default: {DEFAULT_TIMEOUT_SEC:g})',
+    )
+    parser.add_argument(
+        '--max-request-bytes',
+        type=int,
+        default=DEFAULT_MAX_REQUEST_BYTES,
+        help=f'Maximum size of a request body (default: {DEFAULT_MAX_REQUEST_BYTES})',
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s][%(levelname)s] %(message)s')
+
+    server = GeophiresXServer(
+        host=args.host,
+        port=args.port,
+        unix_socket_path=args.unix_socket,
+        max_workers=args.workers,
+        timeout_sec=args.timeout,
+        max_request_bytes=args.max_request_bytes,
+    )
+    server.start()
+    print(f'GEOPHIRES-X server listening on {server.address}', flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,49 @@
+from __future__ import annotations
+
 import atexit
-import os
-import sys
 import threading
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from dataclasses import dataclass
 from multiprocessing import Manager
 from multiprocessing import current_process
 from pathlib import Path
+from typing import Any
+from typing import Iterable
+from typing import Iterator
 
 # noinspection PyPep8Naming
 from geophires_x import GEOPHIRESv3 as geophires
+from geophires_x.OutputsStructured import get_structured_result_file_path
+from geophires_x.Parameter import OutputParameter
+from geophires_x.ParameterSerialization import output_parameter_from_json_dict
 
+from .async_client import AsyncGeophiresXClient  # noqa: F401
 from .common import _get_logger
 from .geophires_input_parameters import GeophiresInputParameters
 from .geophires_input_parameters import ImmutableGeophiresInputParameters
 from .geophires_x_result import GeophiresXResult
+from .server_transport import GeophiresXServerTransport
+
+
+@dataclass
+class GeophiresXBatchResult:
+    """The outcome of one case of a batch run with GeophiresXClient.get_geophires_results"""
+
+    index: int
+    """The position of the case in the batch's inputs"""
+
+    input_params: GeophiresInputParameters
+    result: GeophiresXResult | None = None
+    exception: Exception | None = None
+    """The exception raised by the case's simulation, if it failed"""
+
+    @property
+    def succeeded(self) -> bool:
+        return self.exception is None
 
 
 class GeophiresXClient:
@@ -30,12 +61,18 @@ class GeophiresXClient:
     _init_lock = threading.Lock()
     """A standard threading lock to make the one-time initialization thread-safe."""
 
-    def __init__(self, enable_caching=False, logger_name=None):
+    def __init__(self, enable_caching=False, logger_name=None, server_address: str | None = None):
+        """
+        :param server_address: If given, simulations are run by the GEOPHIRES-X server (geophires_x.server) at this
+            address (``http://<host>:<port>`` or ``unix:<socket path>``) instead of in the current process
+        """
+
         if logger_name is None:
             logger_name = __name__
 
         self._logger = _get_logger(logger_name=logger_name)
         self._enable_caching = enable_caching
+        self._server_transport = GeophiresXServerTransport(server_address) if server_address is not None else None
 
         if enable_caching and GeophiresXClient._manager is None:
             # Lazy-initialize shared resources if they haven't been already.
@@ -110,22 +147,184 @@ def get_geophires_result(self, input_params: GeophiresInputParameters) -> Geophi
             GeophiresXClient._cache[cache_key] = result
             return result
 
+    def get_geophires_output_parameters(
+        self, input_params: GeophiresInputParameters, outputs: Iterable[str] | None = None
+    ) -> dict[str, OutputParameter]:
+        """
+        Calculates a GEOPHIRES result without rendering any outputs (text report, JSON, HTML, etc.) and returns the
+        calculated output parameters by name. Use this instead of get_geophires_result when only the values are needed,
+        e.g. in optimization or Monte Carlo loops, to avoid report formatting overhead.
+
+        :param outputs: The names of the output parameters to calculate and return, e.g. ['LCOE', 'Net Electricity
+            Production'], if only some are needed; post-processing that produces none of them is skipped (see
+            geophires_x.OutputProjection)
+        """
+        return self._run_geophires(input_params, headless=True, outputs=outputs)
+
+    def get_geophires_results(
+        self,
+        inputs: Iterable[GeophiresInputParameters],
+        max_workers: int | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> Iterator[GeophiresXBatchResult]:
+        """
+        Calculates GEOPHIRES results for a batch of cases in parallel, yielding each case's outcome as it completes.
+        Cases run in a pool of worker processes, or, if the client uses a server, in threads that send requests to the
+        server.
+
+        Identical cases (instances of ImmutableGeophiresInputParameters with the same content) are only simulated once,
+        and if caching is enabled, cases that are already in the cache are not simulated at all. A case that fails does
+        not affect the other cases: its exception is captured in its outcome instead of being raised.
+
+        :param max_workers: Maximum number of worker processes (or threads, with a server); defaults to the executor's
+            default (the number of CPUs for processes)
+        :param chunksize: Number of cases sent to a worker at a time; larger chunks reduce inter-process
+            communication overhead for many short simulations, but results are yielded a chunk at a time. Defaults to 1.
+        :param ordered: If True, outcomes are yielded in the order of inputs; if False, in order of completion
+        """
+
+        input_params_list = list(inputs)
+        chunksize = chunksize if chunksize is not None else 1
+        if chunksize < 1:
+            raise ValueError(f'chunksize must be at least 1 (got {chunksize})')
+
+        # Indexes of the cases that have the same inputs, by cache key
+        indexes_by_key: dict[Any, list[int]] = {}
+        for index, input_params in enumerate(input_params_list):
+            key = hash(input_params) if isinstance(input_params, ImmutableGeophiresInputParameters) else (None, index)
+            indexes_by_key.setdefault(key, []).append(index)
+
+        use_cache = self._enable_caching and GeophiresXClient._manager is not None
+        cached_results: dict[Any, GeophiresXResult] = {}
+        if use_cache:
+            with GeophiresXClient._lock:
+                cached_results = {
+                    key: GeophiresXClient._cache[key] for key in indexes_by_key if key in GeophiresXClient._cache
+                }
+
+        keys_to_simulate = [key for key in indexes_by_key if key not in cached_results]
+        chunks = [keys_to_simulate[i : i + chunksize] for i in range(0, len(keys_to_simulate), chunksize)]
+
+        ready_outcomes: dict[int, GeophiresXBatchResult] = {}
+        next_index = 0
+
+        def _outcomes(
+            key: Any, result: GeophiresXResult | None, exception: Exception | None
+        ) -> Iterator[GeophiresXBatchResult]:
+            nonlocal next_index
+
+            for index in indexes_by_key[key]:
+                outcome = GeophiresXBatchResult(index, input_params_list[index], result, exception)
+                if not ordered:
+                    yield outcome
+                    continue
+
+                ready_outcomes[index] = outcome
+                while next_index in ready_outcomes:
+                    yield ready_outcomes.pop(next_index)
+                    next_index += 1
+
+        for key, result in cached_results.items():
+            yield from _outcomes(key, result, None)
+
+        if len(chunks) == 0:
+            return
+
+        server_address = self._server_transport.server_address if self._server_transport is not None else None
+        executor: Executor = (
+            ThreadPoolExecutor(max_workers=max_workers)
+            if server_address is not None
+            else ProcessPoolExecutor(max_workers=max_workers)
+        )
+        futures: dict[Future, list[Any]] = {}
+        try:
+            for chunk in chunks:
+                chunk_input_params = [input_params_list[indexes_by_key[key][0]] for key in chunk]
+                futures[executor.submit(_run_batch_cases, chunk_input_params, server_address)] = chunk
+
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    chunk_outcomes = future.result()
+                except Exception as e:
+                    # The worker failed as a whole, e.g. because its process died
+                    chunk_outcomes = [(None, e)] * len(chunk)
+
+                for key, (result, exception) in zip(chunk, chunk_outcomes):
+                    if exception is None and use_cache and not isinstance(key, tuple):
+                        with GeophiresXClient._lock:
+                            GeophiresXClient._cache[key] = result
+
+                    yield from _outcomes(key, result, exception)
+        finally:
+            # Don't run the remaining cases if the caller stops consuming outcomes
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+
     def _run_simulation(self, input_params: GeophiresInputParameters) -> GeophiresXResult:
         """Helper method to encapsulate the actual GEOPHIRES run."""
-        stash_cwd = Path.cwd()
-        stash_sys_argv = sys.argv
-        sys.argv = ['', input_params.as_file_path(), input_params.get_output_file_path()]
+        self._run_geophires(input_params)
+
+        self._logger.info(f'GEOPHIRES-X output file: {input_params.get_output_file_path()}')
+        result = GeophiresXResult(input_params.get_output_file_path())
+        return result
+
+    # noinspection PyMethodMayBeStatic
+    def _run_geophires(
+        self, input_params: GeophiresInputParameters, headless: bool = False, outputs: Iterable[str] | None = None
+    ) -> dict[str, OutputParameter] | None:
+        if self._server_transport is not None:
+            return self._run_geophires_on_server(input_params, headless=headless, outputs=outputs)
 
         try:
-            geophires.main(enable_geophires_logging_config=False)
+            return geophires.main(
+                enable_geophires_logging_config=False,
+                headless=headless,
+                input_file=input_params.as_file_path(),
+                output_file=input_params.get_output_file_path(),
+                outputs=outputs,
+            )
         except Exception as e:
             raise RuntimeError(f'GEOPHIRES encountered an exception: {e!s}') from e
         except SystemExit:
             raise RuntimeError('GEOPHIRES exited without giving a reason') from None
-        finally:
-            sys.argv = stash_sys_argv
-            os.chdir(stash_cwd)
 
-        self._logger.info(f'GEOPHIRES-X output file: {input_params.get_output_file_path()}')
-        result = GeophiresXResult(input_params.get_output_file_path())
-        return result
+    def _run_geophires_on_server(
+        self, input_params: GeophiresInputParameters, headless: bool = False, outputs: Iterable[str] | None = None
+    ) -> dict[str, OutputParameter] | None:
+        response = self._server_transport.simulate(
+            input_params.as_text(), headless=headless, outputs=list(outputs) if outputs is not None else None
+        )
+
+        if headless:
+            return {name: output_parameter_from_json_dict(it) for name, it in response['output_parameters'].items()}
+
+        # Write the outputs where GEOPHIRES would have written them if run in the current process
+        output_file_path = Path(input_params.get_output_file_path())
+        output_file_path.write_text(response['output'], encoding='UTF-8')
+        if response['json'] is not None:
+            output_file_path.with_suffix('.json').write_text(response['json'], encoding='UTF-8')
+        if response['structured_result'] is not None:
+            get_structured_result_file_path(output_file_path).write_text(
+                response['structured_result'], encoding='UTF-8'
+            )
+
+        return None
+
+
+def _run_batch_cases(
+    input_params_list: list[GeophiresInputParameters], server_address: str | None
+) -> list[tuple[GeophiresXResult | None, Exception | None]]:
+    """Runs a chunk of a batch in a worker; see GeophiresXClient.get_geophires_results"""
+
+    client = GeophiresXClient(server_address=server_address)
+    outcomes = []
+    for input_params in input_params_list:
+        try:
+            outcomes.append((client.get_geophires_result(input_params), None))
+        except Exception as e:
+            outcomes.append((None, e))
+
+    return outcomes
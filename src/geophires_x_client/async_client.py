@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+import geophires_x_client
+from geophires_x.Parameter import OutputParameter
+
+from .common import _get_logger
+from .geophires_input_parameters import GeophiresInputParameters
+from .geophires_x_result import GeophiresXResult
+
+_DEFAULT_TIMEOUT = object()
+
+
+def _run_in_worker(
+    input_params: GeophiresInputParameters, headless: bool, outputs: list[str] | None = None
+) -> GeophiresXResult | dict[str, OutputParameter]:
+    client = geophires_x_client.GeophiresXClient()
+    if headless:
+        return client.get_geophires_output_parameters(input_params, outputs=outputs)
+
+    return client.get_geophires_result(input_params)
+
+
+def _release_threadsafe(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        pass  # the event loop is closed
+
+
+class AsyncGeophiresXClient:
+    """
+    An asyncio client for running GEOPHIRES simulations, for use in async applications such as web backends.
+
+    Simulations run in a pool of worker processes, so they neither block the event loop nor contend for the GIL of the
+    event loop's process. The number of simulations that run concurrently is bounded; further requests wait for a free
+    slot.
+
+    A simulation that times out or is cancelled before it starts never runs. A simulation that times out or is
+    cancelled while running in a worker process runs to completion in the background (GEOPHIRES cannot be interrupted),
+    and its result is discarded. It keeps its slot until it completes, so that the next simulation does not wait for
+    a busy worker process.
+
+    Use as an async context manager, or call close() when done, to shut down the worker processes.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        timeout_sec: float | None = None,
+        logger_name: str | None = None,
+    ):
+        """
+        :param max_concurrency: Maximum number of simulations that run at a time, which is also the number of worker
+            processes; defaults to the number of CPUs
+        :param timeout_sec: Default timeout for each simulation (not including time spent waiting for a free slot), or
+            None for no timeout
+        """
+
+        self._logger = _get_logger(logger_name=logger_name if logger_name is not None else __name__)
+        self.max_concurrency = max_concurrency if max_concurrency is not None else os.cpu_count() or 1
+        self.timeout_sec = timeout_sec
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def get_geophires_result(
+        self, input_params: GeophiresInputParameters, timeout_sec: float | None = _DEFAULT_TIMEOUT
+    ) -> GeophiresXResult:
+        """
+        :param timeout_sec: Timeout for this simulation, overriding the client's default timeout
+        :raises TimeoutError: If the simulation did not complete within the timeout
+        :raises RuntimeError: If GEOPHIRES encountered an exception
+        """
+
+        return await self._run(input_params, headless=False, timeout_sec=timeout_sec)
+
+    async def get_geophires_output_parameters(
+        self,
+        input_params: GeophiresInputParameters,
+        timeout_sec: float | None = _DEFAULT_TIMEOUT,
+        outputs: Iterable[str] | None = None,
+    ) -> dict[str, OutputParameter]:
+        """
+        Like GeophiresXClient.get_geophires_output_parameters, calculates a result without rendering any outputs and
+        returns the calculated output parameters by name (only the requested outputs, if outputs are given).
+        """
+
+        return await self._run(
+            input_params, headless=True, timeout_sec=timeout_sec, outputs=list(outputs) if outputs is not None else None
+        )
+
+    async def _run(
+        self,
+        input_params: GeophiresInputParameters,
+        headless: bool,
+        timeout_sec: float | None,
+        outputs: list[str] | None = None,
+    ) -> GeophiresXResult | dict[str, OutputParameter]:
+        if timeout_sec is _DEFAULT_TIMEOUT:
+            timeout_sec = self.timeout_sec
+
+        if self._semaphore is None:
+            # Created on first use so that it belongs to the running event loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._executor = ProcessPoolExecutor(max_workers=self.max_concurrency)
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore
+        await semaphore.acquire()
+        try:
+            concurrent_future = self._executor.submit(_run_in_worker, input_params, headless, outputs)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        # The slot is freed when the worker process is done with the simulation, rather than when this call returns,
+        # so that a simulation that took the slot of one that timed out does not wait for a worker (and time out).
+        concurrent_future.add_done_callback(lambda _: _release_threadsafe(loop, semaphore))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(concurrent_future), timeout=timeout_sec)
+        except asyncio.TimeoutError:
+            self._logger.warning(f'GEOPHIRES simulation timed out after {timeout_sec} seconds')
+            raise TimeoutError(f'GEOPHIRES simulation timed out after {timeout_sec} seconds') from None
+
+    async def close(self) -> None:
+        """
+        Shuts down the worker processes, waiting for any simulations that are still running in them to complete.
+        """
+
+        if self._executor is not None:
+            executor = self._executor
+            self._executor = None
+            self._semaphore = None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self) -> AsyncGeophiresXClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -12,9 +12,13 @@
 
 from geophires_x.GeoPHIRESUtils import is_float
 from geophires_x.GeoPHIRESUtils import is_int
+from geophires_x.OutputsStructured import STRUCTURED_RESULT_SCHEMA_VERSION
+from geophires_x.OutputsStructured import get_report_sha256
+from geophires_x.OutputsStructured import get_structured_result_file_path
 
 from .common import _get_logger
 from .geophires_input_parameters import EndUseOption
+from .report_index import build_report_index
 
 
 class _EqualSignDelimitedField:
@@ -388,7 +392,12 @@ class GeophiresXResult:
     CARBON_REVENUE_PROFILE_NAME: ClassVar[str] = 'CARBON REVENUE PROFILE'
     _CARBON_PRICE_FIELD_NAME: ClassVar[str] = 'Carbon Price (USD/lb)'
 
-    def __init__(self, output_file_path, logger_name=None):
+    def __init__(self, output_file_path, logger_name=None, use_structured_result: bool = True):
+        """
+        :param use_structured_result: If False, the result is parsed from the report even if it has a structured
+            result sidecar
+        """
+
         if logger_name is None:
             logger_name = __name__
         self._logger = _get_logger(logger_name)
@@ -397,9 +406,28 @@ def __init__(self, output_file_path, logger_name=None):
         with open(self.output_file_path, encoding='utf-8') as f:
             self._lines = list(f.readlines())
 
-        self.is_ags_clgs_style_output = '***AGS/CLGS STYLE OUTPUT***' in [_l.strip() for _l in self._lines]
-
-        self._lines_by_category = self._get_lines_by_category()
+        # The result is read from the structured result sidecar written by GEOPHIRES alongside the report, if
+        # available (see geophires_x.OutputsStructured), and otherwise parsed from the report. The sidecar also holds
+        # the calculated output parameters, with full-precision values; they are None for reports without a sidecar.
+        self.output_parameters: dict[str, dict[str, Any]] | None = None
+        self._output_parameter_profiles: dict[str, dict[str, Any]] | None = None
+        structured_result = self._read_structured_result() if use_structured_result else None
+        if structured_result is not None:
+            self.output_parameters = structured_result['output_parameters']
+            self.is_ags_clgs_style_output = structured_result['is_ags_clgs_style_output']
+            self.result = structured_result['result']
+            self.result['metadata'] = {'output_file_path': self.output_file_path, **self.result['metadata']}
+        else:
+            self._parse_report()
+
+    def _parse_report(self) -> None:
+        # Report fields and profiles are looked up from an index of the report text, which is tokenized once rather
+        # than searched for each field.
+        self._report_index: dict[str, Any] = build_report_index(''.join(self._lines))
+
+        self.is_ags_clgs_style_output = '***AGS/CLGS STYLE OUTPUT***' in [h[1] for h in self._report_index['headers']]
+
+        self._line_ranges_by_category = self._get_line_ranges_by_category()
 
         # TODO generic-er result value map
 
@@ -409,17 +437,14 @@ def __init__(self, output_file_path, logger_name=None):
             fields = category_fields[1]
 
             self.result[category] = {}
-            category_lines = self._lines_by_category.get(category, [])
-            search_lines = category_lines if not self.is_ags_clgs_style_output else self._lines
-
             for field in fields:
                 if isinstance(field, _EqualSignDelimitedField):
                     self.result[category][field.field_name] = self._get_equal_sign_delimited_field(
-                        field.field_name, search_lines=search_lines
+                        field.field_name, category=category
                     )
                 elif isinstance(field, _UnlabeledStringField):
                     self.result[category][field.field_name] = self._get_unlabeled_string_field(
-                        field.field_name, field.marker_prefixes, search_lines=search_lines
+                        field.field_name, field.marker_prefixes, category=category
                     )
                 else:
                     is_string_field = isinstance(field, _StringValueField)
@@ -429,7 +454,7 @@ def __init__(self, output_file_path, logger_name=None):
                         field_name,
                         is_string_value_field=is_string_field,
                         min_indentation_spaces=indent,
-                        search_lines=search_lines,
+                        category=category,
                     )
 
         try:
@@ -470,40 +495,144 @@ def __init__(self, output_file_path, logger_name=None):
         if self._get_end_use_option() is not None:
             self.result['metadata']['End-Use Option'] = self._get_end_use_option().name
 
-    def _get_lines_by_category(self) -> dict[str, list[str]]:
+    @property
+    def structured_result_file_path(self) -> Path:
+        return get_structured_result_file_path(self.output_file_path)
+
+    @property
+    def output_parameter_profiles(self) -> dict[str, dict[str, Any]] | None:
+        """
+        The array valued output parameters from the structured result sidecar, with their values as arrays, or None for
+        reports without a sidecar. They are read from the sidecar when first accessed.
+        """
+
+        if self._output_parameter_profiles is None and self.output_parameters is not None:
+            with open(self.structured_result_file_path, encoding='utf-8') as f:
+                f.readline()
+                self._output_parameter_profiles = json.loads(f.readline())['profiles']
+
+        return self._output_parameter_profiles
+
+    def _read_structured_result(self) -> dict[str, Any] | None:
         """
-        Parses the raw output file lines into a dictionary where keys are
-        category headers and values are the lines belonging to that category.
+        :return: the structured result sidecar of the report, or None if the sidecar does not exist or does not
+            match the report (e.g. if the report was regenerated by a version of GEOPHIRES that does not write sidecars,
+            or by one that writes sidecars in a different format).
         """
-        lines_by_category = {}
+        try:
+            with open(self.structured_result_file_path, encoding='utf-8') as f:
+                # The first line holds everything but the profiles; see output_parameter_profiles
+                structured_result = json.loads(f.readline())
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            self._logger.warning(f'Ignoring invalid structured result file {self.structured_result_file_path}: {e}')
+            return None
+
+        if structured_result.get('schema_version') != STRUCTURED_RESULT_SCHEMA_VERSION:
+            self._logger.debug(f'Ignoring structured result with unsupported schema version: {self.output_file_path}')
+            return None
+
+        if structured_result.get('report_sha256') != get_report_sha256(''.join(self._lines)):
+            self._logger.debug(f'Ignoring structured result that does not match report: {self.output_file_path}')
+            return None
+
+        return structured_result
+
+    def _get_line_ranges_by_category(self) -> dict[str, list[tuple[int, int]]]:
+        """
+        :return: Line number ranges (start inclusive, end exclusive) of each category of the report
+        """
+        ranges_by_category = {}
+        known_headers = {f'***{h}***' if h != 'Simulation Metadata' else h: h for h in self._RESULT_FIELDS_BY_CATEGORY}
         current_category = None
-        known_headers = list(self._RESULT_FIELDS_BY_CATEGORY.keys())
+        current_start = None
+        for line_no, header in self._report_index['headers']:
+            category = known_headers.get(header)
+            if category is None:
+                continue
 
-        for line in self._lines:
+            if current_category is not None:
+                ranges_by_category[current_category].append((current_start, line_no))
 
-            def get_header_content(h_: str) -> str:
-                """
-                TODO adjust this to also work with AGS/CLGS-style headers like '### Cost Results ###'
-                    For now, AGS-style results are parsed from all lines according to the categories defined in
-                    _RESULT_FIELDS_BY_CATEGORY.
-                """
+            current_category = category
+            current_start = line_no + 1
+            if current_category not in ranges_by_category:
+                ranges_by_category[current_category] = []
 
-                if h_ == 'Simulation Metadata':
-                    return h_
-                return f'***{h_}***'
+        if current_category is not None:
+            ranges_by_category[current_category].append((current_start, self._report_index['num_lines']))
 
-            # Check if the line is a category header
-            found_header = next((h for h in known_headers if get_header_content(h) == line.strip()), None)
+        return ranges_by_category
 
-            if found_header:
-                current_category = found_header
-                if current_category not in lines_by_category:
-                    lines_by_category[current_category] = []
-            elif current_category:
-                # Append the line to the current category if one has been found
-                lines_by_category[current_category].append(line)
+    def _in_category(self, line_no: int, category: str | None) -> bool:
+        """Whether a line of the report is in the category; all lines are in every category of AGS/CLGS-style reports"""
+        if category is None or self.is_ags_clgs_style_output:
+            return True
 
-        return lines_by_category
+        return any(start <= line_no < end for start, end in self._line_ranges_by_category.get(category, []))
+
+    def _get_result_field(
+        self,
+        field_name: str,
+        is_string_value_field: bool = False,
+        min_indentation_spaces: int = 4,
+        category: str | None = None,
+    ):
+        matching_values = []
+        for line_no, indentation, val_and_unit_str in self._report_index['fields'].get(field_name, []):
+            if indentation >= min_indentation_spaces and self._in_category(line_no, category):
+                matching_values.append(val_and_unit_str)
+
+        if len(matching_values) == 0:
+            self._logger.debug(f'Field not found: {field_name}')
+            return None
+
+        if len({_.strip() for _ in matching_values}) > 1:
+            self._logger.error(
+                f'Found multiple ({len(matching_values)}) entries for field with different values: '
+                f'{field_name}\n\t{matching_values}'
+            )
+
+        return self._get_result_field_value(field_name, matching_values[0], is_string_value_field)
+
+    def _get_equal_sign_delimited_field(self, field_name: str, category: str | None = None):
+        matching_values = [
+            value
+            for line_no, value in self._report_index['equal_sign_fields'].get(field_name, [])
+            if self._in_category(line_no, category)
+        ]
+
+        if len(matching_values) == 0:
+            self._logger.debug(f'Equal sign-delimited field not found: {field_name}')
+            return None
+
+        if len(matching_values) > 1:
+            self._logger.warning(
+                f'Found multiple ({len(matching_values)}) entries for equal sign-delimited field: '
+                f'{field_name}\n\t{matching_values}'
+            )
+
+        return matching_values[0]
+
+    def _get_unlabeled_string_field(self, field_name: str, marker_prefixes: list[str], category: str | None = None):
+        matching_notes = [
+            note
+            for line_no, note in self._report_index['notes']
+            if self._in_category(line_no, category) and any(m in note for m in marker_prefixes)
+        ]
+
+        if len(matching_notes) == 0:
+            self._logger.debug(f'Unlabeled string field not found: {field_name}')
+            return None
+
+        if len(matching_notes) > 1:
+            self._logger.warning(
+                f'Found multiple ({len(matching_notes)}) entries for unlabeled string field: '
+                f'{field_name}\n\t{matching_notes}'
+            )
+
+        return matching_notes[0]
 
     @property
     def direct_use_heat_breakeven_price_USD_per_MMBTU(self):
@@ -611,42 +740,7 @@ def _json_fields(self) -> MappingProxyType:
         except FileNotFoundError:
             return {}
 
-    def _get_result_field(
-        self,
-        field_name: str,
-        is_string_value_field: bool = False,
-        min_indentation_spaces: int = 4,
-        search_lines: list[str] | None = None,
-    ):
-        if search_lines is None:
-            search_lines = self._lines
-
-        # TODO make this less fragile with proper regex
-        matching_lines = set(filter(lambda line: f'{min_indentation_spaces * " "}{field_name}: ' in line, search_lines))
-
-        if len(matching_lines) == 0:
-            self._logger.debug(f'Field not found: {field_name}')
-            return None
-
-        if len(matching_lines) > 1:
-
-            def normalize_spaces(matched_line):
-                return re.sub(r'\s+', r' ', matched_line)
-
-            if len({normalize_spaces(_) for _ in matching_lines}) > 1:
-                # TODO maybe this should throw a RuntimeError...
-                self._logger.error(
-                    f'Found multiple ({len(matching_lines)}) entries for field with different values: '
-                    f'{field_name}\n\t{matching_lines}'
-                )
-            else:
-                self._logger.debug(
-                    f'Found multiple ({len(matching_lines)}) entries for field with same value: '
-                    f'{field_name}\n\t{set(matching_lines)}'
-                )
-
-        matching_line = matching_lines.pop()
-        val_and_unit_str = re.sub(r'\s\s+', '', matching_line.replace(f'{field_name}:', '').replace('\n', ''))
+    def _get_result_field_value(self, field_name: str, val_and_unit_str: str, is_string_value_field: bool):
         if is_string_value_field:
             return {'value': val_and_unit_str, 'unit': None}
         val_and_unit_tuple = val_and_unit_str.strip().split(' ')
@@ -660,62 +754,6 @@ def normalize_spaces(matched_line):
 
         return {'value': self._parse_number(str_val, field=f'field "{field_name}"'), 'unit': unit}
 
-    def _get_equal_sign_delimited_field(self, field_name, search_lines: list[str] | None = None):
-        if search_lines is None:
-            search_lines = self._lines
-
-        metadata_markers = (
-            f'  {field_name} = ',
-            # Previous versions of GEOPHIRES erroneously included an extra space after the field name so we include
-            # the pattern for it for backwards compatibility with existing .out files.
-            f'  {field_name}  = ',
-        )
-        matching_lines = set(filter(lambda line: any(m in line for m in metadata_markers), search_lines))
-
-        if len(matching_lines) == 0:
-            self._logger.debug(f'Equal sign-delimited field not found: {field_name}')
-            return None
-
-        if len(matching_lines) > 1:
-            self._logger.warning(
-                f'Found multiple ({len(matching_lines)}) entries for equal sign-delimited field: '
-                f'{field_name}\n\t{matching_lines}'
-            )
-
-        matching_line = matching_lines.pop()
-        for marker in metadata_markers:
-            if marker in matching_line:
-                return matching_line.split(marker)[1].replace('\n', '')
-
-        self._logger.error(f'Unexpected error extracting equal sign-delimited field {field_name}')  # Shouldn't happen
-        return None
-
-    def _get_unlabeled_string_field(
-        self, field_name: str, marker_prefixes: list[str], search_lines: list[str] | None = None
-    ):
-        if search_lines is None:
-            search_lines = self._lines
-
-        matching_lines = set(filter(lambda line: any(m in line for m in marker_prefixes), search_lines))
-
-        if len(matching_lines) == 0:
-            self._logger.debug(f'Unlabeled string field not found: {field_name}')
-            return None
-
-        if len(matching_lines) > 1:
-            self._logger.warning(
-                f'Found multiple ({len(matching_lines)}) entries for unlabeled string field: '
-                f'{field_name}\n\t{matching_lines}'
-            )
-
-        matching_line = matching_lines.pop()
-        for marker_prefix in marker_prefixes:
-            if marker_prefix in matching_line:
-                return matching_line.strip()
-
-        self._logger.error(f'Unexpected error extracting unlabeled string  field {field_name}')  # Shouldn't happen
-        return None
-
     @property
     def power_generation_profile(self):
         return self.result['POWER GENERATION PROFILE']
@@ -888,12 +926,11 @@ def _get_sam_cash_flow_profile(self) -> list[Any]:
         profile_name = 'SAM CASH FLOW PROFILE'
 
         try:
-            s1 = f'*  {profile_name}  *'
-            _lines_joined = ''.join(self._lines)
-            if s1 not in _lines_joined:
+            if profile_name not in self._report_index['profile_offsets']:
                 return None
 
-            profile_text = _lines_joined.split(s1)[1]
+            profile_text = ''.join(self._lines)[self._report_index['profile_offsets'][profile_name] :]
+
             profile_text = re.split(r'^\s*-{20,}\s*$\n?', profile_text, flags=re.MULTILINE)[1]
             rd = csv.reader(StringIO(profile_text), delimiter='\t', skipinitialspace=True)
             profile_lines = []
@@ -949,9 +986,11 @@ def _extract_addons_style_table_data(self, lines: list):
         return table_data
 
     def _get_profile_lines(self, profile_name):
-        s1 = f'*  {profile_name}  *'
-        s2 = '\n\n'
-        return ''.join(self._lines).split(s1)[1].split(s2)[0].split('\n')  # [5:]
+        if profile_name not in self._report_index['profiles']:
+            raise IndexError(f'Profile not found: {profile_name}')
+
+        # Copy since callers modify the returned lines
+        return list(self._report_index['profiles'][profile_name])
 
     def _get_data_from_profile_lines(self, profile_lines):
         data_lines = profile_lines[5:]
@@ -996,26 +1035,18 @@ def _parse_number(self, number_str, field='string') -> int | float:
             return None
 
     def _get_end_use_option(self) -> EndUseOption:
-        try:
-            end_use_option_snippet = next(filter(lambda x: 'End-Use Option: ' in x, self._lines)).split(
-                'End-Use Option: '
-            )[1]
-
-            if 'Direct-Use Heat' in end_use_option_snippet:
-                return EndUseOption.DIRECT_USE_HEAT
-            elif 'Electricity' in end_use_option_snippet:
-                return EndUseOption.ELECTRICITY
-        except StopIteration:
-            # FIXME clean up
-            try:
-                end_use_option_snippet = next(filter(lambda x: 'End-Use: ' in x, self._lines)).split('End-Use: ')[1]
+        for end_use_option_label in ['End-Use Option', 'End-Use']:
+            entries = self._report_index['fields'].get(end_use_option_label, [])
+            if len(entries) > 0:
+                end_use_option_snippet = entries[0][2]
 
                 if 'Direct-Use Heat' in end_use_option_snippet:
                     return EndUseOption.DIRECT_USE_HEAT
                 elif 'Electricity' in end_use_option_snippet:
                     return EndUseOption.ELECTRICITY
-            except StopIteration:
-                # FIXME
-                self._logger.error('Failed to parse End-Use Option')
 
+                return None
+
+        # FIXME
+        self._logger.error('Failed to parse End-Use Option')
         return None
@@ -0,0 +1,130 @@
+"""
+One-pass index of a GEOPHIRES text report, from which GeophiresXResult looks up fields and profile table sections
+instead of searching the whole report for each of them.
+"""
+
+from __future__ import annotations
+
+import re
+from io import StringIO
+from typing import Any
+
+_PROFILE_MARKER_PATTERN = re.compile(r'\*  (.+?)  \*')
+_METADATA_HEADER = 'Simulation Metadata'
+
+
+def _split_lines(report_text: str) -> list[str]:
+    """Splits report text into lines the same way as reading the report file with readlines()."""
+    return StringIO(report_text).readlines()
+
+
+def _label_starts(line: str, end: int) -> list[tuple[int, int]]:
+    """
+    :return: (start position, number of spaces immediately preceding start) for every word start before ``end``
+        that is preceded by at least one space.
+    """
+    starts = []
+    spaces = 0
+    for i in range(end):
+        if line[i] == ' ':
+            spaces += 1
+        else:
+            if spaces > 0:
+                starts.append((i, spaces))
+            spaces = 0
+
+    return starts
+
+
+def _index_colon_fields(line: str, line_no: int, fields: dict[str, list]) -> None:
+    indexed_for_line: dict[str, int] = {}
+    p = line.find(': ')
+    while p != -1:
+        for start, indent in _label_starts(line, p):
+            label = line[start:p]
+            indexed_for_line[label] = max(indent, indexed_for_line.get(label, 0))
+        p = line.find(': ', p + 1)
+
+    for label, indent in indexed_for_line.items():
+        value_str = re.sub(r'\s\s+', '', line.replace(f'{label}:', '').replace('\n', ''))
+        fields.setdefault(label, []).append([line_no, indent, value_str])
+
+
+def _index_equal_sign_fields(line: str, line_no: int, equal_sign_fields: dict[str, list]) -> None:
+    labels = set()
+    p = line.find(' = ')
+    while p != -1:
+        for start, indent in _label_starts(line, p):
+            if indent < 2:
+                continue
+            labels.add(line[start:p])
+            if p - 1 > start and line[p - 1] == ' ':
+                labels.add(line[start : p - 1])
+        p = line.find(' = ', p + 1)
+
+    for label in labels:
+        for marker in (f'  {label} = ', f'  {label}  = '):
+            if marker in line:
+                equal_sign_fields.setdefault(label, []).append([line_no, line.split(marker)[1].replace('\n', '')])
+                break
+
+
+def build_report_index(report_text: str) -> dict[str, Any]:
+    """
+    Tokenizes a GEOPHIRES text report in a single pass.
+
+    :return: A JSON-serializable dict with:
+        ``headers``: ``[line number, header]`` for each ``***CATEGORY***`` (or ``Simulation Metadata``) header line
+        ``fields``: label -> ``[line number, indentation, value and unit string]`` for each ``label: value`` entry
+        ``equal_sign_fields``: label -> ``[line number, value string]`` for each ``label = value`` entry
+        ``notes``: ``[line number, text]`` for lines without a label, e.g. calculation notes
+        ``profiles``: profile name -> lines of the profile table section
+        ``profile_offsets``: profile name -> character offset of the report text immediately following the profile
+            marker, for profiles (e.g. the SAM cash flow profile) that contain blank lines
+    """
+
+    lines = _split_lines(report_text)
+
+    headers = []
+    fields: dict[str, list] = {}
+    equal_sign_fields: dict[str, list] = {}
+    notes = []
+    profile_names = []
+
+    for line_no, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped == _METADATA_HEADER or (
+            len(stripped) > 6 and stripped.startswith('***') and stripped.endswith('***')
+        ):
+            headers.append([line_no, stripped])
+
+        has_colon_field = ': ' in line
+        if has_colon_field:
+            _index_colon_fields(line, line_no, fields)
+
+        if ' = ' in line:
+            _index_equal_sign_fields(line, line_no, equal_sign_fields)
+        elif not has_colon_field and stripped != '':
+            notes.append([line_no, stripped])
+
+        for profile_name in _PROFILE_MARKER_PATTERN.findall(line):
+            if profile_name not in profile_names:
+                profile_names.append(profile_name)
+
+    profiles = {}
+    profile_offsets = {}
+    for profile_name in profile_names:
+        marker = f'*  {profile_name}  *'
+        offset = report_text.index(marker) + len(marker)
+        profile_offsets[profile_name] = offset
+        profiles[profile_name] = report_text[offset:].split(marker)[0].split('\n\n')[0].split('\n')
+
+    return {
+        'num_lines': len(lines),
+        'headers': headers,
+        'fields': fields,
+        'equal_sign_fields': equal_sign_fields,
+        'notes': notes,
+        'profiles': profiles,
+        'profile_offsets': profile_offsets,
+    }
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+from typing import Any
+from urllib.parse import urlparse
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, unix_socket_path: str, timeout: float | None = None):
+        super().__init__('localhost', timeout=timeout)
+        self._unix_socket_path = unix_socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self._unix_socket_path)
+
+
+class GeophiresXServerTransport:
+    """
+    Sends simulation requests to a GEOPHIRES-X server (geophires_x.server) over HTTP on localhost or on a Unix domain
+    socket.
+    """
+
+    def __init__(self, server_address: str, timeout_sec: float | None = None):
+        """
+        :param server_address: ``http://<host>:<port>`` or ``unix:<socket path>``, as printed by the server on startup
+        :param timeout_sec: Timeout for connecting and for each response, or None to wait indefinitely
+        """
+
+        self.server_address = server_address
+        self._timeout_sec = timeout_sec
+
+        if server_address.startswith('unix:'):
+            self._unix_socket_path = server_address[len('unix:') :]
+        else:
+            parsed = urlparse(server_address)
+            if parsed.scheme != 'http' or parsed.hostname is None:
+                raise ValueError(
+                    f'Invalid GEOPHIRES-X server address: {server_address} '
+                    f'(expected http://<host>:<port> or unix:<socket path>)'
+                )
+
+            self._unix_socket_path = None
+            self._host = parsed.hostname
+            self._port = parsed.port
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._unix_socket_path is not None:
+            return _UnixHTTPConnection(self._unix_socket_path, timeout=self._timeout_sec)
+
+        return http.client.HTTPConnection(self._host, self._port, timeout=self._timeout_sec)
+
+    def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        connection = self._connection()
+        try:
+            if body is None:
+                connection.request(method, path)
+            else:
+                connection.request(
+                    method, path, body=json.dumps(body).encode('UTF-8'), headers={'Content-Type': 'application/json'}
+                )
+            response = connection.getresponse()
+            response_body = json.loads(response.read())
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            raise RuntimeError(f'Unable to communicate with GEOPHIRES-X server at {self.server_address}: {e!s}') from e
+        finally:
+            connection.close()
+
+        if response.status != 200:
+            raise RuntimeError(response_body.get('error', f'GEOPHIRES-X server returned status {response.status}'))
+
+        return response_body
+
+    def health(self) -> dict[str, Any]:
+        return self._request('GET', '/health')
+
+    def simulate(self, input_text: str, headless: bool = False, outputs: list[str] | None = None) -> dict[str, Any]:
+        """
+        :return: The server's response to the simulation request, as documented in geophires_x.server
+        :raises RuntimeError: If the simulation failed or the server could not be reached
+        """
+
+        request_body = {'input': input_text, 'headless': headless}
+        if outputs is not None:
+            request_body['outputs'] = outputs
+
+        return self._request('POST', '/simulate', request_body)
@@ -87,7 +87,9 @@ def get_parameters_json(self) -> Tuple[str, str]:
 
         def with_category(param_dict: dict, category: str):
             def _with_cat(p: Parameter, cat: str):
-                p.parameter_category = cat
+                # Output parameters have no category field
+                if isinstance(p, Parameter):
+                    p.parameter_category = cat
                 return p
 
             return {k: _with_cat(v, category) for k, v in param_dict.items()}
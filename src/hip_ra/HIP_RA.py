@@ -18,6 +18,7 @@
 import logging.config
 import os
 import sys
+from pathlib import Path
 
 import numpy as np
 
@@ -296,17 +297,32 @@ def _UtilEff_func(x: float) -> float:
     return y
 
 
+def _configure_logging() -> None:
+    """
+    Configures logging from logging.conf. The log file is written in the package directory, not in the current
+    working directory of the caller.
+    """
+
+    package_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+    logging.config.fileConfig(
+        Path(package_dir, 'logging.conf'),
+        defaults={'log_file_path': Path(package_dir, 'all_messages_conf.log').as_posix()},
+    )
+
+
 class HIP_RA:
     """
     HIP_RA is the container class of the HIP_RA application, giving access to everything else, including the logger
     """
 
-    def __init__(self, enable_hip_ra_logging_config=True):
+    def __init__(self, enable_hip_ra_logging_config=True, input_file=None, output_file='HIP.out'):
         """
         The __init__ function is called automatically every time the class is being used to create a new object.
         The self parameter is a Python convention. It must be included in each function definition and points to the
         current instance of the class (the object that is being created).
         :param self: Reference the class instance itself
+        :param input_file: The input file path; if None, the default values are used
+        :param output_file: The output file path
         :return: Nothing
         :doc-author: Malcolm Ross
         """
@@ -314,9 +330,12 @@ def __init__(self, enable_hip_ra_logging_config=True):
         self.logger = logging.getLogger('root')
 
         if enable_hip_ra_logging_config:
-            logging.config.fileConfig('logging.conf')
+            _configure_logging()
             self.logger.setLevel(logging.INFO)
 
+        self.input_file = input_file
+        self.output_file = output_file
+
         self.logger.info(f'Init {__class__!s}: {sys._getframe().f_code.co_name}')
 
         # Initiate the elements of the Model
@@ -402,7 +421,7 @@ def __init__(self, enable_hip_ra_logging_config=True):
             UnitType=Units.TIME,
             PreferredUnits=TimeUnit.YEAR,
             CurrentUnits=TimeUnit.YEAR,
-            AllowableRange=list(range(1, 101, 1)),
+            AllowableRange=range(1, 101, 1),
             Required=True,
             ErrMessage='assume default Reservoir Life Cycle (25 years)',
             ToolTipText='Reservoir Life Cycle [30 years]',
@@ -604,7 +623,7 @@ def read_parameters(self) -> None:
         # that they want to change from the default.
         # we do this as soon as possible because what we instantiate may depend on settings in this file
 
-        read_input_file(self.InputParameters, logger=self.logger)
+        read_input_file(self.InputParameters, logger=self.logger, input_file_name=self.input_file)
 
         # Deal with all the parameter values that the user has provided.  They should really only provide values
         # that they want to change from the default values, but they can provide a value that is already set because
@@ -737,7 +756,7 @@ def PrintOutputs(self):
         # ---------------------------------------
         try:
             nl = '\n'
-            outputfile = 'HIP.out' if len(sys.argv) <= 2 else sys.argv[2]
+            outputfile = self.output_file
 
             def render_default(p: Parameter) -> str:
                 return f'{p.value:10.2f} {p.CurrentUnits.value}'
@@ -812,19 +831,28 @@ def __str__(self):
         return 'HIP_RA'
 
 
-def main(enable_hip_ra_logging_config=True):
-    # set the starting directory to be the directory that this file is in
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+def main(enable_hip_ra_logging_config=True, input_file=None, output_file=None):
+    """
+    :param input_file: The input file path; if None, the default values are used
+    :param output_file: The output file path; defaults to HIP.out in the current working directory
+    """
+
+    if output_file is None:
+        output_file = 'HIP.out'
 
     if enable_hip_ra_logging_config:
         # set up logging.
-        logging.config.fileConfig('logging.conf')
+        _configure_logging()
 
     logger = logging.getLogger('root')
     logger.info(f'Init {__name__!s}')
 
     # initiate the HIP-RA parameters, setting them to their default values
-    model = HIP_RA(enable_hip_ra_logging_config=enable_hip_ra_logging_config)
+    model = HIP_RA(
+        enable_hip_ra_logging_config=enable_hip_ra_logging_config,
+        input_file=str(input_file) if input_file is not None else None,
+        output_file=str(output_file),
+    )
 
     # read the parameters that apply to the model
     model.read_parameters()
@@ -839,4 +867,8 @@ def main(enable_hip_ra_logging_config=True):
 
 
 if __name__ == '__main__':
-    main()
+    # called as a command line program: input file, then output file
+    main(
+        input_file=sys.argv[1] if len(sys.argv) > 1 else None,
+        output_file=sys.argv[2] if len(sys.argv) > 2 else None,
+    )
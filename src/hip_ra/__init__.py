@@ -1,6 +1,4 @@
-import os
 import re
-import sys
 import tempfile
 import uuid
 from pathlib import Path
@@ -61,20 +59,16 @@ def __init__(self, enable_caching=True, logger_name='root'):
         self._logger = _get_logger(logger_name=logger_name)
 
     def get_hip_ra_result(self, input_params: HipRaInputParameters) -> HipRaResult:
-        stash_cwd = Path.cwd()
-        stash_sys_argv = sys.argv
-
-        sys.argv = ['', input_params.as_file_path(), input_params.output_file_path]
         try:
-            HIP_RA.main(enable_hip_ra_logging_config=False)
+            HIP_RA.main(
+                enable_hip_ra_logging_config=False,
+                input_file=input_params.as_file_path(),
+                output_file=input_params.output_file_path,
+            )
         except Exception as e:
             raise RuntimeError(f'HIP-RA encountered an exception: {e!s}') from e
         except SystemExit:
             raise RuntimeError('HIP-RA exited without giving a reason') from None
-        finally:
-            # Undo HIP-RA internal global settings changes
-            sys.argv = stash_sys_argv
-            os.chdir(stash_cwd)
 
         self._logger.info(f'HIP-RA output file: {input_params.output_file_path}')
 
@@ -72,6 +72,19 @@ def UpgradeSymbologyOfUnits(unit: str) -> str:
     return unit
 
 
+def _configure_logging() -> None:
+    """
+    Configures logging from logging.conf. The log file is written in the package directory, not in the current
+    working directory of the caller.
+    """
+
+    package_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+    logging.config.fileConfig(
+        Path(package_dir, 'logging.conf'),
+        defaults={'log_file_path': Path(package_dir, 'all_messages_conf.log').as_posix()},
+    )
+
+
 class HIP_RA_X:
     """
     HIP_RA_X is the container class of the HIP-RA-X application, giving access to everything else, including the logger
@@ -79,14 +92,22 @@ class HIP_RA_X:
 
     _ureg = pint.get_application_registry()
 
-    def __init__(self, enable_hip_ra_logging_config=True):
+    def __init__(self, enable_hip_ra_logging_config=True, input_file=None, output_file='HIP.out'):
+        """
+        :param input_file: The input file path; if None, the default values are used
+        :param output_file: The output file path
+        """
+
         # get logging started
         self.logger = logging.getLogger('root')
 
         if enable_hip_ra_logging_config:
-            logging.config.fileConfig(Path(os.path.dirname(os.path.abspath(__file__)), 'logging.conf'))
+            _configure_logging()
             self.logger.setLevel(logging.INFO)
 
+        self.input_file = input_file
+        self.output_file = output_file
+
         self.logger.info(f'Init {__class__.__name__!s}: {__name__}')
 
         # Initiate the elements of the Model
@@ -187,7 +208,7 @@ def parameter_dict_entry(param: Parameter) -> Parameter:
                 UnitType=Units.TIME,
                 PreferredUnits=TimeUnit.YEAR,
                 CurrentUnits=TimeUnit.YEAR,
-                AllowableRange=list(range(1, 101, 1)),
+                AllowableRange=range(1, 101, 1),
                 Required=True,
                 ErrMessage='assume default Reservoir Life Cycle (25 years)',
                 ToolTipText='Reservoir Life Cycle',
@@ -614,7 +635,7 @@ def read_parameters(self) -> None:
         """
         self.logger.info(f'Init {__class__.__name__!s}: {__name__}')
 
-        read_input_file(self.InputParameters, logger=self.logger)
+        read_input_file(self.InputParameters, logger=self.logger, input_file_name=self.input_file)
 
         if len(self.InputParameters) > 0:
             for item in self.ParameterDict.items():
@@ -816,7 +837,7 @@ def PrintOutputs(self):
         # write results to output file and screen
         # ---------------------------------------
         try:
-            outputfile = 'HIP.out' if len(sys.argv) <= 2 else sys.argv[2]
+            outputfile = self.output_file
 
             def render_default(p: Parameter) -> str:
                 return f'{p.value:10.2f} {p.CurrentUnits.value}'
@@ -1020,19 +1041,28 @@ def __str__(self):
         return 'HIP_RA_X'
 
 
-def main(enable_hip_ra_logging_config=True):
-    # set the starting directory to be the directory that this file is in
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+def main(enable_hip_ra_logging_config=True, input_file=None, output_file=None):
+    """
+    :param input_file: The input file path; if None, the default values are used
+    :param output_file: The output file path; defaults to HIP.out in the current working directory
+    """
+
+    if output_file is None:
+        output_file = 'HIP.out'
 
     # set up logging.
     if enable_hip_ra_logging_config:
-        logging.config.fileConfig('logging.conf')
+        _configure_logging()
     logger = logging.getLogger('root')
 
     logger.info('Initializing the HIP-RA-X application')
 
     # initiate the HIP-RA parameters, setting them to their default values
-    model = HIP_RA_X(enable_hip_ra_logging_config=enable_hip_ra_logging_config)
+    model = HIP_RA_X(
+        enable_hip_ra_logging_config=enable_hip_ra_logging_config,
+        input_file=str(input_file) if input_file is not None else None,
+        output_file=str(output_file),
+    )
 
     # read the parameters that apply to the model
     model.read_parameters()
@@ -1053,4 +1083,8 @@ def main(enable_hip_ra_logging_config=True):
 
 
 if __name__ == '__main__':
-    main()
+    # called as a command line program: input file, then output file
+    main(
+        input_file=sys.argv[1] if len(sys.argv) > 1 else None,
+        output_file=sys.argv[2] if len(sys.argv) > 2 else None,
+    )
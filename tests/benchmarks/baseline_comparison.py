@@ -0,0 +1,91 @@
+"""
+Saving, loading, and comparing benchmark results against stored baselines, shared by the benchmarks that gate on
+regressions.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+def environment_info() -> dict[str, str]:
+    """:return: the environment the results were recorded in, which baselines are specific to"""
+
+    return {
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy_version': np.__version__,
+    }
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    with open(path, encoding='UTF-8') as f:
+        return json.load(f)
+
+
+def save_results(results: dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='UTF-8') as f:
+        json.dump(results, f, indent=4)
+        f.write('\n')
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change_pct(self) -> float:
+        return (self.current / self.baseline - 1) * 100
+
+    def is_regression(self, threshold_pct: float) -> bool:
+        return self.change_pct > threshold_pct
+
+
+def compare_results(
+    baseline: dict[str, dict[str, Any]], current: dict[str, dict[str, Any]], metric: str
+) -> list[Comparison]:
+    """
+    :param baseline: baseline results by benchmark name
+    :param current: current results by benchmark name
+    :param metric: the key of the compared value in each benchmark's results
+    :return: comparisons of the metric for the benchmarks that are in both the baseline and the current results
+    """
+
+    return [
+        Comparison(name=name, baseline=baseline[name][metric], current=current_result[metric])
+        for name, current_result in current.items()
+        if name in baseline and baseline[name].get(metric) is not None and current_result.get(metric) is not None
+    ]
+
+
+def print_comparisons(
+    comparisons: list[Comparison], threshold_pct: float, name_header: str, unit: str, scale: float = 1.0
+) -> None:
+    print(f'{name_header:<56}{f"Baseline ({unit})":>15}{f"Current ({unit})":>14}{"Change":>10}')
+    for c in comparisons:
+        flag = '  REGRESSION' if c.is_regression(threshold_pct) else ''
+        print(f'{c.name:<56}{c.baseline * scale:>15.4f}{c.current * scale:>14.4f}{c.change_pct:>+9.1f}%{flag}')
+
+
+def report_regressions(comparisons: list[Comparison], threshold_pct: float) -> int:
+    """
+    Prints the regressions beyond the threshold, if any.
+
+    :return: the process exit status: 1 if there are regressions, else 0
+    """
+
+    regressions = [c for c in comparisons if c.is_regression(threshold_pct)]
+    if len(regressions) == 0:
+        return 0
+
+    print(f'\n{len(regressions)} regressed by more than {threshold_pct:g}%: {", ".join(c.name for c in regressions)}')
+    return 1
@@ -0,0 +1,127 @@
+"""
+Benchmark of the Wanju Yuan closed-loop (AGS) Laplace-space solver: the vectorized inversion over all times of operation
+(AGSWellBores.inverselaplace_times) against the scalar inversion per time of operation (AGSWellBores.inverselaplace).
+
+For each case of the Wanju Yuan example (tests/examples/Wanju_Yuan_Closed-Loop_Geothermal_Energy_Recovery.txt, as
+given, with more multilateral sections, and with a longer plant lifetime), calculates the model and then times both
+solvers on the model's times of operation; reports the time of each, and the largest difference of their produced
+temperatures (degC).
+
+Usage:
+    python -m tests.benchmarks.benchmark_ags_laplace [--repeat N] [--save PATH] [case ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from geophires_x.AGSWellBores import inverselaplace
+from geophires_x.AGSWellBores import inverselaplace_times
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_WANJU_EXAMPLE_FILE_PATH = (
+    Path(__file__).parent.parent / 'examples' / 'Wanju_Yuan_Closed-Loop_Geothermal_Energy_Recovery.txt'
+)
+
+# Cases and their overrides of the Wanju Yuan example
+CASES: dict[str, dict[str, Any]] = {
+    'example': {},
+    '5-sections': {'Number of Multilateral Sections': 5, 'Nonvertical Length per Multilateral Section': 3000},
+    '80-years': {'Plant Lifetime': 80},
+}
+
+
+def run_benchmark(overrides: dict[str, Any], repeat: int) -> dict[str, Any]:
+    """
+    :return: JSON-serializable times of the scalar and vectorized solvers (best of repeat)
+    """
+
+    model = Model(
+        enable_geophires_logging_config=False, input_file=str(_WANJU_EXAMPLE_FILE_PATH), output_file=os.devnull
+    )
+    model.reset(overrides)
+    model.Calculate()
+
+    wellbores = model.wellbores
+    pressure = model.reserv.lithostatic_pressure()
+    t = wellbores.time_operation.value
+    times_operation = []
+    while t <= wellbores.time_max:
+        times_operation.append(t)
+        t += wellbores.al
+    t = wellbores.time_operation.value
+
+    scalar_sec = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scalar = []
+        for time_operation in times_operation:
+            wellbores.time_operation.value = time_operation
+            scalar.append(inverselaplace(wellbores, 16, 0, pressure))
+        scalar_sec.append(time.perf_counter() - start)
+    wellbores.time_operation.value = t
+
+    vectorized_sec = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        vectorized = inverselaplace_times(wellbores, 16, np.array(times_operation), pressure)
+        vectorized_sec.append(time.perf_counter() - start)
+
+    return {
+        'times_of_operation': len(times_operation),
+        'scalar_sec': min(scalar_sec),
+        'vectorized_sec': min(vectorized_sec),
+        'speedup': min(scalar_sec) / min(vectorized_sec),
+        'max_abs_difference_degC': float(np.max(np.abs(vectorized - np.array(scalar)))),
+    }
+
+
+def _print_results(results: dict[str, dict[str, Any]]) -> None:
+    print(f'{"Case":<12}{"Times":>7}{"Scalar (s)":>12}{"Vectorized (ms)":>17}{"Speedup":>10}{"Max diff (degC)":>17}')
+    for case, r in results.items():
+        print(
+            f'{case:<12}{r["times_of_operation"]:>7}{r["scalar_sec"]:>12.3f}{r["vectorized_sec"] * 1000:>17.2f}'
+            f'{r["speedup"]:>9.0f}x{r["max_abs_difference_degC"]:>17.1e}'
+        )
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('cases', nargs='*', help=f'Cases to run (default: all of {", ".join(CASES)})')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+    cases = args.cases or list(CASES)
+    unknown = [case for case in cases if case not in CASES]
+    if len(unknown) > 0:
+        parser.error(f'Unknown cases: {", ".join(unknown)}')
+
+    logging.disable(logging.CRITICAL)
+
+    results = {case: run_benchmark(CASES[case], args.repeat) for case in cases}
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'repeat': args.repeat,
+        'cases': results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Throughput benchmark of GeophiresXClient.get_geophires_results (batch submission) against calling
+GeophiresXClient.get_geophires_result for each case in turn.
+
+Runs a batch of cases of a GEOPHIRES example (example4 by default) that differ in their geothermal gradient; a fraction of
+the cases duplicate other cases, which the batch API simulates only once. For each number of workers and chunk size,
+reports the batch's wall time, throughput in cases per second, and speedup relative to the sequential loop.
+
+Usage:
+    python -m tests.benchmarks.benchmark_client_batch [--cases N] [--duplicate-fraction F] [--workers N ...]
+        [--chunksizes N ...] [--input-file PATH] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from geophires_x_client import GeophiresXClient
+from geophires_x_client import ImmutableGeophiresInputParameters
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+
+def batch_inputs(
+    input_file_path: Path, cases: int, duplicate_fraction: float
+) -> list[ImmutableGeophiresInputParameters]:
+    unique_cases = max(cases - int(cases * duplicate_fraction), 1)
+    gradients = [50 + 20 * i / unique_cases for i in range(unique_cases)]
+    return [
+        ImmutableGeophiresInputParameters(
+            from_file_path=input_file_path, params={'Gradient 1': gradients[i % unique_cases]}
+        )
+        for i in range(cases)
+    ]
+
+
+def _time_sequential(inputs: list[ImmutableGeophiresInputParameters]) -> float:
+    client = GeophiresXClient()
+    start = time.perf_counter()
+    for input_params in inputs:
+        client.get_geophires_result(input_params)
+    return time.perf_counter() - start
+
+
+def _time_batch(inputs: list[ImmutableGeophiresInputParameters], workers: int, chunksize: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    outcomes = list(GeophiresXClient().get_geophires_results(inputs, max_workers=workers, chunksize=chunksize))
+    return time.perf_counter() - start, sum(1 for it in outcomes if not it.succeeded)
+
+
+def run_benchmark(
+    input_file_path: Path, cases: int, duplicate_fraction: float, workers: list[int], chunksizes: list[int]
+) -> dict[str, Any]:
+    """
+    :return: JSON-serializable wall time and throughput of the sequential loop and of each batch configuration
+    """
+
+    inputs = batch_inputs(input_file_path, cases, duplicate_fraction)
+
+    with open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+        # warm up imports and caches, so that the sequential loop is not penalized for running first
+        GeophiresXClient().get_geophires_result(inputs[0])
+        sequential_sec = _time_sequential(inputs)
+
+    results = {
+        'sequential': {'wall_time_sec': sequential_sec, 'cases_per_sec': cases / sequential_sec},
+        'batch': [],
+    }
+    _print_result('sequential', '', '', sequential_sec, cases, sequential_sec, 0)
+
+    for chunksize in chunksizes:
+        for worker_count in workers:
+            with open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+                wall_time_sec, failed = _time_batch(inputs, worker_count, chunksize)
+
+            results['batch'].append(
+                {
+                    'workers': worker_count,
+                    'chunksize': chunksize,
+                    'wall_time_sec': wall_time_sec,
+                    'cases_per_sec': cases / wall_time_sec,
+                    'speedup': sequential_sec / wall_time_sec,
+                    'failed_cases': failed,
+                }
+            )
+            _print_result('batch', worker_count, chunksize, wall_time_sec, cases, sequential_sec, failed)
+
+    return results
+
+
+def _print_header() -> None:
+    print(f'{"Mode":<12}{"Workers":>8}{"Chunk":>7}{"Wall (s)":>10}{"Cases/s":>9}{"Speedup":>9}')
+
+
+def _print_result(
+    mode: str, workers: int | str, chunksize: int | str, wall_time_sec: float, cases: int, sequential_sec: float, failed
+) -> None:
+    failed_message = f'  ({failed} failed)' if failed > 0 else ''
+    print(
+        f'{mode:<12}{workers:>8}{chunksize:>7}{wall_time_sec:>10.2f}{cases / wall_time_sec:>9.2f}'
+        f'{sequential_sec / wall_time_sec:>8.2f}x{failed_message}'
+    )
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cases', type=int, default=16)
+    parser.add_argument(
+        '--duplicate-fraction', type=float, default=0.25, help='Fraction of cases that duplicate another case'
+    )
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--chunksizes', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--input-file', type=Path, default=_EXAMPLES_DIR / 'example4.txt')
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    _print_header()
+    results = run_benchmark(
+        args.input_file.absolute(),
+        args.cases,
+        args.duplicate_fraction,
+        sorted(set(args.workers)),
+        sorted(set(args.chunksizes)),
+    )
+
+    report = {
+        **environment_info(),
+        'cpu_count': os.cpu_count(),
+        'input_file': args.input_file.name,
+        'cases': args.cases,
+        'duplicate_fraction': args.duplicate_fraction,
+        **results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
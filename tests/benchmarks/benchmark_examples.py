@@ -0,0 +1,283 @@
+"""
+End-to-end benchmark of the examples in tests/examples, run through the public client (GeophiresXClient) as consumers
+run them.
+
+Each example is run in its own process, so that its peak resident set size (RSS) is not affected by the other examples,
+with warm-up runs followed by the measured runs. For each example, the report records the median wall time of the
+client call, the time spent reading inputs and calculating (from the timings GEOPHIRES includes in the JSON output),
+the rest of the wall time, which is spent rendering the outputs (text report, JSON, structured result) and parsing the
+result, and the peak RSS of the process over all its runs.
+
+Results can be saved as JSON and compared against a baseline (by default tests/benchmarks/baselines/examples.json); the
+compare command exits with status 1 if any example's median wall time (or, optionally, peak RSS) regressed by more than
+the threshold. Baselines are machine-specific, so regenerate the baseline (with run --save) on the machine that runs the
+comparison before relying on it.
+
+Usage:
+    python -m tests.benchmarks.benchmark_examples run [--runs N] [--warmup-runs N] [--save PATH] [example stem ...]
+    python -m tests.benchmarks.benchmark_examples compare [--baseline PATH] [--results PATH] [--threshold PCT]
+        [--rss-threshold PCT] [--runs N] [--warmup-runs N] [example stem ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from geophires_x_client import GeophiresXClient
+from geophires_x_client import ImmutableGeophiresInputParameters
+from tests.benchmarks.baseline_comparison import compare_results
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import load_results
+from tests.benchmarks.baseline_comparison import print_comparisons
+from tests.benchmarks.baseline_comparison import report_regressions
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+_REPO_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_BASELINE_PATH = Path(__file__).parent / 'baselines' / 'examples.json'
+
+_INPUT_STAGES = ('Read Input File', 'Initiate Elements', 'Read Parameters')
+_CALCULATION_STAGES = (
+    'Reservoir Calculate',
+    'Wellbores Calculate',
+    'Surface Plant Calculate',
+    'District Heating Second Pass',
+    'Economics Calculate',
+)
+
+
+def _get_peak_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS and in kilobytes on other platforms
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def _run_once(client: GeophiresXClient, input_params: ImmutableGeophiresInputParameters) -> dict[str, float]:
+    start = time.perf_counter()
+    client.get_geophires_result(input_params)
+    wall_time_sec = time.perf_counter() - start
+
+    with open(input_params.get_output_file_path().with_suffix('.json'), encoding='UTF-8') as f:
+        timings = json.load(f)['Timings']
+
+    def _sum_stages(stage_names: tuple[str, ...]) -> float:
+        return sum(timings[it]['wall_time_sec'] for it in stage_names if it in timings)
+
+    input_sec = _sum_stages(_INPUT_STAGES)
+    calculation_sec = _sum_stages(_CALCULATION_STAGES)
+    return {
+        'wall_time_sec': wall_time_sec,
+        'input_sec': input_sec,
+        'calculation_sec': calculation_sec,
+        'rendering_sec': wall_time_sec - input_sec - calculation_sec,
+    }
+
+
+def run_example(example_input_file_path: Path, runs: int, warmup_runs: int) -> dict[str, Any]:
+    """
+    Runs the example in the current process.
+
+    :return: JSON-serializable results of the example's measured runs
+    """
+
+    client = GeophiresXClient()
+    input_params = ImmutableGeophiresInputParameters(
+        from_file_path=example_input_file_path, params={'Include Timings in JSON Output': True}
+    )
+
+    with open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(warmup_runs):
+            _run_once(client, input_params)
+
+        run_results = [_run_once(client, input_params) for _ in range(runs)]
+
+    def _median(key: str) -> float:
+        return statistics.median(it[key] for it in run_results)
+
+    return {
+        'median_wall_time_sec': _median('wall_time_sec'),
+        'min_wall_time_sec': min(it['wall_time_sec'] for it in run_results),
+        'median_input_sec': _median('input_sec'),
+        'median_calculation_sec': _median('calculation_sec'),
+        'median_rendering_sec': _median('rendering_sec'),
+        'peak_rss_bytes': _get_peak_rss_bytes(),
+        'runs': runs,
+        'warmup_runs': warmup_runs,
+    }
+
+
+def _run_example_in_subprocess(
+    example_input_file_path: Path, runs: int, warmup_runs: int, timeout_sec: float
+) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        result_file_path = Path(tmp_dir, 'result.json')
+        completed = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                '-m',
+                'tests.benchmarks.benchmark_examples',
+                '_run-example',
+                str(example_input_file_path),
+                '--runs',
+                str(runs),
+                '--warmup-runs',
+                str(warmup_runs),
+                '--result-file',
+                str(result_file_path),
+            ],
+            cwd=_REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=timeout_sec,
+        )
+        if completed.returncode != 0:
+            error_lines = completed.stderr.replace(f'{_REPO_ROOT}{os.sep}', '').strip().splitlines()
+            raise RuntimeError(error_lines[-1] if len(error_lines) > 0 else f'exit status {completed.returncode}')
+
+        return load_results(result_file_path)
+
+
+def example_input_file_paths(example_stems: list[str] | None = None) -> list[Path]:
+    if example_stems:
+        return [Path(_EXAMPLES_DIR, f'{stem}.txt') for stem in example_stems]
+
+    return [p for p in sorted(_EXAMPLES_DIR.glob('*.txt')) if p.with_suffix('.out').exists()]
+
+
+def run_examples(
+    example_stems: list[str] | None = None, runs: int = 3, warmup_runs: int = 1, timeout_sec: float = 600
+) -> dict[str, Any]:
+    """
+    :return: JSON-serializable results of each example, and the error of any example that failed
+    """
+
+    results = {**environment_info(), 'runs': runs, 'warmup_runs': warmup_runs, 'examples': {}, 'failed': {}}
+    for example_input_file_path in example_input_file_paths(example_stems):
+        stem = example_input_file_path.stem
+        try:
+            results['examples'][stem] = _run_example_in_subprocess(
+                example_input_file_path, runs, warmup_runs, timeout_sec
+            )
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            results['failed'][stem] = str(e)
+
+        _print_example_result(stem, results)
+
+    return results
+
+
+def _print_header() -> None:
+    print(f'{"Example":<56}{"Wall (s)":>10}{"Input (s)":>11}{"Calc (s)":>10}{"Render (s)":>12}{"Peak RSS (MB)":>15}')
+
+
+def _print_example_result(stem: str, results: dict[str, Any]) -> None:
+    if stem in results['failed']:
+        print(f'{stem:<56}{"failed":>10} ({results["failed"][stem]:.80})')
+        return
+
+    r = results['examples'][stem]
+    peak_rss_mb = f'{r["peak_rss_bytes"] / 1024 ** 2:.1f}' if r['peak_rss_bytes'] is not None else 'n/a'
+    print(
+        f'{stem:<56}{r["median_wall_time_sec"]:>10.3f}{r["median_input_sec"]:>11.3f}'
+        f'{r["median_calculation_sec"]:>10.3f}{r["median_rendering_sec"]:>12.3f}{peak_rss_mb:>15}'
+    )
+
+
+def _add_run_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--runs', type=int, default=3, help='Number of measured runs of each example')
+    parser.add_argument('--warmup-runs', type=int, default=1, help='Number of unmeasured runs before measuring')
+    parser.add_argument('--timeout', type=float, default=600, help='Timeout for all runs of an example, in seconds')
+    parser.add_argument('example_stems', nargs='*')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmark and print the results')
+    _add_run_arguments(run_parser)
+    run_parser.add_argument('--save', type=Path, help='Save the results as JSON to this path (e.g. to a baseline)')
+
+    compare_parser = subparsers.add_parser(
+        'compare', help='Compare results against a baseline; exits with status 1 if any example regressed'
+    )
+    _add_run_arguments(compare_parser)
+    compare_parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE_PATH)
+    compare_parser.add_argument(
+        '--results', type=Path, help='Previously saved results to compare (if not given, the benchmark is run)'
+    )
+    compare_parser.add_argument(
+        '--threshold', type=float, default=20.0, help='Regression threshold, in percent increase of median wall time'
+    )
+    compare_parser.add_argument(
+        '--rss-threshold',
+        type=float,
+        help='Regression threshold, in percent increase of peak RSS (peak RSS is not compared if not given)',
+    )
+
+    # runs a single example in the current process; used by run and compare to isolate examples
+    run_example_parser = subparsers.add_parser('_run-example')
+    run_example_parser.add_argument('example_input_file_path', type=Path)
+    run_example_parser.add_argument('--runs', type=int, required=True)
+    run_example_parser.add_argument('--warmup-runs', type=int, required=True)
+    run_example_parser.add_argument('--result-file', type=Path, required=True)
+
+    args = parser.parse_args(argv)
+    logging.disable(logging.CRITICAL)
+
+    if args.command == '_run-example':
+        save_results(run_example(args.example_input_file_path, args.runs, args.warmup_runs), args.result_file)
+        return 0
+
+    if args.command == 'run' or args.results is None:
+        _print_header()
+        current = run_examples(
+            args.example_stems, runs=args.runs, warmup_runs=args.warmup_runs, timeout_sec=args.timeout
+        )
+        if args.command == 'run':
+            if args.save is not None:
+                save_results(current, args.save)
+            return 0
+        print()
+    else:
+        current = load_results(args.results)
+
+    baseline = load_results(args.baseline)
+
+    comparisons = compare_results(baseline['examples'], current['examples'], 'median_wall_time_sec')
+    print_comparisons(comparisons, args.threshold, 'Example (median wall time)', 's')
+    exit_status = report_regressions(comparisons, args.threshold)
+
+    if args.rss_threshold is not None:
+        print()
+        rss_comparisons = compare_results(baseline['examples'], current['examples'], 'peak_rss_bytes')
+        print_comparisons(rss_comparisons, args.rss_threshold, 'Example (peak RSS)', 'MB', scale=1 / 1024**2)
+        exit_status = max(exit_status, report_regressions(rss_comparisons, args.rss_threshold))
+
+    newly_failed = [it for it in current['failed'] if it in baseline['examples']]
+    if len(newly_failed) > 0:
+        print(f'\n{len(newly_failed)} failed that succeeded in the baseline: {", ".join(newly_failed)}')
+        exit_status = 1
+
+    return exit_status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Compares per-run wall time of GEOPHIRES runs that render outputs (text report, JSON, etc.) vs. headless runs that only
+return the calculated output parameters, for each example in tests/examples.
+
+Usage:
+    python tests/benchmarks/benchmark_headless.py [--repeat N] [example stem ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import logging
+import statistics
+import time
+from pathlib import Path
+
+from geophires_x_client import GeophiresXClient
+from geophires_x_client import ImmutableGeophiresInputParameters
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+
+def _time_run(run, example_input_file_path: Path) -> tuple[float, float]:
+    """:return: wall time and CPU time of the run in seconds"""
+
+    input_params = ImmutableGeophiresInputParameters(from_file_path=example_input_file_path)
+    gc.collect()
+    with contextlib.redirect_stdout(io.StringIO()):  # examples that print output to console
+        start = time.perf_counter()
+        start_cpu = time.process_time()
+        run(input_params)
+        return time.perf_counter() - start, time.process_time() - start_cpu
+
+
+def _time_runs(
+    client: GeophiresXClient, example_input_file_path: Path, repeat: int
+) -> tuple[tuple[float, float], tuple[float, float]]:
+    """
+    Rendered and headless runs are interleaved so that both are equally affected by warm-up and system noise.
+
+    :return: median (wall, CPU) seconds of rendered runs and of headless runs
+    """
+
+    rendered_timings = []
+    headless_timings = []
+    for _ in range(repeat):
+        rendered_timings.append(_time_run(client.get_geophires_result, example_input_file_path))
+        headless_timings.append(_time_run(client.get_geophires_output_parameters, example_input_file_path))
+
+    def _medians(timings: list[tuple[float, float]]) -> tuple[float, float]:
+        return statistics.median(t[0] for t in timings), statistics.median(t[1] for t in timings)
+
+    return _medians(rendered_timings), _medians(headless_timings)
+
+
+def main(repeat: int, example_stems: list[str]) -> None:
+    logging.disable(logging.CRITICAL)
+
+    client = GeophiresXClient()
+    example_input_file_paths = (
+        [Path(_EXAMPLES_DIR, f'{stem}.txt') for stem in example_stems]
+        if len(example_stems) > 0
+        else [p for p in sorted(_EXAMPLES_DIR.glob('*.txt')) if p.with_suffix('.out').exists()]
+    )
+
+    saved_shares = []
+    saved_cpu_shares = []
+    print(
+        f'{"Example":<52}{"Rendered (s)":>14}{"Headless (s)":>14}{"Saved":>8}'
+        f'{"Rendered CPU (s)":>18}{"Headless CPU (s)":>18}{"Saved":>8}'
+    )
+    for example_input_file_path in example_input_file_paths:
+        try:
+            (rendered_sec, rendered_cpu_sec), (headless_sec, headless_cpu_sec) = _time_runs(
+                client, example_input_file_path, repeat
+            )
+        except RuntimeError as e:
+            print(f'{example_input_file_path.stem:<52}{"failed":>14} ({e!s:.60})')
+            continue
+
+        saved_share = (rendered_sec - headless_sec) / rendered_sec
+        saved_shares.append(saved_share)
+        saved_cpu_share = (rendered_cpu_sec - headless_cpu_sec) / rendered_cpu_sec
+        saved_cpu_shares.append(saved_cpu_share)
+        print(
+            f'{example_input_file_path.stem:<52}{rendered_sec:>14.3f}{headless_sec:>14.3f}{saved_share:>8.1%}'
+            f'{rendered_cpu_sec:>18.3f}{headless_cpu_sec:>18.3f}{saved_cpu_share:>8.1%}'
+        )
+
+    if len(saved_shares) > 0:
+        print(
+            f'{"Median":<80}{statistics.median(saved_shares):>8.1%}'
+            f'{"":>36}{statistics.median(saved_cpu_shares):>8.1%}'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('example_stems', nargs='*')
+    args = parser.parse_args()
+    main(args.repeat, args.example_stems)
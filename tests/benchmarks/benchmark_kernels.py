@@ -0,0 +1,439 @@
+"""
+Microbenchmarks of GEOPHIRES numerical kernels (wellbore pressure drop and heat loss, reservoir Laplace inversion, SBT
+solvers, AGS interpolation, district heating utilization, financial performance, and unit conversion).
+
+Each kernel is called with realistic arguments taken from a model of one of the examples in tests/examples, so the
+timings track the cost of the kernels in real runs. Results can be saved as JSON and compared against a baseline (by
+default tests/benchmarks/baselines/kernels.json); the compare command exits with status 1 if any kernel's median time
+regressed by more than the threshold. Baselines are machine-specific, so regenerate the baseline (with run --save) on
+the machine that runs the comparison before relying on it.
+
+Usage:
+    python -m tests.benchmarks.benchmark_kernels run [--repeat N] [--save PATH] [kernel ...]
+    python -m tests.benchmarks.benchmark_kernels compare [--baseline PATH] [--results PATH] [--threshold PCT]
+        [--repeat N] [kernel ...]
+    python -m tests.benchmarks.benchmark_kernels list
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import timeit
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+# ruff: noqa: I001  # Successful module initialization is dependent on this specific import order.
+import geophires_x
+from geophires_x.Model import Model
+from geophires_x.Economics import CalculateFinancialPerformance
+from geophires_x.Economics import calculate_npv
+from geophires_x.Parameter import ConvertUnits
+from geophires_x.WellBores import InjPressureDropAndPumpingPowerUsingIndexes
+from geophires_x.WellBores import InjectionWellPressureDrop
+from geophires_x.WellBores import ProdPressureDropAndPumpingPowerUsingIndexes
+from geophires_x.WellBores import RameyCalc
+from geophires_x.WellBores import WellPressureDrop
+from tests.benchmarks.baseline_comparison import compare_results
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import load_results
+from tests.benchmarks.baseline_comparison import print_comparisons
+from tests.benchmarks.baseline_comparison import report_regressions
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+_GEOPHIRES_X_DIR = Path(geophires_x.__file__).parent
+DEFAULT_BASELINE_PATH = Path(__file__).parent / 'baselines' / 'kernels.json'
+
+
+class KernelUnavailableError(Exception):
+    """Raised by a kernel's setup if the kernel cannot be run in this environment (e.g. missing data files)."""
+
+
+_KERNEL_SETUPS: dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def _kernel(name: str) -> Callable:
+    """
+    Registers a kernel setup function, which prepares the kernel's arguments and returns a zero-argument callable that
+    runs the kernel once.
+    """
+
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        _KERNEL_SETUPS[name] = setup
+        return setup
+
+    return decorator
+
+
+def _new_model(input_file_path: Path) -> Model:
+    m = Model(enable_geophires_logging_config=False, input_file=str(input_file_path))
+    m.read_parameters()
+    return m
+
+
+@lru_cache(maxsize=None)
+def _calculated_model(example_stem: str) -> Model:
+    m = _new_model(_EXAMPLES_DIR / f'{example_stem}.txt')
+    m.Calculate()
+    return m
+
+
+@_kernel('WellBores.RameyCalc')
+def _ramey_calc() -> Callable[[], Any]:
+    m = _calculated_model('example1')
+    r = m.reserv
+    args = (
+        r.krock.value,
+        r.rhorock.value,
+        r.cprock.value,
+        m.wellbores.prodwelldiam.value,
+        r.timevector.value,
+        m.surfaceplant.utilization_factor.value,
+        m.wellbores.prodwellflowrate.value,
+        r.cpwater.value,
+        r.Trock.value,
+        r.Tresoutput.value,
+        r.averagegradient.value,
+        r.depth.value,
+    )
+    return lambda: RameyCalc(*args)
+
+
+def _well_pressure_drop_args(m: Model) -> tuple:
+    return (
+        m,
+        m.reserv.Tresoutput.value - m.wellbores.ProdTempDrop.value / 4.0,
+        m.wellbores.prodwellflowrate.value,
+        m.wellbores.prodwelldiam.value,
+        m.wellbores.impedancemodelused.value,
+        m.reserv.depth.value,
+    )
+
+
+@_kernel('WellBores.WellPressureDrop')
+def _well_pressure_drop() -> Callable[[], Any]:
+    args = _well_pressure_drop_args(_calculated_model('example1'))
+    return lambda: WellPressureDrop(*args)
+
+
+@_kernel('WellBores.ProdPressureDropAndPumpingPowerUsingIndexes')
+def _prod_pressure_drop_using_indexes() -> Callable[[], Any]:
+    m = _calculated_model('example1')
+    w = m.wellbores
+    _, f3, vprod, rhowaterprod = WellPressureDrop(*_well_pressure_drop_args(m))
+    args = (
+        m,
+        w.productionwellpumping.value,
+        w.usebuiltinppwellheadcorrelation,
+        m.reserv.Trock.value,
+        m.reserv.depth.value,
+        w.ppwellhead.value,
+        w.PI.value,
+        w.prodwellflowrate.value,
+        f3,
+        vprod,
+        w.prodwelldiam.value,
+        w.nprod.value,
+        m.surfaceplant.pump_efficiency.value,
+        rhowaterprod,
+    )
+    return lambda: ProdPressureDropAndPumpingPowerUsingIndexes(*args)
+
+
+@_kernel('WellBores.InjPressureDropAndPumpingPowerUsingIndexes')
+def _inj_pressure_drop_using_indexes() -> Callable[[], Any]:
+    m = _calculated_model('example1')
+    w = m.wellbores
+    _, f1, vinj, rhowaterinj = _injection_well_pressure_drop(m)
+    args = (
+        m,
+        w.productionwellpumping.value,
+        w.usebuiltinppwellheadcorrelation,
+        m.surfaceplant.usebuiltinoutletplantcorrelation.value,
+        w.injection_reservoir_temperature.value,
+        w.injection_reservoir_depth.value,
+        w.ppwellhead.value,
+        w.II.value,
+        w.prodwellflowrate.value,
+        f1,
+        vinj,
+        w.injwelldiam.value,
+        w.nprod.value,
+        w.ninj.value,
+        m.reserv.waterloss.value,
+        m.surfaceplant.pump_efficiency.value,
+        rhowaterinj,
+        m.surfaceplant.plant_outlet_pressure.value,
+    )
+    return lambda: InjPressureDropAndPumpingPowerUsingIndexes(*args)
+
+
+def _injection_well_pressure_drop(m: Model) -> tuple:
+    w = m.wellbores
+    return InjectionWellPressureDrop(
+        m,
+        w.Tinj.value,
+        w.prodwellflowrate.value,
+        w.injwelldiam.value,
+        w.impedancemodelused.value,
+        m.reserv.depth.value,
+        w.nprod.value,
+        w.ninj.value,
+        m.reserv.waterloss.value,
+    )
+
+
+def _reservoir_calculate(example_stem: str) -> Callable[[], Any]:
+    # The reservoir's Laplace inversion runs on every call; the base Reservoir.Calculate it calls first is cached per
+    # model, so it is not part of the timing.
+    m = _calculated_model(example_stem)
+
+    def _calculate() -> None:
+        m.reserv.Calculate(m)
+
+    return _calculate
+
+
+@_kernel('MPFReservoir.Calculate')
+def _mpf_reservoir_calculate() -> Callable[[], Any]:
+    return _reservoir_calculate('example1')
+
+
+@_kernel('LHSReservoir.Calculate')
+def _lhs_reservoir_calculate() -> Callable[[], Any]:
+    return _reservoir_calculate('example2')
+
+
+def _sbt_solver(input_file_path: Path, solver_name: str) -> Callable[[], Any]:
+    m = _new_model(input_file_path)
+
+    # bypass the solver's per-model cache so that each call runs the solver
+    solver = getattr(type(m.reserv), solver_name).__wrapped__
+
+    def _solve() -> None:
+        solver(m.reserv, m)
+
+    try:
+        _solve()
+    except NotImplementedError as e:
+        raise KernelUnavailableError(str(e)) from e
+
+    return _solve
+
+
+@_kernel('SBTReservoir.Calculate_Uloop')
+def _sbt_uloop() -> Callable[[], Any]:
+    return _sbt_solver(_EXAMPLES_DIR / 'example_SBT_Lo_T.txt', 'Calculate_Uloop')
+
+
+@_kernel('SBTReservoir.Calculate_Coaxial')
+def _sbt_coaxial() -> Callable[[], Any]:
+    example_input = (_EXAMPLES_DIR / 'example_SBT_Lo_T.txt').read_text(encoding='UTF-8')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        coaxial_input_file_path = Path(tmp_dir, 'example_SBT_Lo_T_coaxial.txt')
+        coaxial_input_file_path.write_text(
+            example_input.replace('Well Geometry Configuration, 5', 'Well Geometry Configuration, 2'), encoding='UTF-8'
+        )
+        return _sbt_solver(coaxial_input_file_path, 'Calculate_Coaxial')
+
+
+@_kernel('AGSWellBores.interp_outlet_states')
+def _ags_interp_outlet_states() -> Callable[[], Any]:
+    example_stem = 'Beckers_et_al_2023_Tabulated_Database_Uloop_water_elec'
+    m = _new_model(_EXAMPLES_DIR / f'{example_stem}.txt')
+    clgs_database_path = Path(m.wellbores.filename)
+    if not clgs_database_path.exists():
+        raise KernelUnavailableError(f'CLGS database not found: {clgs_database_path.relative_to(_GEOPHIRES_X_DIR)}')
+
+    m = _calculated_model(example_stem)
+    return lambda: m.wellbores.u_H2O.interp_outlet_states(m.wellbores.point)
+
+
+@_kernel('SurfacePlantDistrictHeating.calc_util_factor')
+def _calc_util_factor() -> Callable[[], Any]:
+    m = _calculated_model('example12_DH')
+    return lambda: m.surfaceplant.calc_util_factor(
+        m.surfaceplant.HeatProduced.value, m.economics.timestepsperyear.value
+    )
+
+
+@_kernel('Economics.calculate_npv')
+def _calculate_npv() -> Callable[[], Any]:
+    e = _calculated_model('example1').economics
+    return lambda: calculate_npv(
+        e.FixedInternalRate.value / 100, e.TotalRevenue.value, e.discount_initial_year_cashflow.value
+    )
+
+
+@_kernel('Economics.CalculateFinancialPerformance')
+def _calculate_financial_performance() -> Callable[[], Any]:
+    m = _calculated_model('example1')
+    e = m.economics
+    args = (
+        m.surfaceplant.plant_lifetime.value,
+        e.FixedInternalRate.value,
+        e.TotalRevenue.value,
+        e.TotalCummRevenue.value,
+        e.CCap.value,
+        e.Coam.value,
+        e.discount_initial_year_cashflow.value,
+    )
+    return lambda: CalculateFinancialPerformance(*args)
+
+
+def _convert_units(param_name: str, value_with_units: str) -> Callable[[], Any]:
+    m = _new_model(_EXAMPLES_DIR / 'example1.txt')
+    param = next(
+        it.ParameterDict[param_name]
+        for it in [m.reserv, m.wellbores, m.surfaceplant, m.economics]
+        if param_name in it.ParameterDict
+    )
+
+    def _convert() -> str:
+        # ConvertUnits updates the parameter's current units, so reset them to make each call do the full conversion
+        param.CurrentUnits = param.PreferredUnits
+        return ConvertUnits(param, value_with_units, m)
+
+    return _convert
+
+
+@_kernel('Parameter.ConvertUnits')
+def _convert_units_pint() -> Callable[[], Any]:
+    return _convert_units('Reservoir Depth', '2400 meter')
+
+
+@_kernel('Parameter.ConvertUnits[currency]')
+def _convert_units_currency() -> Callable[[], Any]:
+    return _convert_units('Reservoir Stimulation Capital Cost', '5000 KUSD')
+
+
+@dataclass
+class KernelTiming:
+    median_sec: float
+    min_sec: float
+    number: int
+    """Number of calls per sample"""
+
+    repeat: int
+    """Number of samples"""
+
+
+def time_kernel(fn: Callable[[], Any], repeat: int) -> KernelTiming:
+    """
+    Times the kernel after a warm-up call. The number of calls per sample is chosen so that each sample takes at least
+    0.2 seconds (or is a single call, for slow kernels).
+    """
+
+    fn()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    sample_times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return KernelTiming(
+        median_sec=statistics.median(sample_times), min_sec=min(sample_times), number=number, repeat=repeat
+    )
+
+
+def kernel_names() -> list[str]:
+    return list(_KERNEL_SETUPS.keys())
+
+
+def run_kernels(names: list[str] | None = None, repeat: int = 7) -> dict[str, Any]:
+    """
+    :return: JSON-serializable results, with the median and minimum time per call of each kernel and the reason that
+        any kernel could not be run
+    """
+
+    names = names if names else kernel_names()
+    unknown_names = [name for name in names if name not in _KERNEL_SETUPS]
+    if len(unknown_names) > 0:
+        raise ValueError(f'Unknown kernel(s): {", ".join(unknown_names)}. Available: {", ".join(kernel_names())}')
+
+    results = {**environment_info(), 'kernels': {}, 'unavailable': {}}
+    for name in names:
+        # some kernels print warnings to console on every call
+        with open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+            try:
+                fn = _KERNEL_SETUPS[name]()
+            except KernelUnavailableError as e:
+                results['unavailable'][name] = str(e)
+                continue
+
+            results['kernels'][name] = vars(time_kernel(fn, repeat))
+
+    return results
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(f'{"Kernel":<56}{"Median (ms)":>13}{"Min (ms)":>11}{"Calls":>8}')
+    for name, timing in results['kernels'].items():
+        print(
+            f'{name:<56}{timing["median_sec"] * 1000:>13.4f}{timing["min_sec"] * 1000:>11.4f}'
+            f'{timing["number"] * timing["repeat"]:>8}'
+        )
+    for name, reason in results['unavailable'].items():
+        print(f'{name:<56}{"unavailable":>13} ({reason:.60})')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks and print the results')
+    run_parser.add_argument('--repeat', type=int, default=7)
+    run_parser.add_argument('--save', type=Path, help='Save the results as JSON to this path (e.g. to a baseline)')
+    run_parser.add_argument('kernels', nargs='*')
+
+    compare_parser = subparsers.add_parser(
+        'compare', help='Compare results against a baseline; exits with status 1 if any kernel regressed'
+    )
+    compare_parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE_PATH)
+    compare_parser.add_argument(
+        '--results', type=Path, help='Previously saved results to compare (if not given, the benchmarks are run)'
+    )
+    compare_parser.add_argument(
+        '--threshold', type=float, default=25.0, help='Regression threshold, in percent increase of the median time'
+    )
+    compare_parser.add_argument('--repeat', type=int, default=7)
+    compare_parser.add_argument('kernels', nargs='*')
+
+    subparsers.add_parser('list', help='List the kernels')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        print('\n'.join(kernel_names()))
+        return 0
+
+    logging.disable(logging.CRITICAL)
+
+    if args.command == 'run':
+        results = run_kernels(args.kernels, repeat=args.repeat)
+        _print_results(results)
+        if args.save is not None:
+            save_results(results, args.save)
+        return 0
+
+    baseline = load_results(args.baseline)
+    if args.results is not None:
+        current = load_results(args.results)
+    else:
+        current = run_kernels(args.kernels, repeat=args.repeat)
+        _print_results(current)
+        print()
+
+    comparisons = compare_results(baseline['kernels'], current['kernels'], 'median_sec')
+    print_comparisons(comparisons, args.threshold, 'Kernel', 'ms', scale=1000)
+    return report_regressions(comparisons, args.threshold)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
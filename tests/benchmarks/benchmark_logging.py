@@ -0,0 +1,146 @@
+"""
+Benchmark of the logging overhead of reading parameters (Model.read_parameters).
+
+For each GEOPHIRES example (by default, the largest input files), reports the mean time of reading the parameters of a
+constructed Model:
+    - warning: with the root logger at WARNING, so that info records are discarded by the level gate of ModelLogger
+    - warning (ungated): the same, with the level gate disabled, so that each info record is discarded by the level
+      checks of logging
+    - info: with the root logger at INFO and records handled (and discarded) by a NullHandler
+and the number of info records that reading the parameters logs.
+
+Usage:
+    python -m tests.benchmarks.benchmark_logging [--models N] [--input-file PATH ...] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+_DEFAULT_EXAMPLES = (
+    'example_PTC',
+    'example5',
+    'example4',
+)
+
+MODES = ('warning', 'warning_ungated', 'info')
+
+
+class _CountingNullHandler(logging.NullHandler):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        self.count += 1
+        return super().handle(record)
+
+
+def _new_model(input_file_path: Path, gated: bool) -> Model:
+    model = Model(enable_geophires_logging_config=False, input_file=str(input_file_path), output_file=os.devnull)
+    if not gated:
+        for method_name in ('debug', 'info'):
+            model.logger.__dict__.pop(method_name, None)
+        model.logger.refresh_level_gate = lambda: None
+
+    return model
+
+
+def _read_parameters_sec(input_file_path: Path, models: int, gated: bool) -> float:
+    total_sec = 0.0
+    for _ in range(models):
+        model = _new_model(input_file_path, gated)
+        start = time.perf_counter()
+        model.read_parameters()
+        total_sec += time.perf_counter() - start
+
+    return total_sec / models
+
+
+def _benchmark_input_file(input_file_path: Path, models: int) -> dict[str, Any]:
+    root_logger = logging.getLogger('root')
+    level = root_logger.level
+    handler = _CountingNullHandler()
+    root_logger.addHandler(handler)
+
+    try:
+        # (some examples print warnings while their parameters are read)
+        with contextlib.redirect_stdout(None):
+            # warm up imports and caches, so that no mode is penalized for running first
+            _read_parameters_sec(input_file_path, 1, True)
+
+            results = {}
+            for mode in MODES:
+                root_logger.setLevel(logging.INFO if mode == 'info' else logging.WARNING)
+                handler.count = 0
+                results[mode] = _read_parameters_sec(input_file_path, models, gated=mode != 'warning_ungated')
+                if mode == 'info':
+                    results['info_records'] = handler.count // models
+    finally:
+        root_logger.removeHandler(handler)
+        root_logger.setLevel(level)
+
+    return results
+
+
+def run_benchmark(input_file_paths: list[Path], models: int) -> dict[str, Any]:
+    """
+    :return: JSON-serializable results by input file name
+    """
+
+    return {
+        input_file_path.name: _benchmark_input_file(input_file_path, models) for input_file_path in input_file_paths
+    }
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(f'{"Input file":<32}{"Info records":>14}{"Warning (ms)":>14}{"Ungated (ms)":>14}{"Info (ms)":>11}')
+    for name, r in results.items():
+        print(
+            f'{name:<32}{r["info_records"]:>14}{r["warning"] * 1000:>14.2f}{r["warning_ungated"] * 1000:>14.2f}'
+            f'{r["info"] * 1000:>11.2f}'
+        )
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, default=50, help='Number of Models to time per input file and mode')
+    parser.add_argument(
+        '--input-file',
+        type=Path,
+        nargs='+',
+        default=[_EXAMPLES_DIR / f'{example}.txt' for example in _DEFAULT_EXAMPLES],
+    )
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark([input_file.absolute() for input_file in args.input_file], args.models)
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'models': args.models,
+        'results': results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Per-Model memory and construction time benchmark.
+
+Constructs Models for a GEOPHIRES example (example13 by default) and reports the mean construction time of a Model and
+the mean memory allocated per retained Model (as traced by tracemalloc), both for constructed Models and for ones that
+have also read their parameters and calculated. Large parameter sweeps and Monte Carlo simulations hold many Models, so
+this is the memory cost that scales with the number of cases.
+
+Usage:
+    python -m tests.benchmarks.benchmark_model_memory [--models N] [--memory-models N] [--input-file PATH] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import os
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from geophires_x.CylindricalReservoir import CylindricalReservoir
+from geophires_x.Reservoir import Reservoir
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+
+def _new_model(input_file_path: Path) -> Model:
+    return Model(enable_geophires_logging_config=False, input_file=str(input_file_path), output_file=os.devnull)
+
+
+def _clear_reservoir_caches() -> None:
+    # Reservoir calculations are memoized by reservoir and model, which would retain models from previous measurements.
+    Reservoir.Calculate.cache_clear()
+    CylindricalReservoir.Calculate.cache_clear()
+    gc.collect()
+
+
+def _memory_mb_per_model(input_file_path: Path, models: int, calculate: bool) -> float:
+    """
+    :return: mean memory allocated per Model, while all the Models are retained
+    """
+
+    _clear_reservoir_caches()
+
+    retained = []
+    tracemalloc.start()
+    start_bytes = tracemalloc.get_traced_memory()[0]
+    for _ in range(models):
+        model = _new_model(input_file_path)
+        if calculate:
+            model.read_parameters()
+            model.Calculate()
+
+        retained.append(model)
+
+    gc.collect()
+    allocated_bytes = tracemalloc.get_traced_memory()[0] - start_bytes
+    tracemalloc.stop()
+
+    return allocated_bytes / models / 1e6
+
+
+def _construct_sec_per_model(input_file_path: Path, models: int) -> float:
+    _clear_reservoir_caches()
+
+    start = time.perf_counter()
+    for _ in range(models):
+        _new_model(input_file_path)
+
+    return (time.perf_counter() - start) / models
+
+
+def run_benchmark(input_file_path: Path, models: int, memory_models: int) -> dict[str, Any]:
+    # warm up imports and caches, so that the first model is not penalized for being constructed first
+    _new_model(input_file_path).read_parameters()
+
+    return {
+        'construct_sec_per_model': _construct_sec_per_model(input_file_path, models),
+        'constructed_memory_mb_per_model': _memory_mb_per_model(input_file_path, memory_models, calculate=False),
+        'calculated_memory_mb_per_model': _memory_mb_per_model(input_file_path, memory_models, calculate=True),
+    }
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(f'Construction: {results["construct_sec_per_model"] * 1000:.2f} ms/model')
+    print(f'Memory, constructed: {results["constructed_memory_mb_per_model"]:.2f} MB/model')
+    print(f'Memory, calculated: {results["calculated_memory_mb_per_model"]:.2f} MB/model')
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, default=50, help='Number of Models to time construction of')
+    parser.add_argument(
+        '--memory-models', type=int, default=5, help='Number of Models to measure memory of (tracing is slow)'
+    )
+    parser.add_argument('--input-file', type=Path, default=_EXAMPLES_DIR / 'example13.txt')
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    results = run_benchmark(args.input_file.absolute(), args.models, args.memory_models)
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'input_file': args.input_file.name,
+        'models': args.models,
+        'memory_models': args.memory_models,
+        **results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Per-case overhead benchmark of a parameter sweep that resets a template Model (Model.reset) for each case against one
+that constructs a new Model for each case.
+
+Sweeps the geothermal gradient of a GEOPHIRES example (example4 by default) over the given number of cases. Fresh models
+are constructed from an input file written for each case (before timing), as when running the cases from input files;
+the template model is constructed once and reset with the case's gradient as override. For both, reports the mean
+per-case time of setting up the case (construction and reading parameters, or resetting) and of calculating it, and
+checks that both produce the same results.
+
+Usage:
+    python -m tests.benchmarks.benchmark_model_reset [--cases N] [--skip-calculate] [--input-file PATH] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from geophires_x.CylindricalReservoir import CylindricalReservoir
+from geophires_x.Reservoir import Reservoir
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+
+def sweep_overrides(cases: int) -> list[dict[str, Any]]:
+    return [{'Gradient 1': 50 + 20 * i / cases} for i in range(cases)]
+
+
+def _new_model(input_file_path: Path) -> Model:
+    return Model(enable_geophires_logging_config=False, input_file=str(input_file_path), output_file=os.devnull)
+
+
+def _result(model: Model) -> tuple[float, float]:
+    return model.economics.LCOE.value, model.reserv.Trock.value
+
+
+def _time_sweep(set_up_case: Callable[[int], Model], cases: int, calculate: bool) -> tuple[float, float, list]:
+    """
+    :return: total set up and calculation time in seconds, and the results of the cases
+    """
+
+    setup_sec = 0
+    calculate_sec = 0
+    results = []
+    for i in range(cases):
+        start = time.perf_counter()
+        model = set_up_case(i)
+        setup_sec += time.perf_counter() - start
+
+        if calculate:
+            start = time.perf_counter()
+            model.Calculate()
+            calculate_sec += time.perf_counter() - start
+
+            # Reservoir calculations are memoized (with maxsize 1024) by reservoir and model, which would retain every
+            # case's model for the rest of the sweep.
+            Reservoir.Calculate.cache_clear()
+            CylindricalReservoir.Calculate.cache_clear()
+
+        results.append(_result(model) if calculate else model.reserv.Trock.value)
+
+    return setup_sec, calculate_sec, results
+
+
+def run_benchmark(input_file_path: Path, cases: int, calculate: bool) -> dict[str, Any]:
+    """
+    :return: JSON-serializable per-case times of the fresh-model and template-reset sweeps
+    """
+
+    overrides = sweep_overrides(cases)
+    with open(input_file_path, encoding='UTF-8') as f:
+        input_text = f.read().rstrip('\n')
+
+    with tempfile.TemporaryDirectory() as case_dir:
+        case_input_file_paths = []
+        for i, case_overrides in enumerate(overrides):
+            case_input_file_path = Path(case_dir, f'case_{i}.txt')
+            with open(case_input_file_path, 'w', encoding='UTF-8') as f:
+                f.write(input_text + '\n' + ''.join(f'{k}, {v}\n' for k, v in case_overrides.items()))
+            case_input_file_paths.append(case_input_file_path)
+
+        # warm up imports and caches, so that the first sweep is not penalized for running first
+        _new_model(input_file_path).read_parameters()
+
+        def _fresh_case(i: int) -> Model:
+            model = _new_model(case_input_file_paths[i])
+            model.read_parameters()
+            return model
+
+        fresh_setup_sec, fresh_calculate_sec, fresh_results = _time_sweep(_fresh_case, cases, calculate)
+
+    template = _new_model(input_file_path)
+    template.read_parameters()
+
+    def _reset_case(i: int) -> Model:
+        template.reset(overrides[i])
+        return template
+
+    reset_setup_sec, reset_calculate_sec, reset_results = _time_sweep(_reset_case, cases, calculate)
+
+    def _sweep_result(setup_sec: float, calculate_sec: float) -> dict[str, float]:
+        return {
+            'setup_sec_per_case': setup_sec / cases,
+            'calculate_sec_per_case': calculate_sec / cases,
+            'total_sec': setup_sec + calculate_sec,
+        }
+
+    return {
+        'fresh': _sweep_result(fresh_setup_sec, fresh_calculate_sec),
+        'reset': _sweep_result(reset_setup_sec, reset_calculate_sec),
+        'setup_speedup': fresh_setup_sec / reset_setup_sec,
+        'total_speedup': (fresh_setup_sec + fresh_calculate_sec) / (reset_setup_sec + reset_calculate_sec),
+        'results_match': fresh_results == reset_results,
+    }
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(f'{"Sweep":<8}{"Setup/case (ms)":>17}{"Calculate/case (ms)":>21}{"Total (s)":>11}')
+    for sweep in ['fresh', 'reset']:
+        r = results[sweep]
+        print(
+            f'{sweep:<8}{r["setup_sec_per_case"] * 1000:>17.2f}{r["calculate_sec_per_case"] * 1000:>21.2f}'
+            f'{r["total_sec"]:>11.2f}'
+        )
+    print(
+        f'Setup speedup: {results["setup_speedup"]:.1f}x, total speedup: {results["total_speedup"]:.2f}x, '
+        f'results match: {results["results_match"]}'
+    )
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cases', type=int, default=1000)
+    parser.add_argument('--skip-calculate', action='store_true', help='Only set up the cases, without calculating them')
+    parser.add_argument('--input-file', type=Path, default=_EXAMPLES_DIR / 'example4.txt')
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    results = run_benchmark(args.input_file.absolute(), args.cases, not args.skip_calculate)
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'input_file': args.input_file.name,
+        'cases': args.cases,
+        'calculate': not args.skip_calculate,
+        **results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Warm start benchmark of loading Models from snapshots (Model.load_snapshot) against constructing them and reading their
+parameters.
+
+For each GEOPHIRES example (by default, a few with different reservoir models and economics), saves a snapshot of a
+Model that has read its parameters, then reports the mean time of loading a Model from the snapshot and of constructing
+a Model and reading its parameters, the snapshot size, and whether Models loaded from the snapshot calculate the same
+results as fresh ones.
+
+Usage:
+    python -m tests.benchmarks.benchmark_model_snapshot [--models N] [--input-file PATH ...] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from geophires_x.CylindricalReservoir import CylindricalReservoir
+from geophires_x.Reservoir import Reservoir
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+_DEFAULT_EXAMPLES = (
+    'example13',
+    'example12_DH',
+    'example_SAM-single-owner-PPA',
+    'Wanju_Yuan_Closed-Loop_Geothermal_Energy_Recovery',
+)
+
+
+def _fresh_model(input_file_path: Path) -> Model:
+    model = Model(enable_geophires_logging_config=False, input_file=str(input_file_path), output_file=os.devnull)
+    model.read_parameters()
+    return model
+
+
+def _sec_per_model(new_model: Callable[[], Model], models: int) -> float:
+    start = time.perf_counter()
+    for _ in range(models):
+        new_model()
+
+    return (time.perf_counter() - start) / models
+
+
+def _result(model: Model) -> tuple[float, float]:
+    model.Calculate()
+
+    # Reservoir calculations are memoized by reservoir and model, which would retain the models.
+    Reservoir.Calculate.cache_clear()
+    CylindricalReservoir.Calculate.cache_clear()
+
+    return model.economics.LCOE.value, model.economics.LCOH.value
+
+
+def _benchmark_input_file(input_file_path: Path, models: int, snapshot_path: Path) -> dict[str, Any]:
+    _fresh_model(input_file_path).save_snapshot(snapshot_path)
+
+    def _loaded_model() -> Model:
+        return Model.load_snapshot(snapshot_path, enable_geophires_logging_config=False)
+
+    # warm up imports and caches, so that neither is penalized for running first
+    _fresh_model(input_file_path)
+    _loaded_model()
+
+    fresh_sec = _sec_per_model(lambda: _fresh_model(input_file_path), models)
+    load_sec = _sec_per_model(_loaded_model, models)
+
+    return {
+        'snapshot_kb': snapshot_path.stat().st_size / 1e3,
+        'fresh_sec_per_model': fresh_sec,
+        'load_sec_per_model': load_sec,
+        'speedup': fresh_sec / load_sec,
+        'results_match': _result(_fresh_model(input_file_path)) == _result(_loaded_model()),
+    }
+
+
+def run_benchmark(input_file_paths: list[Path], models: int) -> dict[str, Any]:
+    """
+    :return: JSON-serializable results by input file name
+    """
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        return {
+            input_file_path.name: _benchmark_input_file(
+                input_file_path, models, Path(snapshot_dir, f'{input_file_path.stem}.pkl')
+            )
+            for input_file_path in input_file_paths
+        }
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(f'{"Input file":<52}{"Snapshot (KB)":>15}{"Fresh (ms)":>12}{"Load (ms)":>11}{"Speedup":>9}{"Match":>7}')
+    for name, r in results.items():
+        print(
+            f'{name:<52}{r["snapshot_kb"]:>15.1f}{r["fresh_sec_per_model"] * 1000:>12.2f}'
+            f'{r["load_sec_per_model"] * 1000:>11.2f}{r["speedup"]:>8.1f}x{r["results_match"]!s:>7}'
+        )
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, default=50, help='Number of Models to time per input file')
+    parser.add_argument(
+        '--input-file',
+        type=Path,
+        nargs='+',
+        default=[_EXAMPLES_DIR / f'{example}.txt' for example in _DEFAULT_EXAMPLES],
+    )
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    results = run_benchmark([input_file.absolute() for input_file in args.input_file], args.models)
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'models': args.models,
+        'results': results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
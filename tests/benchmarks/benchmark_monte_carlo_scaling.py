@@ -0,0 +1,232 @@
+"""
+Scaling benchmark of the Monte Carlo simulation's process pool (geophires_monte_carlo.MC_GeoPHIRES3.run_iterations)
+over numbers of workers and chunk sizes, for choosing MAX_WORKERS and CHUNKSIZE in Monte Carlo settings files.
+
+Runs a fixed Monte Carlo study (GEOPHIRES example4 with 3 uniformly/triangularly distributed inputs by default) with
+strong scaling (a fixed total number of iterations) and/or weak scaling (a fixed number of iterations per worker). For
+each number of workers and chunk size, reports throughput, parallel efficiency relative to a single worker with the same
+chunk size, and the mean per-iteration time spent spawning workers, writing the input file, simulating, parsing the
+result, waiting for the output file lock, and otherwise (inter-process communication and idle workers). Finally
+recommends the settings with the highest throughput, preferring fewer workers and smaller chunks when they are within
+5% of it.
+
+Usage:
+    python -m tests.benchmarks.benchmark_monte_carlo_scaling [--mode strong|weak|both] [--workers N ...]
+        [--chunksizes N ...] [--iterations N] [--iterations-per-worker N] [--input-file PATH] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from geophires_monte_carlo.MC_GeoPHIRES3 import IterationsRun
+from geophires_monte_carlo.MC_GeoPHIRES3 import run_iterations
+from geophires_x import GEOPHIRESv3
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+_DEFAULT_INPUTS = [
+    ['Gradient 1', 'uniform', '55', '75'],
+    ['Utilization Factor', 'uniform', '0.8', '0.95'],
+    ['Ambient Temperature', 'triangular', '10', '15', '20'],
+]
+_DEFAULT_OUTPUTS = ['Average Net Electricity Production', 'Average Production Temperature']
+
+_RECOMMENDATION_TOLERANCE = 0.05
+
+
+@dataclass
+class ScalingResult:
+    mode: str
+    workers: int
+    chunksize: int
+    iterations: int
+    wall_time_sec: float
+    throughput_per_sec: float
+    efficiency: float | None
+    """Parallel efficiency relative to a single worker with the same chunk size, if that was run"""
+
+    spawn_sec: float
+    input_write_sec: float
+    simulation_sec: float
+    parse_sec: float
+    lock_wait_sec: float
+    other_sec: float
+    """Per-iteration worker time not spent in an iteration or spawning: inter-process communication and idle workers"""
+
+    failed_iterations: int
+
+
+def _scaling_result(mode: str, workers: int, iterations_run: IterationsRun) -> ScalingResult:
+    iterations = max(len(iterations_run.iteration_timings), 1)
+
+    def _mean_sec(phase: str) -> float:
+        return sum(getattr(it, phase) for it in iterations_run.iteration_timings) / iterations
+
+    worker_time_sec = iterations_run.wall_time_sec * workers
+    busy_sec = sum(it.total_sec for it in iterations_run.iteration_timings) + iterations_run.spawn_sec
+    return ScalingResult(
+        mode=mode,
+        workers=workers,
+        chunksize=iterations_run.chunksize,
+        iterations=len(iterations_run.iteration_timings),
+        wall_time_sec=iterations_run.wall_time_sec,
+        throughput_per_sec=iterations_run.throughput_per_sec,
+        efficiency=None,
+        spawn_sec=iterations_run.spawn_sec / iterations,
+        input_write_sec=_mean_sec('input_write_sec'),
+        simulation_sec=_mean_sec('simulation_sec'),
+        parse_sec=_mean_sec('parse_sec'),
+        lock_wait_sec=_mean_sec('lock_wait_sec'),
+        other_sec=max(worker_time_sec - busy_sec, 0.0) / iterations,
+        failed_iterations=iterations_run.failed_iterations,
+    )
+
+
+def _set_efficiencies(results: list[ScalingResult]) -> None:
+    single_worker_results = {(it.mode, it.chunksize): it for it in results if it.workers == 1}
+    for result in results:
+        reference = single_worker_results.get((result.mode, result.chunksize))
+        if reference is None or reference.throughput_per_sec == 0:
+            continue
+
+        if result.mode == 'strong':
+            result.efficiency = result.throughput_per_sec / (result.workers * reference.throughput_per_sec)
+        else:
+            result.efficiency = reference.wall_time_sec / result.wall_time_sec
+
+
+def recommend_settings(results: list[ScalingResult]) -> ScalingResult | None:
+    """
+    :return: the result with the highest throughput, preferring fewer workers and then smaller chunks among results
+        whose throughput is within 5% of the highest
+    """
+
+    candidates = [it for it in results if it.mode == 'strong'] or results
+    if len(candidates) == 0:
+        return None
+
+    max_throughput = max(it.throughput_per_sec for it in candidates)
+    return min(
+        (it for it in candidates if it.throughput_per_sec >= max_throughput * (1 - _RECOMMENDATION_TOLERANCE)),
+        key=lambda it: (it.workers, it.chunksize),
+    )
+
+
+def run_scaling_benchmark(
+    input_file_path: Path,
+    modes: list[str],
+    workers: list[int],
+    chunksizes: list[int],
+    iterations: int,
+    iterations_per_worker: int,
+) -> list[ScalingResult]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pass_list = [
+            _DEFAULT_INPUTS,
+            _DEFAULT_OUTPUTS,
+            argparse.Namespace(Code_File=GEOPHIRESv3.__file__, Input_file=str(input_file_path.absolute())),
+            str(Path(tmp_dir, 'MC_Result.txt')),
+            tmp_dir + os.sep,
+            sys.executable,
+        ]
+
+        with open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+            # warm up imports, caches, and the process pool machinery
+            run_iterations(pass_list, 1, max_workers=1)
+
+        results = []
+        for mode in modes:
+            for chunksize in chunksizes:
+                for worker_count in workers:
+                    mode_iterations = iterations if mode == 'strong' else iterations_per_worker * worker_count
+                    with open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+                        iterations_run = run_iterations(
+                            pass_list, mode_iterations, max_workers=worker_count, chunksize=chunksize
+                        )
+
+                    result = _scaling_result(mode, worker_count, iterations_run)
+                    results.append(result)
+                    _set_efficiencies(results)
+                    _print_result(result)
+
+        return results
+
+
+def _print_header() -> None:
+    print(
+        f'{"Mode":<8}{"Workers":>8}{"Chunk":>7}{"Iters":>7}{"Wall (s)":>10}{"Iters/s":>9}{"Effic.":>8}'
+        f'   per iteration (ms): {"Spawn":>7}{"Input":>7}{"Sim":>8}{"Parse":>7}{"Lock":>7}{"Other":>8}'
+    )
+
+
+def _print_result(r: ScalingResult) -> None:
+    efficiency = f'{r.efficiency * 100:.0f}%' if r.efficiency is not None else 'n/a'
+    failed = f'  ({r.failed_iterations} failed)' if r.failed_iterations > 0 else ''
+    print(
+        f'{r.mode:<8}{r.workers:>8}{r.chunksize:>7}{r.iterations:>7}{r.wall_time_sec:>10.2f}'
+        f'{r.throughput_per_sec:>9.2f}{efficiency:>8}{"":>23}{r.spawn_sec * 1000:>7.1f}{r.input_write_sec * 1000:>7.1f}'
+        f'{r.simulation_sec * 1000:>8.1f}{r.parse_sec * 1000:>7.1f}{r.lock_wait_sec * 1000:>7.1f}'
+        f'{r.other_sec * 1000:>8.1f}{failed}'
+    )
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mode', choices=['strong', 'weak', 'both'], default='both')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--chunksizes', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--iterations', type=int, default=16, help='Total iterations for strong scaling')
+    parser.add_argument('--iterations-per-worker', type=int, default=4, help='Iterations per worker for weak scaling')
+    parser.add_argument('--input-file', type=Path, default=_EXAMPLES_DIR / 'example4.txt')
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    _print_header()
+    results = run_scaling_benchmark(
+        args.input_file,
+        ['strong', 'weak'] if args.mode == 'both' else [args.mode],
+        sorted(set(args.workers)),
+        sorted(set(args.chunksizes)),
+        args.iterations,
+        args.iterations_per_worker,
+    )
+
+    recommended = recommend_settings(results)
+    report = {
+        **environment_info(),
+        'cpu_count': os.cpu_count(),
+        'input_file': args.input_file.name,
+        'results': [vars(it) for it in results],
+        'recommended': (
+            {'MAX_WORKERS': recommended.workers, 'CHUNKSIZE': recommended.chunksize} if recommended else None
+        ),
+    }
+
+    if recommended is not None:
+        print(
+            f'\nRecommended Monte Carlo settings for this host ({os.cpu_count()} CPUs), '
+            f'{recommended.throughput_per_sec:.2f} iterations/s:\n'
+            f'MAX_WORKERS, {recommended.workers}\nCHUNKSIZE, {recommended.chunksize}'
+        )
+
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
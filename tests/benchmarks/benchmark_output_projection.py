@@ -0,0 +1,181 @@
+"""
+Benchmark of output projection (the ``outputs`` of headless GEOPHIRESv3.main runs) against full headless runs.
+
+For each GEOPHIRES example (by default, the SAM economic model examples), reports the mean time of a full headless run
+and of a run projected to a few outputs (by default, LCOE and net electricity production), both end to end and split
+into the SAM economics calculation and the JSON serialization of the returned outputs (as done by the server), and
+whether the projected values equal those of the full run.
+
+Usage:
+    python -m tests.benchmarks.benchmark_output_projection [--runs N] [--input-file PATH ...] [--outputs NAME ...]
+        [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+import numpy as np
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from geophires_x import GEOPHIRESv3 as geophires
+from geophires_x.EconomicsSam import calculate_sam_economics
+from geophires_x.OutputProjection import OutputProjection
+from geophires_x.Parameter import OutputParameter
+from geophires_x.ParameterSerialization import output_parameter_to_json_dict
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+_DEFAULT_EXAMPLES = (
+    'example_SAM-single-owner-PPA',
+    'example_SAM-single-owner-PPA-2',
+    'example_SAM-single-owner-PPA-4',
+)
+
+_DEFAULT_OUTPUTS = ('LCOE', 'Net Electricity Production')
+
+
+def _mean_sec(f: Callable[[], Any], runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        f()
+
+    return (time.perf_counter() - start) / runs
+
+
+def _run(input_file_path: Path, outputs: list[str] | None) -> dict[str, OutputParameter]:
+    return geophires.main(
+        enable_geophires_logging_config=False,
+        headless=True,
+        input_file=str(input_file_path),
+        output_file=os.devnull,
+        outputs=outputs,
+    )
+
+
+def _serialize(output_parameters: dict[str, OutputParameter]) -> list[dict[str, Any]]:
+    return [output_parameter_to_json_dict(output_parameter) for output_parameter in output_parameters.values()]
+
+
+def _calculated_model(input_file_path: Path) -> Model:
+    model = Model(enable_geophires_logging_config=False, input_file=str(input_file_path), output_file=os.devnull)
+    model.read_parameters()
+    model.Calculate()
+    return model
+
+
+def _sam_economics_sec(model: Model, output_projection: OutputProjection | None, runs: int) -> float:
+    model.output_projection = output_projection
+
+    def _calculate() -> None:
+        # SAM economics are memoized on the model
+        model.sam_economics_calculations_cache = None
+        calculate_sam_economics(model)
+
+    try:
+        return _mean_sec(_calculate, runs)
+    finally:
+        model.output_projection = None
+        model.sam_economics_calculations_cache = None
+
+
+def _values_match(full: dict[str, OutputParameter], projected: dict[str, OutputParameter]) -> bool:
+    return all(
+        full[name].CurrentUnits == projected[name].CurrentUnits
+        and np.array_equal(np.asarray(full[name].value), np.asarray(projected[name].value))
+        for name in projected
+    )
+
+
+def _benchmark_input_file(input_file_path: Path, outputs: list[str], runs: int) -> dict[str, Any]:
+    # warm up imports and caches, so that neither is penalized for running first
+    full = _run(input_file_path, None)
+    projected = _run(input_file_path, outputs)
+
+    model = _calculated_model(input_file_path)
+
+    results = {'values_match': _values_match(full, projected)}
+    for mode, mode_outputs, mode_output_parameters in [('full', None, full), ('projected', outputs, projected)]:
+        results[mode] = {
+            'run_sec': _mean_sec(lambda mode_outputs=mode_outputs: _run(input_file_path, mode_outputs), runs),
+            'sam_economics_sec': _sam_economics_sec(
+                model, OutputProjection(mode_outputs) if mode_outputs is not None else None, runs * 10
+            ),
+            'serialization_sec': _mean_sec(
+                lambda mode_output_parameters=mode_output_parameters: _serialize(mode_output_parameters), runs * 10
+            ),
+            'outputs': len(mode_output_parameters),
+        }
+
+    results['saved_sec_per_run'] = results['full']['run_sec'] - results['projected']['run_sec']
+    return results
+
+
+def run_benchmark(input_file_paths: list[Path], outputs: list[str], runs: int) -> dict[str, Any]:
+    """
+    :return: JSON-serializable results by input file name
+    """
+
+    return {
+        input_file_path.name: _benchmark_input_file(input_file_path, outputs, runs)
+        for input_file_path in input_file_paths
+    }
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(
+        f'{"Input file":<40}{"Mode":>10}{"Outputs":>9}{"Run (ms)":>10}{"SAM econ (ms)":>15}{"Serialize (ms)":>16}'
+        f'{"Match":>7}'
+    )
+    for name, r in results.items():
+        for mode in ('full', 'projected'):
+            m = r[mode]
+            print(
+                f'{name:<40}{mode:>10}{m["outputs"]:>9}{m["run_sec"] * 1000:>10.1f}'
+                f'{m["sam_economics_sec"] * 1000:>15.2f}{m["serialization_sec"] * 1000:>16.3f}'
+                f'{r["values_match"]!s:>7}'
+            )
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Number of runs to time per input file and mode')
+    parser.add_argument(
+        '--input-file',
+        type=Path,
+        nargs='+',
+        default=[_EXAMPLES_DIR / f'{example}.txt' for example in _DEFAULT_EXAMPLES],
+    )
+    parser.add_argument('--outputs', nargs='+', default=list(_DEFAULT_OUTPUTS), help='The outputs to project to')
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    results = run_benchmark([input_file.absolute() for input_file in args.input_file], args.outputs, args.runs)
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'runs': args.runs,
+        'outputs': args.outputs,
+        'results': results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
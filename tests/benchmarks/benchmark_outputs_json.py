@@ -0,0 +1,96 @@
+"""
+Compares serialization time of calculated output parameters to JSON (as written to the JSON output file) using jsons vs.
+geophires_x.OutputsJson, for each example in tests/examples, and verifies that both produce identical JSON.
+
+Usage:
+    python tests/benchmarks/benchmark_outputs_json.py [--repeat N] [example stem ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+
+import jsons
+
+from geophires_x.OutputsJson import output_parameters_to_json_dict
+from geophires_x_client import GeophiresXClient
+from geophires_x_client import ImmutableGeophiresInputParameters
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+
+def _serialize_with_jsons(output_parameters: dict) -> str:
+    return json.dumps(json.loads(jsons.dumps(output_parameters, indent=4, sort_keys=True, supress_warnings=True)))
+
+
+def _serialize_directly(output_parameters: dict) -> str:
+    return json.dumps(output_parameters_to_json_dict([output_parameters]))
+
+
+def _time(fn, output_parameters: dict, repeat: int) -> tuple[float, str]:
+    timings = []
+    serialized = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        serialized = fn(output_parameters)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings), serialized
+
+
+def main(repeat: int, example_stems: list[str]) -> None:
+    logging.disable(logging.CRITICAL)
+    jsons.suppress_warnings(True)
+
+    client = GeophiresXClient()
+    example_input_file_paths = (
+        [Path(_EXAMPLES_DIR, f'{stem}.txt') for stem in example_stems]
+        if len(example_stems) > 0
+        else [p for p in sorted(_EXAMPLES_DIR.glob('*.txt')) if p.with_suffix('.out').exists()]
+    )
+
+    total_jsons_sec = 0.0
+    total_direct_sec = 0.0
+    print(f'{"Example":<52}{"jsons (ms)":>12}{"Direct (ms)":>13}{"Speedup":>10}')
+    for example_input_file_path in example_input_file_paths:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):  # examples that print output to console
+                output_parameters = client.get_geophires_output_parameters(
+                    ImmutableGeophiresInputParameters(from_file_path=example_input_file_path)
+                )
+        except RuntimeError as e:
+            print(f'{example_input_file_path.stem:<52}{"failed":>12} ({e!s:.60})')
+            continue
+
+        jsons_sec, jsons_serialized = _time(_serialize_with_jsons, output_parameters, repeat)
+        direct_sec, direct_serialized = _time(_serialize_directly, output_parameters, repeat)
+        if jsons_serialized != direct_serialized:
+            raise RuntimeError(f'Direct JSON serialization does not match jsons for {example_input_file_path.stem}')
+
+        total_jsons_sec += jsons_sec
+        total_direct_sec += direct_sec
+        print(
+            f'{example_input_file_path.stem:<52}{jsons_sec * 1000:>12.2f}{direct_sec * 1000:>13.2f}'
+            f'{jsons_sec / direct_sec:>9.1f}x'
+        )
+
+    if total_direct_sec > 0:
+        print(
+            f'{"Total":<52}{total_jsons_sec * 1000:>12.2f}{total_direct_sec * 1000:>13.2f}'
+            f'{total_jsons_sec / total_direct_sec:>9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('example_stems', nargs='*')
+    args = parser.parse_args()
+    main(args.repeat, args.example_stems)
@@ -0,0 +1,147 @@
+"""
+Benchmark of evaluating the analytical reservoir models for many parameter sets with one call of their array-batched
+kernels (geophires_x.ReservoirKernels) against calculating a Model's reservoir for each parameter set.
+
+For each example, sweeps a parameter of its reservoir model over the given number of cases. The per-model path resets a
+template Model with the case's parameter as override and calculates its reservoir, as an uncertainty or optimization
+study does; the batched path evaluates the example's kernel once for the parameters of all cases (collected from the
+per-model path). Reports the per-case time of the per-model path (for resetting and calculating separately), the time
+of the batched call, and the largest difference of their dimensionless production temperatures.
+
+Usage:
+    python -m tests.benchmarks.benchmark_reservoir_kernels [--cases N] [--save PATH] [example ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from geophires_x.Reservoir import Reservoir
+from geophires_x.ReservoirKernels import model_kernel
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+# Examples and the parameter (and range) that is swept for each; one example per reservoir model
+SWEEPS: dict[str, tuple[str, float, float]] = {
+    'example4': ('Drawdown Parameter', 0.001, 0.01),  # TDP
+    'example3': ('Drawdown Parameter', 0.00005, 0.0002),  # SF
+    'example1': ('Fracture Separation', 50, 300),  # MPF
+    'example2': ('Fracture Separation', 50, 300),  # LHS
+}
+
+
+def _dimensionless_temperature(model: Model) -> np.ndarray:
+    return (model.reserv.Tresoutput.value - model.wellbores.Tinj.value) / (
+        model.reserv.Trock.value - model.wellbores.Tinj.value
+    )
+
+
+def run_benchmark(example: str, cases: int) -> dict[str, Any]:
+    """
+    :return: JSON-serializable times of the per-model and batched evaluation of the example's sweep
+    """
+
+    param_name, low, high = SWEEPS[example]
+    template = Model(
+        enable_geophires_logging_config=False,
+        input_file=str(_EXAMPLES_DIR / f'{example}.txt'),
+        output_file=os.devnull,
+    )
+    template.read_parameters()
+
+    reset_sec = 0
+    calculate_sec = 0
+    expected = []
+    params = []
+    for value in np.linspace(low, high, cases):
+        start = time.perf_counter()
+        template.reset({param_name: float(value)})
+        reset_sec += time.perf_counter() - start
+
+        start = time.perf_counter()
+        template.reserv.Calculate(template)
+        calculate_sec += time.perf_counter() - start
+
+        # Reservoir calculations are memoized by reservoir and model, which would retain every case.
+        Reservoir.Calculate.cache_clear()
+
+        kernel, case_params = model_kernel(template)
+        expected.append(_dimensionless_temperature(template))
+        params.append(case_params)
+
+    batch_params = {name: np.array([p[name] for p in params]) for name in params[0]}
+    timevector = template.reserv.timevector.value
+    start = time.perf_counter()
+    result = kernel(batch_params, timevector)
+    batch_sec = time.perf_counter() - start
+
+    return {
+        'kernel': kernel.__name__,
+        'swept_parameter': param_name,
+        'model': {
+            'reset_sec_per_case': reset_sec / cases,
+            'calculate_sec_per_case': calculate_sec / cases,
+        },
+        'batch': {
+            'total_sec': batch_sec,
+            'sec_per_case': batch_sec / cases,
+        },
+        'calculate_speedup': calculate_sec / batch_sec,
+        'max_abs_difference': float(np.max(np.abs(result - np.array(expected)))),
+    }
+
+
+def _print_results(results: dict[str, dict[str, Any]]) -> None:
+    print(
+        f'{"Example":<10}{"Kernel":>7}{"Reset/case (ms)":>17}{"Calculate/case (ms)":>21}{"Batch/case (ms)":>17}'
+        f'{"Speedup":>10}{"Max diff":>11}'
+    )
+    for example, r in results.items():
+        print(
+            f'{example:<10}{r["kernel"]:>7}{r["model"]["reset_sec_per_case"] * 1000:>17.2f}'
+            f'{r["model"]["calculate_sec_per_case"] * 1000:>21.3f}{r["batch"]["sec_per_case"] * 1000:>17.4f}'
+            f'{r["calculate_speedup"]:>9.1f}x{r["max_abs_difference"]:>11.1e}'
+        )
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('examples', nargs='*', help=f'Examples to sweep (default: all of {", ".join(SWEEPS)})')
+    parser.add_argument('--cases', type=int, default=50)
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+    examples = args.examples or list(SWEEPS)
+    unknown = [example for example in examples if example not in SWEEPS]
+    if len(unknown) > 0:
+        parser.error(f'Unknown examples: {", ".join(unknown)}')
+
+    logging.disable(logging.CRITICAL)
+
+    results = {example: run_benchmark(example, args.cases) for example in examples}
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'cases': args.cases,
+        'examples': results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
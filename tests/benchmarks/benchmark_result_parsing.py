@@ -0,0 +1,73 @@
+"""
+Benchmarks GeophiresXResult construction from text reports on the largest example outputs, separating the time spent
+tokenizing the report into its one-pass index (geophires_x_client.report_index.build_report_index) from the time spent
+looking up the result fields and parsing the profiles from the index.
+
+Usage:
+    python tests/benchmarks/benchmark_result_parsing.py [--repeat N] [--all]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+from pathlib import Path
+
+from geophires_x_client import GeophiresXResult
+from geophires_x_client.report_index import build_report_index
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+_LARGEST_EXAMPLES = [
+    'example_SAM-single-owner-PPA-5.out',
+    'Fervo_Project_Cape-4.out',
+    'example_SAM-single-owner-PPA.out',
+    'example_SBT_Hi_T.out',
+    'example_SBT_Lo_T.out',
+]
+
+
+def _time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def main(repeat: int, all_examples: bool) -> None:
+    logging.disable(logging.CRITICAL)
+
+    example_paths = (
+        sorted(_EXAMPLES_DIR.glob('*.out')) if all_examples else [Path(_EXAMPLES_DIR, e) for e in _LARGEST_EXAMPLES]
+    )
+
+    total_index_sec = 0.0
+    total_result_sec = 0.0
+    print(f'{"Example":<60}{"Lines":>8}{"Index (ms)":>12}{"Result (ms)":>13}')
+    for example_path in example_paths:
+        report_text = example_path.read_text(encoding='utf-8')
+
+        index_sec = _time(lambda t=report_text: build_report_index(t), repeat)
+        result_sec = _time(lambda p=example_path: GeophiresXResult(str(p)), repeat)
+
+        total_index_sec += index_sec
+        total_result_sec += result_sec
+        print(
+            f'{example_path.name:<60}{report_text.count(chr(10)):>8}{index_sec * 1000:>12.2f}'
+            f'{result_sec * 1000:>13.2f}'
+        )
+
+    print(f'{"Total":<60}{"":>8}{total_index_sec * 1000:>12.2f}{total_result_sec * 1000:>13.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--all', action='store_true', help='Benchmark all example outputs instead of the largest')
+    args = parser.parse_args()
+    main(args.repeat, args.all)
@@ -0,0 +1,115 @@
+"""
+Benchmark of simulation request latency with and without the GEOPHIRES-X server (geophires_x.server).
+
+Measures, for the same input:
+    - cold: a new process that imports GeophiresXClient and runs the simulation in-process, as each client user
+      process does without the server (includes interpreter startup and imports)
+    - cold client, warm server: a new process that imports GeophiresXClient and sends the request to a running server
+    - warm server, first request: the first request an in-process client sends to a newly started server
+    - warm server: subsequent requests an in-process client sends to the server
+
+The server's startup time (starting and warming up its workers) is reported separately, since it is paid once.
+
+Usage:
+    python -m tests.benchmarks.benchmark_server_latency [--runs N] [--input-file PATH] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from geophires_x.server import GeophiresXServer
+from geophires_x_client import GeophiresXClient
+from geophires_x_client import ImmutableGeophiresInputParameters
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+_REPO_ROOT = Path(__file__).parent.parent.parent
+
+_CLIENT_PROCESS_SCRIPT = """
+import sys
+from geophires_x_client import GeophiresXClient, ImmutableGeophiresInputParameters
+
+server_address = sys.argv[2] if len(sys.argv) > 2 else None
+GeophiresXClient(server_address=server_address).get_geophires_result(
+    ImmutableGeophiresInputParameters(from_file_path=sys.argv[1])
+)
+"""
+
+
+def _time_client_process(input_file_path: Path, server_address: str | None = None) -> float:
+    args = [sys.executable, '-c', _CLIENT_PROCESS_SCRIPT, str(input_file_path)]
+    if server_address is not None:
+        args.append(server_address)
+
+    start = time.perf_counter()
+    subprocess.run(args, cwd=_REPO_ROOT, check=True, capture_output=True)  # noqa: S603
+    return time.perf_counter() - start
+
+
+def _time_request(client: GeophiresXClient, input_file_path: Path) -> float:
+    start = time.perf_counter()
+    client.get_geophires_result(ImmutableGeophiresInputParameters(from_file_path=input_file_path))
+    return time.perf_counter() - start
+
+
+def _latency(times_sec: list[float]) -> dict[str, Any]:
+    return {'median_sec': statistics.median(times_sec), 'min_sec': min(times_sec), 'runs': len(times_sec)}
+
+
+def run_benchmark(input_file_path: Path, runs: int = 3) -> dict[str, Any]:
+    """
+    :return: JSON-serializable latencies of each configuration, and the server's startup time
+    """
+
+    results = {
+        'cold': _latency([_time_client_process(input_file_path) for _ in range(runs)]),
+    }
+
+    start = time.perf_counter()
+    with GeophiresXServer(port=0, max_workers=1) as server:
+        results['server_startup_sec'] = time.perf_counter() - start
+
+        client = GeophiresXClient(server_address=server.address)
+        results['warm_server_first_request'] = _latency([_time_request(client, input_file_path)])
+        results['warm_server'] = _latency([_time_request(client, input_file_path) for _ in range(runs)])
+        results['cold_client_warm_server'] = _latency(
+            [_time_client_process(input_file_path, server.address) for _ in range(runs)]
+        )
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help='Number of measured requests of each configuration')
+    parser.add_argument('--input-file', type=Path, default=_EXAMPLES_DIR / 'example2.txt')
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    latencies = run_benchmark(args.input_file.absolute(), runs=args.runs)
+
+    print(f'{"Configuration":<32}{"Median (s)":>12}{"Min (s)":>10}')
+    for name in ('cold', 'cold_client_warm_server', 'warm_server_first_request', 'warm_server'):
+        print(f'{name:<32}{latencies[name]["median_sec"]:>12.3f}{latencies[name]["min_sec"]:>10.3f}')
+    print(f'\nServer startup (once): {latencies["server_startup_sec"]:.3f} s')
+
+    report = {**environment_info(), 'input_file': args.input_file.name, 'latencies': latencies}
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Compares GeophiresXResult construction from example text reports with construction from their structured result
+sidecars (see geophires_x.OutputsStructured), checks that both give the same result, and measures the accuracy of the
+report values that are also output parameters against the full-precision sidecar values.
+
+Each example in tests/examples is run to produce its report and sidecar. Examples that fail to run (e.g. because they
+need data that is not available) are reported and skipped.
+
+Usage:
+    python tests/benchmarks/benchmark_structured_result.py [--repeat N] [example stem ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+from geophires_x_client import GeophiresXClient
+from geophires_x_client import GeophiresXResult
+from geophires_x_client import ImmutableGeophiresInputParameters
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def _max_relative_deviation(r: GeophiresXResult) -> tuple[int, float]:
+    """
+    :return: The number of report fields that are also output parameters with the same unit, and the maximum relative
+        deviation of their report values from the sidecar values
+    """
+
+    num_fields = 0
+    max_deviation = 0.0
+    for category, fields in r.result.items():
+        if category == 'metadata' or not isinstance(fields, dict):
+            continue
+
+        for field_name, report_value in fields.items():
+            output_parameter = r.output_parameters.get(field_name)
+            if not isinstance(report_value, dict) or output_parameter is None:
+                continue
+
+            if report_value['unit'] != output_parameter['unit'] or not isinstance(report_value['value'], (int, float)):
+                continue
+
+            num_fields += 1
+            value = output_parameter['value']
+            if value != 0:
+                max_deviation = max(max_deviation, abs(report_value['value'] - value) / abs(value))
+
+    return num_fields, max_deviation
+
+
+def main(repeat: int, example_stems: list[str]) -> None:
+    logging.disable(logging.CRITICAL)
+
+    if len(example_stems) == 0:
+        example_stems = sorted(
+            p.stem for p in _EXAMPLES_DIR.glob('*.out') if Path(_EXAMPLES_DIR, f'{p.stem}.txt').exists()
+        )
+
+    client = GeophiresXClient(enable_caching=False)
+
+    total_text_sec = 0.0
+    total_structured_sec = 0.0
+    print(f'{"Example":<60}{"Text (ms)":>12}{"Sidecar (ms)":>14}{"Speedup":>10}{"Fields":>8}{"Max rel dev":>14}')
+    for example_stem in example_stems:
+        try:
+            # Discard the reports that examples copy to the console
+            with open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+                r = client.get_geophires_result(
+                    ImmutableGeophiresInputParameters(from_file_path=Path(_EXAMPLES_DIR, f'{example_stem}.txt'))
+                )
+        except RuntimeError as e:
+            print(f'{example_stem:<60}skipped: {e!s}'.splitlines()[0])
+            continue
+
+        text_result = GeophiresXResult(r.output_file_path, use_structured_result=False)
+        if json.dumps(text_result.result, default=str) != json.dumps(r.result, default=str):
+            raise RuntimeError(f'Structured result does not match text result for {example_stem}')
+
+        text_sec = _time(lambda p=r.output_file_path: GeophiresXResult(p, use_structured_result=False), repeat)
+        structured_sec = _time(lambda p=r.output_file_path: GeophiresXResult(p), repeat)
+        num_fields, max_deviation = _max_relative_deviation(r)
+
+        total_text_sec += text_sec
+        total_structured_sec += structured_sec
+        print(
+            f'{example_stem:<60}{text_sec * 1000:>12.2f}{structured_sec * 1000:>14.2f}'
+            f'{text_sec / structured_sec:>9.1f}x{num_fields:>8}{max_deviation:>14.2e}'
+        )
+
+    print(
+        f'{"Total":<60}{total_text_sec * 1000:>12.2f}{total_structured_sec * 1000:>14.2f}'
+        f'{total_text_sec / total_structured_sec:>9.1f}x'
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('examples', nargs='*', help='Stems of the examples to benchmark (default: all)')
+    args = parser.parse_args()
+    main(args.repeat, args.examples)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+from typing import Iterable
+
+from tests.base_test_case import BaseTestCase
+from tests.benchmarks.baseline_comparison import load_results
+
+
+class BenchmarkTestCase(BaseTestCase):
+    """
+    Benchmarks disable logging for the whole process so that it does not skew their timings; it is re-enabled after
+    each benchmark test so that the tests that run after them are not affected.
+    """
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        super().tearDown()
+
+    def assertBaselineCovers(
+        self, baseline_path: Path, names: Iterable[str], measured_key: str, unmeasured_key: str
+    ) -> None:
+        """
+        Asserts that the stored baseline has a result for each benchmark name, either measured (under measured_key) or
+        recorded as not measurable in the baseline's environment (under unmeasured_key), so that no benchmark is left
+        out of the regression comparison.
+        """
+
+        baseline = load_results(baseline_path)
+        self.assertListEqual(sorted(names), sorted([*baseline[measured_key].keys(), *baseline[unmeasured_key].keys()]))
+
+    def assertTimingsMeasured(self, results: dict[str, dict[str, Any]], *timing_keys: str) -> None:
+        """
+        Asserts that each benchmark's result, by benchmark name, has positive values of the timings
+        """
+
+        for name, result in results.items():
+            with self.subTest(benchmark=name):
+                for timing_key in timing_keys:
+                    self.assertGreater(result[timing_key], 0)
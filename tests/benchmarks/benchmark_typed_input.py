@@ -0,0 +1,240 @@
+"""
+Input processing benchmark of typed (JSON and TOML) input files against text input files.
+
+Converts GEOPHIRES examples (by default, the ones with the most input parameters) to typed input files, with values in
+the units of the JSON schema where the text input gives other units, then reports the mean time of reading the input
+file (Model construction's Read Input File stage) and of reading the parameters (Model.read_parameters) for each
+format, and checks that all formats read the same parameter values.
+
+Usage:
+    python -m tests.benchmarks.benchmark_typed_input [--runs N] [--input-file PATH ...] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Ruff disabled because imports are order-dependent
+# ruff: noqa: I001
+from geophires_x.Model import Model
+from geophires_x.Parameter import Parameter
+from geophires_x.Parameter import boolParameter
+from geophires_x.Parameter import intParameter
+from geophires_x.Parameter import listParameter
+from geophires_x.Parameter import strParameter
+from geophires_x.Units import convertible_unit
+from geophires_x.Units import get_unit_registry
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_ureg = get_unit_registry()
+
+_EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+_DEFAULT_EXAMPLES = (
+    'example1_addons',
+    'example_PTC',
+    'example_ITC',
+    'example12_DH',
+    'example_SAM-single-owner-PPA-5',
+    'Fervo_Project_Cape-3',
+)
+
+FORMATS = ('txt', 'json', 'toml')
+
+
+def _new_model(input_file_path: Path) -> Model:
+    return Model(enable_geophires_logging_config=False, input_file=str(input_file_path), output_file=os.devnull)
+
+
+def _parameters_by_name(model: Model) -> dict[str, Parameter]:
+    return {
+        parameter.Name: parameter
+        for element_name in model._initial_elements
+        if getattr(model, element_name) is not None
+        for parameter in getattr(model, element_name).ParameterDict.values()
+        if isinstance(parameter, Parameter)
+    }
+
+
+def _typed_value(parameter: Parameter | None, s_value: str, raw_entry: str) -> Any:
+    if isinstance(parameter, boolParameter):
+        return s_value in ['1', 'true', 'True', 'TRUE', 't', 'T', 'yes', 'Yes', 'y', 'Y']
+
+    if isinstance(parameter, strParameter):
+        return s_value
+
+    if isinstance(parameter, listParameter) and not parameter.Name.split(' ')[-1].isdigit():
+        return [float(it) for it in raw_entry.split('--')[0].split(',')[1:] if it.strip() != '']
+
+    if isinstance(parameter, intParameter):
+        return int(float(s_value))
+
+    return float(s_value)
+
+
+def typed_input_document(input_file_path: Path) -> dict[str, Any]:
+    """
+    :return: The typed input (see geophires_x.GeoPHIRESUtils.read_typed_input_file) equivalent to a text input file.
+        Values with units are converted to the units of the JSON schema (the parameter's units), as reading the text
+        input file would convert them, so that the typed input takes the fast path without unit conversion.
+    """
+
+    model = _new_model(input_file_path)
+
+    # The units of the schema are those of the parameters before they are read. (Reading the parameters may initiate
+    # other elements, e.g. the surface plant, whose parameters are taken from the read model.)
+    read_model = _new_model(input_file_path)
+    read_model.read_parameters()
+    parameters = {**_parameters_by_name(read_model), **_parameters_by_name(model)}
+
+    document = {}
+    for name, entry in model._initial_input_parameters.items():
+        parameter = parameters.get(name)
+        try:
+            if ' ' in entry.sValue and isinstance(parameter, Parameter) and parameter.CurrentUnits is not None:
+                value, units = entry.sValue.split(' ', 1)
+                quantity = _ureg.Quantity(float(value), convertible_unit(units.strip()))
+                document[name] = quantity.to(convertible_unit(parameter.CurrentUnits.value)).magnitude
+            else:
+                document[name] = _typed_value(parameter, entry.sValue, entry.raw_entry)
+        except (ValueError, TypeError, AttributeError):
+            # values that are not of the parameter's type (e.g. option names) are kept as text
+            document[name] = entry.sValue
+
+    return document
+
+
+def _toml_value(value: Any) -> str:
+    if isinstance(value, dict):
+        return '{ ' + ', '.join(f'{k} = {_toml_value(v)}' for k, v in value.items()) + ' }'
+
+    # (JSON numbers, booleans, strings and arrays are valid TOML values)
+    return json.dumps(value)
+
+
+def write_typed_input_files(input_file_path: Path, output_dir: Path) -> dict[str, Path]:
+    """
+    :return: The paths of the input file in each format
+    """
+
+    document = typed_input_document(input_file_path)
+
+    json_path = Path(output_dir, f'{input_file_path.stem}.json')
+    json_path.write_text(json.dumps(document, indent=4), encoding='UTF-8')
+
+    toml_path = Path(output_dir, f'{input_file_path.stem}.toml')
+    toml_path.write_text(
+        ''.join(f'{json.dumps(name)} = {_toml_value(value)}\n' for name, value in document.items()), encoding='UTF-8'
+    )
+
+    return {'txt': input_file_path, 'json': json_path, 'toml': toml_path}
+
+
+def _parameter_values(model: Model) -> dict[str, Any]:
+    return {
+        # (compared as text, because values may be arrays)
+        f'{element_name}.{name}': (str(parameter.value), str(parameter.CurrentUnits))
+        for element_name in model._initial_elements
+        if getattr(model, element_name) is not None
+        for name, parameter in getattr(model, element_name).ParameterDict.items()
+        if isinstance(parameter, Parameter)
+    }
+
+
+def _benchmark_input_file(input_file_path: Path, runs: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    parameter_values = {}
+    for input_format, path in input_file_path.items():
+        # warm up imports and caches, so that the first format is not penalized for running first
+        _new_model(path).read_parameters()
+
+        read_input_file_sec = read_parameters_sec = 0
+        for _ in range(runs):
+            model = _new_model(path)
+            read_input_file_sec += model.timings.stages['Read Input File'].wall_time_sec
+
+            start = time.perf_counter()
+            model.read_parameters()
+            read_parameters_sec += time.perf_counter() - start
+
+        parameter_values[input_format] = _parameter_values(model)
+        results[input_format] = {
+            'read_input_file_sec': read_input_file_sec / runs,
+            'read_parameters_sec': read_parameters_sec / runs,
+            'input_processing_sec': (read_input_file_sec + read_parameters_sec) / runs,
+        }
+
+    for input_format in FORMATS[1:]:
+        results[input_format]['speedup'] = (
+            results['txt']['input_processing_sec'] / results[input_format]['input_processing_sec']
+        )
+    results['values_match'] = all(parameter_values[it] == parameter_values['txt'] for it in FORMATS[1:])
+    return results
+
+
+def run_benchmark(input_file_paths: list[Path], runs: int) -> dict[str, Any]:
+    """
+    :return: JSON-serializable results by input file name
+    """
+
+    with tempfile.TemporaryDirectory() as typed_input_dir:
+        return {
+            input_file_path.name: _benchmark_input_file(
+                write_typed_input_files(input_file_path, Path(typed_input_dir)), runs
+            )
+            for input_file_path in input_file_paths
+        }
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(f'{"Input file":<36}{"Format":>7}{"Read file (ms)":>16}{"Read parameters (ms)":>22}{"Speedup":>9}')
+    for name, r in results.items():
+        for input_format in FORMATS:
+            f = r[input_format]
+            speedup = f'{f["speedup"]:.1f}x' if 'speedup' in f else ''
+            print(
+                f'{name if input_format == "txt" else "":<36}{input_format:>7}{f["read_input_file_sec"] * 1000:>16.3f}'
+                f'{f["read_parameters_sec"] * 1000:>22.3f}{speedup:>9}'
+            )
+        if not r['values_match']:
+            print(f'{"":<36}Parameter values do not match')
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=50, help='Number of Models to time per input file and format')
+    parser.add_argument(
+        '--input-file',
+        type=Path,
+        nargs='+',
+        default=[_EXAMPLES_DIR / f'{example}.txt' for example in _DEFAULT_EXAMPLES],
+    )
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    results = run_benchmark([input_file.absolute() for input_file in args.input_file], args.runs)
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'runs': args.runs,
+        'results': results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Cold start benchmark of the unit registry cache (see geophires_x.Units.get_unit_registry).
+
+Spawns new Python processes that import geophires_x.Model, as server and client worker processes do, with the unit
+registry cache disabled and with a populated cache, and reports the mean time of loading the unit registry and of the
+whole process (including interpreter startup and imports).
+
+Usage:
+    python -m tests.benchmarks.benchmark_unit_registry [--runs N] [--save PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from geophires_x.Units import UNIT_REGISTRY_CACHE_FOLDER_ENV_VAR
+from tests.benchmarks.baseline_comparison import environment_info
+from tests.benchmarks.baseline_comparison import save_results
+
+_REPO_ROOT = Path(__file__).parent.parent.parent
+
+_COLD_START_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+from geophires_x.Units import get_unit_registry
+ureg = get_unit_registry()
+ureg.Quantity(1, 'MMBTU').to('BTU')
+registry_sec = time.perf_counter() - start
+
+import geophires_x.Model
+
+print(json.dumps({'registry_sec': registry_sec, 'import_sec': time.perf_counter() - start}))
+"""
+
+
+def _cold_start(cache_folder: str) -> dict[str, float]:
+    env = {**os.environ, UNIT_REGISTRY_CACHE_FOLDER_ENV_VAR: cache_folder}
+
+    start = time.perf_counter()
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', _COLD_START_SCRIPT], cwd=_REPO_ROOT, env=env, check=True, capture_output=True, text=True
+    )
+    process_sec = time.perf_counter() - start
+
+    return {**json.loads(result.stdout), 'process_sec': process_sec}
+
+
+def _mean_cold_start(cache_folder: str, runs: int) -> dict[str, float]:
+    cold_starts = [_cold_start(cache_folder) for _ in range(runs)]
+    return {key: statistics.mean(cold_start[key] for cold_start in cold_starts) for key in cold_starts[0]}
+
+
+def run_benchmark(runs: int) -> dict[str, Any]:
+    """
+    :return: JSON-serializable results by cache mode
+    """
+
+    with tempfile.TemporaryDirectory() as cache_folder:
+        # the first process populates the cache
+        _cold_start(cache_folder)
+
+        results = {
+            'uncached': _mean_cold_start('', runs),
+            'cached': _mean_cold_start(cache_folder, runs),
+        }
+
+    results['registry_speedup'] = results['uncached']['registry_sec'] / results['cached']['registry_sec']
+    return results
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(f'{"Cache":<10}{"Registry (ms)":>15}{"Imports (ms)":>14}{"Process (ms)":>14}')
+    for mode in ('uncached', 'cached'):
+        r = results[mode]
+        print(
+            f'{mode:<10}{r["registry_sec"] * 1000:>15.1f}{r["import_sec"] * 1000:>14.1f}'
+            f'{r["process_sec"] * 1000:>14.1f}'
+        )
+
+    print(f'Registry speedup: {results["registry_speedup"]:.1f}x')
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='Number of processes to spawn per cache mode')
+    parser.add_argument('--save', type=Path, help='Save the results as JSON to this path')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.runs)
+    _print_results(results)
+
+    report = {
+        **environment_info(),
+        'runs': args.runs,
+        'results': results,
+    }
+    if args.save is not None:
+        save_results(report, args.save)
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
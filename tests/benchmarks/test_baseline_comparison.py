@@ -0,0 +1,23 @@
+from tests.base_test_case import BaseTestCase
+from tests.benchmarks.baseline_comparison import compare_results
+from tests.benchmarks.baseline_comparison import report_regressions
+
+
+class BaselineComparisonTestCase(BaseTestCase):
+
+    def test_compare_results(self):
+        baseline = {'a': {'median_sec': 1.0}, 'b': {'median_sec': 2.0}, 'removed': {'median_sec': 1.0}}
+        current = {'a': {'median_sec': 1.2}, 'b': {'median_sec': 1.0}, 'new': {'median_sec': 1.0}}
+
+        comparisons = {c.name: c for c in compare_results(baseline, current, 'median_sec')}
+        self.assertListEqual(['a', 'b'], list(comparisons.keys()))
+
+        self.assertAlmostEqual(20.0, comparisons['a'].change_pct)
+        self.assertTrue(comparisons['a'].is_regression(10))
+        self.assertFalse(comparisons['a'].is_regression(25))
+
+        self.assertAlmostEqual(-50.0, comparisons['b'].change_pct)
+        self.assertFalse(comparisons['b'].is_regression(0))
+
+        self.assertEqual(1, report_regressions(list(comparisons.values()), 10))
+        self.assertEqual(0, report_regressions(list(comparisons.values()), 25))
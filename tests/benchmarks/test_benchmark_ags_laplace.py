@@ -0,0 +1,13 @@
+from tests.benchmarks.benchmark_ags_laplace import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkAgsLaplaceTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--repeat', '1', 'example'])
+
+        r = report['cases']['example']
+        self.assertEqual(40, r['times_of_operation'])
+        self.assertLess(r['max_abs_difference_degC'], 1e-4)
+        self.assertGreater(r['speedup'], 1)
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from tests.benchmarks.benchmark_client_batch import batch_inputs
+from tests.benchmarks.benchmark_client_batch import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkClientBatchTestCase(BenchmarkTestCase):
+
+    def test_batch_inputs(self):
+        inputs = batch_inputs(Path('example4.txt'), 8, 0.25)
+        self.assertEqual(8, len(inputs))
+        self.assertEqual(6, len(set(inputs)))
+
+    def test_main(self):
+        report = main(['--cases', '3', '--workers', '1', '2', '--chunksizes', '2'])
+
+        self.assertGreater(report['sequential']['cases_per_sec'], 0)
+        self.assertListEqual([(1, 2), (2, 2)], [(it['workers'], it['chunksize']) for it in report['batch']])
+        for result in report['batch']:
+            self.assertEqual(0, result['failed_cases'])
+            self.assertGreater(result['speedup'], 0)
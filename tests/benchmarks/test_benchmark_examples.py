@@ -0,0 +1,29 @@
+from tests.benchmarks.benchmark_examples import DEFAULT_BASELINE_PATH
+from tests.benchmarks.benchmark_examples import example_input_file_paths
+from tests.benchmarks.benchmark_examples import run_examples
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkExamplesTestCase(BenchmarkTestCase):
+
+    def test_baseline_covers_examples(self):
+        self.assertBaselineCovers(
+            DEFAULT_BASELINE_PATH, [it.stem for it in example_input_file_paths()], 'examples', 'failed'
+        )
+
+    def test_run_examples(self):
+        results = run_examples(['example2', 'example_does_not_exist'], runs=1, warmup_runs=0)
+
+        self.assertListEqual(['example2'], list(results['examples'].keys()))
+        self.assertListEqual(['example_does_not_exist'], list(results['failed'].keys()))
+
+        self.assertTimingsMeasured(results['examples'], 'median_calculation_sec', 'median_rendering_sec')
+
+        example_result = results['examples']['example2']
+        self.assertAlmostEqual(
+            example_result['median_wall_time_sec'],
+            example_result['median_input_sec']
+            + example_result['median_calculation_sec']
+            + example_result['median_rendering_sec'],
+        )
+        self.assertGreater(example_result['peak_rss_bytes'], 0)
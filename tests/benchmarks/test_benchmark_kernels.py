@@ -0,0 +1,21 @@
+from tests.benchmarks.benchmark_kernels import DEFAULT_BASELINE_PATH
+from tests.benchmarks.benchmark_kernels import kernel_names
+from tests.benchmarks.benchmark_kernels import run_kernels
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkKernelsTestCase(BenchmarkTestCase):
+
+    def test_baseline_covers_kernels(self):
+        self.assertBaselineCovers(DEFAULT_BASELINE_PATH, kernel_names(), 'kernels', 'unavailable')
+
+    def test_run_kernels(self):
+        results = run_kernels(['Economics.calculate_npv', 'Parameter.ConvertUnits'], repeat=2)
+        self.assertListEqual(['Economics.calculate_npv', 'Parameter.ConvertUnits'], list(results['kernels'].keys()))
+        self.assertTimingsMeasured(results['kernels'], 'median_sec')
+        for timing in results['kernels'].values():
+            self.assertLessEqual(timing['min_sec'], timing['median_sec'])
+            self.assertEqual(2, timing['repeat'])
+
+        with self.assertRaises(ValueError):
+            run_kernels(['NotAKernel'])
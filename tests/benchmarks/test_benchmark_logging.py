@@ -0,0 +1,16 @@
+from tests.benchmarks.benchmark_logging import MODES
+from tests.benchmarks.benchmark_logging import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkLoggingTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--models', '2'])
+
+        self.assertEqual(3, len(report['results']))
+        for input_file, results in report['results'].items():
+            with self.subTest(input_file=input_file):
+                self.assertGreater(results['info_records'], 0)
+                for mode in MODES:
+                    self.assertGreater(results[mode], 0)
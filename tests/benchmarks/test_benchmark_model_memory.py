@@ -0,0 +1,14 @@
+from tests.benchmarks.benchmark_model_memory import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkModelMemoryTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--models', '3', '--memory-models', '2'])
+
+        self.assertGreater(report['construct_sec_per_model'], 0)
+
+        # Models used to take about 40 MB each, mostly for the allowable values of integer parameters
+        self.assertLess(report['constructed_memory_mb_per_model'], 5)
+        self.assertLess(report['calculated_memory_mb_per_model'], 5)
@@ -0,0 +1,15 @@
+from tests.benchmarks.benchmark_model_reset import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkModelResetTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--cases', '3'])
+
+        self.assertTrue(report['results_match'])
+        for sweep in ['fresh', 'reset']:
+            self.assertGreater(report[sweep]['setup_sec_per_case'], 0)
+            self.assertGreater(report[sweep]['calculate_sec_per_case'], 0)
+
+        self.assertGreater(report['setup_speedup'], 1)
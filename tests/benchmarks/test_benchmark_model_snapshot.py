@@ -0,0 +1,15 @@
+from tests.benchmarks.benchmark_model_snapshot import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkModelSnapshotTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--models', '3'])
+
+        self.assertEqual(4, len(report['results']))
+        for input_file, results in report['results'].items():
+            with self.subTest(input_file=input_file):
+                self.assertTrue(results['results_match'])
+                self.assertGreater(results['snapshot_kb'], 0)
+                self.assertGreater(results['load_sec_per_model'], 0)
@@ -0,0 +1,54 @@
+from tests.benchmarks.benchmark_monte_carlo_scaling import ScalingResult
+from tests.benchmarks.benchmark_monte_carlo_scaling import main
+from tests.benchmarks.benchmark_monte_carlo_scaling import recommend_settings
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+def _scaling_result(workers: int, chunksize: int, throughput_per_sec: float, mode: str = 'strong') -> ScalingResult:
+    return ScalingResult(
+        mode=mode,
+        workers=workers,
+        chunksize=chunksize,
+        iterations=16,
+        wall_time_sec=16 / throughput_per_sec,
+        throughput_per_sec=throughput_per_sec,
+        efficiency=None,
+        spawn_sec=0,
+        input_write_sec=0,
+        simulation_sec=0,
+        parse_sec=0,
+        lock_wait_sec=0,
+        other_sec=0,
+        failed_iterations=0,
+    )
+
+
+class BenchmarkMonteCarloScalingTestCase(BenchmarkTestCase):
+
+    def test_recommend_settings(self):
+        self.assertIsNone(recommend_settings([]))
+
+        results = [
+            _scaling_result(1, 1, 1.0),
+            _scaling_result(2, 1, 1.9),
+            _scaling_result(4, 1, 3.0),
+            _scaling_result(4, 2, 3.5),
+            _scaling_result(8, 2, 3.6),
+            _scaling_result(8, 4, 3.4),
+            _scaling_result(8, 1, 10.0, mode='weak'),
+        ]
+        recommended = recommend_settings(results)
+        self.assertEqual((4, 2), (recommended.workers, recommended.chunksize))
+
+    def test_main(self):
+        report = main(['--mode', 'both', '--workers', '1', '2', '--chunksizes', '1', '--iterations', '2'])
+
+        self.assertEqual(4, len(report['results']))
+        results = {f'{it["mode"]} {it["workers"]}x{it["chunksize"]}': it for it in report['results']}
+        self.assertTimingsMeasured(results, 'simulation_sec', 'efficiency')
+        for result in report['results']:
+            self.assertEqual(0, result['failed_iterations'])
+
+        self.assertEqual(1, report['results'][0]['efficiency'])
+        self.assertIn(report['recommended']['MAX_WORKERS'], [1, 2])
+        self.assertEqual(1, report['recommended']['CHUNKSIZE'])
@@ -0,0 +1,16 @@
+from tests.benchmarks.benchmark_output_projection import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkOutputProjectionTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--runs', '1'])
+
+        self.assertEqual(3, len(report['results']))
+        for input_file, results in report['results'].items():
+            with self.subTest(input_file=input_file):
+                self.assertTrue(results['values_match'])
+                self.assertEqual(2, results['projected']['outputs'])
+                self.assertGreater(results['full']['outputs'], results['projected']['outputs'])
+                self.assertGreater(results['projected']['sam_economics_sec'], 0)
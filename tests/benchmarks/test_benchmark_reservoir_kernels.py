@@ -0,0 +1,15 @@
+from tests.benchmarks.benchmark_reservoir_kernels import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkReservoirKernelsTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--cases', '3'])
+
+        self.assertEqual({'tdp', 'sf', 'mpf', 'lhs'}, {r['kernel'] for r in report['examples'].values()})
+        for example, r in report['examples'].items():
+            with self.subTest(example=example):
+                self.assertLess(r['max_abs_difference'], 1e-5)
+                self.assertGreater(r['model']['calculate_sec_per_case'], 0)
+                self.assertGreater(r['batch']['total_sec'], 0)
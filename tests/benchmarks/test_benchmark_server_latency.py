@@ -0,0 +1,15 @@
+from tests.benchmarks.benchmark_server_latency import main
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+
+
+class BenchmarkServerLatencyTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--runs', '1'])
+
+        latencies = report['latencies']
+        for name in ('cold', 'cold_client_warm_server', 'warm_server_first_request', 'warm_server'):
+            self.assertGreater(latencies[name]['median_sec'], 0)
+            self.assertEqual(1, latencies[name]['runs'])
+
+        self.assertGreater(latencies['server_startup_sec'], 0)
@@ -0,0 +1,16 @@
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+from tests.benchmarks.benchmark_typed_input import FORMATS
+from tests.benchmarks.benchmark_typed_input import main
+
+
+class BenchmarkTypedInputTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--runs', '2'])
+
+        self.assertEqual(6, len(report['results']))
+        for input_file, results in report['results'].items():
+            with self.subTest(input_file=input_file):
+                self.assertTrue(results['values_match'])
+                for input_format in FORMATS:
+                    self.assertGreater(results[input_format]['input_processing_sec'], 0)
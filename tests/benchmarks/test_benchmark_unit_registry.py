@@ -0,0 +1,14 @@
+from tests.benchmarks.benchmark_test_case import BenchmarkTestCase
+from tests.benchmarks.benchmark_unit_registry import main
+
+
+class BenchmarkUnitRegistryTestCase(BenchmarkTestCase):
+
+    def test_main(self):
+        report = main(['--runs', '2'])
+
+        for mode in ('uncached', 'cached'):
+            with self.subTest(mode=mode):
+                results = report['results'][mode]
+                self.assertGreater(results['registry_sec'], 0)
+                self.assertGreaterEqual(results['process_sec'], results['import_sec'])
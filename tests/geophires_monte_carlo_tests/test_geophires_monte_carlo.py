@@ -1,13 +1,17 @@
+import argparse
 import json
 import os
 import re
+import sys
 import unittest
 from pathlib import Path
 
 from geophires_monte_carlo import GeophiresMonteCarloClient
+from geophires_monte_carlo import MC_GeoPHIRES3
 from geophires_monte_carlo import MonteCarloRequest
 from geophires_monte_carlo import MonteCarloResult
 from geophires_monte_carlo import SimulationProgram
+from geophires_x import GEOPHIRESv3
 
 
 class GeophiresMonteCarloTestCase(unittest.TestCase):
@@ -110,6 +114,43 @@ def test_monte_carlo_result_ordering(self):
 
             self.assertDictEqual(result_json_obj, result.result['output'])
 
+    def test_geophires_monte_carlo_max_workers_and_chunksize(self):
+        client = GeophiresMonteCarloClient()
+
+        result: MonteCarloResult = client.get_monte_carlo_result(
+            MonteCarloRequest(
+                SimulationProgram.GEOPHIRES,
+                self._get_arg_file_path('GEOPHIRES-example1.txt'),
+                self._get_arg_file_path('MC_GEOPHIRES_Settings_file-4.txt'),
+            )
+        )
+
+        with open(result.output_file_path) as f:
+            result_lines = f.readlines()
+            self.assertEqual(
+                'Average Net Electricity Production, Average Production Temperature, Gradient 1, Utilization Factor\n',
+                result_lines[0],
+            )
+            self.assertEqual(4, len([line for line in result_lines if '(Gradient 1:' in line]))
+
+    def test_run_iterations(self):
+        pass_list = [
+            [['Gradient 1', 'uniform', '25', '60']],
+            ['Average Net Electricity Production'],
+            argparse.Namespace(
+                Code_File=GEOPHIRESv3.__file__, Input_file=str(self._get_arg_file_path('does-not-exist.txt'))
+            ),
+            str(self._get_arg_file_path('MC_run_iterations_Result.txt')),
+            str(self._get_arg_file_path('.')),
+            sys.executable,
+        ]
+
+        iterations_run = MC_GeoPHIRES3.run_iterations(pass_list, 3, max_workers=2, chunksize=2)
+        self.assertEqual(3, iterations_run.failed_iterations)
+        self.assertListEqual([], iterations_run.iteration_timings)
+        self.assertEqual(0, iterations_run.throughput_per_sec)
+        self.assertIn('0 iterations succeeded (3 failed)', str(iterations_run))
+
     @unittest.skip('FIXME TODO https://github.com/NREL/GEOPHIRES-X/issues/192')
     def test_geophires_monte_carlo_single_input(self):
         client = GeophiresMonteCarloClient()
@@ -0,0 +1,85 @@
+import asyncio
+
+from geophires_x_client import AsyncGeophiresXClient
+from geophires_x_client.geophires_input_parameters import ImmutableGeophiresInputParameters
+from tests.base_test_case import BaseTestCase
+
+
+class AsyncGeophiresXClientTestCase(BaseTestCase):
+
+    def _input_params(self, gradient: float) -> ImmutableGeophiresInputParameters:
+        return ImmutableGeophiresInputParameters(
+            from_file_path=self._get_test_file_path('client_test_input_1.txt'), params={'Gradient 1': gradient}
+        )
+
+    @staticmethod
+    def _gradient(result) -> float:
+        return result.result['RESOURCE CHARACTERISTICS']['Geothermal gradient']['value']
+
+    def test_concurrent_requests(self):
+        gradients = [45, 50, 55, 60, 65, 70]
+
+        async def _run():
+            async with AsyncGeophiresXClient(max_concurrency=2) as client:
+                return await asyncio.gather(*[client.get_geophires_result(self._input_params(g)) for g in gradients])
+
+        results = asyncio.run(_run())
+        self.assertListEqual(gradients, [self._gradient(it) for it in results])
+
+    def test_output_parameters(self):
+        async def _run():
+            async with AsyncGeophiresXClient(max_concurrency=1) as client:
+                return await client.get_geophires_output_parameters(self._input_params(50))
+
+        output_parameters = asyncio.run(_run())
+        self.assertIn('Net Electricity Production', output_parameters)
+
+    def test_timeout(self):
+        async def _run():
+            async with AsyncGeophiresXClient(max_concurrency=1, timeout_sec=60) as client:
+                with self.assertRaises(TimeoutError):
+                    await client.get_geophires_result(self._input_params(50), timeout_sec=0.001)
+
+                # Requests after a timeout are not affected by it
+                return await client.get_geophires_result(self._input_params(55))
+
+        self.assertEqual(55, self._gradient(asyncio.run(_run())))
+
+    def test_timed_out_simulation_keeps_slot_until_complete(self):
+        async def _run():
+            async with AsyncGeophiresXClient(max_concurrency=1) as client:
+                await client.get_geophires_result(self._input_params(45))
+
+                with self.assertRaises(TimeoutError):
+                    await client.get_geophires_result(self._input_params(50), timeout_sec=0.001)
+
+                # The timed out simulation is still running in the only worker process
+                self.assertTrue(client._semaphore.locked())
+
+                # The next simulation's timeout starts once the worker process is free
+                return await client.get_geophires_result(self._input_params(55), timeout_sec=60)
+
+        self.assertEqual(55, self._gradient(asyncio.run(_run())))
+
+    def test_cancellation(self):
+        async def _run():
+            async with AsyncGeophiresXClient(max_concurrency=1) as client:
+                running = asyncio.create_task(client.get_geophires_result(self._input_params(50)))
+                waiting = asyncio.create_task(client.get_geophires_result(self._input_params(55)))
+                await asyncio.sleep(0.1)
+                waiting.cancel()
+
+                with self.assertRaises(asyncio.CancelledError):
+                    await waiting
+
+                return await running
+
+        self.assertEqual(50, self._gradient(asyncio.run(_run())))
+
+    def test_simulation_error(self):
+        async def _run():
+            async with AsyncGeophiresXClient(max_concurrency=1) as client:
+                await client.get_geophires_result(ImmutableGeophiresInputParameters(params={'Gradient 1': 0}))
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(_run())
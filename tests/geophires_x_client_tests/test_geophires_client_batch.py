@@ -0,0 +1,75 @@
+from geophires_x_client import GeophiresXClient
+from geophires_x_client.geophires_input_parameters import ImmutableGeophiresInputParameters
+from tests.base_test_case import BaseTestCase
+
+
+class GeophiresClientBatchTestCase(BaseTestCase):
+
+    def _input_params(self, gradient: float) -> ImmutableGeophiresInputParameters:
+        return ImmutableGeophiresInputParameters(
+            from_file_path=self._get_test_file_path('client_test_input_1.txt'), params={'Gradient 1': gradient}
+        )
+
+    @staticmethod
+    def _gradient(result) -> float:
+        return result.result['RESOURCE CHARACTERISTICS']['Geothermal gradient']['value']
+
+    def test_ordered(self):
+        gradients = [55, 45, 50]
+        outcomes = list(
+            GeophiresXClient().get_geophires_results([self._input_params(g) for g in gradients], max_workers=2)
+        )
+
+        self.assertListEqual([0, 1, 2], [it.index for it in outcomes])
+        for outcome, gradient in zip(outcomes, gradients):
+            self.assertTrue(outcome.succeeded)
+            self.assertEqual(gradient, self._gradient(outcome.result))
+
+    def test_unordered(self):
+        gradients = [55, 45, 50, 60]
+        outcomes = list(
+            GeophiresXClient().get_geophires_results(
+                [self._input_params(g) for g in gradients], max_workers=2, chunksize=2, ordered=False
+            )
+        )
+
+        self.assertListEqual([0, 1, 2, 3], sorted(it.index for it in outcomes))
+        for outcome in outcomes:
+            self.assertEqual(gradients[outcome.index], self._gradient(outcome.result))
+
+    def test_deduplication(self):
+        inputs = [self._input_params(50), self._input_params(55), self._input_params(50)]
+        outcomes = list(GeophiresXClient().get_geophires_results(inputs, max_workers=2))
+
+        # Identical inputs are simulated once and share the result
+        self.assertIs(outcomes[0].result, outcomes[2].result)
+        self.assertIsNot(outcomes[0].result, outcomes[1].result)
+        self.assertIs(inputs[2], outcomes[2].input_params)
+
+    def test_deduplication_via_cache(self):
+        client = GeophiresXClient(enable_caching=True)
+        first_outcomes = list(client.get_geophires_results([self._input_params(50), self._input_params(52)]))
+        second_outcomes = list(client.get_geophires_results([self._input_params(53), self._input_params(50)]))
+
+        # The cached case's result is the result simulated in the first batch, with its output file path.
+        self.assertEqual(first_outcomes[0].result.output_file_path, second_outcomes[1].result.output_file_path)
+        self.assertEqual(53, self._gradient(second_outcomes[0].result))
+
+    def test_failure_isolation(self):
+        inputs = [
+            self._input_params(50),
+            ImmutableGeophiresInputParameters(params={'Gradient 1': 0}),
+            self._input_params(55),
+        ]
+        outcomes = list(GeophiresXClient().get_geophires_results(inputs, max_workers=2, chunksize=3))
+
+        self.assertListEqual([True, False, True], [it.succeeded for it in outcomes])
+        self.assertIsNone(outcomes[1].result)
+        self.assertIsInstance(outcomes[1].exception, RuntimeError)
+        self.assertEqual(55, self._gradient(outcomes[2].result))
+
+    def test_empty(self):
+        self.assertListEqual([], list(GeophiresXClient().get_geophires_results([])))
+
+        with self.assertRaises(ValueError):
+            list(GeophiresXClient().get_geophires_results([self._input_params(50)], chunksize=0))
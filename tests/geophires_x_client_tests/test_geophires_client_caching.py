@@ -1,4 +1,3 @@
-import sys
 import unittest
 from unittest.mock import patch
 
@@ -17,11 +16,9 @@ def _create_mock_output_file(self, *args, **kwargs):
         """
         A helper function to be used as a side_effect for mocking geophires.main.
         It simulates the behavior of GEOPHIRES by creating an output file based on
-        the arguments it receives via sys.argv.
+        the output file path argument it receives.
         """
-        # The client sets sys.argv to ['', input_path, output_path] before calling main.
-        # We read from sys.argv directly to correctly simulate the real process.
-        output_path_arg = sys.argv[2]
+        output_path_arg = kwargs['output_file']
         with open(output_path_arg, 'w') as f:
             with open(self._get_test_file_path('caching-test-result.out'), encoding='utf-8') as fr:
                 f.write(fr.read())
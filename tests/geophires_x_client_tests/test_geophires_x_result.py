@@ -1,4 +1,9 @@
+import json
+from pathlib import Path
+
+from geophires_x_client import GeophiresXClient
 from geophires_x_client import GeophiresXResult
+from geophires_x_client.geophires_input_parameters import ImmutableGeophiresInputParameters
 from tests.base_test_case import BaseTestCase
 
 
@@ -16,11 +21,11 @@ def test_get_sam_cash_flow_row_name_unit_split(self) -> None:
                 actual = GeophiresXResult._get_sam_cash_flow_row_name_unit_split(case[0])
                 self.assertListEqual(actual, case[1])
 
-    def test_get_lines_by_category(self) -> None:
+    def test_get_line_ranges_by_category(self) -> None:
         r: GeophiresXResult = GeophiresXResult(self._get_test_file_path('../examples/example2.out'))
-        lines_by_cat = r._get_lines_by_category()
-        res_params_lines = lines_by_cat['RESERVOIR PARAMETERS']
-        self.assertGreater(len(res_params_lines), 0)
+        line_ranges_by_cat = r._get_line_ranges_by_category()
+        res_params_line_ranges = line_ranges_by_cat['RESERVOIR PARAMETERS']
+        self.assertGreater(sum(end - start for start, end in res_params_line_ranges), 0)
 
     def test_reservoir_volume_calculation_note(self) -> None:
         r: GeophiresXResult = GeophiresXResult(self._get_test_file_path('../examples/example2.out'))
@@ -67,3 +72,74 @@ def test_ags_clgs_style_output(self) -> None:
     def test_sutra_reservoir_model_in_summary(self) -> None:
         r: GeophiresXResult = GeophiresXResult(self._get_test_file_path('../examples/SUTRAExample1.out'))
         self.assertEqual('SUTRA Model', r.result['SUMMARY OF RESULTS']['Reservoir Model'])
+
+    def test_structured_result(self) -> None:
+        input_params = ImmutableGeophiresInputParameters(
+            from_file_path=self._get_test_file_path('../examples/example1.txt')
+        )
+        r: GeophiresXResult = GeophiresXClient().get_geophires_result(input_params)
+
+        self.assertTrue(r.structured_result_file_path.exists())
+        self.assertIsNone(getattr(r, '_report_index', None))  # read from the sidecar, without parsing the report
+        self.assertDictEqual(GeophiresXResult(r.output_file_path, use_structured_result=False).result, r.result)
+        output_parameters = GeophiresXClient().get_geophires_output_parameters(input_params)
+        self.assertSetEqual(
+            set(output_parameters.keys()), set(r.output_parameters.keys()) | set(r.output_parameter_profiles.keys())
+        )
+
+        # Full-precision value of a field that the report rounds to 2 decimal places
+        wellhead_pressure = r.output_parameters['Production wellhead pressure']
+        self.assertEqual('kPa', wellhead_pressure['unit'])
+        self.assertEqual(output_parameters['Production wellhead pressure'].value, wellhead_pressure['value'])
+        self.assertEqual(
+            r.result['RESERVOIR PARAMETERS']['Production wellhead pressure'],
+            {'value': round(wellhead_pressure['value'], 2), 'unit': 'kPa'},
+        )
+
+        net_electricity = r.output_parameter_profiles['Net Electricity Production']
+        self.assertEqual('MW', net_electricity['unit'])
+        self.assertListEqual(output_parameters['Net Electricity Production'].value.tolist(), net_electricity['value'])
+
+    def test_structured_result_ignored_if_stale(self) -> None:
+        input_params = ImmutableGeophiresInputParameters(
+            from_file_path=self._get_test_file_path('../examples/example1.txt')
+        )
+        output_file_path = Path(GeophiresXClient().get_geophires_result(input_params).output_file_path)
+
+        with open(output_file_path, encoding='utf-8') as f:
+            content = f.read()
+        with open(output_file_path, 'w', encoding='utf-8') as f:
+            f.write(
+                content.replace(
+                    'Number of production wells:                             2',
+                    'Number of production wells:                             3',
+                )
+            )
+
+        r: GeophiresXResult = GeophiresXResult(str(output_file_path))
+        self.assertIsNone(r.output_parameters)
+        self.assertIsNone(r.output_parameter_profiles)
+        self.assertEqual(3, r.result['SUMMARY OF RESULTS']['Number of production wells']['value'])
+
+    def test_no_structured_result(self) -> None:
+        r: GeophiresXResult = GeophiresXResult(self._get_test_file_path('../examples/example2.out'))
+        self.assertIsNone(r.output_parameters)
+        self.assertIsNone(r.output_parameter_profiles)
+
+    def test_result_identical_to_line_scan_parsing(self) -> None:
+        """
+        The reports in result-parsing-regression are copies of the largest SAM, SBT and multi-section example outputs,
+        with the results that the per-field line scan parser (which the report index replaced) read from them.
+        """
+
+        regression_dir = Path(self._get_test_file_path('result-parsing-regression'))
+        report_paths = sorted(regression_dir.glob('*.out'))
+        self.assertGreater(len(report_paths), 0)
+
+        for report_path in report_paths:
+            with self.subTest(msg=report_path.name):
+                result = GeophiresXResult(str(report_path)).result
+                del result['metadata']['output_file_path']
+
+                expected = report_path.with_suffix('.expected.json').read_text(encoding='utf-8')
+                self.assertEqual(expected, json.dumps(result, indent=1) + '\n')
@@ -0,0 +1,207 @@
+# ruff: noqa: S603
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from geophires_x.server import GeophiresXServer
+from geophires_x_client import GeophiresXClient
+from geophires_x_client.geophires_input_parameters import ImmutableGeophiresInputParameters
+from geophires_x_client.server_transport import GeophiresXServerTransport
+from tests.base_test_case import BaseTestCase
+
+
+class GeophiresXServerTestCase(BaseTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._server = GeophiresXServer(port=0, max_workers=1)
+        cls._server.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._server.__exit__(None, None, None)
+
+    def _input_params(self, params=None) -> ImmutableGeophiresInputParameters:
+        return ImmutableGeophiresInputParameters(
+            from_file_path=self._get_test_file_path('client_test_input_1.txt'), params=params or {}
+        )
+
+    def test_health(self):
+        health = GeophiresXServerTransport(self._server.address).health()
+        self.assertEqual('ok', health['status'])
+        self.assertEqual(1, health['workers'])
+
+    def test_get_geophires_result(self):
+        server_result = GeophiresXClient(server_address=self._server.address).get_geophires_result(self._input_params())
+        local_result = GeophiresXClient().get_geophires_result(self._input_params())
+
+        def _without_metadata(result: dict) -> dict:
+            return {k: v for k, v in result.items() if k not in ('metadata', 'Simulation Metadata')}
+
+        self.assertDictEqual(_without_metadata(local_result.result), _without_metadata(server_result.result))
+        self.assertTrue(server_result.structured_result_file_path.exists())
+        self.assertDictEqual(local_result.output_parameters, server_result.output_parameters)
+        self.assertDictEqual(local_result.output_parameter_profiles, server_result.output_parameter_profiles)
+        self.assertTrue(Path(server_result.output_file_path).with_suffix('.json').exists())
+
+    def test_get_geophires_output_parameters(self):
+        input_params = self._input_params()
+        server_output_parameters = GeophiresXClient(
+            server_address=self._server.address
+        ).get_geophires_output_parameters(input_params)
+        local_output_parameters = GeophiresXClient().get_geophires_output_parameters(input_params)
+
+        self.assertListEqual(list(local_output_parameters.keys()), list(server_output_parameters.keys()))
+        for name, local_output_parameter in local_output_parameters.items():
+            server_output_parameter = server_output_parameters[name]
+            self.assertIs(type(local_output_parameter), type(server_output_parameter))
+            self.assertEqual(local_output_parameter.CurrentUnits, server_output_parameter.CurrentUnits)
+            self.assertEqual(local_output_parameter.PreferredUnits, server_output_parameter.PreferredUnits)
+            self.assertEqual(type(local_output_parameter.value), type(server_output_parameter.value), msg=name)
+            if isinstance(local_output_parameter.value, np.ndarray):
+                np.testing.assert_array_equal(local_output_parameter.value, server_output_parameter.value)
+            else:
+                self.assertEqual(local_output_parameter.value, server_output_parameter.value, msg=name)
+
+    def test_get_geophires_output_parameters_projected(self):
+        outputs = ['LCOE', 'Net Electricity Production']
+        server_output_parameters = GeophiresXClient(
+            server_address=self._server.address
+        ).get_geophires_output_parameters(self._input_params(), outputs=outputs)
+        local_output_parameters = GeophiresXClient().get_geophires_output_parameters(self._input_params())
+
+        self.assertListEqual(outputs, list(server_output_parameters))
+        self.assertEqual(local_output_parameters['LCOE'].value, server_output_parameters['LCOE'].value)
+
+        with self.assertRaises(RuntimeError):
+            GeophiresXClient(server_address=self._server.address).get_geophires_output_parameters(
+                self._input_params(), outputs=['Not an output']
+            )
+
+    def test_get_geophires_results(self):
+        outcomes = list(
+            GeophiresXClient(server_address=self._server.address).get_geophires_results(
+                [self._input_params({'Gradient 1': 45}), ImmutableGeophiresInputParameters(params={'Gradient 1': 0})],
+                max_workers=2,
+            )
+        )
+
+        self.assertTrue(outcomes[0].succeeded)
+        self.assertEqual(45, outcomes[0].result.result['RESOURCE CHARACTERISTICS']['Geothermal gradient']['value'])
+        self.assertIsInstance(outcomes[1].exception, RuntimeError)
+
+    def test_simulation_error(self):
+        client = GeophiresXClient(server_address=self._server.address)
+        with self.assertRaises(RuntimeError) as re:
+            client.get_geophires_result(ImmutableGeophiresInputParameters(params={'Gradient 1': 0}))
+
+        self.assertIn('GEOPHIRES encountered an exception', str(re.exception))
+
+        # The server continues to handle requests after a failed simulation
+        self.assertIsNotNone(client.get_geophires_result(self._input_params()))
+
+    def test_output_paths_confined(self):
+        client = GeophiresXClient(server_address=self._server.address)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for output_path in [str(Path(tmp_dir, 'profile.prof')), '../profile.prof']:
+                with self.subTest(output_path=output_path):
+                    with self.assertRaises(RuntimeError) as re:
+                        client.get_geophires_result(self._input_params({'Profile Output File': output_path}))
+
+                    self.assertIn('Profile Output File must be a file name', str(re.exception))
+                    self.assertFalse(Path(tmp_dir, 'profile.prof').exists())
+
+        # File names are written in the request's temporary directory, not in the server's working directory
+        profile_file_name = f'profile_{self.id()}.prof'
+        self.assertIsNotNone(
+            client.get_geophires_result(self._input_params({'Profile Output File': profile_file_name}))
+        )
+        self.assertFalse(Path(profile_file_name).exists())
+
+    def test_input_paths_confined(self):
+        client = GeophiresXClient(server_address=self._server.address)
+        for param_name, input_path in [
+            ('District Heating Demand File Name', '/etc/passwd'),
+            ('District Heating Demand File Name', 'Examples/../../cornell_heat_demand.csv'),
+            ('Flowrate File', 'C:\\flowrate.xlsx'),
+            ('TOUGH2 Executable Path', '/bin/sh'),
+            ('TOUGH2 Model/File Name', 'Doublet; ls'),
+        ]:
+            with self.subTest(param_name=param_name, input_path=input_path):
+                with self.assertRaises(RuntimeError) as re:
+                    client.get_geophires_result(self._input_params({param_name: input_path}))
+
+                self.assertIn(f'{param_name} must be a relative path', str(re.exception))
+
+        # Relative paths are read from the package directory, which has the data files of the examples
+        example_params = ImmutableGeophiresInputParameters(
+            from_file_path=self._get_test_file_path('../examples/example12_DH.txt')
+        )
+        self.assertEqual(
+            GeophiresXClient().get_geophires_result(example_params).result['SUMMARY OF RESULTS'],
+            client.get_geophires_result(example_params).result['SUMMARY OF RESULTS'],
+        )
+
+    def test_request_too_large(self):
+        max_request_bytes = self._server.max_request_bytes
+        self._server.max_request_bytes = 100
+        try:
+            with self.assertRaises(RuntimeError) as re:
+                GeophiresXClient(server_address=self._server.address).get_geophires_result(self._input_params())
+
+            self.assertIn('Request body exceeds 100 bytes', str(re.exception))
+        finally:
+            self._server.max_request_bytes = max_request_bytes
+
+    def test_timeout(self):
+        timeout_sec = self._server.timeout_sec
+        self._server.timeout_sec = 0.001
+        try:
+            with self.assertRaises(RuntimeError) as re:
+                GeophiresXClient(server_address=self._server.address).get_geophires_result(self._input_params())
+
+            self.assertIn('timed out', str(re.exception))
+        finally:
+            self._server.timeout_sec = timeout_sec
+
+    def test_invalid_address(self):
+        with self.assertRaises(ValueError):
+            GeophiresXClient(server_address='localhost:8765')
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            client = GeophiresXClient(server_address=f'unix:{Path(tmp_dir, "does-not-exist.sock")}')
+            with self.assertRaises(RuntimeError):
+                client.get_geophires_result(self._input_params())
+
+
+class GeophiresXServerUnixSocketTestCase(BaseTestCase):
+
+    def test_server_on_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = Path(tmp_dir, 'geophires.sock')
+            server_process = subprocess.Popen(
+                [sys.executable, '-m', 'geophires_x.server', '--unix-socket', str(socket_path), '--workers', '1'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            try:
+                self.assertEqual(
+                    f'GEOPHIRES-X server listening on unix:{socket_path}', server_process.stdout.readline().strip()
+                )
+
+                client = GeophiresXClient(server_address=f'unix:{socket_path}')
+                result = client.get_geophires_result(
+                    ImmutableGeophiresInputParameters(
+                        from_file_path=self._get_test_file_path('client_test_input_1.txt')
+                    )
+                )
+                self.assertIsNotNone(result.result['SUMMARY OF RESULTS']['Average Net Electricity Production'])
+            finally:
+                server_process.terminate()
+                server_process.wait(timeout=30)
+                server_process.stdout.close()
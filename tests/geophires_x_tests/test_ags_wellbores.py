@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import math
+import os
+
+import numpy as np
+
+# ruff: noqa: I001  # Successful module initialization is dependent on this specific import order.
+from geophires_x.Model import Model
+from geophires_x.AGSWellBores import Chebyshev
+from geophires_x.AGSWellBores import chebyshev_quadrature
+from geophires_x.AGSWellBores import image_series
+from geophires_x.AGSWellBores import inverselaplace
+from geophires_x.AGSWellBores import inverselaplace_times
+from geophires_x.AGSWellBores import stehfest_coefficients
+from geophires_x.AGSWellBores import thetaY
+from geophires_x.AGSWellBores import thetaZ
+from tests.base_test_case import BaseTestCase
+
+
+class AGSWellBoresTestCase(BaseTestCase):
+
+    def test_stehfest_coefficients(self):
+        V = stehfest_coefficients(16)
+
+        self.assertIs(V, stehfest_coefficients(16))
+        self.assertAlmostEqual(-1 / 2520, V[1])
+        self.assertAlmostEqual(0, np.sum(V[1:17]) / np.max(np.abs(V)))
+        with self.assertRaises(ValueError):
+            V[1] = 0  # shared by all callers, so read-only
+
+    def test_chebyshev_quadrature(self):
+        def f(t):
+            return np.exp(-t / 1000.0) / (1.0 + t)
+
+        expected = 0.0
+        a = 1.0e-8
+        for _ in range(13):
+            expected += Chebyshev(None, a, a * 10.0, 32, 0, 0, 0, 0, 0, 0, 0, 0, lambda *args: f(args[-1]))
+            a = a * 10.0
+
+        nodes, weights = chebyshev_quadrature()
+
+        self.assertEqual((13 * 32,), nodes.shape)
+        self.assertAlmostEqual(expected, weights @ f(nodes), delta=1e-12 * abs(expected))
+
+    def test_image_series(self):
+        alpha = 100.0
+        t = np.array([1e-8, 1.0, 1.0e4])
+        e = 2.0e15
+        for x in [0.0, -0.125, 2.0e15, 2.0e15 - 0.125]:
+            with self.subTest(x=x):
+                np.testing.assert_allclose(image_series(x, e, alpha, t), [thetaY(x, e, alpha, t_i) for t_i in t])
+                np.testing.assert_allclose(image_series(x, e, alpha, t), [thetaZ(x, e, alpha, t_i) for t_i in t])
+
+        # more images are added where they are not negligible (for which thetaY and thetaZ do not terminate)
+        e = 1.0
+        j = np.arange(-1000, 1000)
+        self.assertAlmostEqual(
+            np.sum(np.exp(-((0.5 + 2 * j * e) ** 2) / 4.0 / alpha / 1.0)) / math.sqrt(math.pi * alpha * 1.0),
+            image_series(0.5, e, alpha, t[:2])[1],
+        )
+
+    def test_inverselaplace_times_equals_inverselaplace(self):
+        for overrides in [{}, {'Number of Multilateral Sections': 5, 'Gradient 1': 40}]:
+            with self.subTest(overrides=overrides):
+                m = Model(
+                    enable_geophires_logging_config=False,
+                    input_file=self._get_test_file_path(
+                        '../examples/Wanju_Yuan_Closed-Loop_Geothermal_Energy_Recovery.txt'
+                    ),
+                    output_file=os.devnull,
+                )
+                m.reset(overrides)
+                m.reserv.Calculate(m)
+                m.wellbores.Calculate(m)
+                w = m.wellbores
+                pressure = m.reserv.lithostatic_pressure()
+
+                times = np.array([0.1, 365.1, 3650.1, 14600.1])
+                expected = []
+                for time_operation in times:
+                    w.time_operation.value = time_operation
+                    expected.append(inverselaplace(w, 16, 0, pressure))
+
+                # The Stehfest coefficients (up to ~4e9) amplify rounding differences of the Laplace-space solution.
+                np.testing.assert_allclose(inverselaplace_times(w, 16, times, pressure), expected, rtol=0, atol=1e-4)
@@ -0,0 +1,81 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from geophires_x.Model import Model
+from geophires_x_client import GeophiresXClient
+from geophires_x_client import GeophiresXResult
+from geophires_x_client.geophires_input_parameters import ImmutableGeophiresInputParameters
+from tests.base_test_case import BaseTestCase
+
+
+class ConcurrentSimulationsTestCase(BaseTestCase):
+    """
+    Runs different examples concurrently in threads of one process, which is safe because GEOPHIRES neither changes nor
+    depends on process-wide state (working directory, command line arguments, logging configuration) while simulating.
+    """
+
+    # Includes examples that read data files by relative path (example5, example12_DH, SUTRAExample1)
+    _EXAMPLES = ('example1', 'example2', 'example4', 'example5', 'example12_DH', 'SUTRAExample1')
+
+    def _input_params(self, example: str) -> ImmutableGeophiresInputParameters:
+        return ImmutableGeophiresInputParameters(from_file_path=self._get_test_file_path(f'../examples/{example}.txt'))
+
+    @staticmethod
+    def _without_metadata(result: GeophiresXResult) -> dict[str, Any]:
+        return {k: v for k, v in result.result.items() if k not in ('metadata', 'Simulation Metadata')}
+
+    def test_concurrent_examples(self):
+        client = GeophiresXClient()
+        expected = {example: client.get_geophires_result(self._input_params(example)) for example in self._EXAMPLES}
+
+        stash_cwd = Path.cwd()
+        stash_sys_argv = list(sys.argv)
+
+        # Each example runs twice, so that runs of the same example also overlap
+        examples = self._EXAMPLES * 2
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda it: client.get_geophires_result(self._input_params(it)), examples))
+
+        for example, result in zip(examples, results):
+            with self.subTest(example=example):
+                self.assertDictEqual(self._without_metadata(expected[example]), self._without_metadata(result))
+
+        self.assertEqual(stash_cwd, Path.cwd())
+        self.assertListEqual(stash_sys_argv, sys.argv)
+
+    def test_concurrent_models(self):
+        def _calculate(example: str) -> Model:
+            m = Model(
+                enable_geophires_logging_config=False,
+                input_file=self._get_test_file_path(f'../examples/{example}.txt'),
+                output_file=os.devnull,
+            )
+            m.read_parameters()
+            m.Calculate()
+            return m
+
+        expected = {example: _calculate(example) for example in self._EXAMPLES}
+
+        with ThreadPoolExecutor(max_workers=len(self._EXAMPLES)) as executor:
+            models = list(executor.map(_calculate, self._EXAMPLES))
+
+        for example, m in zip(self._EXAMPLES, models):
+            with self.subTest(example=example):
+                expected_model = expected[example]
+                self.assertEqual(
+                    expected_model.economics.LCOE.value,
+                    m.economics.LCOE.value,
+                )
+                self.assertListEqual(list(expected_model.reserv.Tresoutput.value), list(m.reserv.Tresoutput.value))
+
+                # Property lookup stats are collected per model, so concurrent models do not count each other's
+                # lookups (although they may hit each other's cache entries).
+                self.assertDictEqual(
+                    {name: stats.calls for name, stats in expected_model.property_call_stats.items()},
+                    {name: stats.calls for name, stats in m.property_call_stats.items()},
+                )
+
+        self.assertEqual(len(models), len({m.logger.extra['model_id'] for m in models}))
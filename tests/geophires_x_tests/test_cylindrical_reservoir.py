@@ -1,6 +1,5 @@
 import math
 import unittest
-from pathlib import Path
 
 from tests.base_test_case import BaseTestCase
 
@@ -19,23 +18,12 @@
 # ruff: noqa: I001
 from geophires_x.AGSWellBores import AGSWellBores
 
-import sys
-import os
-
 from geophires_x.Units import LengthUnit
 
 
 class CylindricalReservoirTestCase(BaseTestCase):
     def _new_model_with_cylindrical_reservoir(self, input_file=None) -> Model:
-        stash_cwd = Path.cwd()
-        stash_sys_argv = sys.argv
-
-        sys.argv = ['']
-
-        if input_file is not None:
-            sys.argv.append(input_file)
-
-        m = Model(enable_geophires_logging_config=False)
+        m = Model(enable_geophires_logging_config=False, input_file=input_file)
         m.InputParameters['Is AGS'] = ParameterEntry(Name='Is AGS', sValue='True')
         reservoir = CylindricalReservoir(m)
         m.reserv = reservoir
@@ -44,9 +32,6 @@ def _new_model_with_cylindrical_reservoir(self, input_file=None) -> Model:
         if input_file is not None:
             m.read_parameters()
 
-        sys.argv = stash_sys_argv
-        os.chdir(stash_cwd)
-
         return m
 
     def test_read_inputs(self):
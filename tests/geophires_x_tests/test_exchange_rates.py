@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from geophires_x.ExchangeRates import ExchangeRateTable
+from geophires_x.ExchangeRates import exchange_rate_table
+from geophires_x.ExchangeRates import load_exchange_rate_table
+from geophires_x.ExchangeRates import parse_exchange_rate_overrides
+from geophires_x.Model import Model
+from geophires_x.Parameter import ParameterEntry
+from geophires_x.Parameter import _parameter_with_currency_units_converted_back_to_preferred_units
+from geophires_x.Units import CurrencyUnit
+from tests.base_test_case import BaseTestCase
+
+
+class ExchangeRatesTestCase(BaseTestCase):
+
+    def _model(self, input_parameters: dict[str, str]) -> Model:
+        m = Model(
+            enable_geophires_logging_config=False,
+            input_file=self._get_test_file_path('generic-egs-case.txt'),
+            output_file=os.devnull,
+        )
+        for name, value in input_parameters.items():
+            m.InputParameters[name] = ParameterEntry(Name=name, sValue=value)
+
+        m.read_parameters()
+        return m
+
+    def test_exchange_rate_table(self):
+        table = load_exchange_rate_table()
+
+        self.assertEqual(1, table.version)
+        self.assertEqual('2024-12-31', table.date)
+        self.assertEqual('EUR', table.base_currency)
+
+        self.assertAlmostEqual(1.0389, table.rate('EUR', 'USD'))
+        self.assertAlmostEqual(1, table.rate('EUR', 'USD') * table.rate('USD', 'EUR'))
+        self.assertEqual(1, table.rate('USD', 'USD'))
+
+        with self.assertRaises(ValueError):
+            table.rate('USD', 'XAU')
+
+    def test_exchange_rate_table_cached_per_process(self):
+        self.assertIs(load_exchange_rate_table(), load_exchange_rate_table())
+        self.assertIs(exchange_rate_table(), load_exchange_rate_table())
+        self.assertIs(exchange_rate_table('EUR: 0.9'), exchange_rate_table('EUR: 0.9'))
+
+    def test_load_exchange_rate_table_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            table_file_path = Path(tmp_dir) / 'rates.json'
+            with open(table_file_path, 'w', encoding='UTF-8') as f:
+                json.dump(
+                    {
+                        'version': 2,
+                        'date': '2025-06-30',
+                        'source': 'test',
+                        'base_currency': 'USD',
+                        'rates': {'USD': 1, 'EUR': 0.85},
+                    },
+                    f,
+                )
+
+            table = load_exchange_rate_table(table_file_path)
+
+        self.assertEqual(2, table.version)
+        self.assertEqual('2025-06-30', table.date)
+        self.assertAlmostEqual(1 / 0.85, table.rate('EUR', 'USD'))
+
+    def test_overrides(self):
+        self.assertEqual({'EUR': 0.92, 'GBP': 0.79}, parse_exchange_rate_overrides('EUR: 0.92; gbp:0.79;'))
+
+        for invalid_overrides in ['EUR 0.92', 'EUR: -1', ': 0.92', 'EUR: x']:
+            with self.subTest(overrides=invalid_overrides):
+                with self.assertRaises(ValueError):
+                    parse_exchange_rate_overrides(invalid_overrides)
+
+        table = exchange_rate_table('EUR: 0.5; XAU: 0.0004')
+        self.assertEqual('USD', table.base_currency)
+        self.assertAlmostEqual(2, table.rate('EUR', 'USD'))
+        self.assertAlmostEqual(2500, table.rate('XAU', 'USD'))
+        # (rates that are not overridden are those of the table)
+        self.assertAlmostEqual(load_exchange_rate_table().rate('USD', 'GBP'), table.rate('USD', 'GBP'))
+
+        with self.assertRaises(ValueError):
+            exchange_rate_table('USD: 2')
+
+    def test_eur_input(self):
+        usd_per_eur = load_exchange_rate_table().rate('EUR', 'USD')
+
+        for value, expected_value_musd in [
+            ('5 MEUR', 5 * usd_per_eur),
+            ('5000 KEUR', 5 * usd_per_eur),
+            ('5000000 EUR', 5 * usd_per_eur),
+            ('5000 KUSD', 5),
+        ]:
+            with self.subTest(value=value):
+                m = self._model({'Exploration Capital Cost': value})
+                param = m.economics.ParameterDict['Exploration Capital Cost']
+
+                self.assertTrue(param.Valid)
+                self.assertAlmostEqual(expected_value_musd, param.value)
+                self.assertEqual(CurrencyUnit.MDOLLARS, param.CurrentUnits)
+
+    def test_eur_input_with_overrides(self):
+        m = self._model({'Exploration Capital Cost': '5 MEUR', 'Exchange Rates': 'EUR: 0.8'})
+        self.assertAlmostEqual(5 / 0.8, m.economics.ParameterDict['Exploration Capital Cost'].value)
+
+        m.reset({'Exploration Capital Cost': '5 MEUR', 'Exchange Rates': 'EUR: 0.5'})
+        self.assertAlmostEqual(10, m.economics.ParameterDict['Exploration Capital Cost'].value)
+
+        # the rates are read as a parameter of the economics
+        self.assertEqual('EUR: 0.5', m.economics.exchange_rates.value)
+        self.assertTrue(m.economics.exchange_rates.Provided)
+        self.assertNotIn('Exchange Rates', m.outputs.ParameterDict)
+
+    def test_kusd_input(self):
+        # (only the prefix factor applies between KUSD and MUSD, without a currency conversion)
+        m = self._model({'Exploration Capital Cost': '2500 KUSD'})
+        param = m.economics.ParameterDict['Exploration Capital Cost']
+
+        self.assertAlmostEqual(2.5, param.value)
+        self.assertEqual(CurrencyUnit.MDOLLARS, param.CurrentUnits)
+
+    def test_meur_input(self):
+        m = self._model({'Exploration Capital Cost': '2.5 MEUR', 'Exchange Rates': 'EUR: 0.5'})
+        param = m.economics.ParameterDict['Exploration Capital Cost']
+
+        self.assertAlmostEqual(5, param.value)
+        self.assertEqual(CurrencyUnit.MDOLLARS, param.CurrentUnits)
+
+    def test_currency_converted_back_to_preferred_units(self):
+        m = self._model({'Exchange Rates': 'EUR: 0.5'})
+
+        for current_units, value, expected_value_musd in [
+            (CurrencyUnit.KDOLLARS, 2500, 2.5),
+            (CurrencyUnit.MEUR, 2.5, 5),
+            (CurrencyUnit.KEUR, 2500, 5),
+        ]:
+            with self.subTest(current_units=current_units):
+                param = copy.deepcopy(m.economics.ParameterDict['Exploration Capital Cost'])
+                param.value = value
+                param.CurrentUnits = current_units
+
+                converted = _parameter_with_currency_units_converted_back_to_preferred_units(param, m)
+                self.assertAlmostEqual(expected_value_musd, converted.value)
+                self.assertEqual(CurrencyUnit.MDOLLARS, converted.CurrentUnits)
+
+    def test_overrides_read_before_elements(self):
+        # the surface plant's currency parameters are read before the economics, but with the override rates
+        m = self._model({'Electricity Rate': '0.05 EUR/kWh', 'Exchange Rates': 'EUR: 0.5'})
+        self.assertAlmostEqual(0.1, m.surfaceplant.electricity_cost_to_buy.value)
+
+    def test_invalid_overrides(self):
+        with self.assertRaises(ValueError):
+            self._model({'Exchange Rates': 'EUR 0.8'})
+
+    def test_exchange_rate_provider(self):
+        m = Model(
+            enable_geophires_logging_config=False,
+            input_file=self._get_test_file_path('generic-egs-case.txt'),
+            output_file=os.devnull,
+        )
+        m.exchange_rate_provider = ExchangeRateTable(
+            version=1, date='2025-01-01', source='test', base_currency='USD', rates={'USD': 1, 'EUR': 0.25}
+        )
+        m.InputParameters['Exploration Capital Cost'] = ParameterEntry(Name='Exploration Capital Cost', sValue='1 MEUR')
+        m.read_parameters()
+
+        self.assertAlmostEqual(4, m.economics.ParameterDict['Exploration Capital Cost'].value)
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from geophires_x.GEOPHIRESv3 import get_output_parameters
+from geophires_x.Model import Model
+from tests.base_test_case import BaseTestCase
+
+
+class ModelTestCase(BaseTestCase):
+
+    def _new_model(self, input_file: str) -> Model:
+        return Model(enable_geophires_logging_config=False, input_file=input_file, output_file=os.devnull)
+
+    def _example_file_path(self, example: str) -> str:
+        return self._get_test_file_path(f'../examples/{example}.txt')
+
+    def _calculated_model(self, example: str, overrides: dict[str, Any] | None = None) -> Model:
+        input_file = self._example_file_path(example)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            if overrides:
+                with open(input_file, encoding='UTF-8') as f:
+                    input_text = f.read().rstrip('\n')
+                input_file = str(Path(tmp_dir, f'{example}.txt'))
+                with open(input_file, 'w', encoding='UTF-8') as f:
+                    f.write(input_text + '\n' + ''.join(f'{k}, {v}\n' for k, v in overrides.items()))
+
+            m = self._new_model(input_file)
+            m.read_parameters()
+            m.Calculate()
+            return m
+
+    @staticmethod
+    def _output_values(m: Model) -> dict[str, Any]:
+        return {
+            name: param.value if isinstance(param.value, (str, dict)) else np.asarray(param.value).tolist()
+            for name, param in get_output_parameters(m).items()
+        }
+
+    def test_reset(self):
+        template = self._new_model(self._example_file_path('example13'))
+        template.read_parameters()
+        template.Calculate()
+        template_values = self._output_values(template)
+
+        for overrides in [
+            {'Gradient 1': 40},
+            {'Reservoir Depth': '3000 meter', 'Production Flow Rate per Well': 40},
+            {'Gradient 1': 45},
+        ]:
+            with self.subTest(overrides=overrides):
+                template.reset(overrides)
+                template.Calculate()
+                values = self._output_values(template)
+                self.assertDictEqual(self._output_values(self._calculated_model('example13', overrides)), values)
+                self.assertNotEqual(template_values, values)
+
+                # rendering the outputs converts units in place, which does not affect the next reset
+                template.outputs.PrintOutputs(template)
+
+        template.reset()
+        template.Calculate()
+        self.assertDictEqual(template_values, self._output_values(template))
+
+    def test_reset_district_heating(self):
+        template = self._new_model(self._example_file_path('example12_DH'))
+        template.read_parameters()
+        template.Calculate()
+
+        template.reset({'Gradient 1': 40})
+        template.Calculate()
+        self.assertDictEqual(
+            self._output_values(self._calculated_model('example12_DH', {'Gradient 1': 40})),
+            self._output_values(template),
+        )
+
+    def test_reset_construction_parameters(self):
+        template = self._new_model(self._example_file_path('example13'))
+        template.read_parameters()
+
+        with self.assertRaises(ValueError):
+            template.reset({'Reservoir Model': 1})
+
+        with self.assertRaises(ValueError):
+            template.reset({'Power Plant Type': 2})
+
+        # Overrides with the input file's value are allowed
+        template.reset({'Reservoir Model': 4})
+
+    def test_reset_sam_economics(self):
+        template = self._new_model(self._example_file_path('example_SAM-single-owner-PPA'))
+        template.read_parameters()
+        template.Calculate()
+
+        other = self._calculated_model('example_SAM-single-owner-PPA')
+        other_sam_economics_calculations = other.sam_economics_calculations_cache
+
+        template.reset({'Gradient 1': 70})
+        template.Calculate()
+        self.assertDictEqual(
+            self._output_values(self._calculated_model('example_SAM-single-owner-PPA', {'Gradient 1': 70})),
+            self._output_values(template),
+        )
+
+        # Resetting a model does not affect the memoized SAM economics calculations of other models
+        self.assertIs(other_sam_economics_calculations, other.sam_economics_calculations_cache)
+
+    def test_reset_memory_usage(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_file = str(Path(tmp_dir, 'example13.txt'))
+            with open(self._example_file_path('example13'), encoding='UTF-8') as f:
+                input_text = f.read().rstrip('\n')
+            with open(input_file, 'w', encoding='UTF-8') as f:
+                f.write(input_text + '\nTrack Memory Usage, True\n')
+
+            template = self._new_model(input_file)
+
+        template.read_parameters()
+        template.Calculate()
+        first_run_memory_usage = template.memory_usage
+        self.assertIn('Reservoir Calculate', first_run_memory_usage.stages)
+
+        template.reset({'Gradient 1': 40})
+        self.assertIsNot(first_run_memory_usage, template.memory_usage)
+        self.assertNotIn('Reservoir Calculate', template.memory_usage.stages)
+
+    def test_snapshot(self):
+        for example in ['example13', 'example12_DH', 'example_SAM-single-owner-PPA']:
+            with self.subTest(example=example):
+                m = self._new_model(self._example_file_path(example))
+                m.read_parameters()
+
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    snapshot_path = Path(tmp_dir, f'{example}.pkl')
+                    m.save_snapshot(snapshot_path)
+                    restored = Model.load_snapshot(snapshot_path, enable_geophires_logging_config=False)
+
+                self.assertIsNot(m.reserv, restored.reserv)
+                self.assertEqual(f'{id(restored):x}', restored.logger.extra['model_id'])
+
+                restored.Calculate()
+                self.assertDictEqual(
+                    self._output_values(self._calculated_model(example)), self._output_values(restored)
+                )
+
+    def test_snapshot_reset(self):
+        m = self._new_model(self._example_file_path('example13'))
+        m.read_parameters()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshot_path = Path(tmp_dir, 'example13.pkl')
+            m.save_snapshot(snapshot_path)
+            restored = Model.load_snapshot(snapshot_path, enable_geophires_logging_config=False)
+
+        restored.reset({'Gradient 1': 40})
+        restored.Calculate()
+        self.assertDictEqual(
+            self._output_values(self._calculated_model('example13', {'Gradient 1': 40})),
+            self._output_values(restored),
+        )
+
+    def test_load_snapshot_not_a_model(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshot_path = Path(tmp_dir, 'not_a_model.pkl')
+            with open(snapshot_path, 'wb') as f:
+                pickle.dump({'Gradient 1': 40}, f)
+
+            with self.assertRaises(ValueError):
+                Model.load_snapshot(snapshot_path, enable_geophires_logging_config=False)
+
+    def test_logger_run_id(self):
+        m = Model(
+            enable_geophires_logging_config=False,
+            input_file=self._example_file_path('example13'),
+            output_file=os.devnull,
+            run_id='sweep-1',
+        )
+        self.assertEqual('sweep-1', m.logger.run_id)
+
+        with self.assertLogs('root', level=logging.INFO) as logs:
+            m.read_parameters()
+        self.assertEqual({'sweep-1'}, {record.run_id for record in logs.records})
+
+        # Each reset starts a new run
+        m.reset({'Gradient 1': 40})
+        self.assertNotEqual('sweep-1', m.logger.run_id)
+        self.assertNotEqual(self._new_model(None).logger.run_id, self._new_model(None).logger.run_id)
+
+    def test_logger_level_gate(self):
+        root_logger = logging.getLogger('root')
+        level = root_logger.level
+        records: list[logging.LogRecord] = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        root_logger.addHandler(handler)
+        try:
+            root_logger.setLevel(logging.WARNING)
+            m = self._new_model(self._example_file_path('example13'))
+            m.read_parameters()
+            self.assertListEqual([], [record for record in records if record.levelno < logging.WARNING])
+
+            # Changes to the level take effect from the next stage on
+            root_logger.setLevel(logging.INFO)
+            m.Calculate()
+            self.assertIn('Calculate', {record.funcName for record in records})
+        finally:
+            root_logger.removeHandler(handler)
+            root_logger.setLevel(level)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from geophires_x import GeoPHIRESUtils
+from geophires_x import __main__ as cli
+from geophires_x.GEOPHIRESv3 import get_output_parameters
+from geophires_x.Model import Model
+from geophires_x.MultiCase import read_cases
+from geophires_x.MultiCase import read_cases_csv
+from geophires_x.MultiCase import run_cases
+from geophires_x.MultiCase import write_results_table
+from geophires_x.Parameter import ParameterEntry
+from tests.base_test_case import BaseTestCase
+
+
+class MultiCaseTestCase(BaseTestCase):
+
+    def _multi_case_input_file_path(self) -> str:
+        return self._get_test_file_path('multi-case.txt')
+
+    def test_read_cases(self):
+        base_input_parameters, cases = read_cases(self._multi_case_input_file_path())
+
+        self.assertEqual('50', base_input_parameters['Gradient 1'].sValue)
+        self.assertEqual(6, len(base_input_parameters))
+        self.assertListEqual(['low gradient', 'deep', 'invalid gradient'], list(cases))
+        self.assertDictEqual(
+            {'Gradient 1': ParameterEntry('Gradient 1', '40', '', 'Gradient 1, 40')}, cases['low gradient']
+        )
+        self.assertEqual('5 kilometer', cases['deep']['Reservoir Depth'].sValue)
+
+    def test_read_cases_single_case_input_file(self):
+        base_input_parameters, cases = read_cases(self._get_test_file_path('generic-egs-case.txt'))
+
+        self.assertGreater(len(base_input_parameters), 0)
+        self.assertDictEqual({}, cases)
+
+    def test_model_multi_case_input_file(self):
+        with self.assertRaises(ValueError):
+            Model(enable_geophires_logging_config=False, input_file=self._multi_case_input_file_path())
+
+    def test_cli_single_case_input_file_read_once(self):
+        read_input_file = Mock(wraps=GeoPHIRESUtils.read_input_file)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = Path(tmp_dir, 'generic-egs-case.out')
+            argv = ['geophires_x', self._get_test_file_path('generic-egs-case.txt'), str(output_file)]
+            with patch('sys.argv', argv), patch('geophires_x.MultiCase.read_input_file', read_input_file), patch(
+                'geophires_x.Model.read_input_file', read_input_file
+            ), open(os.devnull, 'w', encoding='UTF-8') as devnull, contextlib.redirect_stdout(devnull):
+                cli.main()
+
+            self.assertTrue(output_file.exists())
+            self.assertEqual(1, read_input_file.call_count)
+
+    def test_read_cases_csv(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cases_file = Path(tmp_dir, 'cases.csv')
+            cases_file.write_text(
+                'Case,Gradient 1,Construction CAPEX Schedule\nc1,45,\n\nc2,,"0.5, 0.5"\n', encoding='UTF-8'
+            )
+            cases = read_cases_csv(cases_file)
+
+            self.assertListEqual(['c1', 'c2'], list(cases))
+            self.assertListEqual(['Gradient 1'], list(cases['c1']))
+            self.assertEqual('45', cases['c1']['Gradient 1'].sValue)
+
+            # list values are read as they are from input files
+            self.assertEqual(
+                'Construction CAPEX Schedule, 0.5, 0.5', cases['c2']['Construction CAPEX Schedule'].raw_entry
+            )
+
+            # without a Case column, cases are named by row number
+            cases_file.write_text('Gradient 1,Reservoir Depth\n45,\n,4 kilometer\n', encoding='UTF-8')
+            self.assertListEqual(['1', '2'], list(read_cases_csv(cases_file)))
+
+            cases_file.write_text('Case,Gradient 1\nc1,45\nc1,46\n', encoding='UTF-8')
+            with self.assertRaises(ValueError):
+                read_cases_csv(cases_file)
+
+            # case names must be unique across the input file and the CSV file
+            cases_file.write_text('Case,Gradient 1\ndeep,45\n', encoding='UTF-8')
+            with self.assertRaises(ValueError):
+                read_cases(self._multi_case_input_file_path(), cases_file)
+
+    def test_run_cases(self):
+        base_input_parameters, cases = read_cases(self._multi_case_input_file_path())
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results_file = Path(tmp_dir, 'results.csv')
+            rows = run_cases(
+                base_input_parameters, cases, results_file, max_workers=2, enable_geophires_logging_config=False
+            )
+
+            with open(results_file, encoding='UTF-8', newline='') as f:
+                table = list(csv.DictReader(f))
+
+        self.assertListEqual(['low gradient', 'deep', 'invalid gradient'], [it['Case'] for it in table])
+        self.assertEqual('', table[0]['Error'])
+        self.assertIn('not a number', table[2]['Error'])
+        self.assertEqual('', table[2]['LCOE (cents/kWh)'])
+
+        for name, row in [('low gradient', rows[0]), ('deep', rows[1])]:
+            with self.subTest(case=name):
+                m = Model(
+                    enable_geophires_logging_config=False,
+                    output_file=os.devnull,
+                    input_parameters={**base_input_parameters, **cases[name]},
+                )
+                m.read_parameters()
+                m.Calculate()
+                m.outputs._convert_units(m)
+
+                expected_lcoe = get_output_parameters(m)['LCOE'].value
+                self.assertEqual(expected_lcoe, row['LCOE (cents/kWh)'])
+                self.assertEqual(str(expected_lcoe), table[rows.index(row)]['LCOE (cents/kWh)'])
+
+        self.assertNotEqual(rows[0]['LCOE (cents/kWh)'], rows[1]['LCOE (cents/kWh)'])
+
+    def test_write_results_table(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results_file = Path(tmp_dir, 'results.csv')
+            write_results_table(
+                [
+                    {'Case': 'a', 'LCOE (cents/kWh)': 5.5},
+                    {'Case': 'b', 'Error': 'failed'},
+                    {'Case': 'c', 'LCOE (cents/kWh)': 6.5, 'LCOH (USD/MMBTU)': 20.0},
+                ],
+                results_file,
+            )
+
+            self.assertEqual(
+                'Case,LCOE (cents/kWh),LCOH (USD/MMBTU),Error\na,5.5,,\nb,,,failed\nc,6.5,20.0,\n',
+                results_file.read_text(encoding='UTF-8').replace('\r\n', '\n'),
+            )
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+from geophires_x import GEOPHIRESv3 as geophires
+from geophires_x.Model import Model
+from geophires_x.OutputProjection import SAM_CASH_FLOW
+from geophires_x.OutputProjection import SAM_CASH_FLOW_PROFILE
+from geophires_x.OutputProjection import OutputProjection
+from geophires_x.Parameter import OutputParameter
+from tests.base_test_case import BaseTestCase
+
+
+class OutputProjectionTestCase(BaseTestCase):
+
+    def _output_parameters(self, input_file_name: str, outputs: list[str] | None = None) -> dict[str, OutputParameter]:
+        return geophires.main(
+            enable_geophires_logging_config=False,
+            headless=True,
+            input_file=self._get_test_file_path(input_file_name),
+            output_file=os.devnull,
+            outputs=outputs,
+        )
+
+    def test_projected_values_equal_full_run_values(self):
+        projections = [
+            ['LCOE', 'Net Electricity Production'],
+            ['After-tax IRR', 'Project Net Present Value'],
+            ['Project MOIC', 'Project Value Investment Ratio', 'Project Payback Period'],
+            ['Total O&M Cost', 'Royalty Holder NPV', 'Average Annual Royalty Cost'],
+        ]
+
+        for input_file_name in [
+            'generic-egs-case-2_sam-single-owner-ppa.txt',
+            '../examples/example_SAM-single-owner-PPA-4.txt',  # royalties
+            'generic-egs-case.txt',  # not a SAM economic model
+        ]:
+            full_run_output_parameters = self._output_parameters(input_file_name)
+            for outputs in projections:
+                if not set(outputs) <= full_run_output_parameters.keys():
+                    continue
+
+                with self.subTest(input_file=input_file_name, outputs=outputs):
+                    projected_output_parameters = self._output_parameters(input_file_name, outputs=outputs)
+
+                    self.assertListEqual(outputs, list(projected_output_parameters))
+                    for name, projected_output_parameter in projected_output_parameters.items():
+                        full_run_output_parameter = full_run_output_parameters[name]
+                        self.assertEqual(
+                            full_run_output_parameter.CurrentUnits, projected_output_parameter.CurrentUnits
+                        )
+                        np.testing.assert_array_equal(
+                            full_run_output_parameter.value, projected_output_parameter.value, err_msg=name
+                        )
+
+    def test_unknown_output(self):
+        with self.assertRaises(ValueError):
+            self._output_parameters('generic-egs-case.txt', outputs=['LCOE', 'Not an output'])
+
+    def test_outputs_require_headless(self):
+        with self.assertRaises(ValueError):
+            geophires.main(
+                enable_geophires_logging_config=False,
+                input_file=self._get_test_file_path('generic-egs-case.txt'),
+                output_file=os.devnull,
+                outputs=['LCOE'],
+            )
+
+    def test_requires(self):
+        projection = OutputProjection(['LCOE', 'After-tax IRR'])
+        self.assertTrue(projection.requires(SAM_CASH_FLOW))
+        self.assertFalse(projection.requires(SAM_CASH_FLOW_PROFILE))
+
+        with self.assertRaises(ValueError):
+            OutputProjection([])
+
+    def test_sam_cash_flow_skipped(self):
+        model = Model(
+            enable_geophires_logging_config=False,
+            input_file=self._get_test_file_path('generic-egs-case-2_sam-single-owner-ppa.txt'),
+            output_file=os.devnull,
+        )
+        model.read_parameters()
+        model.output_projection = OutputProjection(['LCOE'])
+        self.assertFalse(model.requires_output_step(SAM_CASH_FLOW))
+
+        model.Calculate()
+
+        self.assertIsNone(model.economics.sam_economics_calculations._sam_cash_flow_profile_operational_years)
+        self.assertGreater(model.economics.LCOE.value, 0)
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
+import json
 import logging
 import os
-import sys
+import pstats
 import tempfile
+import time
+import uuid
 from pathlib import Path
 
 from geophires_x.Model import Model
+from geophires_x.ModelTimings import ModelTimings
 from geophires_x_client import GeophiresInputParameters
 from geophires_x_client import GeophiresXClient
 from tests.base_test_case import BaseTestCase
@@ -62,6 +68,150 @@ def test_absolute_output_file_path(self):
             self._strip_drive(str(html_filepath)), str(Path('/home/user/my-geophires-project/foo.html'))
         )
 
+    def test_timings(self):
+        input_file = GeophiresInputParameters(
+            from_file_path=self._get_test_file_path('../examples/example1.txt')
+        ).as_file_path()
+        m = self._new_model(input_file=input_file)
+        m.Calculate()
+
+        self.assertListEqual(
+            [
+                'Read Input File',
+                'Initiate Elements',
+                'Read Parameters',
+                'Reservoir Calculate',
+                'Wellbores Calculate',
+                'Surface Plant Calculate',
+                'Economics Calculate',
+            ],
+            list(m.timings.stages.keys()),
+        )
+        for stage_timing in m.timings.stages.values():
+            self.assertGreaterEqual(stage_timing.wall_time_sec, 0)
+            self.assertGreaterEqual(stage_timing.cpu_time_sec, 0)
+
+        self.assertAlmostEqual(
+            m.timings.total_wall_time_sec, sum(it['wall_time_sec'] for it in m.timings.to_dict().values())
+        )
+
+    def test_nested_stage_timings(self):
+        timings = ModelTimings()
+        with timings.stage('Wellbores Calculate'):
+            with timings.stage('AGS Database Load'):
+                time.sleep(0.01)
+
+        self.assertEqual('Wellbores Calculate', timings.stages['AGS Database Load'].parent_stage)
+        self.assertIsNone(timings.stages['Wellbores Calculate'].parent_stage)
+        self.assertEqual('Wellbores Calculate', timings.to_dict()['AGS Database Load']['parent_stage'])
+
+        # nested stages are not counted twice in the totals
+        self.assertEqual(timings.stages['Wellbores Calculate'].wall_time_sec, timings.total_wall_time_sec)
+        self.assertEqual(timings.stages['Wellbores Calculate'].cpu_time_sec, timings.total_cpu_time_sec)
+
+    def test_timings_in_json_output(self):
+        def _json_output(params: dict) -> dict:
+            r = GeophiresXClient().get_geophires_result(
+                GeophiresInputParameters(
+                    from_file_path=self._get_test_file_path('../examples/example12_DH.txt'),
+                    params=params,
+                )
+            )
+            with open(r.json_output_file_path, encoding='UTF-8') as f:
+                return json.load(f)
+
+        self.assertNotIn('Timings', _json_output({}))
+
+        timings = _json_output({'Include Timings in JSON Output': True})['Timings']
+        self.assertListEqual(
+            [
+                'Read Input File',
+                'Initiate Elements',
+                'Read Parameters',
+                'Reservoir Calculate',
+                'Wellbores Calculate',
+                'Surface Plant Calculate',
+                'District Heating Second Pass',
+                'Economics Calculate',
+                'Text Output',
+            ],
+            list(timings.keys()),
+        )
+        self.assertIn('wall_time_sec', timings['District Heating Second Pass'])
+        self.assertIn('cpu_time_sec', timings['District Heating Second Pass'])
+
+    def test_memory_usage(self):
+        def _memory_usage_json_output(example_stem: str, params: dict) -> dict | None:
+            r = GeophiresXClient().get_geophires_result(
+                GeophiresInputParameters(
+                    from_file_path=self._get_test_file_path(f'../examples/{example_stem}.txt'),
+                    params=params,
+                )
+            )
+            with open(r.json_output_file_path, encoding='UTF-8') as f:
+                return json.load(f).get('Memory Usage')
+
+        def _assert_memory_usage_consistent(memory_usage: dict, is_traced: bool) -> None:
+            self.assertListEqual(
+                [
+                    'Initiate Elements',
+                    'Read Parameters',
+                    'Reservoir Calculate',
+                    'Wellbores Calculate',
+                    'Surface Plant Calculate',
+                    'Economics Calculate',
+                    'Text Output',
+                ],
+                list(memory_usage.keys()),
+            )
+
+            previous_peak_rss_bytes = 0
+            for stage_name, stage_memory_usage in memory_usage.items():
+                with self.subTest(msg=stage_name):
+                    if stage_memory_usage['peak_rss_bytes'] is not None:
+                        # the process high-water mark can only increase from one stage to the next
+                        self.assertGreaterEqual(stage_memory_usage['peak_rss_bytes'], previous_peak_rss_bytes)
+                        previous_peak_rss_bytes = stage_memory_usage['peak_rss_bytes']
+
+                        if stage_memory_usage['rss_bytes'] is not None:
+                            self.assertLessEqual(stage_memory_usage['rss_bytes'], stage_memory_usage['peak_rss_bytes'])
+
+                    if is_traced:
+                        self.assertGreaterEqual(stage_memory_usage['peak_allocated_bytes'], 0)
+                        self.assertGreaterEqual(
+                            stage_memory_usage['peak_allocated_bytes'], stage_memory_usage['net_allocated_bytes']
+                        )
+                    else:
+                        self.assertIsNone(stage_memory_usage['peak_allocated_bytes'])
+                        self.assertIsNone(stage_memory_usage['net_allocated_bytes'])
+
+        self.assertIsNone(_memory_usage_json_output('example1', {}))
+        self.assertIsNone(_memory_usage_json_output('example1', {'Track Memory Usage': 'no'}))
+
+        # boolean values are parsed as they are for boolean parameters
+        self.assertIsNotNone(_memory_usage_json_output('example1', {'Track Memory Usage': 'yes'}))
+
+        _assert_memory_usage_consistent(
+            _memory_usage_json_output('example_SBT_Lo_T', {'Track Memory Usage': True}), is_traced=False
+        )
+
+        traced_memory_usage = _memory_usage_json_output('example1', {'Trace Memory Allocations': True})
+        _assert_memory_usage_consistent(traced_memory_usage, is_traced=True)
+        self.assertGreater(traced_memory_usage['Reservoir Calculate']['peak_allocated_bytes'], 0)
+
+    def test_profile_output_file(self):
+        profile_path = Path(tempfile.gettempdir(), f'example1_{uuid.uuid4()!s}.prof').absolute()
+        GeophiresXClient().get_geophires_result(
+            GeophiresInputParameters(
+                from_file_path=self._get_test_file_path('../examples/example1.txt'),
+                params={'Profile Output File': str(profile_path)},
+            )
+        )
+
+        self.assertTrue(profile_path.exists())
+        stats = pstats.Stats(str(profile_path))
+        self.assertTrue(any(func_name == 'Calculate' for _, _, func_name in stats.stats))
+
     # noinspection PyMethodMayBeStatic
     def _strip_drive(self, p: str) -> str:
         return p.replace('D:', '').replace('C:', '')
@@ -85,20 +235,9 @@ def _assert_file_paths_equal(self, file_path_1, file_path_2):
 
     # noinspection PyMethodMayBeStatic
     def _new_model(self, input_file=None, original_cwd=None) -> Model:
-        stash_cwd = Path.cwd()
-        stash_sys_argv = sys.argv
-
-        sys.argv = ['']
-
-        if input_file is not None:
-            sys.argv.append(input_file)
-
-        m = Model(enable_geophires_logging_config=False)
+        m = Model(enable_geophires_logging_config=False, input_file=input_file)
 
         if input_file is not None:
             m.read_parameters(default_output_path=original_cwd)
 
-        sys.argv = stash_sys_argv
-        os.chdir(stash_cwd)
-
         return m
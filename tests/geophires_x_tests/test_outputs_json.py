@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+
+import jsons
+import numpy as np
+
+from geophires_x.OptionList import EndUseOptions
+from geophires_x.OutputsJson import output_parameters_to_json_dict
+from geophires_x.Parameter import OutputParameter
+from geophires_x.Units import TemperatureUnit
+from geophires_x.Units import Units
+from geophires_x_client import GeophiresXClient
+from geophires_x_client import ImmutableGeophiresInputParameters
+from tests.base_test_case import BaseTestCase
+
+
+class OutputsJsonTestCase(BaseTestCase):
+
+    @staticmethod
+    def _jsons_dumps(output_parameter_dicts: list[dict]) -> str:
+        """The JSON output file content as previously serialized with jsons"""
+
+        json_merged = {}
+        for output_parameter_dict in output_parameter_dicts:
+            json_output_parameters = jsons.dumps(output_parameter_dict, supress_warnings=True)
+            json_merged = {**json_merged, **json.loads(json_output_parameters)}
+
+        return json.dumps(json_merged)
+
+    def test_identical_to_jsons(self):
+        for example_stem in [
+            'example1',
+            'example12_DH',
+            'example_SAM-single-owner-PPA',
+            'example_SBT_Lo_T',
+            'S-DAC-GT',
+            'SUTRAExample1',
+            'Wanju_Yuan_Closed-Loop_Geothermal_Energy_Recovery',
+        ]:
+            with self.subTest(msg=example_stem):
+                output_parameters = GeophiresXClient().get_geophires_output_parameters(
+                    ImmutableGeophiresInputParameters(
+                        from_file_path=self._get_test_file_path(f'../examples/{example_stem}.txt')
+                    )
+                )
+
+                self.assertEqual(
+                    self._jsons_dumps([output_parameters]),
+                    json.dumps(output_parameters_to_json_dict([output_parameters])),
+                )
+
+    def test_value_types(self):
+        temperature = OutputParameter(
+            Name='Temperature',
+            value=np.array([150.0, np.float64(151.5)]),
+            UnitType=Units.TEMPERATURE,
+            PreferredUnits=TemperatureUnit.CELSIUS,
+            CurrentUnits=TemperatureUnit.CELSIUS,
+        )
+        end_use = OutputParameter(Name='End-Use Option', value=EndUseOptions.ELECTRICITY)
+        count = OutputParameter(Name='Count', value=3)
+        output_parameter_dicts = [
+            {'Temperature': temperature, 'Count': count},
+            {'End-Use Option': end_use, 'Temperature': temperature},
+        ]
+
+        self.assertEqual(
+            self._jsons_dumps(output_parameter_dicts),
+            json.dumps(output_parameters_to_json_dict(output_parameter_dicts)),
+        )
+
+        json_dict = output_parameters_to_json_dict(output_parameter_dicts)
+        self.assertEqual(['Temperature', 'Count', 'End-Use Option'], list(json_dict))
+        self.assertEqual([150.0, 151.5], json_dict['Temperature']['value'])
+        self.assertEqual('CELSIUS', json_dict['Temperature']['CurrentUnits'])
+        self.assertEqual('ELECTRICITY', json_dict['End-Use Option']['value'])
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from unittest.mock import patch
+
+import numpy as np
+
+from geophires_x.GeoPHIRESUtils import density_water_kg_per_m3
+from geophires_x.Model import Model
+from geophires_x.PropertyCallCounters import collect_property_call_stats
+from geophires_x.PropertyCallCounters import count_property_calls
+from geophires_x.PropertyCallCounters import property_call_stats_to_dict
+from tests.base_test_case import BaseTestCase
+
+
+@count_property_calls('test_property_call_counters._cached_square')
+@lru_cache
+def _cached_square(x: float) -> float:
+    return x * x
+
+
+@count_property_calls('test_property_call_counters._uncached_sum')
+def _uncached_sum(*values: np.ndarray | float) -> float:
+    return float(np.sum(values))
+
+
+class PropertyCallCountersTestCase(BaseTestCase):
+
+    def test_cached_function_stats(self):
+        _cached_square.cache_clear()
+
+        with collect_property_call_stats() as collector:
+            for x in [1.0, 2.0, 1.0, 3.0, 1.0]:
+                _cached_square(x)
+
+        stats = collector.get_stats()['test_property_call_counters._cached_square']
+        self.assertEqual(5, stats.calls)
+        self.assertEqual(3, stats.unique_keys)
+        self.assertEqual(2, stats.hits)
+        self.assertEqual(3, stats.misses)
+        self.assertGreater(stats.cumulative_time_sec, 0)
+
+    def test_uncached_function_stats(self):
+        with collect_property_call_stats() as collector:
+            _uncached_sum(np.array([1.0, 2.0]))
+            _uncached_sum(np.array([1.0, 2.0]))
+            _uncached_sum(1.0, 2.0)
+            _uncached_sum(1.0, 2.0)
+
+        stats = collector.get_stats()['test_property_call_counters._uncached_sum']
+        self.assertEqual(4, stats.calls)
+        # calls with unhashable arguments (arrays) are not counted as unique keys
+        self.assertEqual(1, stats.unique_keys)
+        self.assertEqual(0, stats.hits)
+        self.assertEqual(4, stats.misses)
+
+    def test_not_counted_outside_of_collector(self):
+        _cached_square(4.0)
+
+        with collect_property_call_stats() as collector:
+            pass
+
+        _cached_square(4.0)
+        self.assertDictEqual({}, collector.get_stats())
+
+        # Stats are per collector, and collecting does not clear the function's cache
+        with collect_property_call_stats() as collector:
+            _cached_square(4.0)
+
+        stats = collector.get_stats()['test_property_call_counters._cached_square']
+        self.assertEqual(1, stats.calls)
+        self.assertEqual(1, stats.unique_keys)
+        self.assertEqual(1, stats.hits)
+
+    def test_unique_keys_bounded(self):
+        with patch('geophires_x.PropertyCallCounters.MAX_UNIQUE_KEYS_PER_RUN', 2):
+            with collect_property_call_stats() as collector:
+                for x in range(5):
+                    _uncached_sum(float(x))
+
+        stats = collector.get_stats()['test_property_call_counters._uncached_sum']
+        self.assertEqual(5, stats.calls)
+        self.assertEqual(2, stats.unique_keys)
+
+    def test_coolprop_calls_counted(self):
+        density_water_kg_per_m3.cache_clear()
+
+        with collect_property_call_stats() as collector:
+            density_water_kg_per_m3(150.0, pressure=None)
+            density_water_kg_per_m3(150.0, pressure=None)
+
+        stats = property_call_stats_to_dict(collector.get_stats())
+        self.assertEqual(1, stats['CoolProp.PropsSI']['calls'])
+        self.assertEqual(2, stats['density_water_kg_per_m3']['calls'])
+        self.assertEqual(1, stats['density_water_kg_per_m3']['hits'])
+
+    def test_model_property_call_stats(self):
+        m = self._new_model(self._get_test_file_path('../examples/example1.txt'))
+        self.assertDictEqual({}, m.property_call_stats)
+
+        m.Calculate()
+        self.assertIn('CoolProp.PropsSI', m.property_call_stats)
+        for name, stats in m.property_call_stats.items():
+            with self.subTest(msg=name):
+                self.assertEqual(stats.calls, stats.hits + stats.misses)
+                self.assertLessEqual(stats.unique_keys, stats.calls)
+
+        # each model's stats are its own
+        m2 = self._new_model(self._get_test_file_path('../examples/example1.txt'))
+        self.assertDictEqual({}, m2.property_call_stats)
+        m2.Calculate()
+
+        self.assertEqual(
+            m.property_call_stats['density_water_kg_per_m3'].calls,
+            m2.property_call_stats['density_water_kg_per_m3'].calls,
+        )
+
+        # a model's stats are a snapshot that is not affected by later lookups
+        m2_stats = m2.property_call_stats['density_water_kg_per_m3']
+        with collect_property_call_stats():
+            density_water_kg_per_m3(150.0, pressure=None)
+        self.assertEqual(m2_stats, m2.property_call_stats['density_water_kg_per_m3'])
+
+    def test_collect_property_call_stats(self):
+        _cached_square(5.0)
+
+        with collect_property_call_stats() as collector:
+            _cached_square(5.0)
+            _cached_square(6.0)
+
+        _cached_square(7.0)
+
+        stats = collector.get_stats()['test_property_call_counters._cached_square']
+        self.assertEqual(2, stats.calls)
+        self.assertEqual(2, stats.unique_keys)
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(1, stats.misses)
+        self.assertNotIn('CoolProp.PropsSI', collector.get_stats())
+
+    # noinspection PyMethodMayBeStatic
+    def _new_model(self, input_file: str) -> Model:
+        m = Model(enable_geophires_logging_config=False, input_file=input_file)
+        m.read_parameters()
+
+        return m
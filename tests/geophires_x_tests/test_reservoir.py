@@ -1,9 +1,6 @@
 from __future__ import annotations
 
 import copy
-import os
-import sys
-from pathlib import Path
 from typing import Any
 
 from pint.facets.plain import PlainQuantity
@@ -107,22 +104,11 @@ def no_metadata(r: GeophiresXResult) -> dict[str, Any]:
 
     # noinspection PyMethodMayBeStatic
     def _new_model(self, input_file=None) -> Model:
-        stash_cwd = Path.cwd()
-        stash_sys_argv = sys.argv
-
-        sys.argv = ['']
-
-        if input_file is not None:
-            sys.argv.append(input_file)
-
-        m = Model(enable_geophires_logging_config=False)
+        m = Model(enable_geophires_logging_config=False, input_file=input_file)
 
         if input_file is not None:
             m.read_parameters()
 
-        sys.argv = stash_sys_argv
-        os.chdir(stash_cwd)
-
         return m
 
     def test_number_of_fractures(self):
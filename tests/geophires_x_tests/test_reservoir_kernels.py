@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import numpy as np
+
+from geophires_x.Model import Model
+from geophires_x.ReservoirKernels import cylindrical
+from geophires_x.ReservoirKernels import lhs
+from geophires_x.ReservoirKernels import model_kernel
+from geophires_x.ReservoirKernels import mpf
+from geophires_x.ReservoirKernels import production_temperature
+from geophires_x.ReservoirKernels import sf
+from geophires_x.ReservoirKernels import tdp
+from tests.base_test_case import BaseTestCase
+
+
+class ReservoirKernelsTestCase(BaseTestCase):
+
+    def _model(self, example_name: str) -> Model:
+        m = Model(
+            enable_geophires_logging_config=False,
+            input_file=self._get_test_file_path(f'../examples/{example_name}.txt'),
+            output_file=os.devnull,
+        )
+        m.read_parameters()
+        return m
+
+    @staticmethod
+    def _dimensionless_temperature(m: Model) -> np.ndarray:
+        """
+        The dimensionless production temperature calculated by the reservoir of the model (which is only calculated
+        here, since redrilling, calculated by the wellbores, changes the reservoir's production temperature)
+        """
+        m.reserv.Calculate(m)
+        return (m.reserv.Tresoutput.value - m.wellbores.Tinj.value) / (m.reserv.Trock.value - m.wellbores.Tinj.value)
+
+    def test_kernels_equal_models(self):
+        for example_name, expected_kernel, overrides in [
+            ('example4', tdp, [{'Drawdown Parameter': 0.01}, {'Drawdown Parameter': 0.001}]),
+            ('example3', sf, [{'Drawdown Parameter': 0.0001}, {'Production Well Flow Rate': 60}]),
+            ('example1', mpf, [{'Fracture Separation': 300}, {'Production Well Flow Rate': 70}]),
+            ('Fervo_Project_Cape-4', mpf, [{'Fracture Height': 200}]),
+            ('example2', lhs, [{'Fracture Separation': 60}, {'Production Well Flow Rate': 40}]),
+        ]:
+            with self.subTest(example=example_name):
+                m = self._model(example_name)
+
+                expected: list[np.ndarray] = []
+                params: list[dict[str, float]] = []
+                Trock: list[float] = []
+                Tinj: list[float] = []
+                for case_overrides in [{}, *overrides]:
+                    m.reset(case_overrides)
+                    expected.append(self._dimensionless_temperature(m))
+                    kernel, case_params = model_kernel(m)
+                    self.assertIs(expected_kernel, kernel)
+                    params.append(case_params)
+                    Trock.append(m.reserv.Trock.value)
+                    Tinj.append(m.wellbores.Tinj.value)
+
+                batch_params = {name: np.array([p[name] for p in params]) for name in params[0]}
+                result = kernel(batch_params, m.reserv.timevector.value)
+
+                self.assertEqual((len(params), len(m.reserv.timevector.value)), result.shape)
+                # (MPFReservoir inverts with mpmath's Stehfest method in 15 digits, which is accurate to ~1e-6)
+                np.testing.assert_allclose(result, np.array(expected), rtol=0, atol=1e-5)
+
+                # one case at a time
+                np.testing.assert_allclose(result[0], kernel(params[0], m.reserv.timevector.value)[0], rtol=1e-12)
+
+                m.reset()
+                m.reserv.Calculate(m)
+                np.testing.assert_allclose(
+                    production_temperature(result, Trock, Tinj)[0], m.reserv.Tresoutput.value, rtol=0, atol=1e-3
+                )
+
+    def test_model_kernel_unsupported_reservoir_model(self):
+        with self.assertRaises(ValueError):
+            model_kernel(self._model('example5'))  # user-provided temperatures
+
+    def test_broadcast_params(self):
+        timevector = np.linspace(0, 30, 121)
+        params: dict[str, Any] = {
+            'drawdp': 0.0001,
+            'cpwater': [4150.0, 4200.0, 4250.0],
+            'krock': 2.7,
+            'rhorock': 2700.0,
+            'cprock': 1000.0,
+        }
+
+        result = sf(params, timevector)
+
+        self.assertEqual((3, 121), result.shape)
+        np.testing.assert_allclose(result[1], sf({**params, 'cpwater': 4200.0}, timevector)[0])
+        self.assertEqual((3, 121), cylindrical(params, timevector).shape)
+
+        with self.assertRaises(ValueError):
+            sf({**params, 'krock': [2.7, 3.0]}, timevector)  # not broadcastable to 3 cases
+
+        with self.assertRaises(ValueError):
+            sf({'drawdp': 0.0001}, timevector)
+
+    def test_large_batch(self):
+        timevector = np.linspace(0, 30, 121)
+        n_cases = 2000
+        rng = np.random.default_rng(1)
+        params = {
+            'nprod': 2,
+            'prodwellflowrate': rng.uniform(30, 80, n_cases),
+            'rhowater': 900.0,
+            'cpwater': 4300.0,
+            'krock': rng.uniform(2, 4, n_cases),
+            'rhorock': 2700.0,
+            'cprock': 1000.0,
+            'fracnumbcalc': 20,
+            'fracwidthcalc': 300.0,
+            'fracheightcalc': 300.0,
+            'fracsepcalc': rng.uniform(50, 200, n_cases),
+        }
+
+        result = mpf(params, timevector)
+
+        self.assertEqual((n_cases, 121), result.shape)
+        self.assertTrue(np.all(np.isfinite(result)))
+        self.assertTrue(np.all((result >= 0) & (result <= 1)))
+        self.assertTrue(np.all(np.diff(result, axis=1) <= 1e-12))  # temperatures decline
+
+        i = 1234
+        np.testing.assert_allclose(
+            result[i],
+            mpf({name: value[i] if np.ndim(value) > 0 else value for name, value in params.items()}, timevector)[0],
+            rtol=1e-12,
+        )
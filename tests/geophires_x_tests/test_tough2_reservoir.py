@@ -1,5 +1,3 @@
-from pathlib import Path
-
 from tests.base_test_case import BaseTestCase
 
 # Ruff disabled because imports are order-dependent
@@ -13,21 +11,10 @@
 from geophires_x.OptionList import ReservoirModel
 from geophires_x_client import GeophiresInputParameters
 
-import sys
-import os
-
 
 class Tough2ReservoirTestCase(BaseTestCase):
     def _new_model_with_tough2_reservoir(self, input_file=None) -> Model:
-        stash_cwd = Path.cwd()
-        stash_sys_argv = sys.argv
-
-        sys.argv = ['']
-
-        if input_file is not None:
-            sys.argv.append(input_file)
-
-        m = Model(enable_geophires_logging_config=False)
+        m = Model(enable_geophires_logging_config=False, input_file=input_file)
         m.InputParameters['Reservoir Model'] = ParameterEntry(
             Name='Reservoir Model', sValue=str(ReservoirModel.TOUGH2_SIMULATOR.int_value)
         )
@@ -36,9 +23,6 @@ def _new_model_with_tough2_reservoir(self, input_file=None) -> Model:
         if input_file is not None:
             m.read_parameters()
 
-        sys.argv = stash_sys_argv
-        os.chdir(stash_cwd)
-
         return m
 
     def test_read_inputs(self):
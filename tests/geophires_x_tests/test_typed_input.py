@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from geophires_x.GeoPHIRESUtils import read_typed_input_file
+from geophires_x.GeoPHIRESUtils import typed_parameter_entry
+from geophires_x.Model import Model
+from tests.base_test_case import BaseTestCase
+
+
+class TypedInputTestCase(BaseTestCase):
+
+    def _model(self, input_file_path: str | Path) -> Model:
+        model = Model(enable_geophires_logging_config=False, input_file=str(input_file_path), output_file=os.devnull)
+        model.read_parameters()
+        return model
+
+    def _typed_input_file_path(self, tmp_dir: str, document: dict) -> Path:
+        input_file_path = Path(tmp_dir, 'input.json')
+        input_file_path.write_text(json.dumps(document), encoding='UTF-8')
+        return input_file_path
+
+    def test_typed_input_files(self):
+        def _read_values(model: Model) -> tuple:
+            return model.wellbores.wellsep.value, model.reserv.depth.value, model.reserv.depth.CurrentUnits
+
+        text_model = self._model(self._get_test_file_path('generic-egs-case.txt'))
+        text_values = _read_values(text_model)
+        text_model.Calculate()
+
+        for typed_input_file_name in ['generic-egs-case.json', 'generic-egs-case.toml']:
+            with self.subTest(input_file=typed_input_file_name):
+                typed_model = self._model(self._get_test_file_path(typed_input_file_name))
+
+                # well separation is converted from the given units
+                self.assertEqual(text_values, _read_values(typed_model))
+                self.assertTrue(typed_model.wellbores.rameyoptionprod.value)
+
+                typed_model.Calculate()
+                self.assertAlmostEqual(text_model.economics.LCOE.value, typed_model.economics.LCOE.value)
+
+    def test_typed_input_in_schema_units(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model = self._model(
+                self._typed_input_file_path(
+                    tmp_dir,
+                    {
+                        '$schema': 'geophires-request.json',
+                        'Reservoir Depth': 3,
+                        'Gradient 1': 50,
+                        'Construction CAPEX Schedule': [0.5, 0.5],
+                        'Construction Years': 2,
+                        'Economic Model': 5,
+                    },
+                )
+            )
+
+            self.assertEqual(3, model.reserv.depth.quantity().to('km').magnitude)
+            self.assertEqual(50, model.reserv.gradient.quantity().to('degC/km').magnitude[0])
+            self.assertListEqual([0.5, 0.5], model.economics.construction_capex_schedule.value)
+
+    def test_typed_input_type_mismatch(self):
+        for document in [{'Reservoir Depth': 'deep'}, {'Number of Production Wells': 2.5}, {'Reservoir Depth': [3]}]:
+            with self.subTest(document=document):
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    with self.assertRaises(ValueError):
+                        self._model(self._typed_input_file_path(tmp_dir, document))
+
+    def test_typed_parameter_entry(self):
+        entry = typed_parameter_entry('Reservoir Depth', {'value': 3.0, 'units': 'kilometer', 'comment': 'deep'})
+        self.assertEqual('3', entry.sValue)
+        self.assertEqual(3.0, entry.value)
+        self.assertEqual('kilometer', entry.units)
+        self.assertEqual('deep', entry.Comment)
+
+        self.assertEqual('0.5, 0.5', typed_parameter_entry('Construction CAPEX Schedule', [0.5, 0.5]).sValue)
+        self.assertIsNone(typed_parameter_entry('Reservoir Depth', None))
+
+        for typed_value in [{'units': 'km'}, {'value': 3, 'unit': 'km'}, {'value': 3, 'units': 1}, ['a'], {'a': 1}]:
+            with self.subTest(typed_value=typed_value):
+                with self.assertRaises(ValueError):
+                    typed_parameter_entry('Reservoir Depth', typed_value)
+
+    def test_read_typed_input_file_not_an_object(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_file_path = Path(tmp_dir, 'input.json')
+            input_file_path.write_text('[1, 2]', encoding='UTF-8')
+
+            with self.assertRaises(ValueError):
+                read_typed_input_file(input_file_path)
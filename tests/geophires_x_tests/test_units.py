@@ -1,8 +1,41 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
 from base_test_case import BaseTestCase
+from geophires_x.Units import UNIT_REGISTRY_CACHE_FOLDER_ENV_VAR
 from geophires_x.Units import CurrencyFrequencyUnit
+from geophires_x.Units import _new_cached_unit_registry
 
 
 class UnitsTestCase(BaseTestCase):
 
     def test_get_currency_frequency_unit_currency_unit_str(self):
         self.assertEqual('USD', CurrencyFrequencyUnit.DOLLARSPERYEAR.get_currency_unit_str())
+
+    def test_unit_registry_cache(self):
+        script = (
+            'from geophires_x.Units import get_unit_registry;'
+            'print(get_unit_registry().Quantity(2, "MMBTU").to("BTU").magnitude)'
+        )
+        with tempfile.TemporaryDirectory() as cache_folder:
+            env = {**os.environ, UNIT_REGISTRY_CACHE_FOLDER_ENV_VAR: cache_folder}
+            for _ in range(2):  # populates the cache, then loads from it
+                result = subprocess.run(  # noqa: S603
+                    [sys.executable, '-c', script], env=env, check=True, capture_output=True, text=True
+                )
+                self.assertEqual('2000000', result.stdout.strip())
+
+            self.assertGreater(len(list(Path(cache_folder).iterdir())), 0)
+
+    def test_unit_registry_cache_disabled(self):
+        with patch.dict(os.environ, {UNIT_REGISTRY_CACHE_FOLDER_ENV_VAR: ''}):
+            self.assertIsNone(_new_cached_unit_registry())
+
+    def test_unit_registry_cache_unsupported(self):
+        # pint versions before 0.20 raise TypeError for the unknown cache_folder argument
+        with patch('pint.UnitRegistry', side_effect=TypeError("unexpected keyword argument 'cache_folder'")):
+            self.assertIsNone(_new_cached_unit_registry())
@@ -476,7 +476,10 @@ def _new_hip_ra_test_instance(self, enable_hip_ra_logging_config=False, pre_re_s
         sys.argv = ['']
 
         try:
-            hip_ra: HIP_RA_X = HIP_RA_X(enable_hip_ra_logging_config=enable_hip_ra_logging_config)
+            hip_ra: HIP_RA_X = HIP_RA_X(
+                enable_hip_ra_logging_config=enable_hip_ra_logging_config,
+                output_file=str(Path(tempfile.gettempdir(), f'HIP_{uuid.uuid1()!s}.out')),
+            )
             if pre_re_stash_runner is not None:
                 pre_re_stash_runner(hip_ra)
             return hip_ra
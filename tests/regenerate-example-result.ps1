@@ -6,6 +6,8 @@ Set-Location -Path $scriptDir
 python -m geophires_x examples\$($args[0]).txt examples\$($args[0]).out
 # Remove JSON file
 Remove-Item -Path "examples\$($args[0]).json"
+# Remove structured result file
+Remove-Item -Path "examples\$($args[0]).result.jsonl"
 cd ..
 
 
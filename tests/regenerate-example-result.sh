@@ -12,6 +12,7 @@
 cd "$(dirname "$0")"
 python -mgeophires_x examples/$1.txt examples/$1.out
 rm examples/$1.json
+rm examples/$1.result.jsonl
 
 if [[ $1 == "example1_addons" ]]
 then
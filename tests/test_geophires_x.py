@@ -494,44 +494,49 @@ def input_for_heat_prices(params) -> GeophiresInputParameters:
         self.assertEqual(cashflow_escalating[2][4], 1.5)
         self.assertEqual(cashflow_escalating[-1][4], 3.0)
 
-    def test_disabled_currency_conversion_exceptions(self):
-        """
-        TODO: this test can be removed once https://github.com/NREL/GEOPHIRES-X/issues/236 is addressed. (Its purpose
-            is to ensure currency conversion failure behavior is as expected in the interim.)
-        """
+    def test_currency_conversion(self):
+        input_file_path = self._get_test_file_path(Path('examples/example1_outputunits.txt'))
 
-        with self.assertRaises(RuntimeError) as re_ec:
-            GeophiresXClient().get_geophires_result(
-                GeophiresInputParameters(
-                    from_file_path=self._get_test_file_path(Path('examples/example1_outputunits.txt')),
-                    params={'Units:Exploration cost,MEUR': 'MEUR'},
-                )
+        def _result(params: dict[str, Any]) -> dict[str, Any]:
+            return (
+                GeophiresXClient()
+                .get_geophires_result(GeophiresInputParameters(from_file_path=input_file_path, params=params))
+                .result
             )
 
-        e_msg = str(re_ec.exception)
+        def _exploration_costs(r: dict[str, Any]) -> dict[str, Any]:
+            return r['CAPITAL COSTS (M$)']['Exploration costs']
 
-        self.assertIn(
-            'Error: GEOPHIRES failed to convert your currency for Exploration cost to something it understands.', e_msg
+        usd_per_eur = 1.0389  # see src/geophires_x/exchange_rates.json
+
+        usd_result = _result({})
+        self.assertEqual('MUSD', _exploration_costs(usd_result)['unit'])
+
+        eur_result = _result({'Units:Exploration cost,MEUR': 'MEUR', 'Units:O&M Make-up Water costs': 'MEUR/yr'})
+        self.assertEqual('MEUR', _exploration_costs(eur_result)['unit'])
+        self.assertAlmostEqual(
+            _exploration_costs(usd_result)['value'] / usd_per_eur, _exploration_costs(eur_result)['value'], places=2
         )
-        self.assertIn('You gave MEUR', e_msg)
-        self.assertIn('https://github.com/NREL/GEOPHIRES-X/issues/236', e_msg)
+        self.assertEqual('MEUR/yr', eur_result['OPERATING AND MAINTENANCE COSTS (M$/yr)']['Water costs']['unit'])
 
-        with self.assertRaises(RuntimeError) as re_omwc:
-            GeophiresXClient().get_geophires_result(
-                GeophiresInputParameters(
-                    from_file_path=self._get_test_file_path(Path('examples/example1_outputunits.txt')),
-                    params={'Units:O&M Make-up Water costs': 'MEUR/yr'},
-                )
-            )
+        override_result = _result({'Units:Exploration cost,MEUR': 'MEUR', 'Exchange Rates': 'EUR: 0.5'})
+        self.assertAlmostEqual(
+            _exploration_costs(usd_result)['value'] * 0.5, _exploration_costs(override_result)['value'], places=2
+        )
 
-        e_msg = str(re_omwc.exception)
+        # Costs given in EUR are converted to USD
+        eur_input_result = _result({'Exploration Capital Cost': '4 MEUR'})
+        self.assertAlmostEqual(4 * usd_per_eur, _exploration_costs(eur_input_result)['value'], places=2)
 
+        with self.assertRaises(RuntimeError) as re_ec:
+            _result({'Exploration Capital Cost': '4 MXAU'})
+
+        e_msg = str(re_ec.exception)
         self.assertIn(
-            'Error: GEOPHIRES failed to convert your currency for O&M Make-up Water costs to something it understands.',
+            'Error: GEOPHIRES failed to convert your currency for Exploration Capital Cost to something it understands.',
             e_msg,
         )
-        self.assertIn('You gave MEUR', e_msg)
-        self.assertIn('https://github.com/NREL/GEOPHIRES-X/issues/236', e_msg)
+        self.assertIn('No exchange rate for XAU', e_msg)
 
     def test_project_red_larger_fractures(self):
         result = GeophiresXClient().get_geophires_result(
@@ -1567,3 +1572,34 @@ def _add_on_cash_flow(r: GeophiresXResult) -> list[float]:
         mcy_addon_cash_flow = _add_on_cash_flow(mcy_result)
 
         self.assertListEqual(base_addon_cash_flow, mcy_addon_cash_flow[mcy_years - 1 :])
+
+    def test_headless_output_parameters(self):
+        import json
+
+        import jsons
+
+        def _json_str(output_parameters_json: dict) -> str:
+            return json.dumps(output_parameters_json, sort_keys=True)
+
+        for example_stem in [
+            'example1',
+            'example1_addons',
+            'S-DAC-GT',
+            'example_SAM-single-owner-PPA',
+            'SUTRAExample1',
+        ]:
+            with self.subTest(msg=example_stem):
+                example_input_file_path = self._get_test_file_path(f'examples/{example_stem}.txt')
+
+                headless_input_params = ImmutableGeophiresInputParameters(from_file_path=example_input_file_path)
+                output_parameters = GeophiresXClient().get_geophires_output_parameters(headless_input_params)
+                self.assertFalse(Path(headless_input_params.get_output_file_path()).exists())
+                self.assertIn('Electricity Sale Price Model', output_parameters)
+
+                input_params = ImmutableGeophiresInputParameters(from_file_path=example_input_file_path)
+                GeophiresXClient().get_geophires_result(input_params)
+                with open(Path(input_params.get_output_file_path()).with_suffix('.json'), encoding='UTF-8') as f:
+                    expected_json = json.load(f)
+
+                headless_json = json.loads(jsons.dumps(output_parameters, sort_keys=True, supress_warnings=True))
+                self.assertEqual(_json_str(expected_json), _json_str(headless_json))
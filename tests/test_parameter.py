@@ -1,4 +1,6 @@
+import copy
 import os
+import pickle
 import sys
 import unittest
 from pathlib import Path
@@ -183,19 +185,104 @@ def test_convert_units_back_currency(self):
         self.assertEqual(param.CurrentUnits, CostPerMassUnit.DOLLARSPERMT)
         self.assertAlmostEqual(param.value, 13.79, places=2)
 
+        param2 = floatParameter(
+            'OPEX',
+            DefaultValue=240,
+            UnitType=Units.CURRENCY,
+            PreferredUnits=CurrencyUnit.DOLLARS,
+            CurrentUnits=CurrencyUnit.EUR,
+        )
+        ConvertUnitsBack(param2, model)
+        self.assertEqual(param2.CurrentUnits, CurrencyUnit.DOLLARS)
+        self.assertAlmostEqual(param2.value, 240 * model.exchange_rates.rate('EUR', 'USD'))
+
+        param3 = floatParameter(
+            'Exploration Capital Cost',
+            DefaultValue=2,
+            UnitType=Units.CURRENCY,
+            PreferredUnits=CurrencyUnit.MDOLLARS,
+            CurrentUnits=CurrencyUnit.KEUR,
+        )
+        ConvertUnitsBack(param3, model)
+        self.assertEqual(param3.CurrentUnits, CurrencyUnit.MDOLLARS)
+        self.assertAlmostEqual(param3.value, 0.002 * model.exchange_rates.rate('EUR', 'USD'))
+
         with self.assertRaises(RuntimeError) as re:
-            # TODO update once https://github.com/NREL/GEOPHIRES-X/issues/236?title=Currency+conversions+disabled is
-            #   addressed
-            param2 = floatParameter(
+            param4 = floatParameter(
                 'OPEX',
                 DefaultValue=240,
                 UnitType=Units.CURRENCY,
                 PreferredUnits=CurrencyUnit.DOLLARS,
-                CurrentUnits=CurrencyUnit.EUR,
+                CurrentUnits='XAU',
+            )
+            ConvertUnitsBack(param4, model)
+
+        self.assertIn('GEOPHIRES failed to convert your currency for OPEX', str(re.exception))
+
+    def test_shared_spec(self):
+        def _depth(value=None) -> floatParameter:
+            return floatParameter(
+                'Reservoir Depth',
+                value=value,
+                DefaultValue=3.0,
+                Min=0.1,
+                Max=15,
+                UnitType=Units.LENGTH,
+                PreferredUnits=LengthUnit.KILOMETERS,
+                CurrentUnits=LengthUnit.KILOMETERS,
             )
-            ConvertUnitsBack(param2, model)
 
-            self.assertIn('GEOPHIRES failed to convert your units for OPEX', str(re))
+        depth = _depth()
+        other_depth = _depth(5.0)
+        self.assertIs(depth._spec, other_depth._spec)
+        self.assertEqual(3.0, depth.value)
+        self.assertEqual(5.0, other_depth.value)
+
+        # Setting a spec field does not affect other parameters that share the spec
+        depth.ErrMessage = 'assume default reservoir depth (3 km)'
+        self.assertEqual('assume default reservoir depth (3 km)', depth.ErrMessage)
+        self.assertEqual('assume default value (see manual)', other_depth.ErrMessage)
+        self.assertEqual('assume default value (see manual)', _depth().ErrMessage)
+
+        # Default values of different types are not shared
+        self.assertIsInstance(floatParameter('Count', DefaultValue=1).value, int)
+        self.assertIsInstance(floatParameter('Count', DefaultValue=1.0).value, float)
+
+    def test_list_default_value_not_shared(self):
+        thicknesses = listParameter('Thicknesses', DefaultValue=[1.0, 2.0])
+        thicknesses.value.append(3.0)
+
+        self.assertEqual([1.0, 2.0], thicknesses.DefaultValue)
+        self.assertEqual([1.0, 2.0], listParameter('Thicknesses', DefaultValue=[1.0, 2.0]).value)
+
+    def test_copy_and_pickle(self):
+        param = floatParameter('Gradient 1', DefaultValue=50.0, UnitType=Units.TEMP_GRADIENT, Required=True)
+        param.value = 60.0
+        param.Provided = True
+
+        for copied in [copy.copy(param), copy.deepcopy(param), pickle.loads(pickle.dumps(param))]:  # noqa: S301
+            with self.subTest(copied=copied):
+                self.assertEqual(param, copied)
+                self.assertEqual(60.0, copied.value)
+                self.assertTrue(copied.Provided)
+                self.assertTrue(copied.Required)
+
+        # Unpickled specs are shared
+        self.assertIs(pickle.loads(pickle.dumps(param))._spec, pickle.loads(pickle.dumps(param))._spec)  # noqa: S301
+
+        self.assertIn("floatParameter(Name='Gradient 1', Required=True, Provided=True", repr(param))
+
+    def test_constructor_arguments(self):
+        self.assertEqual('Depth', OutputParameter('Depth').display_name)
+
+        with self.assertRaises(TypeError):
+            floatParameter('Depth', Name='Depth')
+
+        with self.assertRaises(TypeError):
+            floatParameter('Depth', Mni=0)
+
+        with self.assertRaises(AttributeError):
+            floatParameter('Depth').not_a_field = 1
 
     def _new_model(self) -> Model:
         stash_cwd = Path.cwd()